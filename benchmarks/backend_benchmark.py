@@ -0,0 +1,78 @@
+import sys
+from typing import Callable, Dict, List, Tuple, Union
+from decoder.parser import FunctionNode
+from interpreter.compiler import compile_functions, execute_compiled
+from interpreter.bytecode import compile_program
+from interpreter.vm import execute_bytecode
+from benchmarks.harness import best_time, checked, load_functions, run_function
+
+Runner = Callable[[str, List[Union[int, str, bool]]], None]
+
+
+def tree_walker(functions: Dict[str, FunctionNode]) -> Runner:
+    """
+    Create a runner for the tree-walking interpreter
+    :param functions: Dict[str, FunctionNode]; parsed functions
+    :return: Runner; function that runs a function by name with the given parameters
+    """
+    return lambda name, parameters: run_function(functions, name, parameters)
+
+
+def closure_compiler(functions: Dict[str, FunctionNode]) -> Runner:
+    """
+    Create a runner for the closure compiler
+    :param functions: Dict[str, FunctionNode]; parsed functions
+    :return: Runner; function that runs a function by name with the given parameters
+    """
+    compiled = compile_functions(functions)
+    return lambda name, parameters: checked(execute_compiled(compiled, name, list(parameters), 0))
+
+
+def virtual_machine(functions: Dict[str, FunctionNode]) -> Runner:
+    """
+    Create a runner for the bytecode virtual machine
+    :param functions: Dict[str, FunctionNode]; parsed functions
+    :return: Runner; function that runs a function by name with the given parameters
+    """
+    program = compile_program(functions)
+    return lambda name, parameters: checked(execute_bytecode(program, name, list(parameters), 0))
+
+
+backends = {
+    'tree-walker': tree_walker,
+    'closures': closure_compiler,
+    'vm': virtual_machine,
+}
+
+workloads = [
+    ('programs/examples.txt', 'power', [3, 2000]),
+    ('programs/examples.txt', 'sum_three', [1, 2, 3]),
+    ('programs/loop.txt', 'sommig_while', [20000]),
+    ('programs/loop.txt', 'sommig_for', [20000]),
+    ('programs/dubble_recursive.txt', 'is_even', [100]),
+]
+
+
+def run(repeat: int) -> List[Tuple[str, str, float]]:
+    """
+    Time every workload on every backend
+    :param repeat: int; amount of runs per workload
+    :return: List[Tuple[str, str, float]]; workload, backend name and fastest time
+    """
+    results = []
+    for file, name, parameters in workloads:
+        functions = load_functions(file)
+        for backend, create in backends.items():
+            runner = create(functions)
+            elapsed = best_time(runner, name, parameters, repeat=repeat)
+            results.append((f'{name} {" ".join(map(str, parameters))}', backend, elapsed))
+    return results
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    baseline = dict()
+    print(f'{"workload":<26}{"backend":<14}{"time (ms)":>12}{"speedup":>10}')
+    for workload, backend, elapsed in run(repeat):
+        baseline.setdefault(workload, elapsed)
+        print(f'{workload:<26}{backend:<14}{elapsed * 1000:>12.2f}{baseline[workload] / elapsed:>9.1f}x')
@@ -0,0 +1,28 @@
+import math
+import sys
+from typing import List, Tuple
+from benchmarks.harness import load_functions, run_function, timed
+
+
+def run(squarings: List[int]) -> List[Tuple[str, int, int, float]]:
+    """
+    Run the functions of big_numbers.txt, which pass big ints to and from every call. repeated_square squares 3 the
+    given amount of times through recursive calls, factorial multiplies all numbers up to the given number
+    :param squarings: List[int]; amount of squarings, the result has about 0.48 * 2 ** n digits
+    :return: List[Tuple[str, int, int, float]]; function name, parameter, digits of the result and seconds
+    """
+    functions = load_functions('programs/big_numbers.txt')
+    calls = [('repeated_square', [3, n]) for n in squarings] + [('factorial', [n]) for n in (50, 100, 150)]
+    results = []
+    for name, parameters in calls:
+        value, elapsed = timed(run_function, functions, name, parameters)
+        digits = int(value[0].bit_length() * math.log10(2)) + 1
+        results.append((name, parameters[-1], digits, elapsed))
+    return results
+
+
+if __name__ == '__main__':
+    squarings = [int(n) for n in sys.argv[1:]] or [8, 12, 16, 20]
+    print(f'{"function":<18}{"n":>6}{"digits":>12}{"seconds":>12}')
+    for name, n, digits, elapsed in run(squarings):
+        print(f'{name:<18}{n:>6}{digits:>12}{elapsed:>12.4f}')
@@ -0,0 +1,50 @@
+import os
+import sys
+from typing import List, Tuple
+from decoder.io.programcache import cache_file
+from interpreter.program import parse_file
+from benchmarks.harness import generated_programs, timed
+
+programs = ['programs/examples.txt', 'programs/loop.txt', 'programs/dubble_recursive.txt']
+
+
+def time_parse(file: str, directory: str, repeat: int) -> Tuple[float, float]:
+    """
+    Time getting the functions of a program without (cold) and with (warm) a cache file
+    :param file: str; path of the program
+    :param directory: str; directory for the cache files
+    :param repeat: int; amount of runs, the fastest run is used
+    :return: Tuple[float, float]; fastest cold and warm time in seconds
+    """
+    cold = []
+    warm = []
+    for _ in range(repeat):
+        if os.path.exists(cache_file(file, directory)):
+            os.remove(cache_file(file, directory))
+        cold.append(timed(parse_file, file, False, directory)[1])
+        warm.append(timed(parse_file, file, False, directory)[1])
+    return min(cold), min(warm)
+
+
+def run(repeat: int, lines: int) -> List[Tuple[str, float, float]]:
+    """
+    Time the example programs and a generated program with and without cache
+    :param repeat: int; amount of runs per program
+    :param lines: int; amount of lines of the generated program
+    :return: List[Tuple[str, float, float]]; program, cold time and warm time
+    """
+    results = []
+    with generated_programs([lines]) as generated:
+        directory = os.path.join(os.path.dirname(generated[0][1]), 'cache')
+        for file in programs + [generated[0][1]]:
+            cold, warm = time_parse(file, directory, repeat)
+            results.append((os.path.basename(file), cold, warm))
+    return results
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 900
+    print(f'{"program":<24}{"cold (ms)":>12}{"warm (ms)":>12}{"speedup":>10}')
+    for name, cold, warm in run(repeat, lines):
+        print(f'{name:<24}{cold * 1000:>12.2f}{warm * 1000:>12.2f}{cold / warm:>9.1f}x')
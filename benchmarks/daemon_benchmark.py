@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import subprocess
+from typing import List, Tuple
+from interpreter.client import send_request, run_request
+from benchmarks.harness import median_time
+
+# A job of the batch system: program, function and command line arguments
+job = ('programs/loop.txt', 'sommig_for', ['100'])
+
+
+def cold_run():
+    """
+    Run the job with a new python process for main.py, as the batch system does without the daemon
+    """
+    subprocess.run([sys.executable, 'main.py', job[0], job[1], *job[2]], check=True, stdout=subprocess.DEVNULL)
+
+
+def client_run(path: str):
+    """
+    Run the job with a new python process for the thin client
+    :param path: str; path of the socket of the daemon
+    """
+    subprocess.run([sys.executable, '-m', 'interpreter.client', f'--socket={path}', job[0], job[1], *job[2]], check=True, stdout=subprocess.DEVNULL)
+
+
+def round_trip(path: str):
+    """
+    Send the job to the daemon from this process, a request without starting python
+    :param path: str; path of the socket of the daemon
+    """
+    answer = send_request(run_request(*job), path)
+    if answer['exit_code'] != 0:
+        raise SystemExit(answer['error'])
+
+
+def run(repeats: int) -> List[Tuple[str, float]]:
+    """
+    Compare the latency of cold command line runs with runs through a daemon
+    :param repeats: int; amount of runs per way of running
+    :return: List[Tuple[str, float]]; way of running and the median latency in milliseconds
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'jcjl.sock')
+        daemon = subprocess.Popen([sys.executable, '-m', 'interpreter.daemon', f'--socket={path}'], stdout=subprocess.PIPE)
+        try:
+            daemon.stdout.readline()
+            # The first request loads the program
+            round_trip(path)
+            ways = [('main.py', cold_run, ()), ('client', client_run, (path, )), ('round trip', round_trip, (path, ))]
+            results = [(name, median_time(measure, *arguments, repeat=repeats) * 1000) for name, measure, arguments in ways]
+        finally:
+            send_request({'command': 'stop'}, path)
+            daemon.wait()
+    return results
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f'{"run":<14}{"median ms":>12}')
+    for name, latency in run(repeats):
+        print(f'{name:<14}{latency:>12.2f}')
@@ -0,0 +1,55 @@
+import sys
+from typing import List, Tuple
+from interpreter.program import Program, BACKENDS
+from benchmarks.harness import timed
+
+# Calls of small functions, as a service that embeds JCJL would make them: function name and python arguments
+calls = [('add_one', (41,)), ('fib', (10,)), ('is_big', (1000,))]
+
+
+def warm_calls(program: Program, name: str, arguments: tuple, repeats: int):
+    """
+    Call a function of a loaded program a number of times
+    :param program: Program; loaded program
+    :param name: str; name of the function
+    :param arguments: tuple; python arguments of the function
+    :param repeats: int; amount of calls
+    """
+    for _ in range(repeats):
+        program.call(name, *arguments)
+
+
+def cold_calls(name: str, arguments: tuple, repeats: int):
+    """
+    Load the program again for every call, as running main.py once per call does (without starting python)
+    :param name: str; name of the function
+    :param arguments: tuple; python arguments of the function
+    :param repeats: int; amount of calls
+    """
+    for _ in range(repeats):
+        Program.load('tests/backend_code.txt').call(name, *arguments)
+
+
+def run(repeats: int) -> List[Tuple[str, str, float]]:
+    """
+    Measure the throughput of repeated calls to a program that is loaded once, for every backend, and of loading the
+    program for every call
+    :param repeats: int; amount of calls per function and backend
+    :return: List[Tuple[str, str, float]]; backend, function and calls per second
+    """
+    results = []
+    for backend in BACKENDS:
+        program = Program.load('tests/backend_code.txt', backend=backend)
+        for name, arguments in calls:
+            results.append((backend, name, repeats / timed(warm_calls, program, name, arguments, repeats)[1]))
+    cold_repeats = max(1, repeats // 100)
+    for name, arguments in calls:
+        results.append(('load per call', name, cold_repeats / timed(cold_calls, name, arguments, cold_repeats)[1]))
+    return results
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print(f'{"backend":<16}{"function":<12}{"calls/s":>14}')
+    for backend, name, rate in run(repeats):
+        print(f'{backend:<16}{name:<12}{rate:>14.0f}')
@@ -0,0 +1,51 @@
+import sys
+from typing import List
+
+
+def generate_function(index: int) -> List[str]:
+    """
+    Generate the lines of a JCJL function that uses most statements of the language. Every function calls the function
+    before it, the first function calls print
+    :param index: int; number of the function, used in its name
+    :return: List[str]; lines of the function
+    """
+    call = f'call function_{index - 1} i' if index > 0 else 'call print i'
+    return [
+        f'comment generated function {index}',
+        f'int function function_{index} int n',
+        '    int result is 0',
+        '    string text is "generated text"',
+        '    bool flag is true',
+        '    for int i is n while i greaterthan 0 with i minmin',
+        '        if i equals 3',
+        '            result plusis 2',
+        '        else',
+        '            result plusis i',
+        '        endif',
+        '    endfor',
+        '    while result greaterthan 100',
+        '        result minis 7',
+        '    endwhile',
+        f'    int value is {call}',
+        '    value is result mul 2',
+        '    flag is flag and false',
+        '    return result',
+        '',
+    ]
+
+
+def generate_program(lines: int) -> str:
+    """
+    Generate a JCJL program of about the given amount of lines
+    :param lines: int; minimal amount of lines of the program
+    :return: str; source of the program
+    """
+    program = []
+    while len(program) < lines:
+        program += generate_function(len(program) // len(generate_function(0)))
+    return '\n'.join(program) + '\n'
+
+
+if __name__ == '__main__':
+    # Write a generated program to stdout, the amount of lines is given as argument
+    sys.stdout.write(generate_program(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,103 @@
+import os
+import time
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from decoder.nodes import FunctionNode
+from decoder.utils import Error
+from decoder.enums import ErrorType
+from interpreter.program import parse_file
+from interpreter.execute import execute_function_node
+from benchmarks.generate import generate_program
+
+# Timing and fixtures shared by the benchmarks: every benchmark times its workload with timed, best_time or median_time,
+# loads its programs with load_functions and writes generated programs with generated_programs. benchmarks.suite
+# measures the phases of the pipeline with the same helpers.
+
+
+def timed(function: Callable, *arguments: Any) -> Tuple[Any, float]:
+    """
+    Call a function once and time it
+    :param function: Callable; function to time
+    :param arguments: Any; arguments of the function
+    :return: Any, float; result of the function and seconds it took
+    """
+    start = time.perf_counter()
+    result = function(*arguments)
+    return result, time.perf_counter() - start
+
+
+def best_time(function: Callable, *arguments: Any, repeat: int = 1) -> float:
+    """
+    Get the fastest time of several calls of a function, the other calls are slowed down by the rest of the system
+    :param function: Callable; function to time
+    :param arguments: Any; arguments of the function
+    :param repeat: int; amount of calls
+    :return: float; fastest time in seconds
+    """
+    return min(timed(function, *arguments)[1] for _ in range(repeat))
+
+
+def median_time(function: Callable, *arguments: Any, repeat: int = 1) -> float:
+    """
+    Get the median time of several calls of a function, for workloads that start a new process and vary a lot
+    :param function: Callable; function to time
+    :param arguments: Any; arguments of the function
+    :param repeat: int; amount of calls
+    :return: float; median time in seconds
+    """
+    times = sorted(timed(function, *arguments)[1] for _ in range(repeat))
+    return times[len(times) // 2]
+
+
+def checked(result: Tuple[Any, Error]) -> Any:
+    """
+    Stop the benchmark when a workload gives an error, a benchmark that measures an error measures nothing
+    :param result: Tuple[Any, Error]; result and error object, as the interpreter returns them
+    :return: Any; the result
+    """
+    value, error = result
+    if error.type != ErrorType.NO_ERROR:
+        raise SystemExit(str(error))
+    return value
+
+
+def load_functions(file: str) -> Dict[str, FunctionNode]:
+    """
+    Lex and parse a JCJL program without printing the status messages
+    :param file: str; path to the JCJL program
+    :return: Dict[str, FunctionNode]; parsed functions of the program
+    """
+    functions, error, _ = parse_file(file)
+    if functions is None:
+        raise SystemExit(str(error))
+    return functions
+
+
+def run_function(functions: Dict[str, FunctionNode], name: str, parameters: List[Union[int, str, bool]]) -> Optional[Tuple[Union[int, str, bool], str]]:
+    """
+    Run a function with the tree-walking interpreter
+    :param functions: Dict[str, FunctionNode]; parsed functions
+    :param name: str; name of the function
+    :param parameters: List; parameters of the function, the list isn't changed
+    :return: Tuple[value, type]; return value of the function and its type
+    """
+    return checked(execute_function_node(functions[name], list(parameters), functions, 0))
+
+
+@contextmanager
+def generated_programs(sizes: List[int]) -> Iterator[List[Tuple[int, str]]]:
+    """
+    Write generated programs (see benchmarks.generate) to a temporary directory, which is removed at the end of the
+    with-statement
+    :param sizes: List[int]; amount of lines of the programs
+    :return: List[Tuple[int, str]]; amount of lines and path of every program
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        programs = []
+        for size in sizes:
+            file = os.path.join(directory, f'generated_{size}.txt')
+            with open(file, 'w') as program:
+                program.write(generate_program(size))
+            programs.append((size, file))
+        yield programs
@@ -0,0 +1,37 @@
+import sys
+from typing import List, Tuple
+from interpreter.program import Program
+from interpreter.console import CaptureOutput
+from benchmarks.harness import best_time, generated_programs
+
+
+def start_program(file: str, lazy: bool):
+    """
+    Load a generated program and call function_5, which reaches 6 functions of the program
+    :param file: str; path of the program
+    :param lazy: bool; parse the function bodies when they are called
+    """
+    Program.load(file, output=CaptureOutput(), lazy=lazy).call('function_5', 3)
+
+
+def run(sizes: List[int], repeat: int) -> List[Tuple[int, float, float]]:
+    """
+    Compare the start time of generated programs with fully parsed and with lazily parsed function bodies
+    :param sizes: List[int]; amount of lines of the generated programs
+    :param repeat: int; amount of runs per program, the fastest run is used
+    :return: List[Tuple[int, float, float]]; lines, seconds when fully parsed and seconds when lazily parsed
+    """
+    results = []
+    with generated_programs(sizes) as programs:
+        for size, file in programs:
+            eager = best_time(start_program, file, False, repeat=repeat)
+            lazy = best_time(start_program, file, True, repeat=repeat)
+            results.append((size, eager, lazy))
+    return results
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f'{"lines":>10}{"full s":>12}{"lazy s":>12}')
+    for lines, eager, lazy in run(sizes, 3):
+        print(f'{lines:>10}{eager:>12.3f}{lazy:>12.3f}')
@@ -0,0 +1,56 @@
+import sys
+from typing import List, Tuple
+from decoder.lexer import lex_line, lexer
+from decoder.utils import quiet_status
+from decoder.io.jcjlreader import process_line
+from benchmarks.harness import best_time, generated_programs, timed
+
+
+def count_tokens(lines: List[str]) -> int:
+    """
+    Tokenize every line of a program
+    :param lines: List[str]; lines of the program
+    :return: int; amount of tokens
+    """
+    tokens = 0
+    for line_nmr, line in enumerate(lines, 1):
+        line = process_line(line)
+        if line:
+            tokens += len(lex_line(line, line_nmr))
+    return tokens
+
+
+def lex_file(file: str):
+    """
+    Read and tokenize a program file with the streaming pipeline of decoder.lexer.lexer
+    :param file: str; path of the program
+    """
+    with quiet_status():
+        lexer(file)
+
+
+def run(sizes: List[int], repeat: int) -> List[Tuple[int, int, int, float, float]]:
+    """
+    Measure the tokenizer throughput on generated programs
+    :param sizes: List[int]; amount of lines of the generated programs
+    :param repeat: int; amount of runs per program, the fastest run is used
+    :return: List[Tuple[int, int, int, float, float]]; lines, bytes, tokens, tokens per second of the tokenizer and
+        lines per second of reading and tokenizing the file
+    """
+    results = []
+    with generated_programs(sizes) as programs:
+        for size, file in programs:
+            with open(file) as program:
+                source = program.read()
+            lines = source.splitlines()
+            tokens, elapsed = min((timed(count_tokens, lines) for _ in range(repeat)), key=lambda result: result[1])
+            file_elapsed = best_time(lex_file, file, repeat=repeat)
+            results.append((len(lines), len(source), tokens, tokens / elapsed, len(lines) / file_elapsed))
+    return results
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 200000]
+    print(f'{"lines":>10}{"megabytes":>12}{"tokens":>12}{"tokens/s":>14}{"file lines/s":>16}')
+    for lines, size, tokens, rate, line_rate in run(sizes, 3):
+        print(f'{lines:>10}{size / 1e6:>12.2f}{tokens:>12}{rate:>14.0f}{line_rate:>16.0f}')
@@ -0,0 +1,25 @@
+import sys
+from typing import List, Tuple
+from benchmarks.harness import load_functions, run_function, timed
+
+
+def run(lengths: List[int]) -> List[Tuple[str, int, float]]:
+    """
+    Run the sommig_while and sommig_for functions for every given loop length
+    :param lengths: List[int]; loop lengths to measure
+    :return: List[Tuple[str, int, float]]; function name, loop length and iterations per second
+    """
+    functions = load_functions('programs/loop.txt')
+    results = []
+    for name in ('sommig_while', 'sommig_for'):
+        for n in lengths:
+            _, elapsed = timed(run_function, functions, name, [n])
+            results.append((name, n, n / elapsed))
+    return results
+
+
+if __name__ == '__main__':
+    lengths = [int(n) for n in sys.argv[1:]] or [10, 100, 1000, 10000, 100000]
+    print(f'{"function":<14}{"iterations":>12}{"iterations/s":>16}')
+    for name, n, rate in run(lengths):
+        print(f'{name:<14}{n:>12}{rate:>16.0f}')
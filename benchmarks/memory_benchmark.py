@@ -0,0 +1,41 @@
+import sys
+import tracemalloc
+from typing import List, Tuple
+from decoder.lexer import lexer
+from decoder.parser import parse
+from decoder.utils import quiet_status
+from benchmarks.harness import generated_programs
+
+
+def measure(file: str) -> Tuple[int, int, int]:
+    """
+    Measure the memory that is used while lexing and parsing a program file
+    :param file: str; path of the program
+    :return: Tuple[int, int, int]; bytes in use after lexing, peak bytes while lexing and parsing, bytes in use after
+        parsing (tokens and functions)
+    """
+    with quiet_status():
+        tracemalloc.start()
+        tokens, _ = lexer(file)
+        lexed = tracemalloc.get_traced_memory()[0]
+        functions, _ = parse(tokens)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return lexed, peak, current
+
+
+def run(sizes: List[int]) -> List[Tuple[int, int, int, int]]:
+    """
+    Measure the memory of lexing and parsing generated programs
+    :param sizes: List[int]; amount of lines of the generated programs
+    :return: List[Tuple[int, int, int, int]]; lines, bytes after lexing, peak bytes and bytes after parsing
+    """
+    with generated_programs(sizes) as programs:
+        return [(size, ) + measure(file) for size, file in programs]
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f'{"lines":>10}{"lexed MB":>12}{"peak MB":>12}{"parsed MB":>12}')
+    for lines, lexed, peak, parsed in run(sizes):
+        print(f'{lines:>10}{lexed / 1e6:>12.1f}{peak / 1e6:>12.1f}{parsed / 1e6:>12.1f}')
@@ -0,0 +1,72 @@
+import os
+import sys
+import shutil
+from typing import Callable, List, Tuple
+from decoder.io.programcache import CACHE_VARIABLE
+from interpreter import modules
+from interpreter.program import Program
+from interpreter.console import CaptureOutput
+from benchmarks.harness import generated_programs, timed
+
+# A program that uses function_5 of a generated library, imported by the name of its file
+program = ['int function main int n', 'int result is call function_5 n', 'return result']
+
+
+def load_and_call(main: str):
+    """
+    Load the program with its library and call main
+    :param main: str; path of the program
+    """
+    Program.load(main, output=CaptureOutput()).call('main', 3)
+
+
+def time_load(main: str, prepare: Callable[[], None], repeat: int) -> float:
+    """
+    Time loading the program with its library and calling main
+    :param main: str; path of the program
+    :param prepare: Callable; function that is called before every load, to empty the caches
+    :param repeat: int; amount of loads, the fastest load is used
+    :return: float; seconds from loading the program to the result of main
+    """
+    times = []
+    for _ in range(repeat):
+        prepare()
+        times.append(timed(load_and_call, main)[1])
+    return min(times)
+
+
+def run(sizes: List[int], repeat: int) -> List[Tuple[int, float, float, float]]:
+    """
+    Compare the load time of a program that imports a generated library of the given sizes: without caches, with the
+    cache file of the library (a new process) and with the library in memory (the same process)
+    :param sizes: List[int]; amount of lines of the libraries
+    :param repeat: int; amount of loads per way of loading, the fastest load is used
+    :return: List[Tuple[int, float, float, float]]; lines, seconds without caches, with cache file and from memory
+    """
+    results = []
+    for size in sizes:
+        with generated_programs([size]) as generated:
+            directory, library = os.path.split(generated[0][1])
+            main = os.path.join(directory, 'main.txt')
+            with open(main, 'w') as main_file:
+                main_file.write('\n'.join([f'import {os.path.splitext(library)[0]}'] + program) + '\n')
+            # The index of the library is stored in a cache directory of its own
+            cache = os.path.join(directory, 'cache')
+            os.environ[CACHE_VARIABLE] = cache
+
+            def cold():
+                modules.modules.clear()
+                shutil.rmtree(cache, ignore_errors=True)
+
+            cold_time = time_load(main, cold, repeat)
+            warm_time = time_load(main, modules.modules.clear, repeat)
+            memory_time = time_load(main, lambda: None, repeat)
+            results.append((size, cold_time, warm_time, memory_time))
+    return results
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f'{"lines":>10}{"cold ms":>12}{"cache ms":>12}{"memory ms":>12}')
+    for lines, cold, warm, memory in run(sizes, 3):
+        print(f'{lines:>10}{cold * 1000:>12.2f}{warm * 1000:>12.2f}{memory * 1000:>12.2f}')
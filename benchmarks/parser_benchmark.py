@@ -0,0 +1,50 @@
+import sys
+from typing import List, Tuple
+from decoder.lexer import lex_stream, Token
+from decoder.parser import parse
+from decoder.utils import quiet_status
+from decoder.io.jcjlreader import process_line
+from benchmarks.generate import generate_program
+from benchmarks.harness import best_time
+
+
+def lex_program(source: str) -> List[Token]:
+    """
+    Tokenize a generated program the same way decoder.lexer.lexer does, with an end-line token after every line
+    :param source: str; source of the program
+    :return: List[Token]; tokens of the program
+    """
+    lines = ((process_line(line), line_nmr) for line_nmr, line in enumerate(source.splitlines(), 1))
+    return list(lex_stream((line, line_nmr) for line, line_nmr in lines if line))
+
+
+def parse_tokens(tokens: List[Token]):
+    """
+    Parse the tokens of a program
+    :param tokens: List[Token]; tokens of the program
+    """
+    with quiet_status():
+        parse(tokens)
+
+
+def run(sizes: List[int], repeat: int) -> List[Tuple[int, int, float, float]]:
+    """
+    Measure the parse time of generated programs
+    :param sizes: List[int]; amount of lines of the generated programs
+    :param repeat: int; amount of runs per program, the fastest run is used
+    :return: List[Tuple[int, int, float, float]]; lines, tokens, seconds and tokens per second of the parser
+    """
+    results = []
+    for size in sizes:
+        source = generate_program(size)
+        tokens = lex_program(source)
+        elapsed = best_time(parse_tokens, tokens, repeat=repeat)
+        results.append((len(source.splitlines()), len(tokens), elapsed, len(tokens) / elapsed))
+    return results
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f'{"lines":>10}{"tokens":>12}{"seconds":>12}{"tokens/s":>14}')
+    for lines, tokens, elapsed, rate in run(sizes, 3):
+        print(f'{lines:>10}{tokens:>12}{elapsed:>12.3f}{rate:>14.0f}')
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+from typing import Callable, List, Tuple
+from interpreter.program import Program
+from interpreter.console import Output, ConsoleOutput, CaptureOutput, FileOutput, DEFAULT_BUFFER_SIZE
+from benchmarks.harness import timed
+
+# A loop that prints a string and a number in every iteration
+source = '''
+int function print_loop int n
+    for int i is 0 while i lessthan n with i plusplus
+        call print "regel"
+        call print i
+    endfor
+    return n
+'''
+
+
+def time_output(make_output: Callable[[str], Output], n: int, backend: str) -> float:
+    """
+    Time the print loop with an output. Stdout is a line buffered file in a temporary directory: it is written for every
+    line, like a terminal, but the speed of a terminal doesn't count
+    :param make_output: Callable[[str], Output]; creates the output, gets the path of a file to write to
+    :param n: int; amount of iterations
+    :param backend: str; execute, compile or vm
+    :return: float; printed lines per second
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        stdout = sys.stdout
+        with open(os.path.join(directory, 'stdout.txt'), 'w', buffering=1) as sys.stdout:
+            try:
+                output = make_output(os.path.join(directory, 'output.txt'))
+                program = Program.from_source(source, backend=backend, output=output)
+
+                def print_loop():
+                    program.call('print_loop', n)
+                    output.close()
+                _, elapsed = timed(print_loop)
+            finally:
+                sys.stdout = stdout
+    return 2 * n / elapsed
+
+
+outputs = {
+    'stdout per line': lambda path: ConsoleOutput(),
+    'stdout buffered': lambda path: ConsoleOutput(DEFAULT_BUFFER_SIZE),
+    'capture': lambda path: CaptureOutput(),
+    'file': lambda path: FileOutput(path),
+}
+
+
+def run(n: int, backend: str) -> List[Tuple[str, float]]:
+    """
+    Compare the outputs of interpreter.console on a loop that prints
+    :param n: int; amount of iterations
+    :param backend: str; execute, compile or vm
+    :return: List[Tuple[str, float]]; name of the output and printed lines per second
+    """
+    return [(name, time_output(make_output, n, backend)) for name, make_output in outputs.items()]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for backend in ('execute', 'compile', 'vm'):
+        print(backend)
+        for name, rate in run(n, backend):
+            print(f'    {name:<18}{rate:>14.0f} lines/s')
@@ -0,0 +1,24 @@
+import sys
+from typing import List, Tuple
+from benchmarks.harness import load_functions, run_function, timed
+
+
+def run(depths: List[int]) -> List[Tuple[int, float]]:
+    """
+    Run is_even of dubble_recursive.txt, which makes a tail call to is_odd (and back) for every decrement of n
+    :param depths: List[int]; values of n, the amount of nested calls
+    :return: List[Tuple[int, float]]; value of n and calls per second
+    """
+    functions = load_functions('programs/dubble_recursive.txt')
+    results = []
+    for n in depths:
+        _, elapsed = timed(run_function, functions, 'is_even', [n])
+        results.append((n, (n + 1) / elapsed))
+    return results
+
+
+if __name__ == '__main__':
+    depths = [int(n) for n in sys.argv[1:]] or [10, 100, 1000, 10000, 100000]
+    print(f'{"depth":>10}{"calls/s":>14}')
+    for n, rate in run(depths):
+        print(f'{n:>10}{rate:>14.0f}')
@@ -0,0 +1,71 @@
+import sys
+import subprocess
+from typing import Dict, List, Tuple
+from benchmarks.harness import median_time
+
+# A short script, for which the startup of the interpreter is most of the run
+job = ['programs/hello_world.txt', 'hello']
+# Modules that the command line only imports when an option or import statement needs them
+DEFERRED_MODULES = ('pickle', 'hashlib', 'tempfile', 'decoder.io.programcache')
+# Default budget of the cumulative import time of the interpreter in milliseconds
+IMPORT_BUDGET = 50.0
+
+
+def run_python(arguments: List[str]):
+    """
+    Run a new python process
+    :param arguments: List[str]; arguments of python
+    """
+    subprocess.run([sys.executable, *arguments], input='JCJL\n', text=True, check=True, stdout=subprocess.DEVNULL)
+
+
+def import_times(module: str) -> Dict[str, Tuple[float, int]]:
+    """
+    Import a module in a new python process with -X importtime
+    :param module: str; name of the module
+    :return: Dict[str, Tuple[float, int]]; cumulative import time in milliseconds and depth of every imported module
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, check=True)
+    times = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(cumulative) / 1000, (len(name) - len(name.lstrip())) // 2)
+    return times
+
+
+def run(repeats: int) -> Tuple[List[Tuple[str, float]], Dict[str, Tuple[float, int]]]:
+    """
+    Measure the end-to-end latency of the hello world program, with and without the status messages, against the
+    startup of python itself, and the import times of the interpreter
+    :param repeats: int; amount of runs per command
+    :return: List[Tuple[str, float]], Dict[str, Tuple[float, int]]; command and median latency in milliseconds, import
+        times as given by import_times
+    """
+    commands = [('python', ['-c', 'pass']), ('main.py', ['main.py', *job]), ('main.py --quiet', ['main.py', '--quiet', *job])]
+    latencies = [(name, median_time(run_python, arguments, repeat=repeats) * 1000) for name, arguments in commands]
+    return latencies, import_times('interpreter.interpreter')
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else IMPORT_BUDGET
+    latencies, times = run(repeats)
+    print(f'{"run":<18}{"median ms":>12}')
+    for name, latency in latencies:
+        print(f'{name:<18}{latency:>12.2f}')
+
+    print(f'\n{"import":<32}{"cumulative ms":>14}')
+    own = sorted(((cumulative, name) for name, (cumulative, depth) in times.items() if name.split('.')[0] in ('decoder', 'interpreter') and depth <= 1), reverse=True)
+    for cumulative, name in own:
+        print(f'{name:<32}{cumulative:>14.2f}')
+    total = times['interpreter.interpreter'][0]
+    print(f'{"total (budget " + str(budget) + ")":<32}{total:>14.2f}')
+
+    # A regression fails the benchmark: a deferred module that is imported at startup, or imports over the budget
+    imported = [module for module in DEFERRED_MODULES if module in times]
+    if imported:
+        print(f'Imported at startup, but should be deferred: {", ".join(imported)}')
+    if imported or total > budget:
+        exit(1)
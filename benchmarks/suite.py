@@ -0,0 +1,224 @@
+import os
+import gc
+import sys
+import json
+import platform
+import statistics
+from typing import Any, Callable, Dict, List, Tuple, Union
+from decoder.io.jcjlreader import read_program
+from decoder.lexer import lex_lines
+from decoder.parser import parse
+from decoder.utils import Error, quiet_status
+from decoder.enums import ErrorType
+from interpreter.execute import execute_function_node
+from interpreter.typecheck import check_program
+from interpreter.console import CaptureOutput, BufferedInput, using
+from interpreter.interpreter import split_options
+from benchmarks.harness import generated_programs, timed
+
+# Runs every phase of the pipeline separately for a set of workloads and stores the statistics as JSON, and compares
+# two of those results to find regressions:
+#   python -m benchmarks.suite run [--output=file] [--repeat=n] [--warmup=n] [--sizes=1000,10000] [--compare=file]
+#   python -m benchmarks.suite compare baseline current [--threshold=0.2] [--minimum=0.05]
+
+# Version of the format of the results
+RESULTS_VERSION = 1
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+PHASES = ('read_program', 'lex_lines', 'parse', 'execute_function_node')
+DEFAULT_REPEAT = 10
+DEFAULT_WARMUP = 2
+DEFAULT_SIZES = (1000, 10000)
+# A phase is a regression when its median is more than this fraction slower than the baseline
+DEFAULT_THRESHOLD = 0.20
+# Medians below this amount of milliseconds are mostly noise and are not compared
+DEFAULT_MINIMUM = 0.05
+
+# A workload: name, file, function, parameters and lines of input
+Workload = Tuple[str, str, str, List[Union[int, str, bool]], List[str]]
+
+# Programs of the programs/ directory that run without imports
+corpus: List[Workload] = [
+    ('examples power', 'programs/examples.txt', 'power', [3, 2000], []),
+    ('examples sum_three', 'programs/examples.txt', 'sum_three', [1, 2, 3], []),
+    ('loop sommig_while', 'programs/loop.txt', 'sommig_while', [5000], []),
+    ('loop sommig_for', 'programs/loop.txt', 'sommig_for', [5000], []),
+    ('dubble_recursive is_even', 'programs/dubble_recursive.txt', 'is_even', [500], []),
+    ('big_numbers repeated_square', 'programs/big_numbers.txt', 'repeated_square', [3, 14], []),
+    ('big_numbers factorial', 'programs/big_numbers.txt', 'factorial', [150], []),
+    ('hello_world hello', 'programs/hello_world.txt', 'hello', [], ['JCJL']),
+]
+
+
+def run_pipeline(file: str, name: str, parameters: List[Union[int, str, bool]], input_lines: List[str]) -> Dict[str, float]:
+    """
+    Read, lex, parse, type check and run a program once and time every phase. Type checking is part of loading a
+    program, but not timed: it only decides how fast the function is executed
+    :param file: str; path of the program
+    :param name: str; name of the function that is run
+    :param parameters: List; parameters of the function
+    :param input_lines: List[str]; lines that the function reads with input
+    :return: Dict[str, float]; seconds of every phase
+    """
+    times = dict()
+
+    def timed_phase(phase: str, function: Callable, *arguments: Any) -> Any:
+        result, times[phase] = timed(function, *arguments)
+        if isinstance(result, Error) or isinstance(result, tuple) and isinstance(result[-1], Error) and result[-1].type != ErrorType.NO_ERROR:
+            raise SystemExit(f'{name} in {file} failed at {phase}: {result if isinstance(result, Error) else result[-1]}')
+        return result
+
+    with quiet_status():
+        lines = timed_phase('read_program', read_program, file)
+        tokens, _ = timed_phase('lex_lines', lex_lines, lines)
+        functions, _ = timed_phase('parse', parse, tokens)
+    check_program(functions)
+    with using(CaptureOutput(), BufferedInput(input_lines)):
+        timed_phase('execute_function_node', execute_function_node, functions[name], list(parameters), functions, 0)
+    return times
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Get the statistics of the times of a phase
+    :param samples: List[float]; seconds of every run
+    :return: Dict[str, float]; minimum, median, mean and standard deviation in milliseconds
+    """
+    milliseconds = [sample * 1000 for sample in samples]
+    return {
+        'min': min(milliseconds),
+        'median': statistics.median(milliseconds),
+        'mean': statistics.fmean(milliseconds),
+        'stdev': statistics.stdev(milliseconds) if len(milliseconds) > 1 else 0.0,
+    }
+
+
+def measure(workload: Workload, repeat: int, warmup: int) -> Dict[str, Dict[str, float]]:
+    """
+    Run a workload a few times without timing it and then time every phase of repeated runs
+    :param workload: Workload; workload to run
+    :param repeat: int; amount of timed runs
+    :param warmup: int; amount of runs before the timed runs
+    :return: Dict[str, Dict[str, float]]; statistics of every phase
+    """
+    _, file, name, parameters, input_lines = workload
+    for _ in range(warmup):
+        run_pipeline(file, name, parameters, input_lines)
+    samples = {phase: [] for phase in PHASES}
+    for _ in range(repeat):
+        # Garbage of a previous run isn't collected during a timed phase
+        gc.collect()
+        for phase, seconds in run_pipeline(file, name, parameters, input_lines).items():
+            samples[phase].append(seconds)
+    return {phase: summarize(phase_samples) for phase, phase_samples in samples.items()}
+
+
+def run(repeat: int, warmup: int, sizes: List[int]) -> Dict[str, Any]:
+    """
+    Measure the corpus and generated programs of the given sizes, which run function_5 of the program
+    :param repeat: int; amount of timed runs per workload
+    :param warmup: int; amount of runs before the timed runs
+    :param sizes: List[int]; amount of lines of the generated programs
+    :return: Dict[str, Any]; results with the statistics of every phase of every workload
+    """
+    results = {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'warmup': warmup,
+        'workloads': dict(),
+    }
+    with generated_programs(sizes) as programs:
+        workloads = list(corpus) + [(f'generated {size} lines', file, 'function_5', [3], []) for size, file in programs]
+        for workload in workloads:
+            results['workloads'][workload[0]] = measure(workload, repeat, warmup)
+    return results
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float, minimum: float) -> List[Tuple[str, str, float, float, bool]]:
+    """
+    Compare the medians of every phase of every workload that is in both results
+    :param baseline: Dict[str, Any]; results to compare with
+    :param current: Dict[str, Any]; new results
+    :param threshold: float; fraction that a phase can be slower than the baseline before it is a regression
+    :param minimum: float; milliseconds below which a median is not compared
+    :return: List[Tuple[str, str, float, float, bool]]; workload, phase, baseline and current median in milliseconds and
+        whether the phase is a regression
+    """
+    comparisons = []
+    for workload, phases in current['workloads'].items():
+        for phase, current_statistics in phases.items():
+            baseline_statistics = baseline['workloads'].get(workload, dict()).get(phase)
+            if baseline_statistics is None:
+                continue
+            before, after = baseline_statistics['median'], current_statistics['median']
+            regression = max(before, after) >= minimum and after > before * (1 + threshold)
+            comparisons.append((workload, phase, before, after, regression))
+    return comparisons
+
+
+def read_results(path: str) -> Dict[str, Any]:
+    """
+    Read results from a JSON file
+    :param path: str; path of the file
+    :return: Dict[str, Any]; results
+    """
+    with open(path) as file:
+        results = json.load(file)
+    if results.get('version') != RESULTS_VERSION:
+        raise SystemExit(f'{path} has results of version {results.get("version")}, expected {RESULTS_VERSION}')
+    return results
+
+
+def print_results(results: Dict[str, Any]):
+    """
+    Print the median and standard deviation of every phase
+    :param results: Dict[str, Any]; results of run
+    """
+    print(f'{"workload":<30}{"phase":<24}{"median ms":>12}{"stdev ms":>12}')
+    for workload, phases in results['workloads'].items():
+        for phase, phase_statistics in phases.items():
+            print(f'{workload:<30}{phase:<24}{phase_statistics["median"]:>12.3f}{phase_statistics["stdev"]:>12.3f}')
+
+
+def print_comparison(comparisons: List[Tuple[str, str, float, float, bool]]) -> bool:
+    """
+    Print the comparison of two results
+    :param comparisons: List[Tuple[str, str, float, float, bool]]; comparisons as given by compare
+    :return: bool; True when a phase is a regression
+    """
+    print(f'{"workload":<30}{"phase":<24}{"baseline ms":>12}{"current ms":>12}{"change":>10}')
+    for workload, phase, before, after, regression in comparisons:
+        change = (after - before) / before * 100 if before else 0.0
+        print(f'{workload:<30}{phase:<24}{before:>12.3f}{after:>12.3f}{change:>+9.1f}%{"  REGRESSION" if regression else ""}')
+    regressions = sum(regression for *_, regression in comparisons)
+    print(f'{regressions} regression(s) in {len(comparisons)} phases')
+    return regressions > 0
+
+
+def main(arguments: List[str]):
+    options, arguments = split_options(arguments)
+    threshold = float(options.get('threshold', DEFAULT_THRESHOLD))
+    minimum = float(options.get('minimum', DEFAULT_MINIMUM))
+    command = arguments[0] if arguments else 'run'
+
+    if command == 'run':
+        sizes = [int(size) for size in options['sizes'].split(',') if size] if isinstance(options.get('sizes'), str) else list(DEFAULT_SIZES)
+        results = run(int(options.get('repeat', DEFAULT_REPEAT)), int(options.get('warmup', DEFAULT_WARMUP)), sizes)
+        print_results(results)
+        if isinstance(options.get('output'), str):
+            with open(options['output'], 'w') as file:
+                json.dump(results, file, indent=2)
+        if options.get('compare'):
+            baseline = read_results(options['compare'] if isinstance(options['compare'], str) else BASELINE)
+            print()
+            exit(1 if print_comparison(compare(baseline, results, threshold, minimum)) else 0)
+    elif command == 'compare' and len(arguments) == 3:
+        exit(1 if print_comparison(compare(read_results(arguments[1]), read_results(arguments[2]), threshold, minimum)) else 0)
+    else:
+        print('Usage: python -m benchmarks.suite run [--output=file] [--compare[=baseline]] | compare baseline current')
+        exit(2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
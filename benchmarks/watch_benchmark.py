@@ -0,0 +1,73 @@
+import sys
+from typing import List, Tuple
+from interpreter.typecheck import check_program
+from interpreter.watch import WatchedProgram
+from interpreter.console import CaptureOutput, using
+from benchmarks.harness import generated_programs, load_functions, run_function, timed
+
+
+def edit(file: str, version: int):
+    """
+    Change one line of function_5 of a generated program, as an edit during development
+    :param file: str; path of the program
+    :param version: int; number of the edit, every edit changes the line
+    """
+    with open(file) as program:
+        lines = program.read().split('\n')
+    start = lines.index('int function function_5 int n')
+    position = next(number for number in range(start, len(lines)) if lines[number].startswith('        result minis'))
+    lines[position] = f'        result minis {8 - version % 2}'
+    with open(file, 'w') as program:
+        program.write('\n'.join(lines))
+
+
+def full_run(file: str):
+    """
+    Read, lex, parse and type check the whole program and run function_5, as a new run does
+    :param file: str; path of the program
+    """
+    functions = load_functions(file)
+    check_program(functions)
+    with using(CaptureOutput()):
+        run_function(functions, 'function_5', [3])
+
+
+def watch_run(program: WatchedProgram):
+    """
+    Load the changed program in watch mode and run function_5
+    :param program: WatchedProgram; program that was loaded before the edit
+    """
+    error = program.refresh()
+    if program.changed != 1:
+        raise SystemExit(f'Expected 1 changed function, got {program.changed} ({error})')
+    with using(CaptureOutput()):
+        run_function(program.functions, 'function_5', [3])
+
+
+def run(sizes: List[int], repeat: int) -> List[Tuple[int, float, float]]:
+    """
+    Compare the time of running a generated program again after an edit of one function, with a full run and in watch
+    mode
+    :param sizes: List[int]; amount of lines of the generated programs
+    :param repeat: int; amount of edits per program, the fastest run is used
+    :return: List[Tuple[int, float, float]]; lines, seconds of a full run and seconds in watch mode
+    """
+    results = []
+    with generated_programs(sizes) as programs:
+        for size, file in programs:
+            watched = WatchedProgram(file)
+            watched.refresh()
+            full, watch = [], []
+            for version in range(repeat):
+                edit(file, version)
+                full.append(timed(full_run, file)[1])
+                watch.append(timed(watch_run, watched)[1])
+            results.append((size, min(full), min(watch)))
+    return results
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f'{"lines":>10}{"full ms":>12}{"watch ms":>12}')
+    for lines, full, watch in run(sizes, 3):
+        print(f'{lines:>10}{full * 1000:>12.1f}{watch * 1000:>12.1f}')
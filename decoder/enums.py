@@ -22,6 +22,7 @@ class TokensTypes(Enum):
     FUNCTION = 'FUNCTION'
     RETURN = 'RETURN'
     CALL = 'CALL'
+    IMPORT = 'IMPORT'
     IDENTIFIER = 'IDENTIFIER'
     ENDLINE = 'END_LINE'
     ERROR = 'ERROR'
@@ -85,7 +86,8 @@ keywords = {
     'endif': TokensTypes.ENDIF,
     'function': TokensTypes.FUNCTION,
     'return': TokensTypes.RETURN,
-    'call': TokensTypes.CALL
+    'call': TokensTypes.CALL,
+    'import': TokensTypes.IMPORT
 }
 
 escape_chars = ["'\\\\'", "'\\n'", "'\\t'", "'\\s'", "'\\\''", "'\\\"'"]
@@ -102,6 +104,8 @@ class ErrorType(Enum):
     PARAMETER_ERROR = 'PARAMETER_ERROR'
     UNKNOW_VARIABLE_ERROR = 'UNKNOW_VARIABLE_ERROR'
     RUNTIME_ERROR = 'RUNTIME_ERROR'
+    TYPE_ERROR = 'TYPE_ERROR'
+    IMPORT_ERROR = 'IMPORT_ERROR'
 
     def __str__(self) -> str:
         """
@@ -1,5 +1,5 @@
 import os
-from typing import List, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from decoder.utils import status_logger
 from decoder.enums import ErrorType
 from decoder.utils import Error
@@ -17,44 +17,72 @@ def process_line(line: str) -> str:
     return line
 
 
-def process_lines(lines: List[str], line_number) -> List[Tuple[str, int]]:
+def process_lines(lines: Iterable[str], line_number: int) -> List[Tuple[str, int]]:
     '''
     This function processes all lines of a JCJL program
-    :param lines: list; List of JCJL program lines
-    :return: str; Single string that contains the cleaned up program
+    :param lines: Iterable[str]; JCJL program lines
+    :param line_number: int; line number of the first line
+    :return: List[Tuple[str, int]]; processed lines that are not empty, including line numbers, as a tuple
     '''
-    if len(lines) < 1:
-        []
-    if len(lines) == 1:
-        if len(lines[0].strip()) > 0:
-            return [(process_line(lines[0]), line_number), ]
-        else:
-            return []
-    processed_line = process_line(lines[0])
+    return list(iterate_processed_lines(lines, line_number))
 
-    result = list()
-    if processed_line:
-        result.append((processed_line, line_number))
-    return result + process_lines(lines[1:], line_number+1)
 
+def iterate_processed_lines(lines: Iterable[str], line_number: int) -> Iterator[Tuple[str, int]]:
+    '''
+    This generator processes the lines of a JCJL program one at a time. Lines that are empty after processing (empty
+    lines and comments) are skipped
+    :param lines: Iterable[str]; JCJL program lines
+    :param line_number: int; line number of the first line
+    :return: Iterator[Tuple[str, int]]; processed lines, including line numbers, as a tuple
+    '''
+    for number, line in enumerate(lines, line_number):
+        processed_line = process_line(line)
+        if processed_line:
+            yield processed_line, number
 
-@status_logger('Start reading in file')
-def read_program(file: str) -> Union[List[Tuple[str, int]], Error]:
+
+def find_program(file: str) -> Optional[Error]:
     '''
-    This functions reads and processes a JCJL program from a file. Throws a file not found error if the file couldn't be found
+    Check if a JCJL program file exists
     :param file: str; File to be processed
-    :return: List[Tuple[str, int]] | Error; This function returns a list of lines, including line numbers, as a tuple. Or an error will be returned
+    :return: Error | None; file not found error, or None if the file exists
     '''
     if not os.path.isfile(file):
         return Error(ErrorType.FILE_NOT_FOUND_ERROR, f'Couldn\'t find file: {file}')
-
-    if not os.path.exists(file):
-        return Error(ErrorType.FILE_NOT_FOUND_ERROR, f'Couldn\'t find file: {file}')
+    return None
 
 
-    lines = []
+def iterate_file_lines(file: str) -> Iterator[Tuple[str, int]]:
+    '''
+    This generator reads a JCJL program one line at a time, so only a single line of the file is held in memory
+    :param file: str; File to be processed
+    :return: Iterator[Tuple[str, int]]; processed lines, including line numbers, as a tuple
+    '''
     with open(file, 'r') as program_file:
-        lines = program_file.readlines()
+        yield from iterate_processed_lines(program_file, 1)
+
 
-    program = process_lines(lines, 1)
-    return program
+@status_logger('Start reading in file')
+def read_program(file: str) -> Union[List[Tuple[str, int]], Error]:
+    '''
+    This functions reads and processes a JCJL program from a file. Throws a file not found error if the file couldn't be found
+    :param file: str; File to be processed
+    :return: List[Tuple[str, int]] | Error; This function returns a list of lines, including line numbers, as a tuple. Or an error will be returned
+    '''
+    error = find_program(file)
+    if error is not None:
+        return error
+    return list(iterate_file_lines(file))
+
+
+@status_logger('Start reading in file')
+def stream_program(file: str) -> Union[Iterator[Tuple[str, int]], Error]:
+    '''
+    This functions opens a JCJL program for reading line by line. The file is read while the returned lines are used
+    :param file: str; File to be processed
+    :return: Iterator[Tuple[str, int]] | Error; processed lines, including line numbers, as a tuple. Or an error will be returned
+    '''
+    error = find_program(file)
+    if error is not None:
+        return error
+    return iterate_file_lines(file)
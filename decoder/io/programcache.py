@@ -0,0 +1,161 @@
+import os
+import sys
+import stat
+import pickle
+import hashlib
+import struct
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from decoder.utils import status_logger
+from decoder.nodes import FunctionNode
+
+# Parsed programs are cached in a binary file, by default in the cache directory of the user (see cache_directory). A
+# cache file starts with a header (magic bytes, format version and key) followed by the pickled functions. The key is a
+# hash of the source and of the interpreter version, so a cache file is never used for a changed program or
+# interpreter. Unpickling a file can run any code, so a cache file is only read when nobody but the user can have
+# written it. interpreter.program.parse_file reads, parses and stores programs through this cache.
+
+CACHE_VARIABLE = 'JCJLCACHE'
+CACHE_EXTENSION = '.jcjlc'
+MAGIC = b'JCJL'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('>4sH32s')
+
+# Packages of which the source is part of the interpreter version: the decoder makes the cached nodes, the interpreter
+# gives them their slots, types, caches and module data
+version_packages = ['decoder', 'interpreter']
+
+
+@lru_cache(maxsize=1)
+def interpreter_version() -> bytes:
+    """
+    Get the version of the interpreter as a hash of the python version and the path, modification time and size of every
+    source file of the decoder and interpreter. The files aren't read, so the version costs almost nothing. It is made
+    once per process
+    :return: bytes; version hash
+    """
+    version = hashlib.sha256(f'{FORMAT_VERSION} {sys.version_info[0]}.{sys.version_info[1]}'.encode())
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for package in version_packages:
+        files = []
+        for directory, directories, names in os.walk(os.path.join(root, package)):
+            directories[:] = [name for name in directories if name != '__pycache__']
+            files.extend(os.path.join(directory, name) for name in names if name.endswith('.py'))
+        for file in sorted(files):
+            status = os.stat(file)
+            version.update(f'{os.path.relpath(file, root)} {status.st_mtime_ns} {status.st_size}\n'.encode())
+    return version.digest()
+
+
+def cache_directory() -> str:
+    """
+    Get the default directory of the cache files: the environment variable JCJLCACHE, or jcjl in the cache directory of
+    the user ($XDG_CACHE_HOME or ~/.cache)
+    :return: str; path of the directory
+    """
+    directory = os.environ.get(CACHE_VARIABLE)
+    if directory:
+        return directory
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'jcjl')
+
+
+def program_key(file: str) -> Optional[bytes]:
+    """
+    Get the cache key of a program file
+    :param file: str; path of the program
+    :return: bytes | None; key of the program, None when the file can't be read
+    """
+    try:
+        with open(file, 'rb') as program_file:
+            source = program_file.read()
+    except OSError:
+        return None
+    return hashlib.sha256(interpreter_version() + source).digest()
+
+
+def cache_file(file: str, directory: Optional[str] = None, extension: str = CACHE_EXTENSION) -> str:
+    """
+    Get the path of the cache file of a program. The default directory has the cache files of all programs of the user,
+    so their names include a hash of the path of the program
+    :param file: str; path of the program
+    :param directory: str | None; directory for the cache files, by default the directory of cache_directory
+    :param extension: str; extension of the cache file
+    :return: str; path of the cache file
+    """
+    if directory is None:
+        path_hash = hashlib.sha256(os.path.abspath(file).encode()).hexdigest()[:16]
+        return os.path.join(cache_directory(), f'{os.path.basename(file)}-{path_hash}{extension}')
+    return os.path.join(directory, os.path.basename(file) + extension)
+
+
+def private_file(status: os.stat_result) -> bool:
+    """
+    Check if only the current user can have written a file: the user owns it and nobody else may write it
+    :param status: os.stat_result; status of the opened file
+    :return: bool; is the file private
+    """
+    if hasattr(os, 'getuid') and status.st_uid != os.getuid():
+        return False
+    return not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def read_cache(path: str, key: bytes) -> Any:
+    """
+    Read the data of a cache file. A cache file that is missing, damaged, made for another source or interpreter
+    version or that others could have written (see private_file) is ignored
+    :param path: str; path of the cache file
+    :param key: bytes; key of the program, as given by program_key
+    :return: Any; cached data, None when the cache can't be used
+    """
+    try:
+        with open(path, 'rb') as cached:
+            if not private_file(os.fstat(cached.fileno())):
+                return None
+            header = cached.read(HEADER.size)
+            if len(header) != HEADER.size or HEADER.unpack(header) != (MAGIC, FORMAT_VERSION, key):
+                return None
+            return pickle.load(cached)
+    except Exception:
+        return None
+
+
+@status_logger('Start reading cached program')
+def load_program(path: str, key: bytes) -> Optional[Dict[str, FunctionNode]]:
+    """
+    Load the parsed functions of a program from a cache file
+    :param path: str; path of the cache file
+    :param key: bytes; key of the program, as given by program_key
+    :return: Dict[str, FunctionNode] | None; parsed functions, None when the cache can't be used
+    """
+    functions = read_cache(path, key)
+    return functions if isinstance(functions, dict) else None
+
+
+def store_program(path: str, key: bytes, functions: Any) -> bool:
+    """
+    Store the parsed functions of a program, or other data of a program, in a cache file. The file is replaced at once,
+    so a program that runs at the same time never reads a half written file. A new directory and the file can only be
+    read and written by the user
+    :param path: str; path of the cache file
+    :param key: bytes; key of the program, as given by program_key
+    :param functions: Any; parsed functions or other data that can be pickled
+    :return: bool; is the cache file written
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # mkstemp creates the file with mode 0o600
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as cached:
+                cached.write(HEADER.pack(MAGIC, FORMAT_VERSION, key))
+                pickle.dump(functions, cached, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+    except (OSError, pickle.PicklingError, RecursionError):
+        return False
+    return True
+
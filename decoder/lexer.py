@@ -1,13 +1,21 @@
-import re
-from functools import reduce
-from typing import List, Tuple, Union, Optional
+import sys
+from typing import Collection, Iterable, Iterator, List, Tuple, Union, Optional
 from decoder.enums import TokensTypes, keywords, escape_chars, ErrorType
 from decoder import utils
 from decoder.io import jcjlreader
 from decoder.utils import Error, status_logger
 
+# Character tables for literals and identifiers. These replace regular expressions, so a run doesn't pay for importing
+# and compiling re at startup
+hex_digits = frozenset('0123456789abcdefABCDEF')
+identifier_start = frozenset('abcdefghijklmnopqrstuvwxyz')
+identifier_characters = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+
 
 class Token():
+    # Programs have a token for every word, __slots__ leaves out the attribute dict of every token
+    __slots__ = ('type', 'value', 'line_nmr', 'slot')
+
     def __init__(self, type: TokensTypes, value: str, line_nmr: int):
         """
         Initialize a Token object
@@ -18,6 +26,8 @@ class Token():
         self.type = type
         self.value = value
         self.line_nmr = line_nmr
+        # Place of the variable of an identifier in the frame of its function, set by interpreter.frame
+        self.slot = None
 
     def __str__(self):
         """
@@ -39,21 +49,19 @@ class Token():
         return self.type == other.type and self.value == other.value and self.line_nmr == other.line_nmr
 
 
-def value_to_token(keyword_list: List[str], value: str, line_nmr: int) -> Optional[Token]:
+def value_to_token(keyword_list: Collection[str], value: str, line_nmr: int) -> Optional[Token]:
     """
     Matches a value to list of keywords, and if found returns the token of the keyword. Otherwise this function
     returns None
-    :param keyword_list: List[str]; List of keywords to match to
+    :param keyword_list: Collection[str]; Keywords to match to, a dict or set gives a hashed lookup
     :param value: str; value that might be a keyword
     :param line_nmr: int; Line number on which the value is found
     :return: Token | None; if the value is a keyword, the token is returned
     """
-    if len(keyword_list) == 0:
-        return None
-    head, *tail = keyword_list
-    if head == value.lower():
-        return Token(keywords[head], value, line_nmr)
-    return value_to_token(tail, value, line_nmr)
+    lowered = value.lower()
+    if lowered in keyword_list:
+        return Token(keywords[lowered], sys.intern(value), line_nmr)
+    return None
 
 
 def check_if_string_literal(value: str, line_nmr: int) -> Optional[Token]:
@@ -75,9 +83,7 @@ def check_if_int_literal(value: str, line_nmr: int) -> Optional[Token]:
     :param line_nmr: int; line number on which the value is
     :return: Token | None; Returns token if value is an integer
     """
-    hex_regex = r'^0x[0-9a-fA-F]{1,16}$'
-    #hex_regex = r'^0x[0-9A-F]{1, 16}$'
-    if re.match(hex_regex, value):
+    if value.startswith('0x') and 2 < len(value) <= 18 and hex_digits.issuperset(value[2:]):
         return Token(TokensTypes.INT, value, line_nmr)
     else:
         try:
@@ -95,12 +101,16 @@ def check_if_valid_identifier(value: str, line_nmr: int) -> Optional[Token]:
     :param line_nmr: int; line number on which the value is
     :return: Token | None; Returns token if value is an identifier
     """
-    identifier_regex = r'^[a-z]([a-zA-Z0-9_]?)*$'
-    if re.match(identifier_regex, value):
-        return Token(TokensTypes.IDENTIFIER, value, line_nmr)
+    if value[:1] in identifier_start and identifier_characters.issuperset(value):
+        # The same identifiers are used over and over, interning lets all their tokens share one string
+        return Token(TokensTypes.IDENTIFIER, sys.intern(value), line_nmr)
     return None
 
 
+# Checks for literals and identifiers, in the order they are tried for a word that is not a keyword
+literal_checks = [check_if_string_literal, check_if_int_literal, check_if_valid_identifier]
+
+
 def lex_token(word: str, line_nmr: int) -> Token:
     """
     Create a token from a word.
@@ -110,12 +120,11 @@ def lex_token(word: str, line_nmr: int) -> Token:
     """
 
     # Check if word is a keyword
-    result = value_to_token([*keywords.keys()], word, line_nmr)
+    result = value_to_token(keywords, word, line_nmr)
 
     if result is None:
         # Check if word is a string literal, integer or identifier
-        functions = [check_if_string_literal, check_if_int_literal, check_if_valid_identifier]
-        result = utils.literal_identifier_function_looper(functions, word, line_nmr)
+        result = utils.literal_identifier_function_looper(literal_checks, word, line_nmr)
 
     if result is None:
         # Create error token if word is not a keyword, identifier or literal
@@ -131,44 +140,86 @@ def lex_splitted_line(line: List[str], line_nmr: int) -> List[Token]:
     :param line_nmr: int; line number on which the words are
     :return: List[Token]; List of tokens for the given list of words
     """
-    if len(line) == 0:
-        return []
-    if len(line) == 1:
-        return [lex_token(line[0], line_nmr), ]
+    return [lex_token(word, line_nmr) for word in line]
 
-    head, *tail = line
-    return [lex_token(head, line_nmr), ] + lex_splitted_line(tail, line_nmr)
 
-
-def string_split_by_whitespace_rec(to_split: str, word: str = '', in_string: bool = False) -> List[str]:
+def whitespace_positions(line: str) -> List[int]:
+    """
+    Find the positions of the whitespace characters in a line. A line with single whitespace characters between its
+    words, as most lines are, is split by str.split and the positions are counted from the lengths of the words.
+    Otherwise every character is checked, str.isspace uses the same whitespace characters as str.split
+    :param line: str; line to search
+    :return: List[int]; positions of the whitespace characters
     """
-    This function splits a string by whitespace. The exception is that expected string literals are kept as a whole.
-    :param to_split: str; The string that yet needs to be splitted
-    :param word: str; what characters are already collected in a word
-    :param in_string: bool; is the current 'to_split' inside an expected string literal
+    words = line.split()
+    if len(words) - 1 + sum(map(len, words)) == len(line):
+        positions = []
+        position = -1
+        for word in words[:-1]:
+            position += len(word) + 1
+            positions.append(position)
+        return positions
+    return [position for position, character in enumerate(line) if character.isspace()]
+
+
+def split_by_whitespace(line: str) -> List[str]:
+    """
+    This function splits a string by whitespace. The exception is that expected string literals are kept as a whole:
+    a word that starts with a quote continues over whitespace until the word ends with a quote. Every whitespace
+    character outside a string literal ends a word, so two whitespace characters after each other give an empty word.
+    Only the positions of whitespace are visited, which makes splitting linear in the length of the line.
+    :param line: str; The string to split
     :return: List[str]; List of splitted words to be tokenized
     """
-    if len(to_split) == 0:
+    if not line:
         return []
-    if len(to_split) == 1:
-        word = word + to_split
-        word = word.strip()
-        if word:
-            return [word, ]
-        return list()
-
-    head = to_split[0]
-    tail = to_split[1:]
-    if head.isspace():
+    if '"' not in line:
+        # Without string literals and with single whitespace characters, str.split gives the words
+        words = line.split()
+        if len(words) - 1 + sum(map(len, words)) == len(line):
+            return words
+
+    words = []
+    start = 0
+    in_string = False
+    last = len(line) - 1
+    for index in whitespace_positions(line):
+        if index >= last:
+            break
         if in_string:
-            if word.endswith('"'):
-                return [word, ] + string_split_by_whitespace_rec(tail)
-        elif not word.startswith('"'):
-            return [word, ] + string_split_by_whitespace_rec(tail)
+            if line[index - 1] == '"':
+                words.append(line[start:index])
+                start = index + 1
+                in_string = False
+        elif index == start or line[start] != '"':
+            words.append(line[start:index])
+            start = index + 1
         else:
             in_string = True
-    word = word + head
-    return string_split_by_whitespace_rec(tail, word, in_string)
+
+    word = line[start:].strip()
+    if word:
+        words.append(word)
+    return words
+
+
+def string_split_by_whitespace_rec(to_split: str) -> List[str]:
+    """
+    Split a string by whitespace, kept for existing callers of the recursive splitter. See split_by_whitespace
+    :param to_split: str; The string to split
+    :return: List[str]; List of splitted words to be tokenized
+    """
+    return split_by_whitespace(to_split)
+
+
+def lex_line(line: str, line_nmr: int) -> List[Token]:
+    """
+    Split a line in words and turn the words to tokens
+    :param line: str; line to tokenize
+    :param line_nmr: int; line number of the line
+    :return: List[Token]; tokens of the line
+    """
+    return lex_splitted_line(split_by_whitespace(line), line_nmr)
 
 
 def format_syntax_error(value: str, line_nmr: int) -> str:
@@ -181,40 +232,57 @@ def format_syntax_error(value: str, line_nmr: int) -> str:
     return f'On line {str(line_nmr)} the symbol: {value} couldn\'t be defined'
 
 
-@status_logger('Start lexing program')
-def lex_lines(lines: List[Tuple[str, int]]) -> Tuple[List[Token], Error]:
-    program = map(lambda x: (string_split_by_whitespace_rec(x[0]), x[1]), lines)
-    # remove empty lines
-    program = filter(lambda x: len(x) > 0, program)
+def lex_stream(lines: Iterable[Tuple[str, int]]) -> Iterator[Token]:
+    """
+    Tokenize lines one at a time. After the tokens of every line an end-line token is given
+    :param lines: Iterable[Tuple[str, int]]; lines with their line numbers, as given by the jcjlreader
+    :return: Iterator[Token]; tokens of the lines
+    """
+    for line, line_nmr in lines:
+        tokens = lex_line(line, line_nmr)
+        if tokens:
+            yield from tokens
+            yield Token(TokensTypes.ENDLINE, '\n', line_nmr)
 
-    # tokenize the lines
-    tokenized_lines = map(lambda x: lex_splitted_line(x[0], x[1]), program)
 
-    # put all tokens in a single list
-    tokens: List[Token] = reduce(lambda a, b: a + b + [Token(TokensTypes.ENDLINE, '\n', b[0].line_nmr), ],
-                                 tokenized_lines, [])
+def tokenize(lines: Iterable[Tuple[str, int]]) -> Tuple[List[Token], Error]:
+    """
+    Tokenize lines and report the symbols that couldn't be tokenized, without a status message
+    :param lines: Iterable[Tuple[str, int]]; lines with their line numbers, as given by the jcjlreader
+    :return: List[Token], Error; A list with token and an Error object depicting the error or no error
+    """
+    tokens = list(lex_stream(lines))
 
     # check for any error tokens
-    error_tokens = list(filter(lambda x: x.type == TokensTypes.ERROR, tokens))
+    error_tokens = [token for token in tokens if token.type == TokensTypes.ERROR]
 
     # If errors are found, format them and return the errors
     if len(error_tokens) > 0:
-        formatted_errors = map(lambda x: format_syntax_error(x.value, x.line_nmr), error_tokens)
-        errors = reduce(lambda x, y: x + '\n' + y, formatted_errors)
+        errors = '\n'.join(format_syntax_error(token.value, token.line_nmr) for token in error_tokens)
         return tokens, Error(ErrorType.SYNTAX_ERROR, errors)
 
     # return tokens with no error
     return tokens, Error(ErrorType.NO_ERROR, '')
 
 
+@status_logger('Start lexing program')
+def lex_lines(lines: Iterable[Tuple[str, int]]) -> Tuple[List[Token], Error]:
+    """
+    Tokenize all lines of a program
+    :param lines: Iterable[Tuple[str, int]]; lines with their line numbers, as given by the jcjlreader
+    :return: List[Token], Error; A list with token and an Error object depicting the error or no error
+    """
+    return tokenize(lines)
+
+
 def lexer(file: str) -> Tuple[List[Token], Error]:
     """
     This function takes in a file path, reads the given file and tokenizes the program in the file
     :param file: str; file path to file
     :return: List[Token], Error; A list with token and an Error object depicting the error or no error
     """
-    # read the file
-    lines_or_error = jcjlreader.read_program(file)
+    # read the file, the lines are read while they are lexed
+    lines_or_error = jcjlreader.stream_program(file)
     if isinstance(lines_or_error, Error):
         return [], lines_or_error
 
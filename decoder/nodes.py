@@ -1,11 +1,15 @@
-from typing import List, NamedTuple, Union
+from typing import List, NamedTuple, Optional, Tuple, Union
 from decoder.lexer import Token
 
 
 class Node:
     """
-    Base class for all nodes
+    Base class for all nodes. Every node class lists its attributes in __slots__, so nodes have no attribute dict
     """
+    # Type that interpreter.typecheck resolved for the node: the type of an expression, or of the variable or condition
+    # of a statement. None when the function of the node did not pass the type check
+    __slots__ = ('resolved_type', )
+
     def __str__(self):
         """
         Represent the node as a string
@@ -34,12 +38,15 @@ class Value(Node):
     """
     Node that represents a value
     """
+    __slots__ = ('value', )
+
     def __init__(self, value: Token):
         """
         Initialize the node with a value token
         :param value: Token; value of the node
         """
         self.value = value
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -70,6 +77,8 @@ class Operator(Node):
     """
     Node that represents a operation (plus, min, etc) on two tokens
     """
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left: Token, operator: Token, right: Token):
         """
         Initialize the operator node with the left, right and oparation
@@ -80,6 +89,7 @@ class Operator(Node):
         self.left = left
         self.operator = operator
         self.right = right
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -110,9 +120,12 @@ class Call(Node):
     """
     This node represents a call to a function
     """
+    __slots__ = ('function', 'parameters')
+
     def __init__(self, function: Token, parameters: List[Token]):
         self.function = function
         self.parameters = parameters
+        self.resolved_type = None
 
     def get_parameters_as_string(self, p: List[Token]):
         """
@@ -152,6 +165,8 @@ class Unary(Node):
     """
     This node represents an unary node where the right side is applied to the left side by the given operator
     """
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left: Token, operator: Token, right: Node):
         """
         Initialize the unary node
@@ -162,6 +177,7 @@ class Unary(Node):
         self.left = left
         self.operator = operator
         self.right = right
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -192,6 +208,8 @@ class IncDec(Node):
     """
     Node that represents an increment or decrement a token
     """
+    __slots__ = ('left', 'operator')
+
     def __init__(self, left: Token, operator: Token):
         """
         Initialize the IncDec node
@@ -200,6 +218,7 @@ class IncDec(Node):
         """
         self.left = left
         self.operator = operator
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -230,6 +249,8 @@ class TypeAssignment(Node):
     """
     Node that assigns a new identifier with an expression
     """
+    __slots__ = ('type', 'id', 'expression')
+
     def __init__(self, type: Token, id: Token, expression: Node):
         """
         Initialize the type assignment
@@ -240,6 +261,7 @@ class TypeAssignment(Node):
         self.type = type
         self.id = id
         self.expression = expression
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -270,6 +292,8 @@ class Assignment(Node):
     """
     Assign new value to a identifier
     """
+    __slots__ = ('id', 'expression')
+
     def __init__(self, id: Token, expression: Node):
         """
         Initialize the assignment node
@@ -278,6 +302,7 @@ class Assignment(Node):
         """
         self.id = id
         self.expression = expression
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -308,6 +333,8 @@ class Compare(Node):
     """
     Compare node that expresses a comparison between two tokens
     """
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left: Token, operator: Token, right: Token):
         """
         Initialize the compare node
@@ -318,6 +345,7 @@ class Compare(Node):
         self.left = left
         self.operator = operator
         self.right = right
+        self.resolved_type = None
 
     def __str__(self):
         """
@@ -348,6 +376,8 @@ class Forloop(Node):
     """
     Node that represents a for-loop
     """
+    __slots__ = ('start', 'dowhile', 'inc', 'body')
+
     def __init__(self, start: TypeAssignment, dowhile: Compare, inc: Node, body: List[Node] = None):
         """
         Initialize the for loop node
@@ -360,6 +390,7 @@ class Forloop(Node):
         self.dowhile = dowhile
         self.inc = inc
         self.body: List[Node] = body if body is not None else []
+        self.resolved_type = None
 
     def add_node(self, n: Node):
         """
@@ -399,6 +430,8 @@ class While(Node):
     """
     Node representing a while loop
     """
+    __slots__ = ('dowhile', 'body')
+
     def __init__(self, dowhile: Node, body: List[Node] = None):
         """
         Initialize the while loop
@@ -407,6 +440,7 @@ class While(Node):
         """
         self.dowhile = dowhile
         self.body = body if body is not None else []
+        self.resolved_type = None
 
     def add_node(self, n: Node):
         """
@@ -439,13 +473,15 @@ class While(Node):
         """
         if not isinstance(other, While):
             return False
-        return self.dowhile == other.dowhile and self.body == other.__getattribute__()
+        return self.dowhile == other.dowhile and self.body == other.body
 
 
 class If(Node):
     """
     Node representing a if-statement
     """
+    __slots__ = ('cmp', 'body', 'else_body')
+
     def __init__(self, cmp: Compare, body: List[Node] = None, else_body: List[Node] = None):
         """
         Initialize the if statement node
@@ -456,6 +492,7 @@ class If(Node):
         self.cmp = cmp
         self.body = body if body is not None else []
         self.else_body = else_body if else_body is not None else []
+        self.resolved_type = None
 
     def add_if_node(self, n: Node):
         """
@@ -520,6 +557,9 @@ class FunctionNode:
     """
     Function node that has a body that is executed, return statement and
     """
+    __slots__ = ('name', 'parameters', 'return_type', 'return_line', 'body', 'return_statement', 'verified', 'frame_size',
+                 'parameter_slots', 'source', 'module')
+
     def __init__(self, name: str, return_type: Token):
         """
         Initialize the function node
@@ -532,6 +572,20 @@ class FunctionNode:
         self.return_line: int = 0
         self.body: List[Node] = []
         self.return_statement: Union[Node, None] = None
+        # The fields below only depend on the source of the function and the file that defines it, so they are the same
+        # for every program that runs the node. The state of a running program is kept by the program, see
+        # interpreter.execute.ProgramFunctions
+        # Set by interpreter.typecheck when the function has no type errors
+        self.verified = False
+        # Size of the frame with the variables of a call and the place of every parameter in it, set by interpreter.frame
+        self.frame_size = None
+        self.parameter_slots: List[int] = []
+        # Lines after the definition up to and including the return, while the body isn't parsed yet (see
+        # decoder.parser.index_functions). None when the function is parsed
+        self.source: Optional[List[Tuple[str, int]]] = None
+        # Path of the module the function was imported from (see interpreter.modules), None for a function of the
+        # program itself
+        self.module: Optional[str] = None
 
     def add_parameter(self, p: Parameter):
         """
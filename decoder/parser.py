@@ -1,6 +1,7 @@
-from decoder.lexer import Token
+from decoder.lexer import Token, tokenize
+from itertools import chain
 from decoder.enums import TokensTypes, ErrorType, identifier_or_literal
-from typing import List, Tuple, Union, Dict, Optional
+from typing import Iterable, List, Tuple, Union, Dict, Optional
 from decoder.utils import Error, status_logger
 from decoder.nodes import (
     Node,
@@ -20,116 +21,136 @@ from decoder.nodes import (
 )
 
 
+# The parser walks over the token list of the whole program with an index. Every parse function gets the token list
+# and a position in it, and returns the position after the tokens it parsed. A body of a statement is given as a range
+# (start and end position) in the same list, so tokens are never copied and a program is parsed in linear time.
+
+
 def check_parameters(tokens: List[Token]) -> Error:
     """
-    This function checks if a list of tokens are valid identifiers or literals
+    This function checks if a list of tokens are valid identifiers or literals. When more tokens are invalid, the error
+    is given for the last invalid token
     :param tokens: List[Token]; Tokens that must be checked
     :return: Error; Object that indicated if there is an error or not
     """
-    if len(tokens) == 0:
-        return Error(ErrorType.NO_ERROR, '')
-    lower_error = check_parameters(tokens[1:])
-    if lower_error.type == ErrorType.NO_ERROR:
-        if tokens[0].type in identifier_or_literal:
-            return Error(ErrorType.NO_ERROR, '')
-        return Error(ErrorType.SYNTAX_ERROR, f'Invalid parameter: {tokens[0].value} at line {tokens[0].line_nmr}')
-    return lower_error
+    for token in reversed(tokens):
+        if token.type not in identifier_or_literal:
+            return Error(ErrorType.SYNTAX_ERROR, f'Invalid parameter: {token.value} at line {token.line_nmr}')
+    return Error(ErrorType.NO_ERROR, '')
 
 
-def get_parameter_list(tokens: List[Token]) -> Tuple[List[Parameter], List[Token], Error]:
+def get_parameter_list(tokens: List[Token], position: int) -> Tuple[List[Parameter], int, Error]:
     """
     This functions gets a list of parameters for a function definition.
     Any errors will be given through the error-object
-    :param tokens: Tokens that must be parsed
-    :return: List[Parameter], List[Token], Error; Parameter list, left over tokens and an error-object
+    :param tokens: List[Token]; Tokens that must be parsed
+    :param position: int; Position of the first parameter type
+    :return: List[Parameter], int, Error; Parameter list, position after the parameters and an error-object
     """
-    if tokens[0].type == TokensTypes.ENDLINE:
-        return [], tokens[1:], Error(ErrorType.NO_ERROR, '')
-    if tokens[0].type == TokensTypes.TYPE:
-        if tokens[1].type == TokensTypes.IDENTIFIER:
-            next_parameters, left_over, error = get_parameter_list(tokens[2:])
-            return [Parameter(type=tokens[0], name=tokens[1].value), ] + next_parameters, left_over, error
-        else:
-            return [], tokens[1:], Error(ErrorType.UNKNOW_TYPE_ERROR, f'Name \'{tokens[1].value}\' at line {str(tokens[1].line_nmr)} is not a valid name')
-    else:
-        return [], tokens[1:], Error(ErrorType.UNKNOW_TYPE_ERROR, f'Type \'{tokens[0].value}\' at line {str(tokens[0].line_nmr)} is not valid')
+    parameters = []
+    while tokens[position].type != TokensTypes.ENDLINE:
+        if tokens[position].type != TokensTypes.TYPE:
+            return [], position + 1, Error(ErrorType.UNKNOW_TYPE_ERROR, f'Type \'{tokens[position].value}\' at line {str(tokens[position].line_nmr)} is not valid')
+        if tokens[position + 1].type != TokensTypes.IDENTIFIER:
+            return [], position + 1, Error(ErrorType.UNKNOW_TYPE_ERROR, f'Name \'{tokens[position + 1].value}\' at line {str(tokens[position + 1].line_nmr)} is not a valid name')
+        parameters.append(Parameter(type=tokens[position], name=tokens[position + 1].value))
+        position += 2
+    return parameters, position + 1, Error(ErrorType.NO_ERROR, '')
 
 
-def find_until(tokens: List[Token], until: TokensTypes) -> Tuple[List[Token], List[Token]]:
+def find_until(tokens: List[Token], until: TokensTypes, start: int, end: int) -> Tuple[int, int]:
     """
-    This function will get all tokens until a given type. The token that is search for will no be in the
-    found tokens or the left-over (basically omitted)
+    This function will find the first token of a given type between start and end. The token that is search for will
+    not be in the found tokens or the left-over (basically omitted)
     :param tokens: List[Token]; List in which must be searched
     :param until: TokensTypes; Type of token for which must be searched
-    :return: List[Token], List[Token]; List of tokens before and a list of tokens after the search-type
+    :param start: int; Position where the search starts
+    :param end: int; Position where the search ends
+    :return: int, int; End position of the tokens before and start position of the tokens after the search-type. When
+        the type is not found, both are end
     """
-    if len(tokens) > 0:
-        head, *tail = tokens
-        if head.type == until:
-            return [], tail
-        found, left_over = find_until(tail, until)
-        return [head, ] + found, left_over
-    return tokens, []
+    for index in range(start, end):
+        if tokens[index].type == until:
+            return index, index + 1
+    return end, end
 
 
-def find_end(tokens: List[Token], start_type: TokensTypes, end_type: TokensTypes, inner_start: int = 0, inner_end: int = 0) -> Tuple[List[Token], List[Token]]:
+def find_end(tokens: List[Token], start_type: TokensTypes, end_type: TokensTypes, start: int, end: int) -> Tuple[int, int]:
     """
     This function finds the body of a statement (for-loop, whileloop, etc)
-    The end-token will not be returned in the body or leftover tokens. This function
-    can handle nested statements
+    The end-token will not be in the body or leftover tokens. This function can handle nested statements
     :param tokens: List[Token]; Tokens in which must be searched
     :param start_type: TokensType; What is the start-type of the statement
     :param end_type: TokensType; What is the endtype of the statement
-    :param inner_start: int; How many times has the start-type been found
-    :param inner_end: int; How many times has the end-type been found
-    :return: List[Token], List[Token]; List of tokens inside the body and List of tokens that are after the body
-    """
-    if len(tokens) == 0:
-        return [], []
-    if len(tokens) == 1:
-        head = tokens[0]
-        tail = []
-    else:
-        head, *tail = tokens
-    if head.type == start_type:
-        body, left_over = find_end(tail, start_type, end_type, inner_start + 1, inner_end)
-        return [head, ] + body, left_over
-    if head.type == end_type:
-        if inner_start == inner_end:
-            return [], tail
-        body, left_over = find_end(tail, start_type, end_type, inner_start, inner_end + 1)
-        return [head, ] + body, left_over
-    body, left_over = find_end(tail, start_type, end_type, inner_start, inner_end)
-    return [head, ] + body, left_over
-
-
-def find_if_else_bodies(tokens: List[Token], inner_start: int = 0, inner_end: int = 0) -> Tuple[List[Token], List[Token]]:
-    """
-    This function slits a list of tokens that are part of an if-statement in the if-body and else-body
-    :param tokens: List[Token]; List of tokens that are part of the if-statement
-    :param inner_start: int; How many times is the if-token type found
-    :param inner_end: int; How many times is the endif-token type found
-    :return: List[Token], List[Token]; List of token for the if-body and a List of token for the else body
-    """
-    if len(tokens) == 0:
-        return [], []
-    head, *tail = tokens
-    if head.type == TokensTypes.IF:
-        if_body, else_body = find_if_else_bodies(tail, inner_start + 1, inner_end)
-        return [head, ] + if_body, else_body
-    if head.type == TokensTypes.ENDIF:
-        if_body, else_body = find_if_else_bodies(tail, inner_start, inner_end + 1)
-        return [head, ] + if_body, else_body
-    if head.type == TokensTypes.ELSE:
-        if inner_start == inner_end:
-            if tail[0].type == TokensTypes.ENDLINE:
-                tail = tail[1:]
-            return [], tail
-        if_body, else_body = find_if_else_bodies(tail, inner_start, inner_end)
-        return [head, ] + if_body, else_body
-    if_body, else_body = find_if_else_bodies(tail, inner_start, inner_end)
-    return [head, ] + if_body, else_body
-
+    :param start: int; Position of the first token of the body
+    :param end: int; Position where the search ends
+    :return: int, int; End position of the body and start position of the tokens after the body
+    """
+    if start_type == TokensTypes.WHILE:
+        return find_while_end(tokens, start, end)
+    inner_start = 0
+    inner_end = 0
+    for index in range(start, end):
+        token_type = tokens[index].type
+        if token_type == start_type:
+            inner_start += 1
+        elif token_type == end_type:
+            if inner_start == inner_end:
+                return index, index + 1
+            inner_end += 1
+    return end, end
+
+
+def find_while_end(tokens: List[Token], start: int, end: int) -> Tuple[int, int]:
+    """
+    This function finds the body of a while loop, like find_end. The while in the header of a for-loop is also counted
+    as the start of a nested while, unless the for-loop ends with its endfor first. So a for-loop inside a while-loop
+    parses, and a for-loop without endfor gives the same error as before
+    :param tokens: List[Token]; Tokens in which must be searched
+    :param start: int; Position of the first token of the body
+    :param end: int; Position where the search ends
+    :return: int, int; End position of the body and start position of the tokens after the body
+    """
+    # Started while-loops and for-loops that are not ended yet, the innermost last
+    started = []
+    for_header = False
+    for index in range(start, end):
+        token_type = tokens[index].type
+        if token_type == TokensTypes.FOR or token_type == TokensTypes.ENDLINE:
+            for_header = token_type == TokensTypes.FOR
+        elif token_type == TokensTypes.WHILE:
+            started.append(TokensTypes.FOR if for_header else TokensTypes.WHILE)
+        elif token_type == TokensTypes.ENDFOR:
+            if started and started[-1] == TokensTypes.FOR:
+                started.pop()
+        elif token_type == TokensTypes.ENDWHILE:
+            if not started:
+                return index, index + 1
+            started.pop()
+    return end, end
+
+
+def find_if_else_bodies(tokens: List[Token], start: int, end: int) -> Tuple[int, int]:
+    """
+    This function slits the tokens that are part of an if-statement in the if-body and else-body
+    :param tokens: List[Token]; List of tokens with the if-statement
+    :param start: int; Position of the first token of the if-body
+    :param end: int; End position of the if-statement
+    :return: int, int; End position of the if-body and start position of the else-body
+    """
+    inner_start = 0
+    inner_end = 0
+    for index in range(start, end):
+        token_type = tokens[index].type
+        if token_type == TokensTypes.IF:
+            inner_start += 1
+        elif token_type == TokensTypes.ENDIF:
+            inner_end += 1
+        elif token_type == TokensTypes.ELSE and inner_start == inner_end:
+            if index + 1 < end and tokens[index + 1].type == TokensTypes.ENDLINE:
+                return index, index + 2
+            return index, index + 1
+    return end, end
 
 
 def get_expression(tokens: List[Token]) -> Tuple[Union[Node, None], Error]:
@@ -165,13 +186,11 @@ def get_expression(tokens: List[Token]) -> Tuple[Union[Node, None], Error]:
             return None, Error(ErrorType.SYNTAX_ERROR, f'Expected function name at line {tokens[1].line_nmr} but got {tokens[1].value}')
 
     elif len(tokens) == 2:
-        # Two tokens can only be increment or decrement, or not-operation
+        # Two tokens can only be increment or decrement
         if tokens[0].type is TokensTypes.IDENTIFIER:
             if tokens[1].type is TokensTypes.INCDEC:
                 return IncDec(tokens[0], tokens[1]), Error(ErrorType.NO_ERROR, '')
             return None, Error(ErrorType.SYNTAX_ERROR, f'Invalid operater. Expected increment or decrement but got {tokens[1].value} at line {tokens[1].line_nmr}')
-        elif tokens[0].value is 'not':
-            pass
         return None, Error(ErrorType.SYNTAX_ERROR, f'Expected identifier at line {tokens[0].line_nmr} but got {tokens[0].value}')
 
     elif len(tokens) == 3:
@@ -244,275 +263,396 @@ def get_compare(tokens: List[Token]) -> Tuple[Union[Compare, None], Error]:
     return Compare(tokens[0], tokens[1], tokens[2]), Error(ErrorType.NO_ERROR, '')
 
 
-def parse_for_loop(tokens: List[Token]) -> Tuple[Optional[Node], List[Token], Error]:
+def parse_for_loop(tokens: List[Token], position: int, end: int) -> Tuple[Optional[Node], int, Error]:
     """
-    Parse tokens to a forloop-node and left-over tokens. When an error occures, the returned node and left-over tokens
-    will be None and an empty list.
-    :param tokens: List[Token]; Tokens that form a for loop with optional extra tokens after the forloop
-    :return: Forloop, List[Token], Error; Node with the forloop, left over token, error-object
+    Parse tokens to a forloop-node. When an error occures, the returned node will be None.
+    :param tokens: List[Token]; Tokens with a for loop at the given position
+    :param position: int; Position of the for-token
+    :param end: int; End position of the body the for loop is part of
+    :return: Forloop, int, Error; Node with the forloop, position after the forloop, error-object
     """
-    start, left_over = find_until(tokens[1:], TokensTypes.WHILE)
-    dowhile, left_over = find_until(left_over, TokensTypes.WITH)
-    with_tokens, left_over = find_until(left_over, TokensTypes.ENDLINE)
-    for_body, left_over = find_end(left_over, TokensTypes.FOR, TokensTypes.ENDFOR)
+    start_end, dowhile_start = find_until(tokens, TokensTypes.WHILE, position + 1, end)
+    dowhile_end, with_start = find_until(tokens, TokensTypes.WITH, dowhile_start, end)
+    with_end, body_start = find_until(tokens, TokensTypes.ENDLINE, with_start, end)
+    body_end, left_over = find_end(tokens, TokensTypes.FOR, TokensTypes.ENDFOR, body_start, end)
 
-    start_node, error = get_type_assignment(start)
+    start_node, error = get_type_assignment(tokens[position + 1:start_end])
     if start_node is None:
         return None, left_over, Error(ErrorType.STATEMENT_ERROR,
-                         f'For loop doesn\'t start with an assignment (type identifier is expression) at line {tokens[0].line_nmr}')
-    if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+                         f'For loop doesn\'t start with an assignment (type identifier is expression) at line {tokens[position].line_nmr}')
 
-    dowhile_node, error = get_compare(dowhile)
+    dowhile_node, error = get_compare(tokens[dowhile_start:dowhile_end])
     if dowhile_node is None:
         return None, left_over, Error(ErrorType.STATEMENT_ERROR,
-                         f'For loop doesn\'t have a valid compare (x compare y) at line {tokens[0].line_nmr}')
-    if error.type != ErrorType.NO_ERROR:
-        return None, left_over, error
+                         f'For loop doesn\'t have a valid compare (x compare y) at line {tokens[position].line_nmr}')
 
-    with_node, error = get_expression(with_tokens)
+    with_node, error = get_expression(tokens[with_start:with_end])
     if with_node is None:
         return None, left_over, Error(ErrorType.STATEMENT_ERROR,
-                         f'For loop doesn\'t have a valid itteration expression at line {tokens[0].line_nmr}')
-    if error.type != ErrorType.NO_ERROR:
-        return None, left_over, error
+                         f'For loop doesn\'t have a valid itteration expression at line {tokens[position].line_nmr}')
 
     for_node = Forloop(start_node, dowhile_node, with_node)
-    body_nodes, error = get_nodes(for_body)
+    body_nodes, error = get_nodes(tokens, body_start, body_end)
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
 
     for_node.body = body_nodes
     return for_node, left_over, Error(ErrorType.NO_ERROR, '')
 
 
-def parse_while_loop(tokens: List[Token]) -> Tuple[Optional[Node], List[Token], Error]:
+def parse_while_loop(tokens: List[Token], position: int, end: int) -> Tuple[Optional[Node], int, Error]:
     """
-    Parse tokens to a while-loop-node and left-over tokens. When an error occures, the returned node and left-over
-    tokens will be None and an empty list.
-    :param tokens: List[Token]; Tokens that form a while loop with optional extra tokens after the loop
-    :return: While, List[Token], Error; Node with the while loop, left over token, error-object
+    Parse tokens to a while-loop-node. When an error occures, the returned node will be None.
+    :param tokens: List[Token]; Tokens with a while loop at the given position
+    :param position: int; Position of the while-token
+    :param end: int; End position of the body the while loop is part of
+    :return: While, int, Error; Node with the while loop, position after the loop, error-object
     """
-    expression_tokens, left_over = find_until(tokens[1:], TokensTypes.ENDLINE)
-
-    body_tokens, left_over = find_end(left_over, TokensTypes.WHILE, TokensTypes.ENDWHILE)
+    expression_end, body_start = find_until(tokens, TokensTypes.ENDLINE, position + 1, end)
+    body_end, left_over = find_end(tokens, TokensTypes.WHILE, TokensTypes.ENDWHILE, body_start, end)
 
-    expression, error = get_expression(expression_tokens)
+    expression, error = get_expression(tokens[position + 1:expression_end])
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
 
-    body, error = get_nodes(body_tokens)
+    body, error = get_nodes(tokens, body_start, body_end)
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
 
     return While(expression, body), left_over, Error(ErrorType.NO_ERROR, '')
 
 
-def parse_if_statement(tokens: List[Token]) -> Tuple[Optional[Node], List[Token], Error]:
+def parse_if_statement(tokens: List[Token], position: int, end: int) -> Tuple[Optional[Node], int, Error]:
     """
-    Parse tokens to a if-node and left-over tokens. When an error occures, the returned node and left-over
-    tokens will be None and an empty list.
-    :param tokens: List[Token]; Tokens that form a if(-else) statement with optional extra tokens after the statement
-    :return: While, List[Token], Error; Node with the if/else statement, left over token, error-object
+    Parse tokens to a if-node. When an error occures, the returned node will be None.
+    :param tokens: List[Token]; Tokens with a if(-else) statement at the given position
+    :param position: int; Position of the if-token
+    :param end: int; End position of the body the if-statement is part of
+    :return: If, int, Error; Node with the if/else statement, position after the statement, error-object
     """
-    expression_tokens, left_over = find_until(tokens[1:], TokensTypes.ENDLINE)
-    if_else_body_tokens, left_over = find_end(left_over, TokensTypes.IF, TokensTypes.ENDIF)
+    expression_end, body_start = find_until(tokens, TokensTypes.ENDLINE, position + 1, end)
+    body_end, left_over = find_end(tokens, TokensTypes.IF, TokensTypes.ENDIF, body_start, end)
 
-    if_body, else_body = find_if_else_bodies(if_else_body_tokens)
+    if_body_end, else_body_start = find_if_else_bodies(tokens, body_start, body_end)
 
-    if len(if_body) == 0:
-        return None, [], Error(ErrorType.SYNTAX_ERROR, f'No if-body found for if-statement at line {tokens[0].line_nmr}')
+    if if_body_end == body_start:
+        return None, end, Error(ErrorType.SYNTAX_ERROR, f'No if-body found for if-statement at line {tokens[position].line_nmr}')
 
-    expression_node, error = get_compare(expression_tokens)
+    expression_node, error = get_compare(tokens[position + 1:expression_end])
 
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
 
     if_node = If(expression_node)
-    if_body_nodes, error = get_nodes(if_body)
+    if_body_nodes, error = get_nodes(tokens, body_start, if_body_end)
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
     if_node.body = if_body_nodes
 
-    else_body_nodes, error = get_nodes(else_body)
+    else_body_nodes, error = get_nodes(tokens, else_body_start, body_end)
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
     if_node.else_body = else_body_nodes
 
     return if_node, left_over, Error(ErrorType.NO_ERROR, '')
 
 
-def parse_call_statement(tokens: List[Token]) -> Tuple[Optional[Node], List[Token], Error]:
+def parse_call_statement(tokens: List[Token], position: int, end: int) -> Tuple[Optional[Node], int, Error]:
     """
     Parse tokens to an call statement. Everything from the call-token till line-end is considered a parameter.
-    Extra token after the end-line token will be returned as left-over
-    :param tokens: List[Token]; Tokens describing a function call with optional extra tokens
-    :return: Call, List[Token], Error; Call-node, left over tokens after the call, an error-object
-    """
-    if tokens[1].type == TokensTypes.IDENTIFIER:
-        parameter_tokens, left_over = find_until(tokens[2:], TokensTypes.ENDLINE)
+    :param tokens: List[Token]; Tokens with a function call at the given position
+    :param position: int; Position of the call-token
+    :param end: int; End position of the body the call is part of
+    :return: Call, int, Error; Call-node, position after the call, an error-object
+    """
+    if tokens[position + 1].type == TokensTypes.IDENTIFIER:
+        parameters_end, left_over = find_until(tokens, TokensTypes.ENDLINE, position + 2, end)
+        parameter_tokens = tokens[position + 2:parameters_end]
         parameter_error = check_parameters(parameter_tokens)
         if parameter_error.type != ErrorType.NO_ERROR:
-            return None, [], parameter_error
-        call = Call(tokens[1], parameter_tokens)
+            return None, end, parameter_error
+        call = Call(tokens[position + 1], parameter_tokens)
 
         return call, left_over, Error(ErrorType.NO_ERROR, '')
 
     else:
-        return None, [], Error(ErrorType.SYNTAX_ERROR,
-                         f'Expected function name at line {tokens[1].line_nmr} but got {tokens[1].value}')
+        return None, end, Error(ErrorType.SYNTAX_ERROR,
+                         f'Expected function name at line {tokens[position + 1].line_nmr} but got {tokens[position + 1].value}')
 
 
-def parse_type_assignment_statement(tokens: List[Token]) -> Tuple[Optional[Node], List[Token], Error]:
+def parse_type_assignment_statement(tokens: List[Token], position: int, end: int) -> Tuple[Optional[Node], int, Error]:
     """
-    Parse tokens to an call statement. Everything from the type-token till line-end is considered part of the
-    assignment. Extra tokens after the end-line token will be returned as left-over
-    :param tokens: List[Token]; Tokens describing a type-assignment
-    :return: TypeAssignment, List[Token], Error; Type-assignment-node, left over tokens, error-object
+    Parse tokens to an type assignment. Everything from the type-token till line-end is considered part of the
+    assignment.
+    :param tokens: List[Token]; Tokens with a type-assignment at the given position
+    :param position: int; Position of the type-token
+    :param end: int; End position of the body the assignment is part of
+    :return: TypeAssignment, int, Error; Type-assignment-node, position after the assignment, error-object
     """
-    statement_tokens, left_over = find_until(tokens, TokensTypes.ENDLINE)
+    statement_end, left_over = find_until(tokens, TokensTypes.ENDLINE, position, end)
 
-    statement, error = get_type_assignment(statement_tokens)
+    statement, error = get_type_assignment(tokens[position:statement_end])
     if error.type != ErrorType.NO_ERROR:
-        return None, [], error
+        return None, end, error
     return statement, left_over, Error(ErrorType.NO_ERROR, '')
 
 
-def parse_identifier(tokens: List[Token]) -> Tuple[Optional[Node], List[Token], Error]:
+def parse_identifier(tokens: List[Token], position: int, end: int) -> Tuple[Optional[Node], int, Error]:
     """
-    Parse a token list that starts with an identifier. This can indicate an assignment, unary expression, increment or
+    Parse tokens that starts with an identifier. This can indicate an assignment, unary expression, increment or
     decrement. This code will detect which option is correct and return a Node with the correct expression.
-    :param tokens: List[Token]; Token list with the expression and optional extra tokens
-    :return: Node, List[Token], Error; Node with correct expression, left-over tokens, error-object
+    :param tokens: List[Token]; Tokens with the expression at the given position
+    :param position: int; Position of the identifier
+    :param end: int; End position of the body the expression is part of
+    :return: Node, int, Error; Node with correct expression, position after the expression, error-object
     """
-    if tokens[1].type == TokensTypes.ASSIGNMENT:
-        expression_tokens, left_over = find_until(tokens[2:], TokensTypes.ENDLINE)
+    identifier = tokens[position]
+    operator = tokens[position + 1]
+    if operator.type == TokensTypes.ASSIGNMENT or operator.type == TokensTypes.UNARY:
+        expression_end, left_over = find_until(tokens, TokensTypes.ENDLINE, position + 2, end)
 
-        expression, error = get_expression(expression_tokens)
+        expression, error = get_expression(tokens[position + 2:expression_end])
         if error.type != ErrorType.NO_ERROR:
-            return None, [], error
-
-        node = Assignment(tokens[0], expression)
+            return None, end, error
 
-    elif tokens[1].type == TokensTypes.UNARY:
-        expression_tokens, left_over = find_until(tokens[2:], TokensTypes.ENDLINE)
-
-        expression, error = get_expression(expression_tokens)
-        if error.type != ErrorType.NO_ERROR:
-            return None, [], error
-
-        node = Unary(tokens[0], tokens[1], expression)
-    elif tokens[1].type == TokensTypes.INCDEC:
-        if tokens[2].type == TokensTypes.ENDLINE:
-            node = IncDec(tokens[0], tokens[1])
-            left_over = tokens[3:]
+        if operator.type == TokensTypes.ASSIGNMENT:
+            node = Assignment(identifier, expression)
         else:
-            return None, [], Error(ErrorType.STATEMENT_ERROR, f'Invalid statement at line {tokens[0].line_nmr}')
+            node = Unary(identifier, operator, expression)
+
+    elif operator.type == TokensTypes.INCDEC and tokens[position + 2].type == TokensTypes.ENDLINE:
+        node = IncDec(identifier, operator)
+        left_over = position + 3
     else:
-        return None, [], Error(ErrorType.STATEMENT_ERROR, f'Invalid statement at line {tokens[0].line_nmr}')
+        return None, end, Error(ErrorType.STATEMENT_ERROR, f'Invalid statement at line {identifier.line_nmr}')
 
     return node, left_over, Error(ErrorType.NO_ERROR, '')
 
 
-def get_nodes(tokens: List[Token]) -> Tuple[List[Node], Error]:
+node_parse_functions = {
+    TokensTypes.FOR: parse_for_loop,
+    TokensTypes.WHILE: parse_while_loop,
+    TokensTypes.IF: parse_if_statement,
+    TokensTypes.CALL: parse_call_statement,
+    TokensTypes.TYPE: parse_type_assignment_statement,
+    TokensTypes.IDENTIFIER: parse_identifier
+}
+
+
+def get_nodes(tokens: List[Token], position: int, end: int) -> Tuple[List[Node], Error]:
     """
-    Parse a list of tokens to a list of nodes. If an error occurs, the node-list will be empty and the error
-    will be given through the error-object
+    Parse the tokens between position and end to a list of nodes. If an error occurs, the node-list will be empty and
+    the error will be given through the error-object
     :param tokens: List[Token]; tokens that need to be parsed
+    :param position: int; Position of the first token
+    :param end: int; Position after the last token
     :return: List[Node], Error; List with nodes, Error-object containing errors
     """
-    if len(tokens) <= 0:
-        return [], Error(ErrorType.NO_ERROR, '')
-
-    node_parse_functions = {
-        TokensTypes.FOR: parse_for_loop,
-        TokensTypes.WHILE: parse_while_loop,
-        TokensTypes.IF: parse_if_statement,
-        TokensTypes.CALL: parse_call_statement,
-        TokensTypes.TYPE: parse_type_assignment_statement,
-        TokensTypes.IDENTIFIER: parse_identifier
-    }
-
-    if tokens[0].type in node_parse_functions:
-        node, left_over, error = node_parse_functions[tokens[0].type](tokens)
+    nodes = []
+    while position < end:
+        if tokens[position].type not in node_parse_functions:
+            return [], Error(ErrorType.STATEMENT_ERROR, f'No valid statement could be formed at line {tokens[position].line_nmr}')
 
+        node, position, error = node_parse_functions[tokens[position].type](tokens, position, end)
         if error.type != ErrorType.NO_ERROR:
             return [], error
 
-        if len(left_over) > 0 and left_over[0].type == TokensTypes.ENDLINE:
-            left_over = left_over[1:]
+        if position < end and tokens[position].type == TokensTypes.ENDLINE:
+            position += 1
+        nodes.append(node)
+    return nodes, Error(ErrorType.NO_ERROR, '')
 
-        next_nodes, error = get_nodes(left_over)
-        if error.type != ErrorType.NO_ERROR:
-            return [], error
 
-        return [node, ] + next_nodes, Error(ErrorType.NO_ERROR, '')
-    else:
-        return [], Error(ErrorType.STATEMENT_ERROR, f'No valid statement could be formed at line {tokens[0].line_nmr}')
-
-
-def find_function_definition(tokens: List[Token]) -> Tuple[Union[FunctionNode, None], List[Token], Error]:
+def find_function_definition(tokens: List[Token], position: int, end: int) -> Tuple[Union[FunctionNode, None], int, Error]:
     """
     Find and parse a function definition from a list of tokens. The list of tokens may contain multiple functions.
-    If an error occurs, the FunctionNode will be None and the left-over token list might be empty
+    If an error occurs, the FunctionNode will be None
     :param tokens: List[Token]; list of tokens containing one or more function descriptions
-    :return: FunctionNode, List[Token], Error; FunctionNode that can be called, left-over tokens, Error-object
-    """
-    if tokens[0].type == TokensTypes.TYPE:
-        if tokens[2].type == TokensTypes.IDENTIFIER:
-            parameter_list, tokens_after_parameters, error = get_parameter_list(tokens[3:])
-            if error.type == ErrorType.NO_ERROR:
-                body_tokens, left_over = find_until(tokens_after_parameters, TokensTypes.RETURN)
-                if len(left_over) == 0:
-                    return None, [], Error(ErrorType.SYNTAX_ERROR, f'No return found in function {tokens[2].value}')
-                body_nodes, error = get_nodes(body_tokens)
-                if error.type != ErrorType.NO_ERROR:
-                    return None, [], error
-
-                return_tokens, left_over = find_until(left_over, TokensTypes.ENDLINE)
-
-                expression, error = get_expression(return_tokens)
-                if error.type != ErrorType.NO_ERROR:
-                    return None, [], error
-
-                function_node = FunctionNode(tokens[2].value, tokens[0])
-                function_node.return_line = return_tokens[0].line_nmr
-                function_node.return_statement = expression
-                function_node.body = body_nodes
-                function_node.parameters = parameter_list
-
-                return function_node, left_over, Error(ErrorType.NO_ERROR, '')
-
-            else:
-                return None, tokens_after_parameters, error
-        else:
-            return None, tokens, Error(ErrorType.INVALID_NAME_ERROR, f'Name \'{tokens[2].value}\' at line {str(tokens[3].line_nmr)} is not a valid name')
-    else:
-        return None, tokens, Error(ErrorType.UNKNOW_TYPE_ERROR, f'Type \'{tokens[0].value}\' at line {str(tokens[0].line_nmr)} is not valid')
+    :param position: int; Position of the return type of the function
+    :param end: int; Position after the last token
+    :return: FunctionNode, int, Error; FunctionNode that can be called, position after the function, Error-object
+    """
+    return_type = tokens[position]
+    if return_type.type != TokensTypes.TYPE:
+        return None, position, Error(ErrorType.UNKNOW_TYPE_ERROR, f'Type \'{return_type.value}\' at line {str(return_type.line_nmr)} is not valid')
+    name = tokens[position + 2]
+    if name.type != TokensTypes.IDENTIFIER:
+        return None, position, Error(ErrorType.INVALID_NAME_ERROR, f'Name \'{name.value}\' at line {str(tokens[position + 3].line_nmr)} is not a valid name')
+
+    parameter_list, body_start, error = get_parameter_list(tokens, position + 3)
+    if error.type != ErrorType.NO_ERROR:
+        return None, body_start, error
+
+    body_end, return_start = find_until(tokens, TokensTypes.RETURN, body_start, end)
+    if return_start >= end:
+        return None, end, Error(ErrorType.SYNTAX_ERROR, f'No return found in function {name.value}')
+    body_nodes, error = get_nodes(tokens, body_start, body_end)
+    if error.type != ErrorType.NO_ERROR:
+        return None, end, error
+
+    return_end, left_over = find_until(tokens, TokensTypes.ENDLINE, return_start, end)
+    return_tokens = tokens[return_start:return_end]
+
+    expression, error = get_expression(return_tokens)
+    if error.type != ErrorType.NO_ERROR:
+        return None, end, error
+
+    function_node = FunctionNode(name.value, return_type)
+    function_node.return_line = return_tokens[0].line_nmr
+    function_node.return_statement = expression
+    function_node.body = body_nodes
+    function_node.parameters = parameter_list
+
+    return function_node, left_over, Error(ErrorType.NO_ERROR, '')
+
+
+def find_imports(tokens: List[Token]) -> Tuple[List[Token], int, Error]:
+    """
+    Find the import statements at the start of a program, an import statement has the form: import name. The modules
+    are loaded by interpreter.modules
+    :param tokens: List[Token]; tokens of the program
+    :return: List[Token], int, Error; name tokens of the imported modules, position after the imports, Error-object
+    """
+    imports = []
+    position = 0
+    while position < len(tokens) and tokens[position].type == TokensTypes.IMPORT:
+        if position + 2 >= len(tokens) or tokens[position + 1].type != TokensTypes.IDENTIFIER or tokens[position + 2].type != TokensTypes.ENDLINE:
+            return imports, position, Error(ErrorType.SYNTAX_ERROR, f'Invalid import at line {tokens[position].line_nmr}, expected: import name')
+        imports.append(tokens[position + 1])
+        position += 3
+    return imports, position, Error(ErrorType.NO_ERROR, '')
 
 
 @status_logger('Start parsing program')
 def parse(tokens: List[Token]) -> Tuple[Dict[str, FunctionNode], Error]:
     """
-    This parses a list of tokens to a dictionary of FunctionNodes indexed by the function names.
+    This parses a list of tokens to a dictionary of FunctionNodes indexed by the function names. The import statements
+    at the start are checked and skipped, the imported functions are added by interpreter.modules
     :param tokens: List[Tokens]; A list of tokens that describe one or more functions that can be called
     :return: Dict[str, FunctionNode], Error; Dictionary with function-name as key and FunctionNode as value, Error-object
     """
     result = dict()
+    _, position, error = find_imports(tokens)
+    if error.type != ErrorType.NO_ERROR:
+        return result, error
+    end = len(tokens)
 
-    while len(tokens) > 1:
-        if tokens[1].type != TokensTypes.FUNCTION:
-            return result, Error(ErrorType.SYNTAX_ERROR, f'No valid function definition at line {tokens[1].line_nmr}')
+    while end - position > 1:
+        if tokens[position + 1].type != TokensTypes.FUNCTION:
+            return result, Error(ErrorType.SYNTAX_ERROR, f'No valid function definition at line {tokens[position + 1].line_nmr}')
 
-        function_node, left_over, error = find_function_definition(tokens)
+        function_node, position, error = find_function_definition(tokens, position, end)
         if error.type != ErrorType.NO_ERROR:
             return result, error
         result[function_node.name] = function_node
-        tokens = left_over
 
-    # Add build-in functionNodes
-    result['print'] = FunctionNode(name='print', return_type=Token(TokensTypes.INT, 'int', -1))
-    result['size'] = FunctionNode(name='size', return_type=Token(TokensTypes.INT, 'int', -1))
-    result['input'] = FunctionNode(name='input', return_type=Token(TokensTypes.STRING, 'string', -1))
+    add_builtins(result)
+    return result, Error(ErrorType.NO_ERROR, '')
+
 
-    return result, Error(ErrorType.NO_ERROR, '')
\ No newline at end of file
+def add_builtins(functions: Dict[str, FunctionNode]):
+    """
+    Add the FunctionNodes of the build-in functions to the functions of a program
+    :param functions: Dict[str, FunctionNode]; functions of the program
+    """
+    functions['print'] = FunctionNode(name='print', return_type=Token(TokensTypes.INT, 'int', -1))
+    functions['size'] = FunctionNode(name='size', return_type=Token(TokensTypes.INT, 'int', -1))
+    functions['input'] = FunctionNode(name='input', return_type=Token(TokensTypes.STRING, 'string', -1))
+
+
+def first_word(line: str) -> str:
+    """
+    Get the first word of a processed line in lower case, the lexer matches keywords in any case
+    :param line: str; line without leading whitespace
+    :return: str; first word of the line in lower case
+    """
+    return line.split(None, 1)[0].lower()
+
+
+@status_logger('Start indexing program')
+def index_functions(lines: Iterable[Tuple[str, int]]) -> Tuple[Dict[str, FunctionNode], Error]:
+    """
+    Find the functions of a program without parsing their bodies. Only the definition line of a function is lexed and
+    parsed, the lines of the body up to the return line are kept in the FunctionNode and parsed by parse_body when the
+    function is needed. Errors in a body are only found then, unless a definition line can't be lexed: then all lines
+    are lexed and every symbol that couldn't be lexed is reported, as decoder.lexer.lex_lines does
+    :param lines: Iterable[Tuple[str, int]]; processed lines with their line numbers, as given by the jcjlreader
+    :return: Dict[str, FunctionNode], Error; functions indexed by name with unparsed bodies, Error-object
+    """
+    result = dict()
+    function_node = None
+    # An iterator, so the lines after a lex error are lexed from where the loop stopped
+    lines = iter(lines)
+    for line, line_nmr in lines:
+        if function_node is not None:
+            function_node.source.append((line, line_nmr))
+            if first_word(line) == 'return':
+                result[function_node.name] = function_node
+                function_node = None
+            continue
+        if not result and first_word(line) == 'import':
+            # Imports are checked by interpreter.modules
+            continue
+
+        tokens, error = tokenize([(line, line_nmr)])
+        if error.type != ErrorType.NO_ERROR:
+            _, error = tokenize(chain(*(function.source for function in result.values()), [(line, line_nmr)], lines))
+            return result, error
+        if len(tokens) < 3 or tokens[1].type != TokensTypes.FUNCTION:
+            return result, Error(ErrorType.SYNTAX_ERROR, f'No valid function definition at line {line_nmr}')
+        if tokens[0].type != TokensTypes.TYPE:
+            return result, Error(ErrorType.UNKNOW_TYPE_ERROR, f'Type \'{tokens[0].value}\' at line {line_nmr} is not valid')
+        if tokens[2].type != TokensTypes.IDENTIFIER:
+            return result, Error(ErrorType.INVALID_NAME_ERROR, f'Name \'{tokens[2].value}\' at line {line_nmr} is not a valid name')
+        parameter_list, _, error = get_parameter_list(tokens, 3)
+        if error.type != ErrorType.NO_ERROR:
+            return result, error
+
+        function_node = FunctionNode(tokens[2].value, tokens[0])
+        function_node.parameters = parameter_list
+        function_node.source = []
+
+    if function_node is not None:
+        return result, Error(ErrorType.SYNTAX_ERROR, f'No return found in function {function_node.name}')
+    add_builtins(result)
+    return result, Error(ErrorType.NO_ERROR, '')
+
+
+def parse_body(function: FunctionNode) -> Error:
+    """
+    Parse the body and return statement of a function that was found by index_functions. The function keeps its
+    unparsed body when it has an error
+    :param function: FunctionNode; function to parse
+    :return: Error; Error-object
+    """
+    tokens, error = tokenize(function.source)
+    if error.type != ErrorType.NO_ERROR:
+        return error
+    body_end, return_start = find_until(tokens, TokensTypes.RETURN, 0, len(tokens))
+    body_nodes, error = get_nodes(tokens, 0, body_end)
+    if error.type != ErrorType.NO_ERROR:
+        return error
+    return_end, _ = find_until(tokens, TokensTypes.ENDLINE, return_start, len(tokens))
+    expression, error = get_expression(tokens[return_start:return_end])
+    if error.type != ErrorType.NO_ERROR:
+        return error
+
+    function.return_line = tokens[return_start].line_nmr
+    function.return_statement = expression
+    function.body = body_nodes
+    function.source = None
+    return error
+
+
+def parse_bodies(functions: Dict[str, FunctionNode]) -> Error:
+    """
+    Parse the bodies of all functions that were found by index_functions and aren't parsed yet
+    :param functions: Dict[str, FunctionNode]; functions of the program
+    :return: Error; first error in a body
+    """
+    for function in functions.values():
+        if function.source is not None:
+            error = parse_body(function)
+            if error.type != ErrorType.NO_ERROR:
+                return error
+    return Error(ErrorType.NO_ERROR, '')
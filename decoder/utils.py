@@ -1,6 +1,7 @@
-from typing import Callable, List, TypeVar, Optional, Any
+from typing import Callable, Iterator, List, TypeVar, Optional, Any
 from decoder.enums import ErrorType
 from functools import wraps
+from contextlib import contextmanager
 
 
 class Error():
@@ -54,6 +55,24 @@ def literal_identifier_function_looper(function_list: List[Callable[[A, B], Opti
     return result if result is not None else literal_identifier_function_looper(function_list[1:], a, b)
 
 
+# The messages of status_logger are only printed when this is True, see quiet_status
+log_status = True
+
+
+@contextmanager
+def quiet_status() -> Iterator[None]:
+    """
+    Don't print the messages of status_logger for the duration of a with-statement
+    """
+    global log_status
+    previous = log_status
+    log_status = False
+    try:
+        yield
+    finally:
+        log_status = previous
+
+
 def status_logger(message: str) -> Callable:
     """
     This decorator logs a message to the console when a function is called. Message is given as a parameter
@@ -69,12 +88,13 @@ def status_logger(message: str) -> Callable:
         @wraps(func)
         def inner_wrapper(*args, **kwargs) -> Any:
             """
-            This function prints the message before calling the function
+            This function prints the message before calling the function, unless status messages are turned off
             :param args: given arguments
             :param kwargs: given keyword arguments
             :return: result of the decorated function
             """
-            print(message)
+            if log_status:
+                print(message)
             return func(*args, **kwargs)
         return inner_wrapper
     return outer_wrapper
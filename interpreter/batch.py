@@ -0,0 +1,221 @@
+import os
+import sys
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from decoder.nodes import FunctionNode
+from decoder.utils import Error
+from decoder.enums import ErrorType
+from interpreter.interpreter import parse_arguments, split_options
+from interpreter.program import Program, parse_file
+from interpreter.console import CaptureOutput, BufferedInput, unlimited_digits
+
+# Batch mode runs one function of a program for many rows of arguments. The program is parsed once and given to every
+# worker process, the rows are sent to the workers in chunks. The results are written as JSONL in the order of the rows,
+# while later chunks are still running, with the text printed while running each row.
+
+DEFAULT_CHUNK_SIZE = 256
+
+# The program of this (worker) process, set by start_worker
+worker_program: Optional[Program] = None
+
+
+def start_worker(functions: Dict[str, FunctionNode], backend: str):
+    """
+    Prepare the parsed program in a worker process
+    :param functions: Dict[str, FunctionNode]; parsed functions of the program
+    :param backend: str; execute, compile or vm
+    """
+    global worker_program
+    worker_program = Program(functions, backend)
+
+
+def run_row(name: str, arguments: Union[List[Union[int, str, bool]], Error]) -> Dict[str, Any]:
+    """
+    Run the function for one row of arguments with the program of this process. The input function has no lines to
+    read in batch mode and gives an error. Every row gets a result, also a row that couldn't be read and a row of which
+    the run raises an exception, so the other rows still run
+    :param name: str; name of the function
+    :param arguments: List | Error; arguments of the row, strings are parsed like command line arguments, or the error of
+        a row that couldn't be read
+    :return: Dict[str, Any]; printed text, exit value and error of the row
+    """
+    if isinstance(arguments, Error):
+        return {'output': '', 'exit_value': None, 'error': str(arguments)}
+    output = CaptureOutput()
+    try:
+        with worker_program.console.using(output, BufferedInput([])):
+            value, error = worker_program.run(name, parse_arguments(arguments))
+    except Exception as exception:
+        # main.py would stop with a traceback
+        error = Error(ErrorType.RUNTIME_ERROR, f'The batch couldn\'t run the row: {exception!r}')
+    if error.type != ErrorType.NO_ERROR:
+        return {'output': output.getvalue(), 'exit_value': None, 'error': str(error)}
+    return {'output': output.getvalue(), 'exit_value': None if value is None else value[0], 'error': None}
+
+
+def run_chunk(name: str, rows: List[List[Union[int, str, bool]]]) -> List[Dict[str, Any]]:
+    """
+    Run the function for a chunk of rows
+    :param name: str; name of the function
+    :param rows: List[List]; arguments of every row
+    :return: List[Dict[str, Any]]; results of the rows, in the same order
+    """
+    return [run_row(name, arguments) for arguments in rows]
+
+
+def chunked(rows: Iterable[List[Union[int, str, bool]]], size: int) -> Iterator[List[List[Union[int, str, bool]]]]:
+    """
+    Group rows in chunks
+    :param rows: Iterable[List]; arguments of every row
+    :param size: int; maximum amount of rows in a chunk
+    :return: Iterator[List[List]]; chunks of rows
+    """
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(functions: Dict[str, FunctionNode], name: str, rows: Iterable[List[Union[int, str, bool]]], backend: str = 'execute', workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Run a function for every row of arguments. With more than one worker the chunks run in a process pool, a limited
+    amount of chunks ahead of the first chunk that hasn't been returned yet, so the rows don't have to fit in memory
+    :param functions: Dict[str, FunctionNode]; parsed functions of the program
+    :param name: str; name of the function
+    :param rows: Iterable[List]; arguments of every row
+    :param backend: str; execute, compile or vm
+    :param workers: int | None; amount of worker processes, by default the amount of processors. With 1 worker the rows
+        run in this process
+    :param chunk_size: int; amount of rows that are sent to a worker at once
+    :return: Iterator[Dict[str, Any]]; result of every row in the order of the rows, with the number of the row
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(rows, chunk_size)
+    number = 0
+    if workers == 1:
+        start_worker(functions, backend)
+        for chunk in chunks:
+            for result in run_chunk(name, chunk):
+                yield dict(row=number, **result)
+                number += 1
+        return
+
+    with ProcessPoolExecutor(workers, initializer=start_worker, initargs=(functions, backend)) as pool:
+        running = deque()
+        for chunk in chunks:
+            running.append(pool.submit(run_chunk, name, chunk))
+            if len(running) < 2 * workers:
+                continue
+            for result in running.popleft().result():
+                yield dict(row=number, **result)
+                number += 1
+        while running:
+            for result in running.popleft().result():
+                yield dict(row=number, **result)
+                number += 1
+
+
+def read_json_row(line: str, line_nmr: int) -> Union[List[Union[int, str, bool]], Error]:
+    """
+    Read a JSONL row, a JSON array of numbers, strings and booleans
+    :param line: str; line with the row
+    :param line_nmr: int; number of the line, for the error
+    :return: List | Error; arguments of the row, or the error of a line that isn't a valid row
+    """
+    try:
+        with unlimited_digits():
+            row = json.loads(line)
+    except ValueError as error:
+        return Error(ErrorType.SYNTAX_ERROR, f'Row at line {line_nmr} is not valid JSON: {error}')
+    if not isinstance(row, list) or not all(isinstance(argument, (int, str)) for argument in row):
+        return Error(ErrorType.SYNTAX_ERROR, f'Row at line {line_nmr} is not a JSON array of numbers, strings and booleans')
+    return row
+
+
+def read_rows(source: TextIO, format: str) -> Iterator[Union[List[Union[int, str, bool]], Error]]:
+    """
+    Read rows of arguments. A CSV row has an argument in every column, a JSONL row is a JSON array of arguments
+    :param source: TextIO; file with the rows
+    :param format: str; csv or jsonl
+    :return: Iterator[List | Error]; arguments of every row, empty lines are skipped. A JSONL line that isn't a valid row
+        gives an Error, which becomes the result of the row
+    """
+    if format == 'csv':
+        yield from (row for row in csv.reader(source) if row)
+    else:
+        yield from (read_json_row(line, line_nmr) for line_nmr, line in enumerate(source, 1) if line.strip())
+
+
+def count_option(options: Dict[str, Union[str, bool]], name: str, default: Optional[int]) -> Tuple[Optional[int], Error]:
+    """
+    Get an option with a positive amount, like --workers=4
+    :param options: Dict[str, str | bool]; options of the command line
+    :param name: str; name of the option
+    :param default: int | None; value when the option isn't given with a value
+    :return: int | None, Error; value of the option, Error-object
+    """
+    if not isinstance(options.get(name), str):
+        return default, Error(ErrorType.NO_ERROR, '')
+    try:
+        value = int(options[name])
+    except ValueError:
+        value = 0
+    if value < 1:
+        return None, Error(ErrorType.SYNTAX_ERROR, f'--{name} takes a positive integer, not {options[name]}')
+    return value, Error(ErrorType.NO_ERROR, '')
+
+
+def batch(arguments: List[str]) -> int:
+    """
+    Run a function of a program for every row of a CSV or JSONL file, or of stdin, and write the results as JSONL
+    :param arguments: List[str]; file and function name and optionally the file with rows, with the options --workers=n,
+        --chunk=n, --format=csv|jsonl, --output=file, --compile and --vm
+    :return: int; exit code: 0 when every row ran without errors, 5 when a row gave an error, like main.py for the rest
+    """
+    options, arguments = split_options(arguments)
+    if len(arguments) < 2:
+        print('At least file and function name are required, but not given')
+        return 2
+    backend = 'compile' if options.get('compile') else 'vm' if options.get('vm') else 'execute'
+    workers, error = count_option(options, 'workers', None)
+    if error.type == ErrorType.NO_ERROR:
+        chunk_size, error = count_option(options, 'chunk', DEFAULT_CHUNK_SIZE)
+    if error.type != ErrorType.NO_ERROR:
+        print(error)
+        return 2
+    functions, error, exit_code = parse_file(arguments[0])
+    if functions is None:
+        print(error)
+        return exit_code
+    if arguments[1] not in functions:
+        print(Error(ErrorType.INVALID_NAME_ERROR, f'Program has no function {arguments[1]}'))
+        return 5
+
+    rows_file = arguments[2] if len(arguments) > 2 and arguments[2] != '-' else None
+    format = options.get('format') if isinstance(options.get('format'), str) else 'csv' if rows_file and rows_file.endswith('.csv') else 'jsonl'
+
+    source = open(rows_file, newline='') if rows_file else sys.stdin
+    output = open(options['output'], 'w') if isinstance(options.get('output'), str) else sys.stdout
+    failed = False
+    try:
+        for result in run_batch(functions, arguments[1], read_rows(source, format), backend, workers, chunk_size):
+            failed = failed or result['error'] is not None
+            with unlimited_digits():
+                output.write(json.dumps(result) + '\n')
+    finally:
+        if rows_file:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    return 5 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(batch(sys.argv[1:]))
@@ -0,0 +1,521 @@
+from array import array
+from decoder.parser import Node, Value, Operator, Call, Unary, IncDec, TypeAssignment, Assignment, Compare, Forloop, While, If, FunctionNode
+from decoder.lexer import Token
+from decoder.enums import TokensTypes, ErrorType
+from interpreter.compiler import builtins, compile_builtin
+from interpreter.execute import int_value
+from interpreter.console import Console
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Every instruction is four ints in the code array: the opcode and three operands. Operands are register indices or
+# jump targets (the index of an instruction). A register is a local variable, a constant or a temporary value.
+# Information that is only needed when an instruction fails (error messages, lines) is kept in the infos list, at the
+# index of the instruction.
+
+MOVE = 0            # r[a] = r[b]
+CHECK = 1           # fail with infos if r[a] is not declared
+JUMP = 2            # pc = a
+JUMP_IF_FALSE = 3   # if not r[a]: pc = b
+JUMP_IF_UNSET = 4   # if r[a] is not declared: pc = b
+OPERATOR = 5        # r[a] = r[b] <operator> r[c]
+COMPARE = 6         # r[a] = r[b] <compare> r[c]
+UNARY = 7           # r[a] = r[a] <unary> r[b]
+INCDEC = 8          # r[a] += b
+ASSIGN = 9          # r[a] = r[b], both must have the same type
+FOR_START = 10      # declare the forloop variable r[a] with r[b]
+WHILE_TEST = 11     # r[a] must be a bool or int; if not r[a]: pc = b
+CALL = 12           # r[a] = callees[b](arguments in infos)
+RETURN = 13         # return r[a]
+RAISE = 14          # fail with infos
+EVAL = 15           # r[a] = infos()
+
+# The operator of OPERATOR, COMPARE and UNARY instructions is stored in the upper bits of the opcode, so a single
+# instruction holds the destination, both operands and the operation
+OPERATION_SHIFT = 8
+
+operators = ['plus', 'min', 'mul', 'mod', 'and', 'or', 'xor', 'bic', 'lshift', 'rshift', 'div']
+compares = ['equals', 'notequals', 'lessthan', 'greaterthan', 'lessthanequals', 'greaterthanequals']
+unary_operators = ['plusis', 'minis', 'mulis', 'divis', 'modis', 'andis', 'oris', 'notis', 'xoris', 'bicis', 'lshiftis', 'rshiftis']
+
+
+class Unset:
+    """
+    Value of a register for a variable that is not yet declared
+    """
+    def __repr__(self):
+        """
+        Represent the unset value as a string
+        :return: str; representation
+        """
+        return '<unset>'
+
+
+UNSET = Unset()
+
+
+class CodeObject:
+    """
+    Bytecode of a single JCJL function
+    """
+    def __init__(self, name: str, return_type: str):
+        """
+        Initialize an empty code object
+        :param name: str; name of the function
+        :param return_type: str; type the function must return
+        """
+        self.name = name
+        self.return_type = return_type
+        self.code = array('l')
+        self.instructions: List[Tuple[int, int, int, int]] = []
+        self.infos: List[Any] = []
+        self.registers: List[Any] = []
+        self.slots: Dict[str, int] = dict()
+        self.parameters: List[Tuple[int, str, str]] = []
+        self.callees: List[Any] = []
+        self.callee_names: List[str] = []
+        self.return_start = 0
+        self.return_line = 0
+
+    def emit(self, opcode: int, a: int = 0, b: int = 0, c: int = 0, info: Any = None) -> int:
+        """
+        Add an instruction to the code
+        :param opcode: int; opcode of the instruction
+        :param a: int; first operand
+        :param b: int; second operand
+        :param c: int; third operand
+        :param info: Any; information that is used when the instruction fails
+        :return: int; index of the instruction
+        """
+        position = len(self.code) // 4
+        self.code.extend((opcode, a, b, c))
+        self.infos.append(info)
+        return position
+
+    def patch(self, position: int, operand: int, value: int):
+        """
+        Change an operand of an emitted instruction, used to fill in jump targets
+        :param position: int; index of the instruction
+        :param operand: int; which operand (1, 2 or 3) must be changed
+        :param value: int; new value of the operand
+        """
+        self.code[position * 4 + operand] = value
+
+    def here(self) -> int:
+        """
+        Get the index of the next instruction
+        :return: int; index of the instruction
+        """
+        return len(self.code) // 4
+
+    def decode(self):
+        """
+        Split the code array in tuples of one instruction, which is the form the virtual machine reads
+        """
+        self.instructions = [tuple(self.code[position:position + 4]) for position in range(0, len(self.code), 4)]
+
+    def __str__(self):
+        """
+        Represent the code object as a readable listing of the instructions
+        :return: str; listing of the code
+        """
+        names = {value: key for key, value in globals().items() if key.isupper() and isinstance(value, int) and key != 'OPERATION_SHIFT'}
+        lines = [f'{self.name} ({len(self.registers)} registers)']
+        for index, position in enumerate(range(0, len(self.code), 4)):
+            opcode, a, b, c = self.code[position:position + 4]
+            name = names.get(opcode & ((1 << OPERATION_SHIFT) - 1), str(opcode))
+            lines.append(f'{index:>5} {name:<14}{a:>4}{b:>4}{c:>4}')
+        return '\n'.join(lines)
+
+
+class FunctionCompiler:
+    """
+    Compiler of a single function node to a code object
+    """
+    def __init__(self, function: FunctionNode, functions: Dict[str, FunctionNode]):
+        """
+        Initialize the compiler for a function
+        :param function: FunctionNode; function to compile
+        :param functions: Dict[str, FunctionNode]; all functions of the program
+        """
+        self.function = function
+        self.functions = functions
+        self.code = CodeObject(function.name, function.return_type.value)
+        self.constants: Dict[Tuple[type, Any], int] = dict()
+        self.temporaries: List[int] = []
+        self.temporaries_used = 0
+        # Variables that are always declared at the current position of the code, these are not checked
+        self.declared = set()
+
+    def register(self, value: Any) -> int:
+        """
+        Add a register with an initial value
+        :param value: Any; initial value of the register
+        :return: int; register index
+        """
+        self.code.registers.append(value)
+        return len(self.code.registers) - 1
+
+    def slot(self, name: str) -> int:
+        """
+        Get the register of a local variable
+        :param name: str; name of the variable
+        :return: int; register index
+        """
+        if name not in self.code.slots:
+            self.code.slots[name] = self.register(UNSET)
+        return self.code.slots[name]
+
+    def constant(self, value: Any) -> int:
+        """
+        Get the register that holds a constant value
+        :param value: Any; constant value
+        :return: int; register index
+        """
+        key = (type(value), value)
+        if key not in self.constants:
+            self.constants[key] = self.register(value)
+        return self.constants[key]
+
+    def temporary(self) -> int:
+        """
+        Get a register for a temporary value. Temporary registers are reused by the next statement
+        :return: int; register index
+        """
+        if self.temporaries_used == len(self.temporaries):
+            self.temporaries.append(self.register(None))
+        self.temporaries_used += 1
+        return self.temporaries[self.temporaries_used - 1]
+
+    def check(self, name: str, type: ErrorType, message: str) -> int:
+        """
+        Get the register of a variable that is read, and emit a check that it is declared when that is not known yet
+        :param name: str; name of the variable
+        :param type: ErrorType; type of the error when the variable is not declared
+        :param message: str; message of the error when the variable is not declared
+        :return: int; register index
+        """
+        slot = self.slot(name)
+        if name not in self.declared:
+            self.code.emit(CHECK, slot, info=(type, message))
+        return slot
+
+    def nested_body(self, nodes: List[Node]):
+        """
+        Compile a body that might not be executed, variables declared in the body are not known to be declared after it
+        :param nodes: List[Node]; statements to compile
+        """
+        declared = set(self.declared)
+        self.body(nodes)
+        self.declared = declared
+
+    def fail(self, type: ErrorType, message: str):
+        """
+        Emit an instruction that always fails
+        :param type: ErrorType; type of the error
+        :param message: str; message of the error
+        """
+        self.code.emit(RAISE, info=(type, message))
+
+    def literal(self, token: Token) -> int:
+        """
+        Get the register of a literal that is used as a value
+        :param token: Token; literal token
+        :return: int; register index
+        """
+        if token.type == TokensTypes.BOOL:
+            return self.constant(token.value.lower() == 'true')
+        elif token.type == TokensTypes.STRING:
+            return self.constant(token.value)
+        try:
+            return self.constant(int(token.value, 0))
+        except ValueError:
+            # Keep the behaviour of the interpreter, which fails on the conversion every time it is executed
+            register = self.temporary()
+            text = token.value
+            self.code.emit(EVAL, register, info=lambda: int(text, 0))
+            return register
+
+    def value(self, token: Token, line: int) -> int:
+        """
+        Compile a value node
+        :param token: Token; token of the value node
+        :param line: int; line of the expression
+        :return: int; register that holds the value
+        """
+        if token.type == TokensTypes.IDENTIFIER:
+            return self.check(token.value, ErrorType.RUNTIME_ERROR, f'Variable {token.value} was not yet declared at line {token.line_nmr}')
+        if token.type in (TokensTypes.BOOL, TokensTypes.STRING, TokensTypes.INT):
+            return self.literal(token)
+        register = self.temporary()
+        self.code.emit(RAISE, info=(ErrorType.RUNTIME_ERROR, f'Literal couldn\'t be resolved. Gotten type: {token.type.value} with value {token.value}'))
+        return register
+
+    def operand(self, token: Token, check: bool = True) -> int:
+        """
+        Get the register of one side of an operator or compare node
+        :param token: Token; identifier or literal token
+        :param check: bool; emit a check that the variable is declared
+        :return: int; register index
+        """
+        if token.type == TokensTypes.IDENTIFIER:
+            if check:
+                return self.check(token.value, ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {token.value} was not declared in the scope at line {token.line_nmr}')
+            return self.slot(token.value)
+        if token.type == TokensTypes.INT:
+            return self.constant(int_value(token.value))
+        if token.type == TokensTypes.BOOL:
+            return self.constant(token.value.lower() == 'true')
+        return self.constant(token.value)
+
+    def call(self, node: Call, target: int) -> int:
+        """
+        Compile a call
+        :param node: Call; call node
+        :param target: int; register for the result, or -1 for a new temporary register
+        :return: int; register that holds the result
+        """
+        name = node.function.value
+        line = node.function.line_nmr
+        register = target if target >= 0 else self.temporary()
+        if name not in self.functions:
+            self.fail(ErrorType.RUNTIME_ERROR, f'Unknow function call to {name} at line {line}')
+            return register
+
+        arguments = []
+        for parameter in node.parameters:
+            if parameter.type == TokensTypes.IDENTIFIER:
+                arguments.append(self.slot(parameter.value))
+            else:
+                arguments.append(self.value(parameter, line))
+        if name not in self.code.callee_names:
+            self.code.callee_names.append(name)
+        self.code.emit(CALL, register, self.code.callee_names.index(name), info=(tuple(arguments), line))
+        return register
+
+    def expression(self, node: Node, line: int, target: int = -1) -> int:
+        """
+        Compile an expression node
+        :param node: Node; expression to compile
+        :param line: int; line of the expression
+        :param target: int; register for the result, or -1 for a new temporary register
+        :return: int; register that holds the result
+        """
+        if isinstance(node, Value):
+            return self.value(node.value, line)
+        elif isinstance(node, Operator):
+            left = self.operand(node.left)
+            right = self.operand(node.right)
+            register = target if target >= 0 else self.temporary()
+            operator = node.operator.value.lower()
+            operation = operators.index(operator) if operator in operators else len(operators)
+            self.code.emit(OPERATOR | (operation << OPERATION_SHIFT), register, left, right, info=(operator, node.operator.line_nmr, node.left.line_nmr))
+            return register
+        elif isinstance(node, Compare):
+            return self.compare(node, target, False)
+        elif isinstance(node, Call):
+            return self.call(node, target)
+        register = self.temporary()
+        self.fail(ErrorType.RUNTIME_ERROR, f'Tried to execute invalid expression node. Given node type: {node.__class__.__name__} at line { line }')
+        return register
+
+    def compare(self, node: Compare, target: int, soft: bool) -> int:
+        """
+        Compile a compare node
+        :param node: Compare; compare node
+        :param target: int; register for the result, or -1 for a new temporary register
+        :param soft: bool; a failing compare gives false instead of an error (used for if statements)
+        :return: int; register that holds the result
+        """
+        register = target if target >= 0 else self.temporary()
+        unset_jumps = []
+        for token in (node.left, node.right):
+            if soft and token.type == TokensTypes.IDENTIFIER and token.value not in self.declared:
+                unset_jumps.append(self.code.emit(JUMP_IF_UNSET, self.slot(token.value)))
+        left = self.operand(node.left, not soft)
+        right = self.operand(node.right, not soft)
+        operator = node.operator.value.lower()
+        operation = compares.index(operator) if operator in compares else len(compares)
+        self.code.emit(COMPARE | (operation << OPERATION_SHIFT), register, left, right, info=(node.operator.value, node.operator.line_nmr, node.left.line_nmr, soft))
+        if unset_jumps:
+            end = self.code.emit(JUMP)
+            for jump in unset_jumps:
+                self.code.patch(jump, 2, self.code.here())
+            self.code.emit(MOVE, register, self.constant(False))
+            self.code.patch(end, 1, self.code.here())
+        return register
+
+    def unary(self, node: Unary):
+        """
+        Compile a unary statement
+        :param node: Unary; unary node
+        """
+        if node.left.type != TokensTypes.IDENTIFIER:
+            self.fail(ErrorType.RUNTIME_ERROR, f'Unary expression needs a identifier at the left side, but got {node.left.type} at line {node.left.line_nmr}')
+            return
+        right = self.expression(node.right, node.left.line_nmr)
+        slot = self.check(node.left.value, ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {node.left.value} was not yet declared at line {node.left.line_nmr}')
+        operator = node.operator.value.lower()
+        operation = unary_operators.index(operator) if operator in unary_operators else len(unary_operators)
+        self.code.emit(UNARY | (operation << OPERATION_SHIFT), slot, right, info=(operator, node.operator.value, node.operator.line_nmr))
+
+    def incdec(self, node: IncDec):
+        """
+        Compile an increment or decrement statement
+        :param node: IncDec; incdec node
+        """
+        slot = self.check(node.left.value, ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {node.left.value} was not yet declared at line {node.left.line_nmr}')
+        step = 1 if node.operator.value.lower() == 'plusplus' else -1
+        self.code.emit(INCDEC, slot, step, info=node.left.line_nmr)
+
+    def forloop(self, node: Forloop):
+        """
+        Compile a forloop statement
+        :param node: Forloop; forloop node
+        """
+        assignment = node.start
+        start = self.expression(assignment.expression, assignment.type.line_nmr)
+        slot = self.slot(assignment.id.value)
+        self.code.emit(FOR_START, slot, start, info=(
+            assignment.type.value.lower(),
+            f'Variable {assignment.id} already exists and cannot be redefined at line {assignment.id.line_nmr}',
+            f'Mismatched type assignment. Variable {assignment.id} expected type {assignment.type.value} but the expression gave '
+        ))
+        self.declared.add(assignment.id.value)
+        declared = set(self.declared)
+        top = self.code.here()
+        self.temporaries_used = 0
+        condition = self.expression(node.dowhile, node.dowhile.left.line_nmr)
+        exit_jump = self.code.emit(JUMP_IF_FALSE, condition)
+        self.body(node.body)
+        self.temporaries_used = 0
+        if isinstance(node.inc, Unary):
+            self.unary(node.inc)
+        elif isinstance(node.inc, IncDec):
+            self.incdec(node.inc)
+        else:
+            self.fail(ErrorType.RUNTIME_ERROR, f'Invalid with operation in forloop at line {node.dowhile.left.line_nmr}, only unary operations, incrementing and decrementing is allowed')
+        self.declared = declared
+        self.code.emit(JUMP, top)
+        self.code.patch(exit_jump, 2, self.code.here())
+
+    def whileloop(self, node: While):
+        """
+        Compile a while loop statement
+        :param node: While; while node
+        """
+        if isinstance(node.dowhile, Compare):
+            line = node.dowhile.left.value
+        elif isinstance(node.dowhile, Value):
+            line = node.dowhile.value.line_nmr
+        elif isinstance(node.dowhile, Operator):
+            line = node.dowhile.left.line_nmr
+        elif isinstance(node.dowhile, Call):
+            line = node.dowhile.function.line_nmr
+        else:
+            self.fail(ErrorType.RUNTIME_ERROR, f'Invalid expression for while loop, line unknow')
+            return
+        top = self.code.here()
+        self.temporaries_used = 0
+        condition = self.expression(node.dowhile, line)
+        exit_jump = self.code.emit(WHILE_TEST, condition, info=line)
+        self.nested_body(node.body)
+        self.code.emit(JUMP, top)
+        self.code.patch(exit_jump, 2, self.code.here())
+
+    def if_statement(self, node: If):
+        """
+        Compile an if statement
+        :param node: If; if node
+        """
+        condition = self.compare(node.cmp, -1, True)
+        else_jump = self.code.emit(JUMP_IF_FALSE, condition)
+        self.nested_body(node.body)
+        if node.else_body:
+            end_jump = self.code.emit(JUMP)
+            self.code.patch(else_jump, 2, self.code.here())
+            self.nested_body(node.else_body)
+            self.code.patch(end_jump, 1, self.code.here())
+        else:
+            self.code.patch(else_jump, 2, self.code.here())
+
+    def statement(self, node: Node):
+        """
+        Compile a statement node
+        :param node: Node; statement to compile
+        """
+        self.temporaries_used = 0
+        if isinstance(node, TypeAssignment):
+            slot = self.slot(node.id.value)
+            value = self.expression(node.expression, node.type.line_nmr, slot)
+            if value != slot:
+                self.code.emit(MOVE, slot, value)
+            self.declared.add(node.id.value)
+        elif isinstance(node, Assignment):
+            slot = self.check(node.id.value, ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {node.id.value} was not yet declared at line {node.id.line_nmr}')
+            value = self.expression(node.expression, node.id.line_nmr)
+            self.code.emit(ASSIGN, slot, value, info=node.id.line_nmr)
+        elif isinstance(node, IncDec):
+            self.incdec(node)
+        elif isinstance(node, Unary):
+            self.unary(node)
+        elif isinstance(node, Call):
+            self.call(node, -1)
+        elif isinstance(node, Forloop):
+            self.forloop(node)
+        elif isinstance(node, While):
+            self.whileloop(node)
+        elif isinstance(node, If):
+            self.if_statement(node)
+        else:
+            self.fail(ErrorType.RUNTIME_ERROR, f'Couldn\'t execute node with type {node.__class__.__name__}; Node: {node}')
+
+    def body(self, nodes: List[Node]):
+        """
+        Compile a list of statements
+        :param nodes: List[Node]; statements to compile
+        """
+        for node in nodes:
+            self.statement(node)
+
+    def compile(self) -> CodeObject:
+        """
+        Compile the function
+        :return: CodeObject; bytecode of the function
+        """
+        for parameter in self.function.parameters:
+            self.code.parameters.append((self.slot(parameter.name), parameter.type.value.lower(), parameter.type.value))
+            self.declared.add(parameter.name)
+        self.body(self.function.body)
+
+        self.code.return_start = self.code.here()
+        self.code.return_line = self.function.return_line
+        self.temporaries_used = 0
+        if self.function.return_statement:
+            result = self.expression(self.function.return_statement, self.function.return_line)
+            self.code.emit(RETURN, result)
+        else:
+            self.fail(ErrorType.RUNTIME_ERROR, f'Expected return statement after function at line {self.function.return_line}')
+        return self.code
+
+
+def compile_program(functions: Dict[str, FunctionNode], program_console: Optional[Console] = None) -> Dict[str, Union[CodeObject, Callable]]:
+    """
+    Compile all functions of a program to bytecode. Build-in functions are given as python functions
+    :param functions: Dict[str, FunctionNode]; parsed functions, as given by decoder.parser.parse
+    :param program_console: Console | None; console of the build-in print and input functions, None for the current
+        output and input
+    :return: Dict[str, CodeObject | Callable]; bytecode of every function, indexed by function name
+    """
+    program = dict()
+    for name, function in functions.items():
+        if name in builtins:
+            program[name] = compile_builtin(function, program_console)
+        else:
+            program[name] = FunctionCompiler(function, functions).compile()
+
+    # Resolve the called functions, so a call does not need to look up the function by name
+    for code in program.values():
+        if isinstance(code, CodeObject):
+            code.callees = [program[name] for name in code.callee_names]
+            code.decode()
+    return program
@@ -0,0 +1,105 @@
+import os
+import sys
+import json
+import socket
+import tempfile
+from typing import Any, Dict, List, Optional
+from interpreter.options import split_options
+
+# Thin client of interpreter.daemon. Besides interpreter.options it only uses the standard library, so starting it costs
+# no more than starting python: the program is read, lexed and parsed by the daemon, which keeps it in memory for the next run.
+#
+# The protocol is line-delimited JSON. A request is one line with a JSON object, the daemon answers it with one line and
+# closes the connection. A run request has the fields program (path), function, arguments (command line strings), and optionally
+# backend and input (text read by the input function). The answer has the fields output (printed text), exit_value,
+# error (text of the error or null) and exit_code, which is the exit code main.py would give.
+
+SOCKET_NAME = 'jcjl.sock'
+
+
+def socket_directory() -> str:
+    """
+    Get the directory of the default socket, a directory that only the user can use: $XDG_RUNTIME_DIR, or jcjl-<uid> in
+    the temporary directory of the system, which the daemon creates
+    :return: str; path of the directory
+    """
+    runtime_directory = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_directory:
+        return runtime_directory
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(tempfile.gettempdir(), f'jcjl-{user}')
+
+
+def default_socket() -> str:
+    """
+    Get the path of the socket that the daemon and the client use without --socket
+    :return: str; path of the socket
+    """
+    return os.path.join(socket_directory(), SOCKET_NAME)
+
+
+def send_request(request: Dict[str, Any], path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Send a request to the daemon and wait for the answer. Every request has a connection of its own
+    :param request: Dict[str, Any]; request, see the protocol above
+    :param path: str | None; path of the socket of the daemon, None for the default socket
+    :return: Dict[str, Any]; answer of the daemon, an answer with an error when the daemon closed the connection without
+        a valid answer
+    """
+    if path is None:
+        path = default_socket()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps(request).encode() + b'\n')
+        with connection.makefile('rb') as answer:
+            line = answer.readline()
+    try:
+        return json.loads(line)
+    except ValueError:
+        reason = 'without an answer' if not line else f'with an invalid answer: {line[:100]!r}'
+        return {'output': '', 'exit_value': None, 'error': f'The JCJL daemon closed the connection {reason}', 'exit_code': 1}
+
+
+def run_request(program: str, function: str, arguments: List[str], backend: str = 'execute', input: str = '') -> Dict[str, Any]:
+    """
+    Create a request to run a function of a program
+    :param program: str; path of the program, made absolute because the daemon may run in another directory
+    :param function: str; name of the function
+    :param arguments: List[str]; parameters of the function as given on the command line
+    :param backend: str; execute, compile or vm
+    :param input: str; text that the input function reads
+    :return: Dict[str, Any]; run request
+    """
+    return {'program': os.path.abspath(program), 'function': function, 'arguments': arguments, 'backend': backend, 'input': input}
+
+
+def client(arguments: List[str]) -> int:
+    """
+    Run a function of a program in the daemon and print the output, like main.py does
+    :param arguments: List[str]; file, function name and parameters, with the options --socket=path, --compile or --vm
+    :return: int; exit code
+    """
+    options, arguments = split_options(arguments)
+    if len(arguments) < 2:
+        print('At least file and function name are required, but not given')
+        return 2
+    backend = 'compile' if options.get('compile') else 'vm' if options.get('vm') else 'execute'
+    path = options['socket'] if isinstance(options.get('socket'), str) else default_socket()
+    try:
+        answer = send_request(run_request(arguments[0], arguments[1], arguments[2:], backend), path)
+    except OSError as error:
+        print(f'Couldn\'t connect to the JCJL daemon at {path}: {error}')
+        return 1
+    print(answer['output'], end='')
+    if answer['error'] is not None:
+        print(answer['error'])
+    elif answer['exit_value'] is not None:
+        print(f'Program exit value: {answer["exit_value"]}')
+    return answer['exit_code']
+
+
+if __name__ == '__main__':
+    # The exit value of a JCJL program can have more digits than python converts by default
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+    sys.exit(client(sys.argv[1:]))
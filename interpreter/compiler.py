@@ -0,0 +1,721 @@
+from decoder.parser import Node, Value, Operator, Call, Unary, IncDec, TypeAssignment, Assignment, Compare, Forloop, While, If, FunctionNode
+from decoder.lexer import Token
+from decoder.enums import TokensTypes, ErrorType
+from decoder.utils import Error
+from interpreter.execute import int_function_map, int_unary_map, int_compare_map, int_value
+from interpreter import console
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# The compiler turns every node of a program into a python closure. Everything that only depends on the node (operator,
+# literal values, error messages) is resolved once while compiling. Compiled code signals errors by raising a
+# RuntimeFault, which is turned back into an Error-object by execute_compiled.
+
+Variables = Dict[str, Tuple[Union[int, str, bool], str]]
+Expression = Callable[[Variables], Tuple[Union[int, str, bool], str]]
+Statement = Callable[[Variables], None]
+CompiledFunction = Callable[[List[Union[int, str, bool]], int], Tuple[Union[int, str, bool], str]]
+
+token_types = {
+    'int': TokensTypes.INT,
+    'bool': TokensTypes.BOOL,
+    'string': TokensTypes.STRING,
+}
+
+literal_types = {
+    TokensTypes.INT: 'int',
+    TokensTypes.BOOL: 'bool',
+    TokensTypes.STRING: 'string',
+}
+
+# The int operations are the ones of the tree-walking interpreter (see interpreter.execute), so every backend calculates
+# the same way
+compare_operations = {
+    'equals': lambda left, right: left == right,
+    'notequals': lambda left, right: left != right,
+    **int_compare_map,
+}
+
+# Error message name of the compare operators that only work on ints
+compare_int_only_names = {
+    'lessthan': 'lessthan',
+    'greaterthan': 'greaterthan',
+    'lessthanequals': 'lessthanequals',
+    'greaterthanequals': 'greaterthan',
+}
+
+NOT_DECLARED = (0, 'int')
+
+
+class RuntimeFault(Exception):
+    """
+    Exception that carries an Error-object out of compiled code
+    """
+    def __init__(self, error: Error):
+        """
+        Initialize the fault with the error that occurred
+        :param error: Error; error that stopped the execution
+        """
+        super().__init__(error.message)
+        self.error = error
+
+
+def fail(type: ErrorType, message: str):
+    """
+    Stop the execution of compiled code with an error
+    :param type: ErrorType; type of the error
+    :param message: str; message of the error
+    """
+    raise RuntimeFault(Error(type, message))
+
+
+def compile_literal(token: Token) -> Expression:
+    """
+    Compile a literal or identifier token that is used as a value
+    :param token: Token; token of the value node
+    :return: Expression; function that returns the value and type
+    """
+    if token.type == TokensTypes.IDENTIFIER:
+        name = token.value
+        message = f'Variable {name} was not yet declared at line {token.line_nmr}'
+
+        def identifier(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+            if name in variables:
+                return variables[name]
+            fail(ErrorType.RUNTIME_ERROR, message)
+        return identifier
+    elif token.type == TokensTypes.BOOL:
+        result = (token.value.lower() == 'true', 'bool')
+    elif token.type == TokensTypes.STRING:
+        result = (token.value, 'string')
+    elif token.type == TokensTypes.INT:
+        try:
+            result = (int(token.value, 0), 'int')
+        except ValueError:
+            # Keep the behaviour of the interpreter, which fails on the conversion every time it is executed
+            text = token.value
+            return lambda variables: (int(text, 0), 'int')
+    else:
+        message = f'Literal couldn\'t be resolved. Gotten type: {token.type.value} with value {token.value}'
+        return lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+    return lambda variables: result
+
+
+def compile_operand(token: Token) -> Expression:
+    """
+    Compile one side of an operator or compare node. Identifiers are read from the variables, literals are converted
+    once. Int values are read as the tree-walking interpreter reads them from a token.
+    :param token: Token; identifier or literal token
+    :return: Expression; function that returns the value and type
+    """
+    if token.type == TokensTypes.IDENTIFIER:
+        name = token.value
+        message = f'Variable {name} was not declared in the scope at line {token.line_nmr}'
+
+        def identifier(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+            if name in variables:
+                value, value_type = variables[name]
+                if value_type == 'int' and type(value) is not int:
+                    return int_value(value), value_type
+                return value, value_type
+            fail(ErrorType.UNKNOW_VARIABLE_ERROR, message)
+        return identifier
+
+    if token.type == TokensTypes.INT:
+        result = (int_value(token.value), 'int')
+    elif token.type == TokensTypes.BOOL:
+        result = (token.value.lower() == 'true', 'bool')
+    else:
+        result = (token.value, literal_types.get(token.type, 'string'))
+    return lambda variables: result
+
+
+def compile_operator(node: Operator) -> Expression:
+    """
+    Compile an operator node
+    :param node: Operator; node to compile
+    :return: Expression; function that returns the value and type of the operation
+    """
+    left = compile_operand(node.left)
+    right = compile_operand(node.right)
+    operator = node.operator.value.lower()
+    operator_line = node.operator.line_nmr
+    line = node.left.line_nmr
+
+    string_message = f'At line {line} a operation between a string and not-string is not allowed'
+    int_message = f'At line {line} a operation between a int not-int is not allowed'
+    bool_message = f'At line {line} a operation between a bool and a not bool is not allowed'
+
+    def operation(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+        left_value, left_type = left(variables)
+        right_value, right_type = right(variables)
+        if left_type == 'string':
+            if right_type != 'string':
+                fail(ErrorType.RUNTIME_ERROR, string_message)
+            if operator == 'plus':
+                return left_value + right_value, 'string'
+            elif operator == 'equals':
+                return left_value == right_value, 'bool'
+            elif operator == 'notequals':
+                return left_value != right_value, 'bool'
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid operator found: {operator} at line {operator_line}')
+        if left_type == 'int':
+            if right_type != 'int':
+                fail(ErrorType.RUNTIME_ERROR, int_message)
+            if operator not in int_function_map:
+                fail(ErrorType.RUNTIME_ERROR, f'Invalid int operator found: {operator} at line {operator_line}')
+            if right_value == 0 and operator == 'div':
+                fail(ErrorType.RUNTIME_ERROR, f'Cannot divide by 0 at line {operator_line}')
+            function, result_type = int_function_map[operator]
+            return function(left_value, right_value), result_type
+        if left_type == 'bool':
+            if right_type != 'bool':
+                fail(ErrorType.RUNTIME_ERROR, bool_message)
+            if operator == 'equals':
+                return left_value == right_value, 'bool'
+            elif operator == 'notequals':
+                return left_value != right_value, 'bool'
+            elif operator == 'and':
+                return left_value and right_value, 'bool'
+            elif operator == 'or':
+                return left_value or right_value, 'bool'
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid bool operator found: {operator} at line {operator_line}')
+        return None
+
+    # Fast path for the common case of an int operation between int operands
+    if operator in int_function_map and operator != 'div':
+        function, result_type = int_function_map[operator]
+
+        def int_operation(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+            left_value, left_type = left(variables)
+            right_value, right_type = right(variables)
+            if left_type == 'int' and right_type == 'int':
+                return function(left_value, right_value), result_type
+            return operation(variables)
+        return int_operation
+    return operation
+
+
+def compile_compare(node: Compare) -> Expression:
+    """
+    Compile a compare node
+    :param node: Compare; node to compile
+    :return: Expression; function that returns the result of the comparison
+    """
+    left = compile_operand(node.left)
+    right = compile_operand(node.right)
+    operator = node.operator.value.lower()
+    operator_line = node.operator.line_nmr
+    line = node.left.line_nmr
+
+    if operator not in compare_operations:
+        message = f'Invalid compare operator ({node.operator.value}) found at line {operator_line}'
+
+        def invalid(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+            left_value, left_type = left(variables)
+            right_value, right_type = right(variables)
+            if left_type != right_type:
+                fail(ErrorType.RUNTIME_ERROR, f'Can\'t compare between different types (left: {token_types[left_type]}, right: {token_types[right_type]}) at line {operator_line}')
+            fail(ErrorType.RUNTIME_ERROR, message)
+        return invalid
+
+    function = compare_operations[operator]
+    int_only = operator in compare_int_only_names
+    name = compare_int_only_names.get(operator, operator)
+
+    def compare(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+        left_value, left_type = left(variables)
+        right_value, right_type = right(variables)
+        if left_type != right_type:
+            fail(ErrorType.RUNTIME_ERROR, f'Can\'t compare between different types (left: {token_types[left_type]}, right: {token_types[right_type]}) at line {operator_line}')
+        if int_only and left_type != 'int':
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid type ({token_types[left_type]}) found for {name} operation at line {line}')
+        return function(left_value, right_value), 'bool'
+    return compare
+
+
+def compile_parameters(parameters: List[Token]) -> Callable[[Variables], List[Union[int, str, bool]]]:
+    """
+    Compile the parameters of a call. Like the tree-walking interpreter, an undeclared variable is passed as 0
+    :param parameters: List[Token]; parameter tokens of a call node
+    :return: function that returns the list of parameter values
+    """
+    getters = []
+    for parameter in parameters:
+        if parameter.type == TokensTypes.IDENTIFIER:
+            getters.append((True, parameter.value))
+        else:
+            getters.append((False, compile_literal(parameter)))
+
+    if all(is_identifier for is_identifier, _ in getters):
+        names = [name for _, name in getters]
+        return lambda variables: [variables.get(name, NOT_DECLARED)[0] for name in names]
+
+    def values(variables: Variables) -> List[Union[int, str, bool]]:
+        return [variables.get(getter, NOT_DECLARED)[0] if is_identifier else getter(variables)[0] for is_identifier, getter in getters]
+    return values
+
+
+def compile_call(node: Call, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Expression:
+    """
+    Compile a call node. The called function is looked up in the compiled functions when the call is executed
+    :param node: Call; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Expression; function that calls the function and returns its value and type
+    """
+    name = node.function.value
+    line = node.function.line_nmr
+    if name not in functions:
+        message = f'Unknow function call to {name} at line {line}'
+        return lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+    parameters = compile_parameters(node.parameters)
+    return_type = functions[name].return_type.value
+
+    def call(variables: Variables) -> Tuple[Union[int, str, bool], str]:
+        return compiled[name](parameters(variables), line)[0], return_type
+    return call
+
+
+def compile_expression(node: Node, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction], line: int) -> Expression:
+    """
+    Compile an expression node
+    :param node: Node; expression to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :param line: int; On which line is the expression in the file
+    :return: Expression; function that returns the value and type of the expression
+    """
+    if isinstance(node, Value):
+        return compile_literal(node.value)
+    elif isinstance(node, Operator):
+        return compile_operator(node)
+    elif isinstance(node, Compare):
+        return compile_compare(node)
+    elif isinstance(node, Call):
+        return compile_call(node, functions, compiled)
+    message = f'Tried to execute invalid expression node. Given node type: {node.__class__.__name__} at line { line }'
+    return lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+
+def compile_unary(node: Unary, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile a unary statement
+    :param node: Unary; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that executes the unary operation
+    """
+    if node.left.type != TokensTypes.IDENTIFIER:
+        message = f'Unary expression needs a identifier at the left side, but got {node.left.type} at line {node.left.line_nmr}'
+        return lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+    right = compile_expression(node.right, functions, compiled, node.left.line_nmr)
+    name = node.left.value
+    operator = node.operator.value.lower()
+    operator_line = node.operator.line_nmr
+    undeclared = f'Variable {name} was not yet declared at line {node.left.line_nmr}'
+    int_function = int_unary_map.get(operator)
+
+    def unary(variables: Variables):
+        right_value, right_type = right(variables)
+        if name not in variables:
+            fail(ErrorType.UNKNOW_VARIABLE_ERROR, undeclared)
+        left_value, left_type = variables[name]
+        if left_type != right_type:
+            fail(ErrorType.RUNTIME_ERROR, f'Unary expression can only be done between the same type, but left is {left_type} and right is {right_type}')
+        if left_type == 'int':
+            if int_function is None:
+                fail(ErrorType.RUNTIME_ERROR, f'Invalid unary operator ({node.operator.value}) between tow ints on line {operator_line}')
+            variables[name] = (int_function(left_value, right_value), left_type)
+        elif left_type == 'string':
+            if operator != 'plusis':
+                fail(ErrorType.RUNTIME_ERROR, f'Invalid unary operator ({node.operator.value}) between two strings at line {operator_line}')
+            variables[name] = (left_value + right_value, left_type)
+        elif left_type == 'bool':
+            if operator == 'andis':
+                variables[name] = (left_value and right_value, left_type)
+            elif operator == 'oris':
+                variables[name] = (left_value or right_value, left_type)
+            else:
+                fail(ErrorType.RUNTIME_ERROR, f'Invalid unary operation ({node.operator.value}) on two bools at line {operator_line}')
+        else:
+            fail(ErrorType.RUNTIME_ERROR, f'Unvalid type found at line {node.left.line_nmr}: {left_type}')
+    return unary
+
+
+def compile_incdec(node: IncDec) -> Statement:
+    """
+    Compile an increment or decrement statement
+    :param node: IncDec; node to compile
+    :return: Statement; function that executes the increment or decrement
+    """
+    name = node.left.value
+    step = 1 if node.operator.value.lower() == 'plusplus' else -1
+    undeclared = f'Variable {name} was not yet declared at line {node.left.line_nmr}'
+
+    def incdec(variables: Variables):
+        if name not in variables:
+            fail(ErrorType.UNKNOW_VARIABLE_ERROR, undeclared)
+        value, value_type = variables[name]
+        if value_type != 'int':
+            fail(ErrorType.RUNTIME_ERROR, f'Variable of type {value_type} can not be incremented or decremented at line {node.left.line_nmr}')
+        variables[name] = (value + step, value_type)
+    return incdec
+
+
+def compile_type_assignment(node: TypeAssignment, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile a type assignment statement
+    :param node: TypeAssignment; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that declares the variable
+    """
+    expression = compile_expression(node.expression, functions, compiled, node.type.line_nmr)
+    name = node.id.value
+
+    def type_assignment(variables: Variables):
+        variables[name] = expression(variables)
+    return type_assignment
+
+
+def compile_assignment(node: Assignment, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile an assignment statement
+    :param node: Assignment; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that assigns the new value
+    """
+    expression = compile_expression(node.expression, functions, compiled, node.id.line_nmr)
+    name = node.id.value
+    line = node.id.line_nmr
+    undeclared = f'Variable {name} was not yet declared at line {line}'
+
+    def assignment(variables: Variables):
+        if name not in variables:
+            fail(ErrorType.UNKNOW_VARIABLE_ERROR, undeclared)
+        result = expression(variables)
+        if result[1] != variables[name][1]:
+            fail(ErrorType.RUNTIME_ERROR, f'Variable has type {variables[name][1]}, but expression gave {result[1]} at line {line}')
+        variables[name] = result
+    return assignment
+
+
+def compile_call_statement(node: Call, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile a call that is used as statement
+    :param node: Call; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that calls the function
+    """
+    name = node.function.value
+    line = node.function.line_nmr
+    if name not in functions:
+        message = f'Unknow function call to {name} at line {line}'
+        return lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+    parameters = compile_parameters(node.parameters)
+
+    def call(variables: Variables):
+        compiled[name](parameters(variables), line)
+    return call
+
+
+def compile_forloop(node: Forloop, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile a forloop statement
+    :param node: Forloop; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that executes the forloop
+    """
+    assignment = node.start
+    start = compile_expression(assignment.expression, functions, compiled, assignment.type.line_nmr)
+    name = assignment.id.value
+    start_type = assignment.type.value.lower()
+    redefined = f'Variable {assignment.id} already exists and cannot be redefined at line {assignment.id.line_nmr}'
+    dowhile = compile_expression(node.dowhile, functions, compiled, node.dowhile.left.line_nmr)
+    body = compile_body(node.body, functions, compiled)
+
+    if isinstance(node.inc, Unary):
+        inc = compile_unary(node.inc, functions, compiled)
+    elif isinstance(node.inc, IncDec):
+        inc = compile_incdec(node.inc)
+    else:
+        message = f'Invalid with operation in forloop at line {node.dowhile.left.line_nmr}, only unary operations, incrementing and decrementing is allowed'
+        inc = lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+    def forloop(variables: Variables):
+        value, value_type = start(variables)
+        if name in variables:
+            fail(ErrorType.RUNTIME_ERROR, redefined)
+        if value_type != start_type:
+            fail(ErrorType.RUNTIME_ERROR, f'Mismatched type assignment. Variable {assignment.id} expected type {assignment.type.value} but the expression gave {value_type}')
+        variables[name] = value, value_type
+        while dowhile(variables)[0]:
+            for statement in body:
+                statement(variables)
+            inc(variables)
+    return forloop
+
+
+def compile_while(node: While, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile a while loop statement
+    :param node: While; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that executes the while loop
+    """
+    if isinstance(node.dowhile, Compare):
+        line = node.dowhile.left.value
+    elif isinstance(node.dowhile, Value):
+        line = node.dowhile.value.line_nmr
+    elif isinstance(node.dowhile, Operator):
+        line = node.dowhile.left.line_nmr
+    elif isinstance(node.dowhile, Call):
+        line = node.dowhile.function.line_nmr
+    else:
+        return lambda variables: fail(ErrorType.RUNTIME_ERROR, f'Invalid expression for while loop, line unknow')
+
+    dowhile = compile_expression(node.dowhile, functions, compiled, line)
+    body = compile_body(node.body, functions, compiled)
+
+    def whileloop(variables: Variables):
+        while True:
+            still_true, still_true_type = dowhile(variables)
+            if still_true_type != 'bool' and still_true_type != 'int':
+                fail(ErrorType.RUNTIME_ERROR, f'While expression resulted in type "{still_true_type}" at line {line}. Valid types are only int and boool.')
+            if not still_true:
+                return
+            for statement in body:
+                statement(variables)
+    return whileloop
+
+
+def compile_if(node: If, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile an if statement. Like the tree-walking interpreter, a condition that fails is seen as false
+    :param node: If; node to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that executes the if statement
+    """
+    condition = compile_expression(node.cmp, functions, compiled, node.cmp.left.line_nmr)
+    body = compile_body(node.body, functions, compiled)
+    else_body = compile_body(node.else_body, functions, compiled)
+
+    def if_statement(variables: Variables):
+        try:
+            is_true = condition(variables)[0]
+        except RuntimeFault:
+            is_true = False
+        for statement in (body if is_true else else_body):
+            statement(variables)
+    return if_statement
+
+
+def compile_statement(node: Node, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> Statement:
+    """
+    Compile a single statement node
+    :param node: Node; statement to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: Statement; function that executes the statement
+    """
+    if isinstance(node, TypeAssignment):
+        return compile_type_assignment(node, functions, compiled)
+    elif isinstance(node, Assignment):
+        return compile_assignment(node, functions, compiled)
+    elif isinstance(node, IncDec):
+        return compile_incdec(node)
+    elif isinstance(node, Unary):
+        return compile_unary(node, functions, compiled)
+    elif isinstance(node, Call):
+        return compile_call_statement(node, functions, compiled)
+    elif isinstance(node, Forloop):
+        return compile_forloop(node, functions, compiled)
+    elif isinstance(node, While):
+        return compile_while(node, functions, compiled)
+    elif isinstance(node, If):
+        return compile_if(node, functions, compiled)
+    message = f'Couldn\'t execute node with type {node.__class__.__name__}; Node: {node}'
+    return lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+
+def compile_body(nodes: List[Node], functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction]) -> List[Statement]:
+    """
+    Compile a list of statement nodes
+    :param nodes: List[Node]; statements to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :return: List[Statement]; compiled statements
+    """
+    return [compile_statement(node, functions, compiled) for node in nodes]
+
+
+def builtin_print(parameters: List[Union[int, str, bool]], call_line: int, program_console: console.Console = console.current) -> Tuple[Union[int, str, bool], str]:
+    """
+    Compiled version of the print function
+    :param parameters: List; given parameters
+    :param call_line: int; line of the call
+    :param program_console: Console; console of the program, by default the current output and input
+    :return: int, str; 0 and its type
+    """
+    if len(parameters) != 1:
+        fail(ErrorType.PARAMETER_ERROR, f'Print function only takes 1 parameter, not {len(parameters)}')
+    program_console.print_value(parameters[0])
+    return 0, 'int'
+
+
+def builtin_size(parameters: List[Union[int, str, bool]], call_line: int) -> Tuple[Union[int, str, bool], str]:
+    """
+    Compiled version of the size function
+    :param parameters: List; given parameters
+    :param call_line: int; line of the call
+    :return: int, str; length of the string and its type
+    """
+    if len(parameters) != 1:
+        fail(ErrorType.PARAMETER_ERROR, f'Size function only takes 1 parameter, not {len(parameters)}')
+    if not isinstance(parameters[0], str):
+        fail(ErrorType.PARAMETER_ERROR, f'Size function only takes a string as parameter, not { "int" if isinstance(parameters[0], int) else "bool" }')
+    return len(parameters[0].strip('"')), 'int'
+
+
+def builtin_input(parameters: List[Union[int, str, bool]], call_line: int, program_console: console.Console = console.current) -> Tuple[Union[int, str, bool], str]:
+    """
+    Compiled version of the input function
+    :param parameters: List; given parameters
+    :param call_line: int; line of the call
+    :param program_console: Console; console of the program, by default the current output and input
+    :return: str, str; read string and its type
+    """
+    if len(parameters) != 1:
+        fail(ErrorType.PARAMETER_ERROR, f'Print function only takes 1 parameter, not {len(parameters)}')
+    try:
+        read_from_console = program_console.read_line(parameters[0].strip('"'))
+    except EOFError:
+        fail(ErrorType.RUNTIME_ERROR, f'No more input to read at line {call_line}')
+    return f'"{read_from_console}"', 'string'
+
+
+builtins = {
+    'print': builtin_print,
+    'size': builtin_size,
+    'input': builtin_input,
+}
+
+
+def compile_builtin(function: FunctionNode, program_console: Optional[console.Console] = None) -> CompiledFunction:
+    """
+    Get the compiled version of a build-in function. The print and input functions of a Program (see
+    interpreter.program) use the console of the program
+    :param function: FunctionNode; build-in function
+    :param program_console: Console | None; console of the program, None for the current output and input
+    :return: CompiledFunction; compiled function
+    """
+    builtin = builtins[function.name]
+    if program_console is None or builtin is builtin_size:
+        return builtin
+    return partial(builtin, program_console=program_console)
+
+
+def parameter_type(value: Union[int, str, bool]) -> str:
+    """
+    Get the JCJL type of a parameter value
+    :param value: int | str | bool; value of the parameter
+    :return: str; type of the value, or an empty string for an unknown type
+    """
+    if isinstance(value, bool):
+        return 'bool'
+    elif isinstance(value, int):
+        return 'int'
+    elif isinstance(value, str):
+        return 'string'
+    return ''
+
+
+def compile_function(function: FunctionNode, functions: Dict[str, FunctionNode], compiled: Dict[str, CompiledFunction], program_console: Optional[console.Console] = None) -> CompiledFunction:
+    """
+    Compile a function node to a python function that takes the parameter values and the line of the call
+    :param function: FunctionNode; function to compile
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param compiled: Dict[str, CompiledFunction]; All compiled functions of the program
+    :param program_console: Console | None; console of the build-in print and input functions, None for the current
+        output and input
+    :return: CompiledFunction; compiled function
+    """
+    if function.name in builtins:
+        return compile_builtin(function, program_console)
+
+    name = function.name
+    parameters = [(parameter.name, parameter.type.value.lower(), parameter.type.value) for parameter in function.parameters]
+    parameter_count = len(parameters)
+    body = compile_body(function.body, functions, compiled)
+    return_type = function.return_type.value
+    return_line = function.return_line
+    valid_return_type = return_type in token_types
+    if function.return_statement:
+        return_statement = compile_expression(function.return_statement, functions, compiled, function.return_line)
+    else:
+        message = f'Expected return statement after function at line {function.return_line}'
+        return_statement = lambda variables: fail(ErrorType.RUNTIME_ERROR, message)
+
+    def run(values: List[Union[int, str, bool]], call_line: int) -> Tuple[Union[int, str, bool], str]:
+        if len(values) != parameter_count:
+            fail(ErrorType.PARAMETER_ERROR, f'Function call with mis matched parameter amount at line {call_line}')
+
+        variables = dict()
+        for (parameter_name, expected_type, declared_type), value in zip(parameters, values):
+            given_type = parameter_type(value)
+            if expected_type != given_type:
+                fail(ErrorType.PARAMETER_ERROR, f'Parameter type mismatch in function call to {name} at line {call_line}. Expected {declared_type} but got {given_type}')
+            variables[parameter_name] = (value, given_type)
+
+        try:
+            for statement in body:
+                statement(variables)
+        except RuntimeFault as fault:
+            fault.error.message = f'Error while executing {name}. Function called at line: {call_line}\n' + fault.error.message
+            raise
+
+        result = return_statement(variables)
+        if result[1] != return_type:
+            fail(ErrorType.RUNTIME_ERROR, f'Function {name} called at line {call_line} did not return the defined type. Expected {return_type} but got {result[1]}')
+        if not valid_return_type:
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid return type ({return_type}) after function at line {return_line}')
+        return result
+    return run
+
+
+def compile_functions(functions: Dict[str, FunctionNode], program_console: Optional[console.Console] = None) -> Dict[str, CompiledFunction]:
+    """
+    Compile all function nodes of a program
+    :param functions: Dict[str, FunctionNode]; parsed functions, as given by decoder.parser.parse
+    :param program_console: Console | None; console of the build-in print and input functions, None for the current
+        output and input
+    :return: Dict[str, CompiledFunction]; compiled functions indexed by function name
+    """
+    compiled = dict()
+    for name, function in functions.items():
+        compiled[name] = compile_function(function, functions, compiled, program_console)
+    return compiled
+
+
+def execute_compiled(compiled: Dict[str, CompiledFunction], name: str, parameters: List[Union[int, str, bool]], call_line: int) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Error]:
+    """
+    Run a compiled function
+    :param compiled: Dict[str, CompiledFunction]; compiled functions, as given by compile_functions
+    :param name: str; name of the function to run
+    :param parameters: List; parameter values for the function
+    :param call_line: int; line from where the function is called
+    :return: Tuple[value, type] | None, Error; return value and type of the function, error object
+    """
+    try:
+        return compiled[name](parameters, call_line), Error(ErrorType.NO_ERROR, '')
+    except RuntimeFault as fault:
+        return None, fault.error
@@ -0,0 +1,339 @@
+import sys
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, TextIO, Union
+
+# The print and input functions of JCJL write to and read from the current output and input of this module, for every
+# backend. By default print writes every line to stdout at once and input reads from the console, as python's print
+# and input do. Other outputs and inputs can be set with using, see the --buffer, --output and --input options of
+# main.py. A Program (see interpreter.program) has a Console of its own, so programs that are embedded in the same
+# process don't share their output and input.
+
+# Buffer size of --buffer without a size, in characters
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+@contextmanager
+def unlimited_digits() -> Iterator[None]:
+    """
+    Lift the limit of python on converting integers of more than 4300 digits to and from strings for the duration of a
+    with-statement, JCJL integers have no size limit. The limit of the process is restored afterwards, so a program that
+    embeds the interpreter keeps its own limit
+    """
+    if not hasattr(sys, 'set_int_max_str_digits'):
+        yield
+        return
+    previous = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(previous)
+
+
+def value_text(value: Union[int, str, bool]) -> str:
+    """
+    Convert a value to text, also an integer of more digits than python converts by default
+    :param value: int | str | bool; value to convert
+    :return: str; text of the value
+    """
+    try:
+        return str(value)
+    except ValueError:
+        with unlimited_digits():
+            return str(value)
+
+
+@lru_cache(maxsize=1024)
+def string_text(value: str) -> str:
+    """
+    Get the text that print writes for a JCJL string: without quotes and with \\n as newline. The text of recently
+    printed strings is kept, so printing the same string in a loop doesn't process it every time
+    :param value: str; JCJL string, including its quotes
+    :return: str; printed text
+    """
+    return value.replace('\\n', '\n')[1:-1]
+
+
+def print_text(value: Union[int, str, bool]) -> str:
+    """
+    Get the line that print writes for a value
+    :param value: int | str | bool; printed value
+    :return: str; printed line, including the newline
+    """
+    if isinstance(value, str):
+        return string_text(value) + '\n'
+    return value_text(value) + '\n'
+
+
+class Output:
+    """
+    Base class of an output for the print function
+    """
+    def write(self, text: str):
+        """
+        Write text
+        :param text: str; text to write
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        Write all buffered text, done before input is read and when the output is no longer used
+        """
+
+    def close(self):
+        """
+        Flush the output and release its resources
+        """
+        self.flush()
+
+
+class ConsoleOutput(Output):
+    """
+    Output to stdout. With a buffer size, text is collected until the buffer is full (or until the output is flushed) and
+    written at once, which saves a write for every printed line
+    """
+    def __init__(self, buffer_size: int = 0):
+        """
+        Initialize the output
+        :param buffer_size: int; amount of characters that are buffered before they are written, 0 writes every line at once
+        """
+        self.buffer_size = buffer_size
+        self.buffer: List[str] = []
+        self.buffered = 0
+
+    def write(self, text: str):
+        """
+        Write text to stdout, or to the buffer
+        :param text: str; text to write
+        """
+        if self.buffer_size == 0:
+            sys.stdout.write(text)
+            return
+        self.buffer.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffer to stdout
+        """
+        if self.buffer:
+            sys.stdout.write(''.join(self.buffer))
+            self.buffer.clear()
+            self.buffered = 0
+        sys.stdout.flush()
+
+
+class CaptureOutput(Output):
+    """
+    Output that keeps the printed text in memory
+    """
+    def __init__(self):
+        """
+        Initialize an empty output
+        """
+        self.parts: List[str] = []
+
+    def write(self, text: str):
+        """
+        Keep text
+        :param text: str; text to write
+        """
+        self.parts.append(text)
+
+    def getvalue(self) -> str:
+        """
+        Get all printed text
+        :return: str; printed text
+        """
+        return ''.join(self.parts)
+
+
+class FileOutput(Output):
+    """
+    Output to a file, buffered by python
+    """
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        """
+        Open the file, an existing file is replaced
+        :param path: str; path of the file
+        :param buffer_size: int; size of the write buffer of the file in bytes
+        """
+        self.file = open(path, 'w', buffering=buffer_size)
+
+    def write(self, text: str):
+        """
+        Write text to the file
+        :param text: str; text to write
+        """
+        self.file.write(text)
+
+    def flush(self):
+        """
+        Write the buffer of the file
+        """
+        self.file.flush()
+
+    def close(self):
+        """
+        Close the file
+        """
+        self.file.close()
+
+
+class Input:
+    """
+    Base class of an input for the input function
+    """
+    def read_line(self, prompt: str, output: Output) -> str:
+        """
+        Read a line. Raises EOFError when there are no more lines
+        :param prompt: str; text that asks for the input
+        :param output: Output; output of the print function, the prompt comes after everything that was printed
+        :return: str; read line, without newline
+        """
+        raise NotImplementedError
+
+
+class ConsoleInput(Input):
+    """
+    Input from the console, one line at a time
+    """
+    def read_line(self, prompt: str, output: Output) -> str:
+        """
+        Show the prompt, after everything that was printed, and read a line
+        :param prompt: str; text that asks for the input
+        :param output: Output; output of the print function, flushed before the prompt is shown
+        :return: str; read line
+        """
+        output.flush()
+        return input(prompt)
+
+
+class BufferedInput(Input):
+    """
+    Input of which all lines are read in advance, from a file, stdin or a list of lines. The prompt is printed to the
+    output of the print function, as the console would show it
+    """
+    def __init__(self, lines: Union[TextIO, Iterable[str]]):
+        """
+        Read all lines
+        :param lines: TextIO | Iterable[str]; opened file or lines
+        """
+        if hasattr(lines, 'read'):
+            lines = lines.read().splitlines()
+        self.lines = deque(lines)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'BufferedInput':
+        """
+        Read all lines of a file, - reads stdin
+        :param path: str; path of the file
+        :return: BufferedInput; input with the lines of the file
+        """
+        if path == '-':
+            return cls(sys.stdin)
+        with open(path) as file:
+            return cls(file)
+
+    def read_line(self, prompt: str, output: Output) -> str:
+        """
+        Give the next line
+        :param prompt: str; text that asks for the input
+        :param output: Output; output of the print function, the prompt is written to it
+        :return: str; read line
+        """
+        output.write(prompt)
+        if not self.lines:
+            raise EOFError('No more input')
+        return self.lines.popleft()
+
+
+output: Output = ConsoleOutput()
+input_source: Input = ConsoleInput()
+
+
+class Console:
+    """
+    Output and input of the print and input functions of one program. An output or input that is None is the current
+    output or input of this module
+    """
+    __slots__ = ('output', 'input_source')
+
+    def __init__(self, output: Optional[Output] = None, input_source: Optional[Input] = None):
+        """
+        Initialize the console
+        :param output: Output | None; output for print, None for the current output
+        :param input_source: Input | None; input for input, None for the current input
+        """
+        self.output = output
+        self.input_source = input_source
+
+    def print_value(self, value: Union[int, str, bool]):
+        """
+        Print a value for the print function
+        :param value: int | str | bool; printed value
+        """
+        (output if self.output is None else self.output).write(print_text(value))
+
+    def read_line(self, prompt: str) -> str:
+        """
+        Read a line for the input function. Raises EOFError when there are no more lines
+        :param prompt: str; text that asks for the input
+        :return: str; read line
+        """
+        return (input_source if self.input_source is None else self.input_source).read_line(prompt, output if self.output is None else self.output)
+
+    def flush(self):
+        """
+        Flush the output of the console, when it has one of its own
+        """
+        if self.output is not None:
+            self.output.flush()
+
+    @contextmanager
+    def using(self, new_output: Optional[Output] = None, new_input: Optional[Input] = None) -> Iterator[None]:
+        """
+        Use another output and/or input for the duration of a with-statement, like the function using does for the
+        current output and input. The output is flushed at the end
+        :param new_output: Output | None; output for print, None keeps the output
+        :param new_input: Input | None; input for input, None keeps the input
+        """
+        previous = self.output, self.input_source
+        if new_output is not None:
+            self.output = new_output
+        if new_input is not None:
+            self.input_source = new_input
+        try:
+            yield
+        finally:
+            self.flush()
+            self.output, self.input_source = previous
+
+
+# Console of everything that isn't a Program, it always uses the current output and input
+current = Console()
+
+
+@contextmanager
+def using(new_output: Optional[Output] = None, new_input: Optional[Input] = None) -> Iterator[None]:
+    """
+    Use another output and/or input for the duration of a with-statement. The output is flushed at the end
+    :param new_output: Output | None; output for print, None keeps the current output
+    :param new_input: Input | None; input for input, None keeps the current input
+    """
+    global output, input_source
+    previous = output, input_source
+    if new_output is not None:
+        output = new_output
+    if new_input is not None:
+        input_source = new_input
+    try:
+        yield
+    finally:
+        output.flush()
+        output, input_source = previous
@@ -0,0 +1,204 @@
+import os
+import sys
+import json
+import stat
+import socket
+import socketserver
+from typing import Any, Dict, Optional, Tuple
+from decoder.utils import Error
+from decoder.enums import ErrorType
+from interpreter.interpreter import parse_arguments, split_options
+from interpreter.program import Program, BACKENDS, parse_file
+from interpreter.client import default_socket, socket_directory
+from interpreter.console import CaptureOutput, BufferedInput, unlimited_digits
+from interpreter.modules import module_files, file_version
+
+# The daemon keeps parsed programs in memory and runs them on request, so a batch job doesn't pay for starting the
+# interpreter and reading, lexing and parsing the program every time. Requests come in over a Unix domain socket, see
+# interpreter.client for the protocol. Requests are handled one at a time and a connection carries one request, so a
+# client that doesn't send its request only holds up the others until REQUEST_TIMEOUT. The output of a run is captured
+# in memory by the console of the program. The socket can only be used by the user that runs the daemon: it can run
+# programs and read files as that user.
+
+# Seconds that the daemon waits for the request of a connection
+REQUEST_TIMEOUT = 5.0
+
+# Loaded programs by path and backend, with the modification time and size of the file and of its imported modules
+# when it was loaded, and the files of the imported modules
+programs: Dict[Tuple[str, str], Tuple[Tuple[Optional[Tuple[int, int]], ...], Tuple[str, ...], Program]] = dict()
+
+
+def answer(output: str, value: Any, error: Error, exit_code: int) -> Dict[str, Any]:
+    """
+    Create the answer to a run request
+    :param output: str; text printed by the program
+    :param value: int | str | bool | None; exit value of the program
+    :param error: Error; error of the program
+    :param exit_code: int; exit code main.py would give
+    :return: Dict[str, Any]; answer, see interpreter.client
+    """
+    return {'output': output, 'exit_value': value, 'error': None if error.type == ErrorType.NO_ERROR else str(error), 'exit_code': exit_code}
+
+
+def load(path: str, backend: str) -> Tuple[Program, Error, int]:
+    """
+    Get a program from memory, or read it when it isn't loaded yet or when the file or a module it imports has changed
+    since it was loaded
+    :param path: str; path of the program
+    :param backend: str; execute, compile or vm
+    :return: Program | None, Error, int; loaded program, error object and exit code main.py would give for the error
+    """
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None, Error(ErrorType.FILE_NOT_FOUND_ERROR, f'Couldn\'t find file: {path}'), 3
+    version = (status.st_mtime_ns, status.st_size)
+    loaded = programs.get((path, backend))
+    if loaded is not None and loaded[0] == (version, *map(file_version, loaded[1])):
+        return loaded[2], Error(ErrorType.NO_ERROR, ''), 0
+
+    functions, error, exit_code = parse_file(path)
+    if functions is None:
+        return None, error, exit_code
+    program = Program(functions, backend)
+    files = module_files(functions)
+    programs[(path, backend)] = ((version, *map(file_version, files)), files, program)
+    return program, error, 0
+
+
+def run(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a function of a program for a run request
+    :param request: Dict[str, Any]; run request, see interpreter.client
+    :return: Dict[str, Any]; answer to the request
+    """
+    backend = request.get('backend', 'execute')
+    if backend not in BACKENDS:
+        return answer('', None, Error(ErrorType.SYNTAX_ERROR, f'Unknown backend {backend}'), 2)
+    program, error, exit_code = load(request['program'], backend)
+    if program is None:
+        return answer('', None, error, exit_code)
+
+    output = CaptureOutput()
+    with program.console.using(output, BufferedInput(request.get('input', '').splitlines())):
+        value, error = program.run(request['function'], parse_arguments(request.get('arguments', [])))
+    if error.type != ErrorType.NO_ERROR:
+        return answer(output.getvalue(), None, error, 5)
+    return answer(output.getvalue(), None if value is None else value[0], error, 0)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler of a connection to the daemon, the first line that is read is the request
+    """
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        """
+        Answer the request of a connection, the connection is closed after the answer
+        """
+        try:
+            line = self.rfile.readline()
+        except socket.timeout:
+            return
+        if line:
+            self.wfile.write(self.respond(line).encode() + b'\n')
+            self.wfile.flush()
+
+    def respond(self, line: bytes) -> str:
+        """
+        Answer a request. Every request gets an answer, also when running it raises an exception, so the connection is
+        never closed without one
+        :param line: bytes; line with the request
+        :return: str; answer as JSON
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('a request is a JSON object')
+        except ValueError as error:
+            return json.dumps(answer('', None, Error(ErrorType.SYNTAX_ERROR, f'Invalid request: {error!r}'), 2))
+        try:
+            if request.get('command') == 'stop':
+                self.server.stopped = True
+                return json.dumps({'stopped': True})
+            result = run(request)
+            with unlimited_digits():
+                return json.dumps(result)
+        except KeyError as error:
+            return json.dumps(answer('', None, Error(ErrorType.SYNTAX_ERROR, f'Invalid request: missing {error}'), 2))
+        except Exception as error:
+            # main.py would stop with a traceback and exit code 1
+            return json.dumps(answer('', None, Error(ErrorType.RUNTIME_ERROR, f'The daemon couldn\'t run the request: {error!r}'), 1))
+
+
+def private_directory(directory: str):
+    """
+    Create the directory of the default socket when it doesn't exist, and check that only the user can use it. Raises
+    PermissionError when others can use it
+    :param directory: str; path of the directory
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    status = os.lstat(directory)
+    if not stat.S_ISDIR(status.st_mode) or (hasattr(os, 'getuid') and status.st_uid != os.getuid()) or status.st_mode & 0o077:
+        raise PermissionError(f'{directory} is not a directory that only this user can use')
+
+
+def remove_stale_socket(path: str):
+    """
+    Remove the socket of a daemon that has stopped without removing it. Raises FileExistsError when the path is not a
+    socket or when a daemon is listening on it
+    :param path: str; path of the socket
+    """
+    try:
+        status = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(status.st_mode):
+        raise FileExistsError(f'{path} exists and is not a socket')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+    raise FileExistsError(f'A JCJL daemon is already listening on {path}')
+
+
+def serve(path: Optional[str] = None):
+    """
+    Serve run requests on a Unix domain socket until a stop request is received. Only the user can connect to the socket
+    :param path: str | None; path of the socket, None for the default socket in a directory of the user. The socket of a
+        stopped daemon at this path is removed
+    """
+    if path is None:
+        private_directory(socket_directory())
+        path = default_socket()
+    remove_stale_socket(path)
+    # Others can't use the socket from the moment it is created
+    umask = os.umask(0o077)
+    try:
+        server = socketserver.UnixStreamServer(path, RequestHandler)
+    finally:
+        os.umask(umask)
+    os.chmod(path, 0o600)
+    with server:
+        server.stopped = False
+        print(f'JCJL daemon listening on {path}', flush=True)
+        try:
+            while not server.stopped:
+                server.handle_request()
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    options, _ = split_options(sys.argv[1:])
+    try:
+        serve(options['socket'] if isinstance(options.get('socket'), str) else None)
+    except OSError as error:
+        print(f'Couldn\'t start the JCJL daemon: {error}')
+        sys.exit(1)
@@ -1,32 +1,11 @@
-from decoder.parser import Node, Value, Operator, Call, Unary, IncDec, TypeAssignment, Assignment, Compare, Forloop, While, If, FunctionNode
+from decoder.parser import Node, Value, Operator, Call, Unary, IncDec, TypeAssignment, Assignment, Compare, Forloop, While, If, FunctionNode, parse_body
 from decoder.lexer import Token
 from decoder.enums import TokensTypes, ErrorType
 from decoder.utils import Error
-from typing import List, Tuple, Optional, Union, Dict
-
-
-def get_identifier_as_literal_token(token: Token, variables: Dict[str, Tuple[Union[int, str, bool], str]]) -> Tuple[Optional[Token], Error]:
-    """
-    This function takes in an identifier token and a dictionary with all variables that are in scope and returns the
-    a literal token (int, bool, string) with the value that the variable contained with the same name as the identifier
-    token pointed to.
-    :param token: Token; identifier token
-    :param variables: Dict[]; dictionary containing variables. Key is variable name, value a tuple with the value and the type
-    :return: Token, Error; Token literal with the value, error object
-    """
-    if token.type == TokensTypes.IDENTIFIER:
-        if token.value in variables:
-            var = variables[token.value]
-            if var[1] == 'int':
-                return Token(TokensTypes.INT, str(var[0]), token.line_nmr), Error(ErrorType.NO_ERROR, '')
-            elif var[1] == 'bool':
-                return Token(TokensTypes.BOOL, str(var[0]), token.line_nmr), Error(ErrorType.NO_ERROR, '')
-            else:
-                return Token(TokensTypes.STRING, var[0], token.line_nmr), Error(ErrorType.NO_ERROR, '')
-        else:
-            return None, Error(ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {token.value} was not declared in the scope at line {token.line_nmr}')
-    else:
-        return None, Error(ErrorType.RUNTIME_ERROR, f'Expected IDENTIFIER, but got {token.type.value} at line {token.line_nmr}')
+from interpreter.memoize import call_key
+from interpreter.frame import Frame, new_frame
+from interpreter import console
+from typing import Any, List, NamedTuple, Tuple, Optional, Union, Dict
 
 
 def bool_token_to_bool(token: Token) -> bool:
@@ -54,86 +33,228 @@ def int_token_to_int(token: Token) -> int:
     return 0
 
 
-def execute_unary(variables: Dict[str, Tuple[Union[int, str, bool], str]], functions: Dict[str, FunctionNode], node: Unary) -> Tuple[Dict[str, Tuple[Union[int, str, bool], str]], Error]:
+# Operations between two ints, with the function and the type of the result. The tables and int_value below are also
+# used by interpreter.compiler, interpreter.bytecode and interpreter.vm, so every backend calculates the same way
+int_function_map = {
+    'plus': (lambda left, right: left + right, 'int'),
+    'min': (lambda left, right: left - right, 'int'),
+    'mul': (lambda left, right: left * right, 'int'),
+    'div': (lambda left, right: left / right, 'int'),
+    'mod': (lambda left, right: left % right, 'int'),
+    'and': (lambda left, right: left & right, 'int'),
+    'or': (lambda left, right: left | right, 'int'),
+    'xor': (lambda left, right: left ^ right, 'int'),
+    'bic': (lambda left, right: left & (~right), 'int'),
+    'lshift': (lambda left, right: left << right, 'int'),
+    'rshift': (lambda left, right: left >> right, 'int'),
+    'equals': (lambda left, right: left == right, 'bool'),
+    'lessthan': (lambda left, right: left < right, 'bool'),
+    'greaterthan': (lambda left, right: left > right, 'bool'),
+    'lessthanequals': (lambda left, right: left <= right, 'bool'),
+    'greaterthanequals': (lambda left, right: left >= right, 'bool'),
+    'notequals': (lambda left, right: left != right, 'bool')
+}
+
+# Unary operations on an int variable
+int_unary_map = {
+    'plusis': lambda left, right: left + right,
+    'minis': lambda left, right: left - right,
+    'mulis': lambda left, right: left * right,
+    'divis': lambda left, right: int(left / right),
+    'modis': lambda left, right: left % right,
+    'andis': lambda left, right: left & right,
+    'oris': lambda left, right: left | right,
+    'notis': lambda left, right: ~right,
+    'xoris': lambda left, right: left ^ right,
+    'bicis': lambda left, right: left & (~right),
+    'lshiftis': lambda left, right: left << right,
+    'rshiftis': lambda left, right: left >> right,
+}
+
+# Comparisons that can only be done between two ints
+int_compare_map = {
+    'lessthan': lambda left, right: left < right,
+    'greaterthan': lambda left, right: left > right,
+    'lessthanequals': lambda left, right: left <= right,
+    'greaterthanequals': lambda left, right: left >= right,
+}
+
+# Operations of nodes that passed interpreter.typecheck, indexed by the resolved type of the node and the operator
+verified_operations = {(result_type, operator): operation for operator, (operation, result_type) in int_function_map.items()}
+verified_operations.update({
+    ('string', 'plus'): lambda left, right: left + right,
+    ('bool', 'and'): lambda left, right: left and right,
+    ('bool', 'or'): lambda left, right: left or right,
+})
+
+verified_unary_operations = {('int', operator): operation for operator, operation in int_unary_map.items()}
+verified_unary_operations.update({
+    ('string', 'plusis'): lambda left, right: left + right,
+    ('bool', 'andis'): lambda left, right: left and right,
+    ('bool', 'oris'): lambda left, right: left or right,
+})
+
+# Token type of a literal of each JCJL type, used in error messages
+literal_token_types = {
+    'int': TokensTypes.INT,
+    'bool': TokensTypes.BOOL,
+    'string': TokensTypes.STRING,
+}
+
+
+def int_value(value: Union[int, float]) -> int:
+    """
+    This function gets the value of an int variable to calculate with. A value that is not a whole number (the result
+    of a div) is read as 0, like an int literal that is not valid
+    :param value: int | float; value of an int variable
+    :return: int; value to calculate with
+    """
+    if type(value) is int:
+        return value
+    try:
+        return int(str(value), 0)
+    except Exception:
+        return 0
+
+
+def get_operand(token: Token, frame: Frame) -> Tuple[Union[int, str, bool], str, Error]:
+    """
+    This function gets the value and type of one side of an operator or compare node. An identifier gives the value of
+    the variable with the same name, a literal gives its own value
+    :param token: Token; identifier or literal token
+    :param frame: Frame; variables of the function call
+    :return: int/str/bool, str, Error; value of the operand, type of the operand, error object
+    """
+    if token.type == TokensTypes.IDENTIFIER:
+        value = frame[token.slot]
+        if value is None:
+            return 0, 'int', Error(ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {token.value} was not declared in the scope at line {token.line_nmr}')
+        value_type = frame[token.slot + 1]
+        if value_type == 'int':
+            return int_value(value), 'int', Error(ErrorType.NO_ERROR, '')
+        elif value_type == 'bool':
+            return value, 'bool', Error(ErrorType.NO_ERROR, '')
+        return value, 'string', Error(ErrorType.NO_ERROR, '')
+    elif token.type == TokensTypes.INT:
+        return int_token_to_int(token), 'int', Error(ErrorType.NO_ERROR, '')
+    elif token.type == TokensTypes.BOOL:
+        return bool_token_to_bool(token), 'bool', Error(ErrorType.NO_ERROR, '')
+    return token.value, 'string', Error(ErrorType.NO_ERROR, '')
+
+
+def verified_operand(token: Token, frame: Frame) -> Union[int, str, bool]:
+    """
+    This function gets the value of one side of an operator or compare node that passed the type check, so the type of
+    the operand doesn't have to be checked
+    :param token: Token; identifier or literal token
+    :param frame: Frame; variables of the function call
+    :return: int/str/bool; value of the operand, None when the variable is not declared yet
+    """
+    if token.type == TokensTypes.IDENTIFIER:
+        value = frame[token.slot]
+        return int_value(value) if value.__class__ is float else value
+    elif token.type == TokensTypes.INT:
+        return int_token_to_int(token)
+    elif token.type == TokensTypes.BOOL:
+        return bool_token_to_bool(token)
+    return token.value
+
+
+def parameter_values(tokens: List[Token], frame: Frame) -> List[Union[int, str, bool]]:
+    """
+    This function gets the values of the parameters of a function call. A variable that is not declared gives 0
+    :param tokens: List[Token]; identifier and literal tokens given to the call
+    :param frame: Frame; variables of the function call
+    :return: List[int/str/bool]; values of the parameters
+    """
+    values = []
+    for token in tokens:
+        if token.type == TokensTypes.IDENTIFIER:
+            value = frame[token.slot]
+            values.append(0 if value is None else value)
+        elif token.type == TokensTypes.BOOL:
+            values.append(token.value.lower() == 'true')
+        elif token.type == TokensTypes.STRING:
+            values.append(token.value)
+        elif token.type == TokensTypes.INT:
+            values.append(int(token.value, 0))
+        else:
+            values.append(0)
+    return values
+
+
+def execute_unary(frame: Frame, functions: Dict[str, FunctionNode], node: Unary) -> Tuple[Frame, Error]:
     """
     Execute a Unary node by getting the value for the right side expression and applying this value to the left side
     given by the unary-operation
-    :param variables: Dict[str, Tuple(value, type)]; All variables that are in scope
+    :param frame: Frame; All variables that are in scope
     :param functions: Dict[str, FunctionNode]; All functions that can be called
     :param node: Unary; Node expressing a unary expression
-    :return: Dict, Error; Updated variable dictionary, error object containing any errors that might have happend
+    :return: Frame, Error; Updated frame, error object containing any errors that might have happend
     """
     if node.left.type != TokensTypes.IDENTIFIER:
-        return variables, Error(ErrorType.RUNTIME_ERROR,
+        return frame, Error(ErrorType.RUNTIME_ERROR,
                                 f'Unary expression needs a identifier at the left side, but got {node.left.type} at line {node.left.line_nmr}')
 
     # get right side expression
-    right_value, right_value_type, error = execute_expression(variables, functions, node.right, node.left.line_nmr)
+    right_value, right_value_type, error = execute_expression(frame, functions, node.right, node.left.line_nmr)
     if error.type != ErrorType.NO_ERROR:
-        return variables, error
+        return frame, error
 
-    if node.left.value not in variables:
-        return variables, Error(ErrorType.UNKNOW_VARIABLE_ERROR,
+    slot = node.left.slot
+    left_value, left_type = frame[slot], frame[slot + 1]
+    if left_value is None:
+        return frame, Error(ErrorType.UNKNOW_VARIABLE_ERROR,
                                 f'Variable {node.left.value} was not yet declared at line {node.left.line_nmr}')
 
-    left_value, left_type = variables[node.left.value]
+    if node.resolved_type is not None:
+        # The type check verified the types of both sides and the operator
+        left_value = verified_unary_operations[(left_type, node.operator.value.lower())](left_value, right_value)
+        frame[slot] = left_value
+        return frame, Error(ErrorType.NO_ERROR, '')
+
     if left_type != right_value_type:
-        return variables, Error(ErrorType.RUNTIME_ERROR,
+        return frame, Error(ErrorType.RUNTIME_ERROR,
                                 f'Unary expression can only be done between the same type, but left is {left_type} and right is {right_value_type}')
 
     if left_type == 'string':
         if node.operator.value.lower() != 'plusis':
-            return variables, Error(ErrorType.RUNTIME_ERROR,
+            return frame, Error(ErrorType.RUNTIME_ERROR,
                                     f'Invalid unary operator ({node.operator.value}) between two strings at line {node.operator.line_nmr}')
         left_value += right_value
-        variables[node.left.value] = (left_value, left_type)
-        return variables, Error(ErrorType.NO_ERROR, '')
+        frame[slot] = left_value
+        return frame, Error(ErrorType.NO_ERROR, '')
 
     elif left_type == 'int':
-        int_function_map = {
-            'plusis': lambda left, right: left + right,
-            'minis': lambda left, right: left - right,
-            'mulis': lambda left, right: left * right,
-            'divis': lambda left, right: int(left / right),
-            'modis': lambda left, right: left % right,
-            'andis': lambda left, right: left & right,
-            'oris': lambda left, right: left | right,
-            'notis': lambda left, right: ~right,
-            'xoris': lambda left, right: left ^ right,
-            'bicis': lambda left, right: left & (~right),
-            'lshiftis': lambda left, right: left << right,
-            'rshiftis': lambda left, right: left >> right,
-        }
-
-        if node.operator.value.lower() not in int_function_map:
-            return variables, Error(ErrorType.RUNTIME_ERROR,
+        if node.operator.value.lower() not in int_unary_map:
+            return frame, Error(ErrorType.RUNTIME_ERROR,
                                     f'Invalid unary operator ({node.operator.value}) between tow ints on line {node.operator.line_nmr}')
 
-        left_value = int_function_map[node.operator.value.lower()](left_value, right_value)
-        variables[node.left.value] = (left_value, left_type)
-        return variables, Error(ErrorType.NO_ERROR, '')
+        left_value = int_unary_map[node.operator.value.lower()](left_value, right_value)
+        frame[slot] = left_value
+        return frame, Error(ErrorType.NO_ERROR, '')
 
     elif left_type == 'bool':
         if node.operator.value.lower() == 'andis':
             left_value = left_value and right_value
-            variables[node.left.value] = (left_value, left_type)
-            return variables, Error(ErrorType.NO_ERROR, '')
+            frame[slot] = left_value
+            return frame, Error(ErrorType.NO_ERROR, '')
         elif node.operator.value.lower() == 'oris':
             left_value = left_value or right_value
-            variables[node.left.value] = (left_value, left_type)
-            return variables, Error(ErrorType.NO_ERROR, '')
+            frame[slot] = left_value
+            return frame, Error(ErrorType.NO_ERROR, '')
         else:
-            return variables, Error(ErrorType.RUNTIME_ERROR,
+            return frame, Error(ErrorType.RUNTIME_ERROR,
                                     f'Invalid unary operation ({node.operator.value}) on two bools at line {node.operator.line_nmr}')
 
-    return variables, Error(ErrorType.RUNTIME_ERROR,
+    return frame, Error(ErrorType.RUNTIME_ERROR,
                                 f'Unvalid type found at line {node.left.line_nmr}: {left_type}')
 
 
-def execute_expression(variables: Dict[str, Tuple[Union[int, str, bool], str]], functions: Dict[str, FunctionNode], node: Node, line: int) -> Tuple[Union[int, str, bool], str, Error]:
+def execute_expression(frame: Frame, functions: Dict[str, FunctionNode], node: Node, line: int) -> Tuple[Union[int, str, bool], str, Error]:
     """
     This executes a expression node to a value and a type
-    :param variables: Dict[str, Tuple(value, type)]; All variables in scope
+    :param frame: Frame; All variables in scope
     :param functions: Dict[str, FunctionNode)]; All callable functions
     :param node: Node; Expression to be executed
     :param line: int; On which line is the expression in the file
@@ -141,8 +262,9 @@ def execute_expression(variables: Dict[str, Tuple[Union[int, str, bool], str]],
     """
     if isinstance(node, Value):
         if node.value.type == TokensTypes.IDENTIFIER:
-            if node.value.value in variables:
-                return variables[node.value.value][0], variables[node.value.value][1], Error(ErrorType.NO_ERROR, '')
+            slot = node.value.slot
+            if frame[slot] is not None:
+                return frame[slot], frame[slot + 1], Error(ErrorType.NO_ERROR, '')
             else:
                 return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Variable {node.value.value} was not yet declared at line {node.value.line_nmr}')
         elif node.value.type == TokensTypes.BOOL:
@@ -154,402 +276,657 @@ def execute_expression(variables: Dict[str, Tuple[Union[int, str, bool], str]],
         else:
             return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Literal couldn\'t be resolved. Gotten type: {node.value.type.value} with value {node.value.value}')
 
-    elif isinstance(node, Operator):
-        left = node.left
-        right = node.right
-        if node.left.type == TokensTypes.IDENTIFIER:
-            left, error = get_identifier_as_literal_token(node.left, variables)
-            if error.type != ErrorType.NO_ERROR:
-                return 0, 'int', error
-        if node.right.type == TokensTypes.IDENTIFIER:
-            right, error = get_identifier_as_literal_token(node.right, variables)
+    elif node.resolved_type is not None and (isinstance(node, Operator) or isinstance(node, Compare)):
+        # The type check verified the types of both sides and the operator. A variable that is not declared yet is
+        # reported by the checked path below
+        left = verified_operand(node.left, frame)
+        right = verified_operand(node.right, frame)
+        if left is None or right is None:
+            return execute_checked_expression(frame, node)
+        operator = node.operator.value.lower()
+        if operator == 'div' and right == 0:
+            return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Cannot divide by 0 at line {node.operator.line_nmr}')
+        return verified_operations[(node.resolved_type, operator)](left, right), node.resolved_type, Error(ErrorType.NO_ERROR, '')
+
+    elif isinstance(node, Operator) or isinstance(node, Compare):
+        return execute_checked_expression(frame, node)
+
+    elif isinstance(node, Call):
+        if node.function.value in functions:
+            parameters = parameter_values(node.parameters, frame)
+            value, error = execute_function_node(functions[node.function.value], parameters, functions, node.function.line_nmr)
             if error.type != ErrorType.NO_ERROR:
-                return 0, 'int', error
-
-        if left.type == TokensTypes.STRING:
-            if right.type == TokensTypes.STRING:
-                if node.operator.value.lower() == 'plus':
-                    return left.value + right.value, 'string', Error(ErrorType.NO_ERROR, '')
-                elif node.operator.value.lower() == 'equals':
-                    return left.value == right.value, 'bool', Error(ErrorType.NO_ERROR, '')
-                elif node.operator.value.lower() == 'notequals':
-                    return left.value != right.value, 'bool', Error(ErrorType.NO_ERROR, '')
+                return 0, 'string', error
+            return value[0], functions[node.function.value].return_type.value, Error(ErrorType.NO_ERROR, '')
+        return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Unknow function call to {node.function.value} at line {node.function.line_nmr}')
+    else:
+        return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Tried to execute invalid expression node. Given node type: {node.__class__.__name__} at line { line }')
+
+
+def execute_checked_expression(frame: Frame, node: Union[Operator, Compare]) -> Tuple[Union[int, str, bool], str, Error]:
+    """
+    This executes an operator or compare node, while checking the types of both sides and the operator
+    :param frame: Frame; All variables in scope
+    :param node: Operator | Compare; Expression to be executed
+    :return: int/str/bool, str, Error; result of the expression, type of the result, Error-object containing any errors.
+    """
+    if isinstance(node, Operator):
+        left, left_type, error = get_operand(node.left, frame)
+        if error.type != ErrorType.NO_ERROR:
+            return 0, 'int', error
+        right, right_type, error = get_operand(node.right, frame)
+        if error.type != ErrorType.NO_ERROR:
+            return 0, 'int', error
+        operator = node.operator.value.lower()
+
+        if left_type == 'string':
+            if right_type == 'string':
+                if operator == 'plus':
+                    return left + right, 'string', Error(ErrorType.NO_ERROR, '')
+                elif operator == 'equals':
+                    return left == right, 'bool', Error(ErrorType.NO_ERROR, '')
+                elif operator == 'notequals':
+                    return left != right, 'bool', Error(ErrorType.NO_ERROR, '')
                 else:
                     return 0, 'int', Error(ErrorType.RUNTIME_ERROR,
-                                           f'Invalid operator found: {node.operator.value.lower()} at line {node.operator.line_nmr}')
+                                           f'Invalid operator found: {operator} at line {node.operator.line_nmr}')
             else:
                 return 0, 'int', Error(ErrorType.RUNTIME_ERROR,
-                                       f'At line {left.line_nmr} a operation between a string and not-string is not allowed')
-        if left.type == TokensTypes.INT:
-            lv = int_token_to_int(left)
-
-            if right.type == TokensTypes.INT:
-                rv = int_token_to_int(right)
-
-                int_function_map = {
-                    'plus': (lambda left, right: left + right, 'int'),
-                    'min': (lambda left, right: left - right, 'int'),
-                    'mul': (lambda left, right: left * right, 'int'),
-                    'div': (lambda left, right: left / right, 'int'),
-                    'mod': (lambda left, right: left % right, 'int'),
-                    'and': (lambda left, right: left & right, 'int'),
-                    'or': (lambda left, right: left | right, 'int'),
-                    'xor': (lambda left, right: left ^ right, 'int'),
-                    'bic': (lambda left, right: left & (~right), 'int'),
-                    'lshift': (lambda left, right: left << right, 'int'),
-                    'rshift': (lambda left, right: left >> right, 'int'),
-                    'equals': (lambda left, right: left == right, 'bool'),
-                    'lessthan': (lambda left, right: left < right, 'bool'),
-                    'greaterthan': (lambda left, right: left > right, 'bool'),
-                    'lessthanequals': (lambda left, right: left <= right, 'bool'),
-                    'greaterthanequals': (lambda left, right: left >= right, 'bool'),
-                    'notequals': (lambda left, right: left != right, 'bool')
-                }
-
-                if node.operator.value.lower() not in int_function_map:
+                                       f'At line {node.left.line_nmr} a operation between a string and not-string is not allowed')
+        if left_type == 'int':
+            if right_type == 'int':
+                if operator not in int_function_map:
                     return 0, 'int', Error(ErrorType.RUNTIME_ERROR,
-                                           f'Invalid int operator found: {node.operator.value.lower()} at line {node.operator.line_nmr}')
-                if rv == 0 and node.operator.value.lower() == 'div':
+                                           f'Invalid int operator found: {operator} at line {node.operator.line_nmr}')
+                if right == 0 and operator == 'div':
                     return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Cannot divide by 0 at line {node.operator.line_nmr}')
 
-                operation, type = int_function_map[node.operator.value.lower()]
-                return operation(lv, rv), type, Error(ErrorType.NO_ERROR, '')
+                operation, type = int_function_map[operator]
+                return operation(left, right), type, Error(ErrorType.NO_ERROR, '')
 
             else:
                 return 0, 'int', Error(ErrorType.RUNTIME_ERROR,
-                                       f'At line {left.line_nmr} a operation between a int not-int is not allowed')
-
-        if left.type == TokensTypes.BOOL:
-            if right.type == TokensTypes.BOOL:
-                if node.operator.value.lower() == 'equals':
-                    return left.value.lower() == right.value.lower(), 'bool', Error(ErrorType.NO_ERROR, '')
-                elif node.operator.value.lower() == 'notequals':
-                    return left.value.lower() != right.value.lower(), 'bool', Error(ErrorType.NO_ERROR, '')
-                elif node.operator.value.lower() == 'and':
-                    return bool_token_to_bool(left) and bool_token_to_bool(right), 'bool', Error(ErrorType.NO_ERROR, '')
-                elif node.operator.value.lower() == 'or':
-                    return bool_token_to_bool(left) or bool_token_to_bool(right), 'bool', Error(ErrorType.NO_ERROR, '')
+                                       f'At line {node.left.line_nmr} a operation between a int not-int is not allowed')
+
+        if left_type == 'bool':
+            if right_type == 'bool':
+                if operator == 'equals':
+                    return left == right, 'bool', Error(ErrorType.NO_ERROR, '')
+                elif operator == 'notequals':
+                    return left != right, 'bool', Error(ErrorType.NO_ERROR, '')
+                elif operator == 'and':
+                    return left and right, 'bool', Error(ErrorType.NO_ERROR, '')
+                elif operator == 'or':
+                    return left or right, 'bool', Error(ErrorType.NO_ERROR, '')
                 else:
-                    return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid bool operator found: {node.operator.value.lower()} at line {node.operator.line_nmr}')
+                    return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid bool operator found: {operator} at line {node.operator.line_nmr}')
             else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'At line {left.line_nmr} a operation between a bool and a not bool is not allowed')
+                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'At line {node.left.line_nmr} a operation between a bool and a not bool is not allowed')
 
     elif isinstance(node, Compare):
-        left = node.left
-        right = node.right
-
-        if node.left.type == TokensTypes.IDENTIFIER:
-            left, error = get_identifier_as_literal_token(node.left, variables)
-            if error.type != ErrorType.NO_ERROR:
-                return 0, 'int', error
-
-        if node.right.type == TokensTypes.IDENTIFIER:
-            right, error = get_identifier_as_literal_token(node.right, variables)
-            if error.type != ErrorType.NO_ERROR:
-                return 0, 'int', error
-
-        if left.type != right.type:
-            return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Can\'t compare between different types (left: {left.type}, right: {right.type}) at line {node.operator.line_nmr}')
-
-        if node.operator.value.lower() == 'equals':
-            if left.type == TokensTypes.INT:
-                return int_token_to_int(left) == int_token_to_int(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            elif left.type == TokensTypes.BOOL:
-                return bool_token_to_bool(left) == bool_token_to_bool(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            elif left.type == TokensTypes.STRING:
-                return left.value == right.value, 'bool', Error(ErrorType.NO_ERROR, '')
-            else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({left.type}) found for equals operation at line {left.line_nmr}')
-        elif node.operator.value.lower() == 'notequals':
-            if left.type == TokensTypes.INT:
-                return int_token_to_int(left) != int_token_to_int(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            elif left.type == TokensTypes.BOOL:
-                return bool_token_to_bool(left) != bool_token_to_bool(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            elif left.type == TokensTypes.STRING:
-                return left.value != right.value, 'bool', Error(ErrorType.NO_ERROR, '')
-            else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({left.type}) found for notequals operation at line {left.line_nmr}')
-        elif node.operator.value.lower() == 'lessthan':
-            if left.type == TokensTypes.INT:
-                return int_token_to_int(left) < int_token_to_int(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({left.type}) found for lessthan operation at line {left.line_nmr}')
-        elif node.operator.value.lower() == 'greaterthan':
-            if left.type == TokensTypes.INT:
-                return int_token_to_int(left) > int_token_to_int(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({left.type}) found for greaterthan operation at line {left.line_nmr}')
-        elif node.operator.value.lower() == 'lessthanequals':
-            if left.type == TokensTypes.INT:
-                return int_token_to_int(left) <= int_token_to_int(right), 'bool', Error(ErrorType.NO_ERROR, '')
-            else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({left.type}) found for lessthanequals operation at line {left.line_nmr}')
-            pass
-        elif node.operator.value.lower() == 'greaterthanequals':
-            if left.type == TokensTypes.INT:
-                return int_token_to_int(left) >= int_token_to_int(right), 'bool', Error(ErrorType.NO_ERROR, '')
+        left, left_type, error = get_operand(node.left, frame)
+        if error.type != ErrorType.NO_ERROR:
+            return 0, 'int', error
+        right, right_type, error = get_operand(node.right, frame)
+        if error.type != ErrorType.NO_ERROR:
+            return 0, 'int', error
+        operator = node.operator.value.lower()
+        line = node.left.line_nmr
+
+        if left_type != right_type:
+            return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Can\'t compare between different types (left: {literal_token_types[left_type]}, right: {literal_token_types[right_type]}) at line {node.operator.line_nmr}')
+
+        if operator == 'equals':
+            return left == right, 'bool', Error(ErrorType.NO_ERROR, '')
+        elif operator == 'notequals':
+            return left != right, 'bool', Error(ErrorType.NO_ERROR, '')
+        elif operator in int_compare_map:
+            if left_type == 'int':
+                return int_compare_map[operator](left, right), 'bool', Error(ErrorType.NO_ERROR, '')
             else:
-                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({left.type}) found for greaterthan operation at line {left.line_nmr}')
+                name = 'greaterthan' if operator == 'greaterthanequals' else operator
+                return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid type ({literal_token_types[left_type]}) found for {name} operation at line {line}')
         else:
             return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Invalid compare operator ({node.operator.value}) found at line {node.operator.line_nmr}')
 
-    elif isinstance(node, Call):
-        if node.function.value in functions:
-            parameters = map(lambda p: execute_expression(variables, functions, Value(p), p.line_nmr)[0], node.parameters)
-            value, error = execute_function_node(functions[node.function.value], list(parameters), functions, node.function.line_nmr)
-            if error.type != ErrorType.NO_ERROR:
-                return 0, 'string', error
-            if value is None:
-                value = 0
-            result = 0
-            if functions[node.function.value].return_type.value == 'string':
-                result = value.value.value
-            elif functions[node.function.value].return_type.value == 'int':
-                result = int(value.value.value, 0)
-            elif functions[node.function.value].return_type.value == 'bool':
-                if value.value.value.lower() == 'true':
-                    result = True
-                elif value.value.value.lower() == 'false':
-                    result = False
-                else:
-                    result = bool(value.value.value)
-            return result, functions[node.function.value].return_type.value, Error(ErrorType.NO_ERROR, '')
-        return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Unknow function call to {node.function.value} at line {node.function.line_nmr}')
-    else:
-        return 0, 'int', Error(ErrorType.RUNTIME_ERROR, f'Tried to execute invalid expression node. Given node type: {node.__class__.__name__} at line { line }')
-
 
-def execute_whileloop(variables, functions: Dict[str, FunctionNode], expression: Node, body: List[Node], call_line: int) -> Tuple[Dict[str, Tuple[Union[int, str, bool], str]], Error]:
+def execute_whileloop(frame: Frame, functions: Dict[str, FunctionNode], expression: Node, body: List[Node], call_line: int) -> Tuple[Frame, Error]:
     """
-    This executes a while loop as long as the while-expression is true
-    :param variables: Dict[str, Tuple[value, type]]; All variables in scope
+    This executes a while loop as long as the while-expression is true. The loop runs iteratively, so the python stack
+    does not grow with the amount of iterations
+    :param frame: Frame; All variables in scope
     :param functions: Dict[str, FunctionNode]; all callable functions
     :param expression: Node; expression that is gives if the while loop should still run
     :param body: List[Node]; List of nodes that form the body of the whileloop
     :param call_line: int, On which line is the while-loop called
-    :return: Dict[str, Tuple[value, type]]; Updated variables, error-object containing any errors.
-    """
-    still_true = execute_expression(variables, functions, expression, call_line)
-    if still_true[2].type != ErrorType.NO_ERROR:
-        return variables, still_true[2]
-    if still_true[1] == 'bool' or still_true[1] == 'int':
-        if still_true[0]:
-            variables, error = execute_nodes(variables, functions, body)
-            if error.type != ErrorType.NO_ERROR:
-                return variables, error
-            return execute_whileloop(variables, functions, expression, body, call_line)
-        return variables, Error(ErrorType.NO_ERROR, '')
-    else:
-        return variables, Error(ErrorType.RUNTIME_ERROR, f'While expression resulted in type "{still_true[1]}" at line {call_line}. Valid types are only int and boool.')
+    :return: Frame; Updated frame, error-object containing any errors.
+    """
+    observed = functions.__class__ is not dict and functions.observed
+    while True:
+        still_true, still_true_type, error = execute_expression(frame, functions, expression, call_line)
+        if error.type != ErrorType.NO_ERROR:
+            return frame, error
+        if expression.resolved_type is None and still_true_type != 'bool' and still_true_type != 'int':
+            return frame, Error(ErrorType.RUNTIME_ERROR, f'While expression resulted in type "{still_true_type}" at line {call_line}. Valid types are only int and boool.')
+        if not still_true:
+            return frame, Error(ErrorType.NO_ERROR, '')
+        if observed:
+            functions.loop_iteration(body, frame)
+        frame, error = execute_nodes(frame, functions, body)
+        if error.type != ErrorType.NO_ERROR:
+            return frame, error
 
 
-def execute_forloop(variables: Dict[str, Tuple[Union[int, str, bool], str]], functions: Dict[str, FunctionNode], assignment: Optional[TypeAssignment], dowhile: Compare, inc: Node, body: List[Node]) -> Tuple[Dict[str, Tuple[Union[int, str, bool], str]], Error]:
+def execute_for_increment(frame: Frame, functions: Dict[str, FunctionNode], inc: Node, dowhile: Compare) -> Tuple[Frame, Error]:
     """
-    This function executes a forloop
-    :param variables: Dict[str, Tuple[value, type]]; All variables in scope
+    This function executes the with-expression of a forloop, which is run after every iteration
+    :param frame: Frame; All variables in scope
+    :param functions: Dict[str, FunctionNode]; All functions that can be called
+    :param inc: Node; How should the data change between iterations
+    :param dowhile: Compare; Expression of the forloop, used for the line number in errors
+    :return: Frame, Error; Updated frame, Error object
+    """
+    if isinstance(inc, Unary):
+        return execute_unary(frame, functions, inc)
+    elif isinstance(inc, IncDec):
+        return execute_incdec(frame, functions, inc)
+    return frame, Error(ErrorType.RUNTIME_ERROR, f'Invalid with operation in forloop at line {dowhile.left.line_nmr}, only unary operations, incrementing and decrementing is allowed')
+
+
+def execute_forloop(frame: Frame, functions: Dict[str, FunctionNode], assignment: Optional[TypeAssignment], dowhile: Compare, inc: Node, body: List[Node]) -> Tuple[Frame, Error]:
+    """
+    This function executes a forloop. The loop runs iteratively, so the python stack does not grow with the amount of
+    iterations. When no start assignment is given, the loop continues an earlier run by first applying the increment.
+    :param frame: Frame; All variables in scope
     :param functions: Dict[str, FunctionNode]; All functions that can be called
     :param assignment: TypeAssignment; With what assignment should the forloop start
     :param dowhile: Compare; Expression that indicates how many times the forloop should run for
     :param inc: Node; How should the data change between iterations
     :param body: List[Node]; List of nodes to execute as the body
-    :return: Dict[str, Tuple[value, type]], Error; Updated variables, Error object
+    :return: Frame, Error; Updated frame, Error object
     """
     if assignment is not None:
-        value, expr_type, error = execute_expression(variables, functions, assignment.expression, assignment.type.line_nmr)
+        value, expr_type, error = execute_expression(frame, functions, assignment.expression, assignment.type.line_nmr)
         if error.type != ErrorType.NO_ERROR:
-            return variables, error
-        if assignment.id.value in variables:
-            return variables, Error(ErrorType.RUNTIME_ERROR, f'Variable {assignment.id} already exists and cannot be redefined at line {assignment.id.line_nmr}')
-        if expr_type != assignment.type.value.lower():
-            return variables, Error(ErrorType.RUNTIME_ERROR, f'Mismatched type assignment. Variable {assignment.id} expected type {assignment.type.value} but the expression gave {expr_type}')
-        variables[assignment.id.value] = value, expr_type
+            return frame, error
+        if frame[assignment.id.slot] is not None:
+            return frame, Error(ErrorType.RUNTIME_ERROR, f'Variable {assignment.id} already exists and cannot be redefined at line {assignment.id.line_nmr}')
+        if assignment.resolved_type is None and expr_type != assignment.type.value.lower():
+            return frame, Error(ErrorType.RUNTIME_ERROR, f'Mismatched type assignment. Variable {assignment.id} expected type {assignment.type.value} but the expression gave {expr_type}')
+        frame[assignment.id.slot] = value
+        frame[assignment.id.slot + 1] = expr_type
     else:
-        if isinstance(inc, Unary):
-            variables, error = execute_unary(variables, functions, inc)
-            if error.type != ErrorType.NO_ERROR:
-                return variables, error
-        elif isinstance(inc, IncDec):
-            if inc.left.value in variables:
-                value, vtype = variables[inc.left.value]
-                if vtype == 'int':
-                    if inc.operator.value.lower() == 'plusplus':
-                        value += 1
-                    else:
-                        value -= 1
-                    variables[inc.left.value] = (value, vtype)
-                else:
-                    return variables, Error(ErrorType.RUNTIME_ERROR,
-                                            f'Variable of type {vtype} can not be incremented or decremented at line {inc.left.line_nmr}')
-            else:
-                return variables, Error(ErrorType.UNKNOW_VARIABLE_ERROR,
-                                        f'Variable {inc.left.value} was not yet declared at line {inc.left.line_nmr}')
-        else:
-            return variables, Error(ErrorType.RUNTIME_ERROR, f'Invalid with operation in forloop at line {dowhile.left.line_nmr}, only unary operations, incrementing and decrementing is allowed')
-
-    dwr = execute_expression(variables, functions, dowhile, dowhile.left.line_nmr)
-    if dwr[2].type != ErrorType.NO_ERROR:
-        return variables, dwr[2]
-    if dwr[0]:
-        variables, error = execute_nodes(variables, functions, body)
+        frame, error = execute_for_increment(frame, functions, inc, dowhile)
         if error.type != ErrorType.NO_ERROR:
-            return variables, error
-        return execute_forloop(variables, functions, None, dowhile, inc, body)
+            return frame, error
+
+    observed = functions.__class__ is not dict and functions.observed
+    while True:
+        dwr = execute_expression(frame, functions, dowhile, dowhile.left.line_nmr)
+        if dwr[2].type != ErrorType.NO_ERROR:
+            return frame, dwr[2]
+        if not dwr[0]:
+            return frame, Error(ErrorType.NO_ERROR, '')
+        if observed:
+            functions.loop_iteration(body, frame)
+        frame, error = execute_nodes(frame, functions, body)
+        if error.type != ErrorType.NO_ERROR:
+            return frame, error
+        frame, error = execute_for_increment(frame, functions, inc, dowhile)
+        if error.type != ErrorType.NO_ERROR:
+            return frame, error
 
-    return variables, Error(ErrorType.NO_ERROR, '')
 
+def execute_type_assignment(frame: Frame, functions: Dict[str, FunctionNode], node: TypeAssignment) -> Tuple[Frame, Error]:
+    """
+    Execute a type assignment statement, which declares a new variable
+    :param frame: Frame; Variables in scope of the node
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param node: TypeAssignment; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    value, vtype, error = execute_expression(frame, functions, node.expression, node.type.line_nmr)
+    if error.type != ErrorType.NO_ERROR:
+        return frame, error
+    frame[node.id.slot] = value
+    frame[node.id.slot + 1] = vtype
+    return frame, error
 
-def execute_nodes(variables: Dict[str, Tuple[Union[int, str, bool], str]], functions: Dict[str, FunctionNode], nodes: List[Node]) -> Tuple[Dict[str, Tuple[Union[int, str, bool], str]], Error]:
+
+def execute_assignment(frame: Frame, functions: Dict[str, FunctionNode], node: Assignment) -> Tuple[Frame, Error]:
     """
-    Execute a list of nodes
-    :param variables: Dict[str, Tuple[value, type]]; Variables in scope of the nodes
+    Execute an assignment statement, which gives an existing variable a new value of the same type
+    :param frame: Frame; Variables in scope of the node
     :param functions: Dict[str, FunctionNode]; All callable functions
-    :param nodes: List[Nodes]; List of nodes to execute
-    :return: Dict[str, Tuple[value, type]], Error; Updated variables, Error object containing errors
+    :param node: Assignment; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
     """
-    if len(nodes) == 0: return variables, Error(ErrorType.NO_ERROR, '')
+    slot = node.id.slot
+    if frame[slot] is None:
+        return frame, Error(ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {node.id.value} was not yet declared at line {node.id.line_nmr}')
+    value, vtype, error = execute_expression(frame, functions, node.expression, node.id.line_nmr)
+    if error.type != ErrorType.NO_ERROR:
+        return frame, error
+    if node.resolved_type is None and vtype != frame[slot + 1]:
+        return frame, Error(ErrorType.RUNTIME_ERROR, f'Variable has type {frame[slot + 1]}, but expression gave {vtype} at line {node.id.line_nmr}')
+    frame[slot] = value
+    return frame, error
 
-    node = nodes[0]
-    if isinstance(node, TypeAssignment):
-        value, vtype, error = execute_expression(variables, functions, node.expression, node.type.line_nmr)
-        if error.type != ErrorType.NO_ERROR:
-            return variables, error
-        variables[node.id.value] = value, vtype
-    elif isinstance(node, Assignment):
-        if node.id.value not in variables:
-            return variables, Error(ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {node.id.value} was not yet declared at line {node.id.line_nmr}')
-        value, vtype, error = execute_expression(variables, functions, node.expression, node.id.line_nmr)
-        if error.type != ErrorType.NO_ERROR:
-            return variables, error
-        if vtype != variables[node.id.value][1]:
-            return variables, Error(ErrorType.RUNTIME_ERROR, f'Variable has type {variables[node.id.value][1]}, but expression gave {vtype} at line {node.id.line_nmr}')
-        variables[node.id.value] = value, vtype
-    elif isinstance(node, IncDec):
-        if node.left.value in variables:
-            value, vtype = variables[node.left.value]
-            if vtype == 'int':
-                if node.operator.value.lower() == 'plusplus':
-                    value += 1
-                else:
-                    value -= 1
-                variables[node.left.value] = (value, vtype)
-            else:
-                return variables, Error(ErrorType.RUNTIME_ERROR, f'Variable of type {vtype} can not be incremented or decremented at line {node.left.line_nmr}')
-        else:
-            return variables, Error(ErrorType.UNKNOW_VARIABLE_ERROR,
-                                    f'Variable {node.left.value} was not yet declared at line {node.left.line_nmr}')
-    elif isinstance(node, Unary):
-        x = execute_unary(variables, functions, node)
-        variables, error = x
+
+def execute_incdec(frame: Frame, functions: Dict[str, FunctionNode], node: IncDec) -> Tuple[Frame, Error]:
+    """
+    Execute an increment or decrement of an int variable
+    :param frame: Frame; Variables in scope of the node
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param node: IncDec; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    slot = node.left.slot
+    value, vtype = frame[slot], frame[slot + 1]
+    if value is None:
+        return frame, Error(ErrorType.UNKNOW_VARIABLE_ERROR,
+                                f'Variable {node.left.value} was not yet declared at line {node.left.line_nmr}')
+    if node.resolved_type is None and vtype != 'int':
+        return frame, Error(ErrorType.RUNTIME_ERROR, f'Variable of type {vtype} can not be incremented or decremented at line {node.left.line_nmr}')
+    if node.operator.value.lower() == 'plusplus':
+        value += 1
+    else:
+        value -= 1
+    frame[slot] = value
+    return frame, Error(ErrorType.NO_ERROR, '')
+
+
+def execute_call_statement(frame: Frame, functions: Dict[str, FunctionNode], node: Call) -> Tuple[Frame, Error]:
+    """
+    Execute a function call as statement. The return value of the function is ignored
+    :param frame: Frame; Variables in scope of the node
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param node: Call; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    if node.function.value not in functions:
+        return frame, Error(ErrorType.RUNTIME_ERROR, f'Unknow function call to {node.function.value} at line {node.function.line_nmr}')
+    parameters = parameter_values(node.parameters, frame)
+    _, error = execute_function_node(functions[node.function.value], parameters, functions, node.function.line_nmr)
+    return frame, error
+
+
+def execute_forloop_statement(frame: Frame, functions: Dict[str, FunctionNode], node: Forloop) -> Tuple[Frame, Error]:
+    """
+    Execute a forloop statement
+    :param frame: Frame; Variables in scope of the node
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param node: Forloop; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    return execute_forloop(frame, functions, node.start, node.dowhile, node.inc, node.body)
+
+
+def execute_while_statement(frame: Frame, functions: Dict[str, FunctionNode], node: While) -> Tuple[Frame, Error]:
+    """
+    Execute a while loop statement
+    :param frame: Frame; Variables in scope of the node
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param node: While; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    if isinstance(node.dowhile, Compare):
+        line = node.dowhile.left.value
+    elif isinstance(node.dowhile, Value):
+        line = node.dowhile.value.line_nmr
+    elif isinstance(node.dowhile, Operator):
+        line = node.dowhile.left.line_nmr
+    elif isinstance(node.dowhile, Call):
+        line = node.dowhile.function.line_nmr
+    else:
+        return frame, Error(ErrorType.RUNTIME_ERROR, f'Invalid expression for while loop, line unknow')
+    return execute_whileloop(frame, functions, node.dowhile, node.body, line)
+
+
+def execute_if_statement(frame: Frame, functions: Dict[str, FunctionNode], node: If) -> Tuple[Frame, Error]:
+    """
+    Execute an if statement by executing either the if-body or the else-body
+    :param frame: Frame; Variables in scope of the node
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param node: If; Node to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    if execute_expression(frame, functions, node.cmp, node.cmp.left.line_nmr)[0]:
+        return execute_nodes(frame, functions, node.body)
+    return execute_nodes(frame, functions, node.else_body)
+
+
+# Functions that execute a statement, indexed by the class of the statement node. The functions of a program that runs
+# with observers (see interpreter.hooks) are not a dict but an ObservedFunctions, which has its own executors that give
+# events and which gets the events of function calls and loop iterations
+statement_executors = {
+    TypeAssignment: execute_type_assignment,
+    Assignment: execute_assignment,
+    IncDec: execute_incdec,
+    Unary: execute_unary,
+    Call: execute_call_statement,
+    Forloop: execute_forloop_statement,
+    While: execute_while_statement,
+    If: execute_if_statement,
+}
+
+
+def execute_nodes(frame: Frame, functions: Dict[str, FunctionNode], nodes: List[Node]) -> Tuple[Frame, Error]:
+    """
+    Execute a list of nodes. Every node is executed by the function that belongs to its class in statement_executors
+    :param frame: Frame; Variables in scope of the nodes
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param nodes: List[Nodes]; List of nodes to execute
+    :return: Frame, Error; Updated frame, Error object containing errors
+    """
+    executors = statement_executors if functions.__class__ is dict else functions.statement_executors
+    for node in nodes:
+        executor = executors.get(node.__class__)
+        if executor is None:
+            return frame, Error(ErrorType.RUNTIME_ERROR, f'Couldn\'t execute node with type {node.__class__.__name__}; Node: {node}')
+        frame, error = executor(frame, functions, node)
         if error.type != ErrorType.NO_ERROR:
-            return variables, error
-    elif isinstance(node, Call):
-        if node.function.value in functions:
-            parameters = map(lambda p: execute_expression(variables, functions, Value(p), p.line_nmr)[0], node.parameters)
-            _, error = execute_function_node(functions[node.function.value], list(parameters), functions, node.function.line_nmr)
+            return frame, error
+
+    return frame, Error(ErrorType.NO_ERROR, '')
+
+
+class ProgramFunctions(dict):
+    """
+    Functions of a program (see interpreter.program) with the state of the running program, which is kept here by
+    function name instead of in the function nodes. Programs made from the same parsed functions share the nodes, but
+    each has its own result caches and console. A plain dict of functions runs without result caches and with the
+    current console
+    """
+    # The functions of a program with observers give the events of a run, see interpreter.hooks.ObservedFunctions
+    observed = False
+
+    def __init__(self, functions: Dict[str, FunctionNode], program_console: Optional[console.Console] = None):
+        """
+        Initialize the functions of a program
+        :param functions: Dict[str, FunctionNode]; parsed functions
+        :param program_console: Console | None; console of the build-in print and input functions, None for the current
+            output and input
+        """
+        super().__init__(functions)
+        self.console = console.current if program_console is None else program_console
+        self.statement_executors = statement_executors
+        # Result cache of every memoized function, set by interpreter.memoize
+        self.caches: Dict[str, Any] = dict()
+
+
+class TailCall(NamedTuple):
+    """
+    Call of which the result is directly returned by the calling function: the last statement of the function assigns
+    the result to the returned variable, or the return statement itself is the call. The call is run by
+    execute_function_node after the calling function has ended, so the python stack doesn't grow with every call
+    """
+    caller: FunctionNode
+    call_line: int
+    callee: FunctionNode
+    parameters: List[Union[int, str, bool]]
+    line: int
+    variable_type: Optional[str]
+    assignment_line: int
+
+
+def execute_function_body(frame: Frame, functions: Dict[str, FunctionNode], function: FunctionNode) -> Tuple[Frame, Optional[Assignment], Error]:
+    """
+    Execute the body of a function, except for a tail call. A tail call is an assignment of a call to the variable that
+    is returned, as the last statement of the body or as the last statement of the executed part of a last if-statement.
+    These last statements are executed here instead of by statement_executors, so observers get their events from here
+    :param frame: Frame; Variables in scope of the body
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param function: FunctionNode; function of which the body is executed
+    :return: Frame, Assignment, Error; Updated frame, the tail call that must still be
+        executed or None, Error object containing errors
+    """
+    returned = None
+    if isinstance(function.return_statement, Value) and function.return_statement.value.type == TokensTypes.IDENTIFIER:
+        returned = function.return_statement.value.value
+
+    observed = functions.__class__ is not dict and functions.observed
+    # Last if-statements of which the executed part is running, they end after that part
+    entered = []
+    nodes = function.body
+    tail = None
+    error = None
+    while returned is not None and nodes:
+        last = nodes[-1]
+        if isinstance(last, Assignment) and isinstance(last.expression, Call) and last.id.value == returned:
+            frame, error = execute_nodes(frame, functions, nodes[:-1])
             if error.type != ErrorType.NO_ERROR:
-                return variables, error
-        else:
-            return variables, Error(ErrorType.RUNTIME_ERROR, f'Unknow function call to {node.function.value} at line {node.function.line_nmr}')
-    elif isinstance(node, Forloop):
-        variables, error = execute_forloop(variables, functions, node.start, node.dowhile, node.inc, node.body)
-        if error.type != ErrorType.NO_ERROR:
-            return variables, error
-    elif isinstance(node, While):
-        line = -1
-        if isinstance(node.dowhile, Compare):
-            line = node.dowhile.left.value
-        elif isinstance(node.dowhile, Value):
-            line = node.dowhile.value.line_nmr
-        elif isinstance(node.dowhile, Operator):
-            line = node.dowhile.left.line_nmr
-        elif isinstance(node.dowhile, Call):
-            line = node.dowhile.function.line_nmr
-        else:
-            return variables, Error(ErrorType.RUNTIME_ERROR, f'Invalid expression for while loop, line unknow')
-        variables, error = execute_whileloop(variables, functions, node.dowhile, node.body, line)
-        if error.type != ErrorType.NO_ERROR:
-            return variables, error
-    elif isinstance(node, If):
-        if execute_expression(variables, functions, node.cmp, node.cmp.left.line_nmr)[0]:
-            variables, error = execute_nodes(variables, functions, node.body)
+                break
+            if frame[last.id.slot] is not None and last.expression.function.value in functions:
+                tail = last
+                if observed:
+                    # The call itself is run after the function has ended
+                    functions.enter_statement(last, frame)
+                    functions.exit_statement(last, frame, error)
+                break
+            # Errors of the assignment are given by executing it as a normal statement
+            nodes = [last]
+            error = None
+            break
+        elif isinstance(last, If):
+            frame, error = execute_nodes(frame, functions, nodes[:-1])
+            if error.type != ErrorType.NO_ERROR:
+                break
+            error = None
+            if observed:
+                functions.enter_statement(last, frame)
+                entered.append(last)
+            if execute_expression(frame, functions, last.cmp, last.cmp.left.line_nmr)[0]:
+                nodes = last.body
+            else:
+                nodes = last.else_body
         else:
-            variables, error = execute_nodes(variables, functions, node.else_body)
-        if error.type != ErrorType.NO_ERROR:
-            return variables, error
+            break
+
+    if error is None:
+        frame, error = execute_nodes(frame, functions, nodes)
+    for node in reversed(entered):
+        functions.exit_statement(node, frame, error)
+    return frame, tail, error
+
+
+def return_value(function: FunctionNode, value: Union[int, str, bool], return_type: str, call_line: int) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Error]:
+    """
+    Check the type of the value that a function returns. The type of a function that passed the type check is not
+    checked again
+    :param function: FunctionNode; function that returns the value
+    :param value: int/str/bool; returned value
+    :param return_type: str; type of the returned value
+    :param call_line: int; line from where the function is called
+    :return: Tuple[value, type], Error; returned value and its type, error object
+    """
+    if function.verified:
+        return (value, return_type), Error(ErrorType.NO_ERROR, '')
+
+    if return_type != function.return_type.value:
+        return None, Error(ErrorType.RUNTIME_ERROR, f'Function {function.name} called at line {call_line} did not return the defined type. Expected {function.return_type.value} but got {return_type}')
+
+    if return_type not in literal_token_types:
+        return None, Error(ErrorType.RUNTIME_ERROR,
+                           f'Invalid return type ({return_type}) after function at line {function.return_line}')
+
+    return (value, return_type), Error(ErrorType.NO_ERROR, '')
+
+
+def add_call_to_error(error: Error, function: FunctionNode, call_line: int):
+    """
+    Put the function in which an error happend and the line of its call in front of the error message
+    :param error: Error; error that happend in the body of the function
+    :param function: FunctionNode; function in which the error happend
+    :param call_line: int; line from where the function is called
+    """
+    error.message = f'Error while executing {function.name}. Function called at line: {call_line}\n' + error.message
+
+
+def execute_function_node(function: FunctionNode, parameters: List[Union[int, str, bool]], functions: Dict[str, FunctionNode], call_line: int) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Error]:
+    """
+    Execute a function with the given parameters. Tail calls are run one after the other instead of recursively, after
+    which the result is returned through the calling functions. When a function has a result cache (see
+    interpreter.memoize) in the program functions, the result is taken from the cache or stored in it
+    :param function: FunctionNode; function to execute
+    :param parameters: List; parameter values for the function
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param call_line: int; line from where the function is called
+    :return: Tuple[value, type], Error; return value of the function and its type, error object
+    """
+    # The result caches and the observers of a program are kept by its functions, a plain dict has neither
+    if functions.__class__ is dict:
+        observed, caches = False, None
     else:
-        return variables, Error(ErrorType.RUNTIME_ERROR, f'Couldn\'t execute node with type {node.__class__.__name__}; Node: {node}')
+        observed, caches = functions.observed, functions.caches
+    tail_calls = []
+    while True:
+        key = cache = None
+        if caches:
+            cache = caches.get(function.name)
+            if cache is not None:
+                key = call_key(function.name, parameters)
+                value = cache.get(key)
+                if value is not None:
+                    error = Error(ErrorType.NO_ERROR, '')
+                    break
+
+        if observed:
+            functions.enter_function(function, parameters, call_line)
+        value, tail_call, error = run_function_node(function, parameters, functions, call_line)
+        if observed:
+            functions.exit_function(function, parameters, value, tail_call, error)
+        if tail_call is None:
+            if key is not None and error.type == ErrorType.NO_ERROR:
+                cache.put(key, value)
+            break
+        tail_calls.append((tail_call, key, cache))
+        function, parameters, call_line = tail_call.callee, tail_call.parameters, tail_call.line
+
+    # Return the value through the functions that made a tail call, the last call first
+    for tail_call, key, cache in reversed(tail_calls):
+        if error.type == ErrorType.NO_ERROR:
+            result = value[0]
+            result_type = tail_call.callee.return_type.value
+            if tail_call.variable_type is not None and not tail_call.caller.verified and result_type != tail_call.variable_type:
+                error = Error(ErrorType.RUNTIME_ERROR, f'Variable has type {tail_call.variable_type}, but expression gave {result_type} at line {tail_call.assignment_line}')
 
-    return execute_nodes(variables, functions, nodes[1:])
+        if error.type != ErrorType.NO_ERROR:
+            value = None
+            if tail_call.variable_type is not None:
+                add_call_to_error(error, tail_call.caller, tail_call.call_line)
+            continue
 
+        value, error = return_value(tail_call.caller, result, result_type, tail_call.call_line)
+        if key is not None and error.type == ErrorType.NO_ERROR:
+            cache.put(key, value)
 
-def execute_function_node(function: FunctionNode, parameters: List[Union[int, str, bool]], functions: Dict[str, FunctionNode], call_line: int) -> Tuple[Optional[Value], Error]:
+    return value, error
+
+
+def load_function(function: FunctionNode, functions: Dict[str, FunctionNode]) -> Error:
+    """
+    Parse and type check the body of a function that was indexed without its body, the first time it is called
+    :param function: FunctionNode; function found by decoder.parser.index_functions
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :return: Error; error in the body of the function
+    """
+    # interpreter.typecheck uses the operator tables of this module, so it is imported when it is needed
+    from interpreter.typecheck import check_function
+    from interpreter.modules import module_functions
+    error = parse_body(function)
+    if error.type == ErrorType.NO_ERROR:
+        # A function of a module is checked with the functions of its module, so it gets the same resolved types in
+        # every program that imports it
+        context = functions if function.module is None else module_functions(function)
+        if context is not None:
+            check_function(function, context)
+    return error
+
+
+def run_function_node(function: FunctionNode, parameters: List[Union[int, str, bool]], functions: Dict[str, FunctionNode], call_line: int) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Optional[TailCall], Error]:
+    """
+    Run a function with the given parameters, up to a tail call
+    :param function: FunctionNode; function to execute
+    :param parameters: List; parameter values for the function
+    :param functions: Dict[str, FunctionNode]; All callable functions
+    :param call_line: int; line from where the function is called
+    :return: Tuple[value, type], TailCall, Error; return value of the function and its type or the tail call that
+        gives the return value, error object
+    """
     if function.name == 'print':
         if len(parameters) == 1:
-            if isinstance(parameters[0], str):
-                print(parameters[0].replace('\\n', '\n')[1:-1])
-            else:
-                print(parameters[0])
-            return Value(Token(TokensTypes.INT, '0', 0)), Error(ErrorType.NO_ERROR, f'')
-        return None, Error(ErrorType.PARAMETER_ERROR, f'Print function only takes 1 parameter, not {len(parameters)}')
+            (console.current if functions.__class__ is dict else functions.console).print_value(parameters[0])
+            return (0, 'int'), None, Error(ErrorType.NO_ERROR, f'')
+        return None, None, Error(ErrorType.PARAMETER_ERROR, f'Print function only takes 1 parameter, not {len(parameters)}')
 
     if function.name == 'size':
         if len(parameters) == 1:
             if isinstance(parameters[0], str):
-                return Value(Token(TokensTypes.INT, str(len(parameters[0].strip('"'))), 0)), Error(ErrorType.NO_ERROR, f'')
-            return None, Error(ErrorType.PARAMETER_ERROR, f'Size function only takes a string as parameter, not { "int" if isinstance(parameters[0], int) else "bool" }')
-        return None, Error(ErrorType.PARAMETER_ERROR, f'Size function only takes 1 parameter, not {len(parameters)}')
+                return (len(parameters[0].strip('"')), 'int'), None, Error(ErrorType.NO_ERROR, f'')
+            return None, None, Error(ErrorType.PARAMETER_ERROR, f'Size function only takes a string as parameter, not { "int" if isinstance(parameters[0], int) else "bool" }')
+        return None, None, Error(ErrorType.PARAMETER_ERROR, f'Size function only takes 1 parameter, not {len(parameters)}')
 
     if function.name == 'input':
         if len(parameters) == 1:
-            read_from_console = input(parameters[0].strip('"'))
-            return Value(Token(TokensTypes.STRING, f'"{read_from_console}"', 0)), Error(ErrorType.NO_ERROR, f'')
-        return None, Error(ErrorType.PARAMETER_ERROR, f'Print function only takes 1 parameter, not {len(parameters)}')
+            try:
+                read_from_console = (console.current if functions.__class__ is dict else functions.console).read_line(parameters[0].strip('"'))
+            except EOFError:
+                return None, None, Error(ErrorType.RUNTIME_ERROR, f'No more input to read at line {call_line}')
+            return (f'"{read_from_console}"', 'string'), None, Error(ErrorType.NO_ERROR, f'')
+        return None, None, Error(ErrorType.PARAMETER_ERROR, f'Print function only takes 1 parameter, not {len(parameters)}')
+
+    if function.source is not None:
+        error = load_function(function, functions)
+        if error.type != ErrorType.NO_ERROR:
+            add_call_to_error(error, function, call_line)
+            return None, None, error
 
     if len(parameters) != len(function.parameters):
-        return None, Error(ErrorType.PARAMETER_ERROR, f'Function call with mis matched parameter amount at line {call_line}')
+        return None, None, Error(ErrorType.PARAMETER_ERROR, f'Function call with mis matched parameter amount at line {call_line}')
 
-    variables = dict()
-    matched_parameters = zip(function.parameters, parameters)
-    for mp in matched_parameters:
+    frame = new_frame(function)
+    matched_parameters = zip(function.parameters, function.parameter_slots, parameters)
+    for parameter, slot, value in matched_parameters:
         given_type = ''
-        if isinstance(mp[1], bool):
+        if isinstance(value, bool):
             given_type = 'bool'
-        elif isinstance(mp[1], int):
+        elif isinstance(value, int):
             given_type = 'int'
-        elif isinstance(mp[1], str):
+        elif isinstance(value, str):
             given_type = 'string'
 
-        if mp[0].type.value.lower() == given_type:
-            variables[mp[0].name] = (mp[1], given_type)
+        if parameter.type.value.lower() == given_type:
+            frame[slot] = value
+            frame[slot + 1] = given_type
         else:
-            return None, Error(ErrorType.PARAMETER_ERROR, f'Parameter type mismatch in function call to {function.name} at line {call_line}. Expected {mp[0].type.value} but got {given_type}')
+            return None, None, Error(ErrorType.PARAMETER_ERROR, f'Parameter type mismatch in function call to {function.name} at line {call_line}. Expected {parameter.type.value} but got {given_type}')
 
-    variables, error = execute_nodes(variables, functions, function.body)
+    frame, tail, error = execute_function_body(frame, functions, function)
 
     if error.type != ErrorType.NO_ERROR:
-        call_line = f'Error while executing {function.name}. Function called at line: {call_line}\n'
-        error.message = call_line + error.message
-        return None, error
+        add_call_to_error(error, function, call_line)
+        return None, None, error
 
-    if function.return_statement:
-        value, return_type, error = execute_expression(variables, functions, function.return_statement, function.return_line)
+    if tail is not None:
+        call = tail.expression
+        parameters = parameter_values(call.parameters, frame)
+        return None, TailCall(function, call_line, functions[call.function.value], parameters, call.function.line_nmr,
+                              frame[tail.id.slot + 1], tail.id.line_nmr), error
 
-        if error.type != ErrorType.NO_ERROR:
-            return None, error
+    call = function.return_statement
+    if isinstance(call, Call) and call.function.value in functions:
+        parameters = parameter_values(call.parameters, frame)
+        return None, TailCall(function, call_line, functions[call.function.value], parameters, call.function.line_nmr,
+                              None, function.return_line), error
 
-        if return_type != function.return_type.value:
-            return None, Error(ErrorType.RUNTIME_ERROR, f'Function {function.name} called at line {call_line} did not return the defined type. Expected {function.return_type.value} but got {return_type}')
+    if function.return_statement:
+        value, return_type, error = execute_expression(frame, functions, function.return_statement, function.return_line)
 
-        if return_type == 'string':
-            token = Token(TokensTypes.STRING, value, function.return_line)
-        elif return_type == 'bool':
-            token = Token(TokensTypes.BOOL, str(value), function.return_line)
-        elif return_type == 'int':
-            token = Token(TokensTypes.INT, str(value), function.return_line)
-        else:
-            return None, Error(ErrorType.RUNTIME_ERROR,
-                               f'Invalid return type ({return_type}) after function at line {function.return_line}')
+        if error.type != ErrorType.NO_ERROR:
+            return None, None, error
 
-        return Value(token), Error(ErrorType.NO_ERROR, '')
+        value, error = return_value(function, value, return_type, call_line)
+        return value, None, error
 
-    return None, Error(ErrorType.RUNTIME_ERROR, f'Expected return statement after function at line {function.return_line}')
+    return None, None, Error(ErrorType.RUNTIME_ERROR, f'Expected return statement after function at line {function.return_line}')
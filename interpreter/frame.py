@@ -0,0 +1,57 @@
+from decoder.nodes import Node, Call, FunctionNode
+from decoder.lexer import Token
+from decoder.enums import TokensTypes
+from typing import Dict, List, Optional, Union
+
+# The variables of a function call are kept in a frame: a list in which every variable of the function has a fixed
+# place. The value of a variable is at its slot and its type directly after it. A variable that is not declared (yet)
+# has None as value and type. resolve_frame gives every identifier token of a function the slot of its variable, so
+# interpreter.execute reads and writes variables by index instead of looking up their name.
+
+Frame = List[Optional[Union[int, str, bool]]]
+
+
+def resolve_tokens(nodes: List[Node], slots: Dict[str, int]):
+    """
+    Give all identifier tokens in a list of nodes the slot of their variable, including the tokens of nested
+    statements and expressions. A variable that has no slot yet gets the next free slot
+    :param nodes: List[Node]; nodes to resolve
+    :param slots: Dict[str, int]; slot of every variable name, new variables are added
+    """
+    todo = list(nodes)
+    while todo:
+        node = todo.pop()
+        if isinstance(node, Call):
+            # The function name of a call is not a variable
+            children = node.parameters
+        else:
+            children = [getattr(node, attribute) for attribute in node.__slots__]
+        for child in children:
+            if isinstance(child, list):
+                todo.extend(child)
+            elif isinstance(child, Node):
+                todo.append(child)
+            elif isinstance(child, Token) and child.type == TokensTypes.IDENTIFIER:
+                child.slot = slots.setdefault(child.value, 2 * len(slots))
+
+
+def resolve_frame(function: FunctionNode):
+    """
+    Give every parameter and variable of a function a slot in the frame of the function
+    :param function: FunctionNode; function to resolve
+    """
+    slots: Dict[str, int] = dict()
+    function.parameter_slots = [slots.setdefault(parameter.name, 2 * len(slots)) for parameter in function.parameters]
+    resolve_tokens(function.body + ([function.return_statement] if function.return_statement else []), slots)
+    function.frame_size = 2 * len(slots)
+
+
+def new_frame(function: FunctionNode) -> Frame:
+    """
+    Create an empty frame for a call to a function. The function is resolved first when that is not done yet
+    :param function: FunctionNode; called function
+    :return: Frame; frame in which no variable is declared
+    """
+    if function.frame_size is None:
+        resolve_frame(function)
+    return [None] * function.frame_size
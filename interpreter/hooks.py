@@ -0,0 +1,156 @@
+from decoder.nodes import Node, FunctionNode
+from decoder.utils import Error
+from decoder.enums import ErrorType
+from interpreter import execute
+from interpreter.frame import Frame
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+# Observers follow the execution of the tree-walking interpreter of interpreter.execute. Observers are attached to a
+# program (see interpreter.program.Program.attach), which then runs with an ObservedFunctions instead of its
+# ProgramFunctions. The interpreter sends the events to those functions, and executes the statements with their
+# executors, which send the events of the statements. A program without observers gives no events.
+#
+# A call of a memoized function that is found in the cache does not run the function and gives no events.
+
+# Build-in functions that read or write the console
+io_builtins = {'print', 'input'}
+
+
+class Observer:
+    """
+    Base class of an observer. Every event does nothing, so an observer only overrides the events it needs
+    """
+    def enter_function(self, function: FunctionNode, parameters: List[Union[int, str, bool]], call_line: int):
+        """
+        A function is called, before the parameters are checked
+        :param function: FunctionNode; called function, build-in functions included
+        :param parameters: List; parameter values of the call
+        :param call_line: int; line from where the function is called
+        """
+
+    def exit_function(self, function: FunctionNode, value: Optional[Tuple[Union[int, str, bool], str]], tail_call: Optional[Any], error: Error):
+        """
+        A function has ended. When it ends with a tail call, the called function is entered after this event and
+        gives the returned value
+        :param function: FunctionNode; function that ended
+        :param value: Tuple[value, type]; returned value and its type, None after an error or with a tail call
+        :param tail_call: TailCall; tail call that gives the returned value, None when there is no tail call
+        :param error: Error; error of the function
+        """
+
+    def enter_statement(self, node: Node, frame: Frame):
+        """
+        A statement is about to be executed
+        :param node: Node; statement
+        :param frame: Frame; variables of the running function
+        """
+
+    def exit_statement(self, node: Node, frame: Frame, error: Error):
+        """
+        A statement has been executed
+        :param node: Node; statement
+        :param frame: Frame; variables of the running function
+        :param error: Error; error of the statement
+        """
+
+    def loop_iteration(self, body: List[Node], frame: Frame):
+        """
+        The body of a for or while loop is about to be executed once more
+        :param body: List[Node]; body of the loop
+        :param frame: Frame; variables of the running function
+        """
+
+    def builtin_io(self, name: str, parameters: List[Union[int, str, bool]], value: Tuple[Union[int, str, bool], str]):
+        """
+        A build-in function has written to or read from the console
+        :param name: str; print or input
+        :param parameters: List; parameter values of the call
+        :param value: Tuple[value, type]; value returned by the build-in function, the read text for input
+        """
+
+
+class ObservedFunctions(execute.ProgramFunctions):
+    """
+    Functions of a program that runs with observers. The interpreter gives the events of a run to the functions it runs
+    with, so the observers only follow the runs of their own program
+    """
+    observed = True
+
+    def __init__(self, functions: execute.ProgramFunctions, observers: List[Observer]):
+        """
+        Initialize the observed functions, with the console and the result caches of the program
+        :param functions: ProgramFunctions; functions of the program
+        :param observers: List[Observer]; observers that get the events, the list can change between runs
+        """
+        super().__init__(functions, functions.console)
+        self.caches = functions.caches
+        self.observers = observers
+        # Statement executors of interpreter.execute that give events
+        self.statement_executors = {node_class: self.observed_statement(executor) for node_class, executor in execute.statement_executors.items()}
+
+    def observed_statement(self, executor: Callable) -> Callable:
+        """
+        Wrap a statement executor of interpreter.execute, so every executed statement gives events
+        :param executor: Callable; original statement executor
+        :return: Callable; executor with the same parameters that gives events
+        """
+        def execute_observed(frame, functions, node):
+            self.enter_statement(node, frame)
+            frame, error = executor(frame, functions, node)
+            self.exit_statement(node, frame, error)
+            return frame, error
+        return execute_observed
+
+    def enter_function(self, function: FunctionNode, parameters: List[Union[int, str, bool]], call_line: int):
+        """
+        Send the event of a function call to the observers
+        :param function: FunctionNode; called function
+        :param parameters: List; parameter values of the call
+        :param call_line: int; line from where the function is called
+        """
+        for observer in self.observers:
+            observer.enter_function(function, parameters, call_line)
+
+    def exit_function(self, function: FunctionNode, parameters: List[Union[int, str, bool]], value: Optional[Tuple[Union[int, str, bool], str]], tail_call: Optional[Any], error: Error):
+        """
+        Send the event of the end of a function to the observers, after the event of the console when a build-in function
+        has written or read it
+        :param function: FunctionNode; function that ended
+        :param parameters: List; parameter values of the call
+        :param value: Tuple[value, type]; returned value and its type, None after an error or with a tail call
+        :param tail_call: TailCall; tail call that gives the returned value, None when there is no tail call
+        :param error: Error; error of the function
+        """
+        if function.name in io_builtins and error.type == ErrorType.NO_ERROR:
+            for observer in self.observers:
+                observer.builtin_io(function.name, parameters, value)
+        for observer in self.observers:
+            observer.exit_function(function, value, tail_call, error)
+
+    def enter_statement(self, node: Node, frame: Frame):
+        """
+        Send the event of a statement that is about to be executed to the observers
+        :param node: Node; statement
+        :param frame: Frame; variables of the running function
+        """
+        for observer in self.observers:
+            observer.enter_statement(node, frame)
+
+    def exit_statement(self, node: Node, frame: Frame, error: Error):
+        """
+        Send the event of an executed statement to the observers
+        :param node: Node; statement
+        :param frame: Frame; variables of the running function
+        :param error: Error; error of the statement
+        """
+        for observer in self.observers:
+            observer.exit_statement(node, frame, error)
+
+    def loop_iteration(self, body: List[Node], frame: Frame):
+        """
+        Send the event of a loop iteration to the observers
+        :param body: List[Node]; body of the loop
+        :param frame: Frame; variables of the running function
+        """
+        for observer in self.observers:
+            observer.loop_iteration(body, frame)
@@ -1,10 +1,16 @@
-from decoder.lexer import lexer, Token
-from decoder.parser import parse, Value
+from decoder import utils
 from decoder.utils import Error
 from decoder.enums import ErrorType
-from interpreter.execute import execute_function_node
+from interpreter.program import Program, ProgramError, parse_file
+from interpreter import modules
+from interpreter.options import split_options
+from interpreter.console import Output, Input, ConsoleOutput, FileOutput, BufferedInput, DEFAULT_BUFFER_SIZE, value_text
+import os
 import sys
-from typing import List, Union, Any
+from typing import List, Union, Any, Dict, Optional, Tuple
+
+# Options that can be combined with --watch
+WATCH_OPTIONS = ('watch', 'quiet', 'path')
 
 
 def parse_parameters(rawp: List[str]) -> List[Union[int, bool, str]]:
@@ -24,36 +30,115 @@ def parse_parameters(rawp: List[str]) -> List[Union[int, bool, str]]:
     return [current, ] + parse_parameters(rawp[1:])
 
 
+def parse_arguments(arguments: List[Union[int, str, bool]]) -> List[Union[int, str, bool]]:
+    """
+    Get parameter values from arguments that are read from a file or request. Strings are parsed like command line
+    arguments, numbers and booleans are used as they are
+    :param arguments: List; arguments, for example from JSON
+    :return: List; parameter values
+    """
+    return [parse_parameters([argument])[0] if isinstance(argument, str) else argument for argument in arguments]
+
+
+def console_options(options: Dict[str, Union[str, bool]]) -> Tuple[Optional[Output], Optional[Input]]:
+    """
+    Get the output and input for print and input from the options --buffer[=size], --output=file and --input=file
+    :param options: Dict[str, str | bool]; options of the command line
+    :return: Output | None, Input | None; output and input, None for the console
+    """
+    output = None
+    if isinstance(options.get('output'), str):
+        output = FileOutput(options['output'])
+    elif options.get('buffer'):
+        output = ConsoleOutput(int(options['buffer']) if isinstance(options['buffer'], str) else DEFAULT_BUFFER_SIZE)
+    input_source = BufferedInput.from_file(options['input']) if isinstance(options.get('input'), str) else None
+    return output, input_source
+
+
 def interpreter(arguments: List[Any]):
+    options, arguments = split_options(arguments)
     if len(arguments) < 2:
         print(Error(ErrorType.SYNTAX_ERROR, f'At least file and function name are required, but not given'))
         exit(2)
 
-    tokens, error = lexer(arguments[0])
-    if error.type != ErrorType.NO_ERROR:
-        print(error)
-        exit(3)
+    # The profiler measures the tree-walking interpreter, the other backends give no events
+    if options.get('profile') and (options.get('compile') or options.get('vm')):
+        print(Error(ErrorType.SYNTAX_ERROR, f'--profile only works with the tree-walking interpreter, not with --compile or --vm'))
+        exit(2)
 
-    functions, error = parse(tokens)
-    if error.type != ErrorType.NO_ERROR:
+    # Watch mode runs every version with the tree-walking interpreter, the options of the other runs can't be used
+    if options.get('watch'):
+        unsupported = [f'--{option}' for option in options if option not in WATCH_OPTIONS]
+        if unsupported:
+            print(Error(ErrorType.SYNTAX_ERROR, f'--watch only works with --quiet and --path, not with {", ".join(unsupported)}'))
+            exit(2)
+
+    # --quiet leaves out the status messages and the banners, only the output and exit value of the program are printed
+    quiet = options.get('quiet')
+    if quiet:
+        utils.log_status = False
+
+    if isinstance(options.get('path'), str):
+        modules.search_path = options['path'].split(os.pathsep)
+
+    if options.get('watch'):
+        from interpreter.watch import watch, DEFAULT_INTERVAL
+        watch(arguments[0], arguments[1], parse_parameters(arguments[2:]), float(options['watch']) if isinstance(options['watch'], str) else DEFAULT_INTERVAL, quiet)
+        exit(0)
+
+    functions, error, exit_code = parse_file(arguments[0], options.get('lazy'), options.get('cache'), quiet=False)
+    if functions is None:
         print(error)
+        exit(exit_code)
+
+    memoize_size = None
+    if options.get('memoize'):
+        from interpreter.memoize import DEFAULT_CACHE_SIZE
+        memoize_size = int(options['memoize']) if isinstance(options['memoize'], str) else DEFAULT_CACHE_SIZE
+    backend = 'compile' if options.get('compile') else 'vm' if options.get('vm') else 'execute'
+    try:
+        program = Program(functions, backend, memoize_size, *console_options(options))
+    except ProgramError as error:
+        # Only with --lazy, when the bodies of the functions are parsed for the backend or --memoize
+        print(error.error)
         exit(4)
 
+    # --typecheck only runs a program without type errors
+    if options.get('typecheck') and program.type_errors:
+        for error in program.type_errors:
+            print(error)
+        exit(6)
+
     parameters = parse_parameters(arguments[2:])
 
-    print('_____________START RUNNING PROGRAM_____________')
-    return_value, error = execute_function_node(functions[arguments[1]], parameters, functions, 0)
+    if not quiet:
+        print('_____________START RUNNING PROGRAM_____________')
+    profiler = None
+    if options.get('profile'):
+        from interpreter.profiler import Profiler
+        profiler = Profiler()
+        program.attach(profiler)
+    try:
+        return_value, error = program.run(arguments[1], parameters)
+    finally:
+        # Buffered output is written before the error or exit value, also when the program stops with an exception
+        if program.console.output is not None:
+            program.console.output.close()
+    if profiler is not None:
+        if isinstance(options['profile'], str):
+            profiler.write_json(options['profile'])
+        else:
+            print(profiler)
     if error.type != ErrorType.NO_ERROR:
         print(error)
         exit(5)
 
-    if return_value is not None and isinstance(return_value, Value):
-        # Print exit value
-        value = return_value.value
-        if isinstance(return_value.value, Token):
-            value = return_value.value.value
-
-        print(f'Program exit value: {value}')
+    if return_value is not None:
+        # Print exit value, every backend returns the value and type
+        print(f'Program exit value: {value_text(return_value[0])}')
 
-    print('_________________PROGRAM ENDED_________________')
+    if program.memoize_cache is not None:
+        print(program.memoize_cache)
+    if not quiet:
+        print('_________________PROGRAM ENDED_________________')
     exit(0)
@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from decoder.nodes import Node, Call, FunctionNode
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+# JCJL has no global variables, so the result of a function only depends on its parameters. The exceptions are
+# functions that (through other functions) call a build-in function with side effects. The results of all other
+# functions can be cached: memoize_functions gives every pure function of a program the same LRUCache, which is used
+# by interpreter.execute.execute_function_node and by memoize_compiled for the closure compiler. The cache belongs to
+# the program, the function nodes don't know about it.
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Build-in functions that read or write the console
+impure_builtins = {'print', 'input'}
+builtin_names = {'print', 'size', 'input'}
+
+
+class LRUCache:
+    """
+    Cache that holds a limited amount of results. When the cache is full, the result that was used longest ago is
+    removed. The cache counts how many times a result was found (hits) and not found (misses)
+    """
+    def __init__(self, size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize an empty cache
+        :param size: int; maximum amount of results in the cache
+        """
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.results: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a result from the cache and mark it as most recently used
+        :param key: Hashable; key of the result
+        :return: Any; cached result, None when the key is not in the cache
+        """
+        result = self.results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.results.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: Any):
+        """
+        Store a result in the cache. When the cache is full, the least recently used result is removed
+        :param key: Hashable; key of the result
+        :param result: Any; result to store, must not be None
+        """
+        if self.size <= 0:
+            return
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.size:
+            self.results.popitem(last=False)
+
+    def __len__(self) -> int:
+        """
+        Get the amount of results in the cache
+        :return: int; amount of cached results
+        """
+        return len(self.results)
+
+    def __str__(self) -> str:
+        """
+        Represent the cache counters as a string
+        :return: str; cache representation
+        """
+        return f'Memoization cache: {self.hits} hits, {self.misses} misses, {len(self.results)}/{self.size} results'
+
+    def __repr__(self) -> str:
+        """
+        Represent the cache counters as a string
+        :return: str; cache representation
+        """
+        return self.__str__()
+
+
+def call_key(name: str, parameters: List[Union[int, str, bool]]) -> Tuple:
+    """
+    Get the cache key of a function call. The type of every parameter is part of the key, because True equals 1 in
+    python but not in JCJL
+    :param name: str; name of the called function
+    :param parameters: List; parameter values of the call
+    :return: Tuple; hashable key of the call
+    """
+    return (name, ) + tuple((parameter.__class__, parameter) for parameter in parameters)
+
+
+def called_functions(nodes: List[Node]) -> Set[str]:
+    """
+    Find the names of all functions that are called in a list of nodes, including calls in nested statements and
+    expressions
+    :param nodes: List[Node]; nodes to search
+    :return: Set[str]; names of the called functions
+    """
+    names = set()
+    todo = list(nodes)
+    while todo:
+        node = todo.pop()
+        if isinstance(node, Call):
+            names.add(node.function.value)
+        for child in (getattr(node, attribute) for attribute in node.__slots__):
+            if isinstance(child, Node):
+                todo.append(child)
+            elif isinstance(child, list):
+                todo.extend(item for item in child if isinstance(item, Node))
+    return names
+
+
+def find_pure_functions(functions: Dict[str, FunctionNode]) -> Set[str]:
+    """
+    Find the functions of a program whose result only depends on their parameters. A function is impure when it calls
+    print or input, a function that doesn't exist, or an impure function
+    :param functions: Dict[str, FunctionNode]; parsed functions, as given by decoder.parser.parse
+    :return: Set[str]; names of the pure functions, build-in functions are not included
+    """
+    callers: Dict[str, Set[str]] = {name: set() for name in functions}
+    impure = set(impure_builtins)
+    for name, function in functions.items():
+        if name in builtin_names:
+            continue
+        calls = called_functions(function.body + ([function.return_statement] if function.return_statement else []))
+        for called in calls:
+            if called in callers:
+                callers[called].add(name)
+            else:
+                impure.add(name)
+
+    # Every function that calls an impure function is impure too
+    todo = list(impure)
+    while todo:
+        for caller in callers.get(todo.pop(), ()):
+            if caller not in impure:
+                impure.add(caller)
+                todo.append(caller)
+
+    return {name for name in functions if name not in builtin_names and name not in impure}
+
+
+def memoize_functions(functions: Dict[str, FunctionNode], size: int = DEFAULT_CACHE_SIZE) -> LRUCache:
+    """
+    Give all pure functions of a program a shared result cache. Calls to these functions in
+    interpreter.execute.execute_function_node use the cache
+    :param functions: ProgramFunctions; functions of the program (see interpreter.execute), the cache is kept in them
+    :param size: int; maximum amount of results in the cache
+    :return: LRUCache; cache of the results
+    """
+    cache = LRUCache(size)
+    for name in find_pure_functions(functions):
+        functions.caches[name] = cache
+    return cache
+
+
+def memoize_compiled(compiled: Dict[str, Any], functions: Dict[str, FunctionNode], size: int = DEFAULT_CACHE_SIZE) -> LRUCache:
+    """
+    Let all pure functions compiled by interpreter.compiler use a shared result cache. Compiled calls look up the
+    called function when they are executed, so the compiled functions are replaced by memoized versions
+    :param compiled: Dict[str, CompiledFunction]; compiled functions, as given by compile_functions
+    :param functions: Dict[str, FunctionNode]; parsed functions of the compiled program
+    :param size: int; maximum amount of results in the cache
+    :return: LRUCache; cache of the results
+    """
+    cache = LRUCache(size)
+
+    def memoized(name: str, run: Any) -> Any:
+        def run_memoized(values: List[Union[int, str, bool]], call_line: int) -> Tuple[Union[int, str, bool], str]:
+            key = call_key(name, values)
+            result = cache.get(key)
+            if result is None:
+                result = run(values, call_line)
+                cache.put(key, result)
+            return result
+        return run_memoized
+
+    for name in find_pure_functions(functions):
+        compiled[name] = memoized(name, compiled[name])
+    return cache
@@ -0,0 +1,268 @@
+import os
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from decoder.lexer import Token
+from decoder.nodes import FunctionNode, Parameter
+from decoder.utils import Error, quiet_status
+from decoder.enums import ErrorType, TokensTypes
+from decoder.parser import first_word, index_functions, parse_bodies, add_builtins
+from decoder.io.jcjlreader import iterate_file_lines, iterate_processed_lines, stream_program
+from interpreter.typecheck import check_program
+from interpreter.memoize import builtin_names
+
+# A program can use the functions of other files with import statements at its start: import name loads the module
+# name.txt. A module is searched in the directory of the file that imports it, then in the directories of --path and
+# then in the directories of the environment variable JCJLPATH. The functions of a module are added to the functions of
+# the program, a name can only be defined once. Every module is parsed and type checked once per process and kept in
+# memory. The functions of a module are type checked with the functions of the module only, so their nodes are the same
+# for every program that imports them. The index of a module, the definition of every function with the lines of its
+# body, is stored in the cache directory of decoder.io.programcache. A next process reads the index and parses the body
+# of a function when it is called for the first time (as with --lazy), so loading a big module costs almost nothing.
+
+MODULE_EXTENSION = '.txt'
+PATH_VARIABLE = 'JCJLPATH'
+INDEX_EXTENSION = '.jcjli'
+# Version of the format of the index, part of the cached data
+INDEX_VERSION = 1
+# Definition of a function in the index: name, return type, line of the definition, type and name of every parameter
+# and the lines of the body
+IndexEntry = Tuple[str, str, int, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, int], ...]]
+
+# Directories that are searched for modules after the directory of the importing file, set by --path
+search_path: List[str] = []
+
+# Loaded modules by absolute path: the modification time and size of the module and of the modules it imports when it
+# was loaded, and its functions including the imported functions
+modules: Dict[str, Tuple[Dict[str, Tuple[int, int]], Dict[str, FunctionNode]]] = dict()
+
+
+def module_path(directory: str) -> List[str]:
+    """
+    Get the directories that are searched for a module
+    :param directory: str; directory of the importing file
+    :return: List[str]; directories in the order they are searched
+    """
+    return [directory] + search_path + [path for path in os.environ.get(PATH_VARIABLE, '').split(os.pathsep) if path]
+
+
+def find_module(name: str, directory: str) -> Optional[str]:
+    """
+    Find the file of a module
+    :param name: str; name of the module
+    :param directory: str; directory of the importing file
+    :return: str | None; absolute path of the module, None when it isn't found
+    """
+    for path in module_path(directory):
+        file = os.path.join(path, name + MODULE_EXTENSION)
+        if os.path.isfile(file):
+            return os.path.abspath(file)
+    return None
+
+
+def file_version(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Get the modification time and size of a file
+    :param path: str; path of the file
+    :return: Tuple[int, int] | None; modification time in nanoseconds and size, None when the file doesn't exist
+    """
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    return status.st_mtime_ns, status.st_size
+
+
+def read_imports(lines: Iterable[Tuple[str, int]]) -> Tuple[List[Tuple[str, int]], Error]:
+    """
+    Read the import statements at the start of a program, the lines after them aren't read
+    :param lines: Iterable[Tuple[str, int]]; processed lines with their line numbers, as given by the jcjlreader
+    :return: List[Tuple[str, int]], Error; name of every imported module with the line of its import, Error-object
+    """
+    imports = []
+    for line, line_nmr in lines:
+        if first_word(line) != 'import':
+            break
+        words = line.split()
+        if len(words) != 2:
+            return imports, Error(ErrorType.SYNTAX_ERROR, f'Invalid import at line {line_nmr}, expected: import name')
+        imports.append((words[1], line_nmr))
+    return imports, Error(ErrorType.NO_ERROR, '')
+
+
+def read_file_imports(file: str) -> Tuple[List[Tuple[str, int]], Error]:
+    """
+    Read the import statements at the start of a file
+    :param file: str; path of the file
+    :return: List[Tuple[str, int]], Error; name of every imported module with the line of its import, Error-object
+    """
+    lines = iterate_file_lines(file)
+    try:
+        return read_imports(lines)
+    finally:
+        lines.close()
+
+
+def to_index(functions: Dict[str, FunctionNode]) -> Tuple[IndexEntry, ...]:
+    """
+    Get the index of a module from its functions, before their bodies are parsed. The index only contains strings,
+    numbers and tuples, which are read a lot faster than pickled nodes
+    :param functions: Dict[str, FunctionNode]; functions as given by decoder.parser.index_functions
+    :return: Tuple[IndexEntry, ...]; definition of every function
+    """
+    return tuple((function.name, function.return_type.value, function.return_type.line_nmr,
+                  tuple((parameter.type.value, parameter.name) for parameter in function.parameters), tuple(function.source))
+                 for name, function in functions.items() if name not in builtin_names)
+
+
+def from_index(index: Tuple[IndexEntry, ...]) -> Dict[str, FunctionNode]:
+    """
+    Get the functions of a module from its index, with unparsed bodies
+    :param index: Tuple[IndexEntry, ...]; definition of every function
+    :return: Dict[str, FunctionNode]; functions indexed by name, as decoder.parser.index_functions gives them
+    """
+    functions = dict()
+    for name, return_type, line_nmr, parameters, source in index:
+        function = FunctionNode(name, Token(TokensTypes.TYPE, return_type, line_nmr))
+        function.parameters = [Parameter(Token(TokensTypes.TYPE, type, line_nmr), parameter) for type, parameter in parameters]
+        function.source = list(source)
+        functions[name] = function
+    add_builtins(functions)
+    return functions
+
+
+def read_module(path: str) -> Tuple[Optional[Dict[str, FunctionNode]], Error]:
+    """
+    Read the functions of a module, from the index in the cache directory when the module hasn't changed since the index
+    was stored. Otherwise the module is lexed and parsed completely, so its errors are found at once, and its index is
+    stored
+    :param path: str; absolute path of the module
+    :return: Dict[str, FunctionNode] | None, Error; functions of the module, Error-object
+    """
+    # Imported here, pickle and hashlib are only needed by programs that import a module
+    from decoder.io.programcache import program_key, cache_file, read_cache, store_program
+    key = program_key(path)
+    index_file = cache_file(path, extension=INDEX_EXTENSION)
+    cached = read_cache(index_file, key) if key is not None else None
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == INDEX_VERSION:
+        return from_index(cached[1]), Error(ErrorType.NO_ERROR, '')
+
+    with quiet_status():
+        lines = stream_program(path)
+        if isinstance(lines, Error):
+            return None, lines
+        functions, error = index_functions(lines)
+    if error.type != ErrorType.NO_ERROR:
+        return None, error
+    index = to_index(functions)
+    error = parse_bodies(functions)
+    if error.type != ErrorType.NO_ERROR:
+        return None, error
+    if key is not None:
+        store_program(index_file, key, (INDEX_VERSION, index))
+    return functions, error
+
+
+def load_module(path: str, loading: FrozenSet[str] = frozenset()) -> Tuple[Optional[Dict[str, FunctionNode]], Error]:
+    """
+    Get the functions of a module from memory, or load the module when it isn't loaded yet or when it or a module it
+    imports has changed
+    :param path: str; absolute path of the module
+    :param loading: FrozenSet[str]; modules that are importing this module, to find import cycles
+    :return: Dict[str, FunctionNode] | None, Error; functions of the module including its imported functions,
+        Error-object
+    """
+    loaded = modules.get(path)
+    if loaded is not None and all(file_version(file) == version for file, version in loaded[0].items()):
+        return loaded[1], Error(ErrorType.NO_ERROR, '')
+
+    versions = {path: file_version(path)}
+    functions, error = read_module(path)
+    if error.type == ErrorType.NO_ERROR:
+        imports, error = read_file_imports(path)
+    if error.type == ErrorType.NO_ERROR:
+        error = import_modules(imports, os.path.dirname(path), functions, loading | {path})
+    if error.type != ErrorType.NO_ERROR:
+        return None, Error(error.type, f'In module {path}:\n{error.message}')
+    check_program(functions)
+
+    for name, function in functions.items():
+        if function.module is None:
+            function.module = path
+        elif name not in builtin_names:
+            versions[function.module] = modules[function.module][0][function.module]
+    modules[path] = (versions, functions)
+    return functions, error
+
+
+def import_modules(imports: List[Tuple[str, int]], directory: str, functions: Dict[str, FunctionNode], loading: FrozenSet[str] = frozenset()) -> Error:
+    """
+    Load imported modules and add their functions to the functions of a program
+    :param imports: List[Tuple[str, int]]; name of every imported module with the line of its import
+    :param directory: str; directory of the importing file
+    :param functions: Dict[str, FunctionNode]; functions of the program, the imported functions are added
+    :param loading: FrozenSet[str]; modules that are importing the program, to find import cycles
+    :return: Error; Error-object
+    """
+    for name, line_nmr in imports:
+        path = find_module(name, directory)
+        if path is None:
+            return Error(ErrorType.IMPORT_ERROR, f'Module {name} imported at line {line_nmr} is not found in: {", ".join(module_path(directory))}')
+        if path in loading:
+            return Error(ErrorType.IMPORT_ERROR, f'Module {name} imported at line {line_nmr} imports itself')
+        module, error = load_module(path, loading)
+        if error.type != ErrorType.NO_ERROR:
+            return error
+        for function_name, function in module.items():
+            if function_name in builtin_names:
+                continue
+            defined = functions.setdefault(function_name, function)
+            if defined is not function:
+                return Error(ErrorType.IMPORT_ERROR, f'Function {function_name} of module {name} imported at line {line_nmr} is already defined')
+    return Error(ErrorType.NO_ERROR, '')
+
+
+def load_imports(file: str, functions: Dict[str, FunctionNode]) -> Error:
+    """
+    Load the modules that a program file imports and add their functions to the functions of the program
+    :param file: str; path of the program
+    :param functions: Dict[str, FunctionNode]; parsed functions of the program, the imported functions are added
+    :return: Error; Error-object
+    """
+    imports, error = read_file_imports(file)
+    if error.type != ErrorType.NO_ERROR or not imports:
+        return error
+    return import_modules(imports, os.path.dirname(os.path.abspath(file)), functions)
+
+
+def load_source_imports(source: str, functions: Dict[str, FunctionNode]) -> Error:
+    """
+    Load the modules that a program in a string imports, modules are searched in the working directory first
+    :param source: str; code of the program
+    :param functions: Dict[str, FunctionNode]; parsed functions of the program, the imported functions are added
+    :return: Error; Error-object
+    """
+    imports, error = read_imports(iterate_processed_lines(source.splitlines(), 1))
+    if error.type != ErrorType.NO_ERROR or not imports:
+        return error
+    return import_modules(imports, os.getcwd(), functions)
+
+
+def module_functions(function: FunctionNode) -> Optional[Dict[str, FunctionNode]]:
+    """
+    Get the functions of the module that defines a function, with which the types of the function are checked
+    :param function: FunctionNode; function of a module
+    :return: Dict[str, FunctionNode] | None; functions of the module, None when the module has been loaded again since
+        the function was loaded
+    """
+    loaded = modules.get(function.module)
+    if loaded is None or loaded[1].get(function.name) is not function:
+        return None
+    return loaded[1]
+
+
+def module_files(functions: Dict[str, FunctionNode]) -> Tuple[str, ...]:
+    """
+    Get the files of the modules a program imports, directly or through another module
+    :param functions: Dict[str, FunctionNode]; functions of the program
+    :return: Tuple[str, ...]; absolute paths of the modules
+    """
+    return tuple(sorted({function.module for function in functions.values() if function.module is not None}))
@@ -0,0 +1,22 @@
+from typing import Dict, List, Tuple, Union
+
+# Command line options of main.py and the scripts in interpreter. This module imports nothing of the interpreter, so the
+# thin client of interpreter.client can use it without loading the interpreter.
+
+
+def split_options(arguments: List[str]) -> Tuple[Dict[str, Union[str, bool]], List[str]]:
+    """
+    Split the command line arguments in options (starting with --) and the other arguments. An option can be given a
+    value with --option=value, otherwise the value of the option is True
+    :param arguments: List[str]; command line arguments
+    :return: Dict[str, str | bool], List[str]; options indexed by name, arguments that are not an option
+    """
+    options = dict()
+    rest = []
+    for argument in arguments:
+        if argument.startswith('--'):
+            name, has_value, value = argument[2:].partition('=')
+            options[name] = value if has_value else True
+        else:
+            rest.append(argument)
+    return options, rest
@@ -0,0 +1,185 @@
+import json
+import time
+from decoder.nodes import Node, Value, Operator, Call, Unary, IncDec, TypeAssignment, Assignment, Compare, Forloop, While, If
+from interpreter import hooks
+from typing import Any, Dict, List, Tuple
+
+# The profiler measures the tree-walking interpreter of interpreter.execute. It is an observer of interpreter.hooks that
+# is attached to a program (see interpreter.program.Program.observing), so other programs run without any extra work.
+#
+# A tail call is run after the calling function has ended (see execute_function_node), so its time is not part of the
+# inclusive time of the calling function. A call of a memoized function that is found in the cache is not counted.
+
+
+class ProfileEntry:
+    """
+    Measurements of a function or source line
+    """
+    __slots__ = ('count', 'inclusive', 'exclusive', 'active')
+
+    def __init__(self):
+        """
+        Initialize an entry without measurements
+        """
+        self.count = 0
+        # Time including the functions or lines that are run from this one, recursive runs are only counted once
+        self.inclusive = 0.0
+        # Time excluding the functions or lines that are run from this one
+        self.exclusive = 0.0
+        # Amount of runs that are busy, used to only count the outermost run in the inclusive time
+        self.active = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the measurements as a dictionary
+        :return: Dict[str, Any]; count, inclusive and exclusive time in seconds
+        """
+        return {'count': self.count, 'inclusive': self.inclusive, 'exclusive': self.exclusive}
+
+
+def expression_line(node: Node) -> int:
+    """
+    Get the source line of an expression
+    :param node: Node; expression node
+    :return: int; line of the expression, 0 when the node has no tokens
+    """
+    if isinstance(node, Value):
+        return node.value.line_nmr
+    elif isinstance(node, Operator) or isinstance(node, Compare):
+        return node.left.line_nmr
+    elif isinstance(node, Call):
+        return node.function.line_nmr
+    elif isinstance(node, Unary) or isinstance(node, IncDec):
+        return node.left.line_nmr
+    return 0
+
+
+def statement_line(node: Node) -> int:
+    """
+    Get the source line of a statement
+    :param node: Node; statement node
+    :return: int; line of the statement, 0 when the node has no tokens
+    """
+    if isinstance(node, TypeAssignment) or isinstance(node, Assignment):
+        return node.id.line_nmr
+    elif isinstance(node, Forloop):
+        return node.dowhile.left.line_nmr
+    elif isinstance(node, While):
+        return expression_line(node.dowhile)
+    elif isinstance(node, If):
+        return node.cmp.left.line_nmr
+    return expression_line(node)
+
+
+class Profiler(hooks.Observer):
+    """
+    Profiler that counts calls, statement executions and time per JCJL function and per source line
+    """
+    def __init__(self):
+        """
+        Initialize a profiler without measurements
+        """
+        self.functions: Dict[str, ProfileEntry] = dict()
+        self.lines: Dict[Tuple[str, int], ProfileEntry] = dict()
+        # Running functions and statements: name or line, entry, start time and time spent in nested runs
+        self.function_stack: List[list] = []
+        self.line_stack: List[list] = []
+
+    def start(self, stack: List[list], key: Any, entry: ProfileEntry):
+        """
+        Start measuring a function or line
+        :param stack: List[list]; running functions or running statements
+        :param key: Any; name of the function or function and line of the statement
+        :param entry: ProfileEntry; entry of the function or line
+        """
+        entry.count += 1
+        entry.active += 1
+        stack.append([key, entry, time.perf_counter(), 0.0])
+
+    def stop(self, stack: List[list]):
+        """
+        Stop measuring the last started function or line and add its time to its entry
+        :param stack: List[list]; running functions or running statements
+        """
+        _, entry, start, nested = stack.pop()
+        elapsed = time.perf_counter() - start
+        entry.exclusive += elapsed - nested
+        if stack:
+            stack[-1][3] += elapsed
+        entry.active -= 1
+        if entry.active == 0:
+            entry.inclusive += elapsed
+
+    def enter_function(self, function, parameters, call_line):
+        """
+        Start measuring a function call
+        """
+        entry = self.functions.get(function.name)
+        if entry is None:
+            entry = self.functions[function.name] = ProfileEntry()
+        self.start(self.function_stack, function.name, entry)
+
+    def exit_function(self, function, value, tail_call, error):
+        """
+        Stop measuring a function call
+        """
+        self.stop(self.function_stack)
+
+    def enter_statement(self, node, frame):
+        """
+        Start measuring a statement, by the running function and the line of the statement
+        """
+        key = (self.function_stack[-1][0] if self.function_stack else '', statement_line(node))
+        entry = self.lines.get(key)
+        if entry is None:
+            entry = self.lines[key] = ProfileEntry()
+        self.start(self.line_stack, key, entry)
+
+    def exit_statement(self, node, frame, error):
+        """
+        Stop measuring a statement
+        """
+        self.stop(self.line_stack)
+
+    def as_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all measurements, sorted by exclusive time
+        :return: Dict[str, List]; measurements of the functions and of the lines
+        """
+        functions = sorted(self.functions.items(), key=lambda item: item[1].exclusive, reverse=True)
+        lines = sorted(self.lines.items(), key=lambda item: item[1].exclusive, reverse=True)
+        return {
+            'functions': [dict(function=name, **entry.as_dict()) for name, entry in functions],
+            'lines': [dict(function=name, line=line, **entry.as_dict()) for (name, line), entry in lines],
+        }
+
+    def write_json(self, file: str):
+        """
+        Write all measurements to a JSON file
+        :param file: str; path of the file
+        """
+        with open(file, 'w') as output:
+            json.dump(self.as_dict(), output, indent=2)
+
+    def report(self, limit: int = 20) -> str:
+        """
+        Represent the measurements as a table, sorted by exclusive time
+        :param limit: int; maximum amount of functions and of lines in the table
+        :return: str; report of the measurements
+        """
+        profile = self.as_dict()
+        rows = [f'{"function":<20}{"calls":>10}{"inclusive s":>14}{"exclusive s":>14}']
+        for function in profile['functions'][:limit]:
+            rows.append(f'{function["function"]:<20}{function["count"]:>10}{function["inclusive"]:>14.6f}{function["exclusive"]:>14.6f}')
+        rows.append('')
+        rows.append(f'{"line":>6}  {"function":<20}{"executions":>12}{"inclusive s":>14}{"exclusive s":>14}')
+        for line in profile['lines'][:limit]:
+            rows.append(f'{line["line"]:>6}  {line["function"]:<20}{line["count"]:>12}{line["inclusive"]:>14.6f}{line["exclusive"]:>14.6f}')
+        return '\n'.join(rows)
+
+    def __str__(self) -> str:
+        """
+        Represent the measurements as a table
+        :return: str; report of the measurements
+        """
+        return self.report()
@@ -0,0 +1,286 @@
+from decoder.lexer import lexer, lex_lines
+from decoder.parser import parse, index_functions, parse_bodies
+from decoder.nodes import FunctionNode
+from decoder.utils import Error, quiet_status
+from decoder.enums import ErrorType
+from decoder.io.jcjlreader import iterate_processed_lines, stream_program
+from interpreter.execute import execute_function_node, ProgramFunctions
+from interpreter.typecheck import check_program
+from interpreter.modules import load_imports, load_source_imports
+from interpreter.console import Output, Input, Console
+from interpreter.hooks import Observer, ObservedFunctions
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from contextlib import contextmanager, nullcontext
+
+# A Program is a JCJL program that is loaded once and can be called many times from python, for example by a service
+# that embeds the language. Unlike interpreter.interpreter it prints nothing and never exits: errors are returned as
+# Error objects by run, or raised as ProgramError by call and the load functions.
+
+# Backends that can run a program: the tree-walking interpreter, the closure compiler and the bytecode VM
+BACKENDS = ('execute', 'compile', 'vm')
+
+
+class ProgramError(Exception):
+    """
+    Exception for an error of a JCJL program, the error object is kept in the exception
+    """
+    def __init__(self, error: Error):
+        """
+        Initialize the exception
+        :param error: Error; error of the program
+        """
+        super().__init__(str(error))
+        self.error = error
+
+
+def to_value(argument: Union[int, str, bool]) -> Union[int, str, bool]:
+    """
+    Convert a python argument to a JCJL value. Strings get the quotes that JCJL strings have while they are executed
+    :param argument: int | str | bool; python value
+    :return: int | str | bool; JCJL value
+    """
+    if isinstance(argument, str):
+        return f'"{argument}"'
+    if isinstance(argument, int):
+        return argument
+    raise ProgramError(Error(ErrorType.PARAMETER_ERROR, f'A JCJL function only takes int, str and bool parameters, not {type(argument).__name__}'))
+
+
+def from_value(value: Tuple[Union[int, str, bool], str]) -> Union[int, str, bool]:
+    """
+    Convert a returned JCJL value to a python value
+    :param value: Tuple[value, type]; returned value and its type
+    :return: int | str | bool; python value, strings without their quotes
+    """
+    if value[1] == 'string':
+        return value[0][1:-1]
+    return value[0]
+
+
+def parse_file(file: str, lazy: bool = False, cache: Union[bool, str] = False, quiet: bool = True) -> Tuple[Optional[Dict[str, FunctionNode]], Error, int]:
+    """
+    Lex and parse a program, with the functions of the modules it imports (see interpreter.modules). Every way of
+    loading a program file, main.py included, goes through this function
+    :param file: str; path of the program
+    :param lazy: bool; only index the functions, their bodies are parsed when they are called (see
+        decoder.parser.index_functions). A program from the cache is parsed already
+    :param cache: bool | str; use the cache of parsed programs (see decoder.io.programcache), a string gives the
+        directory of the cache files. A lazily indexed program isn't stored in the cache
+    :param quiet: bool; don't print the messages of status_logger
+    :return: Dict[str, FunctionNode] | None, Error, int; parsed functions, error object and the exit code main.py gives
+        for the error: 3 when the program can't be read or lexed, 4 when it or an imported module can't be parsed
+    """
+    with quiet_status() if quiet else nullcontext():
+        functions = None
+        if cache:
+            from decoder.io import programcache
+            key = programcache.program_key(file)
+            cache_file = programcache.cache_file(file, cache if isinstance(cache, str) else None)
+            if key is not None:
+                functions = programcache.load_program(cache_file, key)
+
+        if functions is None and lazy:
+            lines = stream_program(file)
+            if isinstance(lines, Error):
+                return None, lines, 3
+            functions, error = index_functions(lines)
+            if error.type != ErrorType.NO_ERROR:
+                return None, error, 4
+
+        if functions is None:
+            tokens, error = lexer(file)
+            if error.type != ErrorType.NO_ERROR:
+                return None, error, 3
+            functions, error = parse(tokens)
+            if error.type != ErrorType.NO_ERROR:
+                return None, error, 4
+            if cache and key is not None:
+                programcache.store_program(cache_file, key, functions)
+
+        error = load_imports(file, functions)
+        if error.type != ErrorType.NO_ERROR:
+            return None, error, 4
+    return functions, error, 0
+
+
+class Program:
+    """
+    Loaded JCJL program of which the functions can be called with python values
+    """
+    def __init__(self, functions: Dict[str, FunctionNode], backend: str = 'execute', memoize: Optional[int] = None, output: Optional[Output] = None, input_source: Optional[Input] = None):
+        """
+        Prepare parsed functions for running. The functions are type checked and compiled for the backend once. Programs
+        made from the same functions share the function nodes, the result caches and the console of a program are kept
+        in its ProgramFunctions (see interpreter.execute)
+        :param functions: Dict[str, FunctionNode]; parsed functions, as given by decoder.parser.parse
+        :param backend: str; execute, compile or vm, see BACKENDS
+        :param memoize: int | None; size of the result cache of pure functions, None to not memoize
+        :param output: Output | None; output of the print function (see interpreter.console), None for the current output
+        :param input_source: Input | None; input of the input function, None for the current input
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f'Unknown backend {backend}, choose from {", ".join(BACKENDS)}')
+        # Output and input of this program only, see interpreter.console
+        self.console = Console(output, input_source)
+        functions = ProgramFunctions(functions, self.console)
+        # Only the tree-walking interpreter parses the bodies of lazily parsed functions when they are called, the other
+        # backends and memoization need all bodies at once
+        if backend != 'execute' or memoize is not None:
+            error = parse_bodies(functions)
+            if error.type != ErrorType.NO_ERROR:
+                raise ProgramError(error)
+        self.functions = functions
+        self.backend = backend
+        # Functions without type errors run without runtime type checks
+        self.type_errors: List[Error] = check_program(functions)
+        self.memoize_cache = None
+        # Observers of the runs of the tree-walking interpreter, see attach
+        self.observers: List[Observer] = []
+        self.observed_functions: Optional[ObservedFunctions] = None
+
+        if backend == 'compile':
+            from interpreter.compiler import compile_functions, execute_compiled
+            compiled = compile_functions(functions, self.console)
+            if memoize is not None:
+                from interpreter.memoize import memoize_compiled
+                self.memoize_cache = memoize_compiled(compiled, functions, memoize)
+            self.runner: Callable = lambda name, parameters: execute_compiled(compiled, name, parameters, 0)
+        elif backend == 'vm':
+            from interpreter.bytecode import compile_program
+            from interpreter.vm import execute_bytecode
+            bytecode = compile_program(functions, self.console)
+            self.runner = lambda name, parameters: execute_bytecode(bytecode, name, parameters, 0)
+        else:
+            if memoize is not None:
+                from interpreter.memoize import memoize_functions
+                self.memoize_cache = memoize_functions(functions, memoize)
+            self.runner = self.execute
+
+    def execute(self, name: str, parameters: List[Union[int, str, bool]]) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Error]:
+        """
+        Run a function with the tree-walking interpreter, with the observers when they are attached
+        :param name: str; name of the function
+        :param parameters: List; parameter values for the function
+        :return: Tuple[value, type] | None, Error; return value and type of the function, error object
+        """
+        functions = self.functions if self.observed_functions is None else self.observed_functions
+        return execute_function_node(functions[name], parameters, functions, 0)
+
+    def attach(self, observer: Observer):
+        """
+        Let an observer follow the runs of the program (see interpreter.hooks). Only the tree-walking interpreter gives
+        events, raises ValueError for the other backends
+        :param observer: Observer; observer to attach
+        """
+        if self.backend != 'execute':
+            raise ValueError(f'Only the execute backend can be observed, not {self.backend}')
+        if observer in self.observers:
+            return
+        self.observers.append(observer)
+        if self.observed_functions is None:
+            self.observed_functions = ObservedFunctions(self.functions, self.observers)
+
+    def detach(self, observer: Observer):
+        """
+        Stop sending events to an observer. Without observers, the program runs without events again
+        :param observer: Observer; observer to detach
+        """
+        if observer not in self.observers:
+            return
+        self.observers.remove(observer)
+        if not self.observers:
+            self.observed_functions = None
+
+    @contextmanager
+    def observing(self, *observers: Observer) -> Iterator[None]:
+        """
+        Attach observers for the duration of a with-statement
+        :param observers: Observer; observers to attach
+        """
+        for observer in observers:
+            self.attach(observer)
+        try:
+            yield
+        finally:
+            for observer in observers:
+                self.detach(observer)
+
+    @classmethod
+    def load(cls, file: str, backend: str = 'execute', memoize: Optional[int] = None, cache: Union[bool, str] = False, quiet: bool = True, output: Optional[Output] = None, input_source: Optional[Input] = None, lazy: bool = False) -> 'Program':
+        """
+        Load a program from a file
+        :param file: str; path of the program
+        :param backend: str; execute, compile or vm, see BACKENDS
+        :param memoize: int | None; size of the result cache of pure functions, None to not memoize
+        :param cache: bool | str; use the cache of parsed programs (see decoder.io.programcache), a string gives the
+            directory of the cache files
+        :param quiet: bool; don't print the messages of status_logger while loading
+        :param output: Output | None; output of the print function, None for the current output
+        :param input_source: Input | None; input of the input function, None for the current input
+        :param lazy: bool; parse the body of a function when it is called for the first time, see
+            decoder.parser.index_functions. A program from the cache is parsed already
+        :return: Program; loaded program
+        """
+        functions, error, _ = parse_file(file, lazy, cache, quiet)
+        if functions is None:
+            raise ProgramError(error)
+        return cls(functions, backend, memoize, output, input_source)
+
+    @classmethod
+    def from_source(cls, source: str, backend: str = 'execute', memoize: Optional[int] = None, quiet: bool = True, output: Optional[Output] = None, input_source: Optional[Input] = None) -> 'Program':
+        """
+        Load a program from a string with JCJL code, imported modules are searched in the working directory first
+        :param source: str; code of the program
+        :param backend: str; execute, compile or vm, see BACKENDS
+        :param memoize: int | None; size of the result cache of pure functions, None to not memoize
+        :param quiet: bool; don't print the messages of status_logger while loading
+        :param output: Output | None; output of the print function, None for the current output
+        :param input_source: Input | None; input of the input function, None for the current input
+        :return: Program; loaded program
+        """
+        with quiet_status() if quiet else nullcontext():
+            tokens, error = lex_lines(iterate_processed_lines(source.splitlines(), 1))
+            if error.type == ErrorType.NO_ERROR:
+                functions, error = parse(tokens)
+            if error.type == ErrorType.NO_ERROR:
+                error = load_source_imports(source, functions)
+        if error.type != ErrorType.NO_ERROR:
+            raise ProgramError(error)
+        return cls(functions, backend, memoize, output, input_source)
+
+    def run(self, name: str, parameters: List[Union[int, str, bool]]) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Error]:
+        """
+        Run a function with JCJL values, strings included with their quotes
+        :param name: str; name of the function
+        :param parameters: List; parameter values for the function
+        :return: Tuple[value, type] | None, Error; return value and type of the function, error object
+        """
+        if name not in self.functions:
+            return None, Error(ErrorType.INVALID_NAME_ERROR, f'Program has no function {name}')
+        try:
+            return self.runner(name, parameters)
+        finally:
+            self.console.flush()
+
+    def call(self, name: str, *arguments: Union[int, str, bool]) -> Union[int, str, bool]:
+        """
+        Call a function with python values and get its return value as python value. Raises ProgramError when the
+        function gives an error
+        :param name: str; name of the function
+        :param arguments: int | str | bool; parameters of the function
+        :return: int | str | bool; return value of the function
+        """
+        value, error = self.run(name, [to_value(argument) for argument in arguments])
+        if error.type != ErrorType.NO_ERROR:
+            raise ProgramError(error)
+        return from_value(value)
+
+    def __getitem__(self, name: str) -> Callable[..., Union[int, str, bool]]:
+        """
+        Get a function of the program as python function, see call
+        :param name: str; name of the function
+        :return: Callable; function that calls the JCJL function with python values
+        """
+        if name not in self.functions:
+            raise KeyError(name)
+        return lambda *arguments: self.call(name, *arguments)
@@ -0,0 +1,382 @@
+from decoder.nodes import Node, Value, Operator, Call, Unary, IncDec, TypeAssignment, Assignment, Compare, Forloop, While, If, FunctionNode
+from decoder.enums import TokensTypes, ErrorType
+from decoder.utils import Error
+from interpreter.execute import int_function_map, int_compare_map, int_unary_map
+from interpreter.memoize import builtin_names
+from typing import Dict, List, Optional, Tuple
+
+# Every variable, parameter and function in JCJL has a declared type, so the type of every expression is known before
+# the program runs. check_program checks all functions of a program at once and reports every type error it finds. The
+# nodes of a function without type errors get the type of their expression or variable in node.resolved_type and the
+# function is marked as verified. interpreter.execute skips its type checks for these nodes. Whether a variable is
+# declared before it is used still depends on the order in which the statements run, so that is checked while running.
+
+# Types that a variable can have
+variable_types = ('int', 'bool', 'string')
+
+# Type of the result of an operator, indexed by the type of both sides and the operator
+operator_types = {
+    'int': {operator: result_type for operator, (_, result_type) in int_function_map.items()},
+    'bool': {'equals': 'bool', 'notequals': 'bool', 'and': 'bool', 'or': 'bool'},
+    'string': {'plus': 'string', 'equals': 'bool', 'notequals': 'bool'},
+}
+
+# Unary operators that can be applied to a variable of each type
+unary_operators = {
+    'int': set(int_unary_map),
+    'bool': {'andis', 'oris'},
+    'string': {'plusis'},
+}
+
+# Type of the parameter of the build-in functions, None when every type is accepted
+builtin_parameter_types = {
+    'print': None,
+    'size': 'string',
+    'input': 'string',
+}
+
+literal_types = {
+    TokensTypes.INT: 'int',
+    TokensTypes.BOOL: 'bool',
+    TokensTypes.STRING: 'string',
+}
+
+
+class FunctionCheck:
+    """
+    Type check of one function. The types of all variables of the function are collected first, because a variable
+    keeps its type for the whole function
+    """
+    def __init__(self, function: FunctionNode, functions: Dict[str, FunctionNode]):
+        """
+        Initialize the check of a function
+        :param function: FunctionNode; function to check
+        :param functions: Dict[str, FunctionNode]; All functions of the program
+        """
+        self.function = function
+        self.functions = functions
+        self.errors: List[Error] = []
+        self.variables: Dict[str, str] = dict()
+        # Nodes with their resolved type, only stored in the nodes when the function has no errors
+        self.resolved: List[Tuple[Node, str]] = []
+
+    def error(self, error_type: ErrorType, message: str):
+        """
+        Add an error of the checked function
+        :param error_type: ErrorType; type of the error
+        :param message: str; message of the error
+        """
+        self.errors.append(Error(error_type, f'In function {self.function.name}: {message}'))
+
+    def resolve(self, node: Node, node_type: str) -> str:
+        """
+        Remember the type of a node
+        :param node: Node; node of which the type is resolved
+        :param node_type: str; type of the node
+        :return: str; the given type
+        """
+        self.resolved.append((node, node_type))
+        return node_type
+
+    def declare(self, name: str, declared_type: str, line: int):
+        """
+        Declare a variable of the function. A variable can be declared more than once, but only with the same type
+        :param name: str; name of the variable
+        :param declared_type: str; type of the variable as written in the program
+        :param line: int; line of the declaration
+        """
+        declared_type = declared_type.lower()
+        if declared_type not in variable_types:
+            self.error(ErrorType.UNKNOW_TYPE_ERROR, f'Unknown type {declared_type} for variable {name} at line {line}')
+        elif self.variables.setdefault(name, declared_type) != declared_type:
+            self.error(ErrorType.TYPE_ERROR, f'Variable {name} is declared as {self.variables[name]} and as {declared_type} at line {line}')
+
+    def declare_nodes(self, nodes: List[Node]):
+        """
+        Declare the variables of all type assignments in a list of nodes, including those in loops and if-statements
+        :param nodes: List[Node]; nodes of the function body
+        """
+        todo = list(reversed(nodes))
+        while todo:
+            node = todo.pop()
+            if isinstance(node, TypeAssignment):
+                self.declare(node.id.value, node.type.value, node.id.line_nmr)
+            elif isinstance(node, Forloop):
+                self.declare(node.start.id.value, node.start.type.value, node.start.id.line_nmr)
+                todo.extend(reversed(node.body))
+            elif isinstance(node, While):
+                todo.extend(reversed(node.body))
+            elif isinstance(node, If):
+                todo.extend(reversed(node.else_body))
+                todo.extend(reversed(node.body))
+
+    def operand_type(self, token) -> Optional[str]:
+        """
+        Get the type of an identifier or literal token
+        :param token: Token; operand or call parameter
+        :return: str; type of the token, None when the token has no type
+        """
+        if token.type == TokensTypes.IDENTIFIER:
+            if token.value not in self.variables:
+                self.error(ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {token.value} is not declared, used at line {token.line_nmr}')
+                return None
+            return self.variables[token.value]
+        if token.type in literal_types:
+            return literal_types[token.type]
+        self.error(ErrorType.TYPE_ERROR, f'{token.value} at line {token.line_nmr} is no identifier or literal')
+        return None
+
+    def call_type(self, node: Call) -> Optional[str]:
+        """
+        Check the parameters of a function call and get the type it returns
+        :param node: Call; function call
+        :return: str; return type of the called function, None when the call is not valid
+        """
+        name = node.function.value
+        line = node.function.line_nmr
+        if name not in self.functions:
+            self.error(ErrorType.INVALID_NAME_ERROR, f'Unknow function call to {name} at line {line}')
+            return None
+        called = self.functions[name]
+        parameter_types = [self.operand_type(token) for token in node.parameters]
+        if name in builtin_names:
+            expected_types = [builtin_parameter_types[name]]
+        else:
+            expected_types = [parameter.type.value.lower() for parameter in called.parameters]
+
+        if len(parameter_types) != len(expected_types):
+            self.error(ErrorType.PARAMETER_ERROR, f'Function {name} takes {len(expected_types)} parameters, but {len(parameter_types)} are given at line {line}')
+            return None
+        for expected, given in zip(expected_types, parameter_types):
+            if given is None:
+                return None
+            if expected is not None and expected != given:
+                self.error(ErrorType.PARAMETER_ERROR, f'Function {name} expects a parameter of type {expected}, but got {given} at line {line}')
+                return None
+        return called.return_type.value
+
+    def expression_type(self, node: Node) -> Optional[str]:
+        """
+        Get the type of an expression
+        :param node: Node; expression node
+        :return: str; type of the expression, None when the expression has a type error
+        """
+        if isinstance(node, Value):
+            node_type = self.operand_type(node.value)
+        elif isinstance(node, Operator):
+            node_type = self.operator_type(node)
+        elif isinstance(node, Compare):
+            node_type = self.compare_type(node)
+        elif isinstance(node, Call):
+            node_type = self.call_type(node)
+        else:
+            self.error(ErrorType.STATEMENT_ERROR, f'{node} is not an expression')
+            return None
+        return self.resolve(node, node_type) if node_type is not None else None
+
+    def operator_type(self, node: Operator) -> Optional[str]:
+        """
+        Get the type of the result of an operator
+        :param node: Operator; operator node
+        :return: str; type of the result, None when the operator can't be applied to the operands
+        """
+        left, right = self.operand_type(node.left), self.operand_type(node.right)
+        if left is None or right is None:
+            return None
+        operator = node.operator.value.lower()
+        if left != right:
+            self.error(ErrorType.TYPE_ERROR, f'Operation {operator} between {left} and {right} at line {node.left.line_nmr}')
+            return None
+        if operator not in operator_types[left]:
+            self.error(ErrorType.TYPE_ERROR, f'Invalid {left} operator found: {operator} at line {node.operator.line_nmr}')
+            return None
+        return operator_types[left][operator]
+
+    def compare_type(self, node: Compare) -> Optional[str]:
+        """
+        Check the operands of a comparison
+        :param node: Compare; compare node
+        :return: str; bool, None when the operands can't be compared
+        """
+        left, right = self.operand_type(node.left), self.operand_type(node.right)
+        if left is None or right is None:
+            return None
+        operator = node.operator.value.lower()
+        if left != right:
+            self.error(ErrorType.TYPE_ERROR, f'Can\'t compare between different types (left: {left}, right: {right}) at line {node.operator.line_nmr}')
+            return None
+        if operator in int_compare_map and left != 'int':
+            self.error(ErrorType.TYPE_ERROR, f'Invalid type ({left}) found for {operator} operation at line {node.operator.line_nmr}')
+            return None
+        if operator not in int_function_map:
+            self.error(ErrorType.TYPE_ERROR, f'Invalid compare operator ({operator}) found at line {node.operator.line_nmr}')
+            return None
+        return 'bool'
+
+    def check_assigned(self, node: Node, name: str, expression: Node, line: int):
+        """
+        Check if an expression gives the type of the variable it is assigned to
+        :param node: Node; assignment node
+        :param name: str; name of the variable
+        :param expression: Node; assigned expression
+        :param line: int; line of the assignment
+        """
+        expression_type = self.expression_type(expression)
+        if name not in self.variables:
+            self.error(ErrorType.UNKNOW_VARIABLE_ERROR, f'Variable {name} is not declared, used at line {line}')
+        elif expression_type is not None:
+            if expression_type != self.variables[name]:
+                self.error(ErrorType.TYPE_ERROR, f'Variable {name} has type {self.variables[name]}, but expression gave {expression_type} at line {line}')
+            else:
+                self.resolve(node, expression_type)
+
+    def check_unary(self, node: Unary):
+        """
+        Check if a unary operator can be applied to a variable
+        :param node: Unary; unary node
+        """
+        if node.left.type != TokensTypes.IDENTIFIER:
+            self.error(ErrorType.TYPE_ERROR, f'Unary expression needs a identifier at the left side at line {node.left.line_nmr}')
+            return
+        right = self.expression_type(node.right)
+        left = self.operand_type(node.left)
+        if left is None or right is None:
+            return
+        operator = node.operator.value.lower()
+        if left != right:
+            self.error(ErrorType.TYPE_ERROR, f'Unary operator {operator} between {left} and {right} at line {node.left.line_nmr}')
+        elif operator not in unary_operators[left]:
+            self.error(ErrorType.TYPE_ERROR, f'Invalid unary operator ({operator}) for {left} at line {node.operator.line_nmr}')
+        else:
+            self.resolve(node, left)
+
+    def check_incdec(self, node: IncDec):
+        """
+        Check if a variable can be incremented or decremented
+        :param node: IncDec; increment or decrement node
+        """
+        variable_type = self.operand_type(node.left)
+        if variable_type is None:
+            return
+        if variable_type != 'int':
+            self.error(ErrorType.TYPE_ERROR, f'Variable of type {variable_type} can not be incremented or decremented at line {node.left.line_nmr}')
+        else:
+            self.resolve(node, variable_type)
+
+    def expression_line(self, node: Node) -> int:
+        """
+        Get the line of an expression
+        :param node: Node; expression node
+        :return: int; line of the expression, the line of the return statement when the node has no tokens
+        """
+        if isinstance(node, Value):
+            return node.value.line_nmr
+        elif isinstance(node, Operator) or isinstance(node, Compare):
+            return node.left.line_nmr
+        elif isinstance(node, Call):
+            return node.function.line_nmr
+        return self.function.return_line
+
+    def check_condition(self, node: Node, line: int):
+        """
+        Check if an expression can be used as the condition of a loop or if-statement
+        :param node: Node; condition expression
+        :param line: int; line of the statement
+        """
+        condition_type = self.expression_type(node)
+        if condition_type is not None and condition_type not in ('int', 'bool'):
+            self.error(ErrorType.TYPE_ERROR, f'Condition gives type {condition_type} at line {line}, only int and bool are valid')
+
+    def check_nodes(self, nodes: List[Node]):
+        """
+        Check a list of statements
+        :param nodes: List[Node]; statements to check
+        """
+        todo = list(reversed(nodes))
+        while todo:
+            node = todo.pop()
+            if isinstance(node, TypeAssignment):
+                self.check_assigned(node, node.id.value, node.expression, node.id.line_nmr)
+            elif isinstance(node, Assignment):
+                self.check_assigned(node, node.id.value, node.expression, node.id.line_nmr)
+            elif isinstance(node, Unary):
+                self.check_unary(node)
+            elif isinstance(node, IncDec):
+                self.check_incdec(node)
+            elif isinstance(node, Call):
+                self.expression_type(node)
+            elif isinstance(node, Forloop):
+                line = node.dowhile.left.line_nmr
+                self.check_assigned(node.start, node.start.id.value, node.start.expression, node.start.id.line_nmr)
+                self.check_condition(node.dowhile, line)
+                if isinstance(node.inc, Unary) or isinstance(node.inc, IncDec):
+                    todo.append(node.inc)
+                else:
+                    self.error(ErrorType.STATEMENT_ERROR, f'Invalid with operation in forloop at line {line}, only unary operations, incrementing and decrementing is allowed')
+                todo.extend(reversed(node.body))
+            elif isinstance(node, While):
+                self.check_condition(node.dowhile, self.expression_line(node.dowhile))
+                todo.extend(reversed(node.body))
+            elif isinstance(node, If):
+                self.check_condition(node.cmp, node.cmp.left.line_nmr)
+                todo.extend(reversed(node.else_body))
+                todo.extend(reversed(node.body))
+            else:
+                self.error(ErrorType.STATEMENT_ERROR, f'{node.__class__.__name__} node is not a statement: {node}')
+
+    def check(self, annotate: bool = True) -> List[Error]:
+        """
+        Check the whole function. When no errors are found, the resolved types are stored in the nodes and the function
+        is marked as verified
+        :param annotate: bool; store the result of the check in the nodes, otherwise only the errors are given
+        :return: List[Error]; all type errors of the function
+        """
+        function = self.function
+        for parameter in function.parameters:
+            self.declare(parameter.name, parameter.type.value, function.return_type.line_nmr)
+        self.declare_nodes(function.body)
+        self.check_nodes(function.body)
+
+        if function.return_statement is None:
+            self.error(ErrorType.NO_RETURN_FOUND, f'Expected return statement after function at line {function.return_line}')
+        else:
+            return_type = self.expression_type(function.return_statement)
+            if return_type is not None and return_type != function.return_type.value:
+                self.error(ErrorType.TYPE_ERROR, f'Function returns {return_type} at line {function.return_line}, but is defined to return {function.return_type.value}')
+
+        if not annotate:
+            return self.errors
+        function.verified = not self.errors
+        if function.verified:
+            for node, node_type in self.resolved:
+                node.resolved_type = node_type
+        return self.errors
+
+
+def check_function(function: FunctionNode, functions: Dict[str, FunctionNode], annotate: bool = True) -> List[Error]:
+    """
+    Check the types of a function. When the function has no type errors, its nodes get their resolved type and the
+    function is marked as verified
+    :param function: FunctionNode; function to check
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :param annotate: bool; store the result of the check in the nodes, otherwise only the errors are given
+    :return: List[Error]; type errors of the function, empty when the function is verified
+    """
+    return FunctionCheck(function, functions).check(annotate)
+
+
+def check_program(functions: Dict[str, FunctionNode]) -> List[Error]:
+    """
+    Check the types of all functions of a program, as given by decoder.parser.parse. Functions of which the body isn't
+    parsed yet (see decoder.parser.index_functions) are checked when they are parsed. Functions that are verified
+    already, like the functions of a module that is imported again (see interpreter.modules), aren't checked again. An
+    imported function that isn't verified is checked for its errors in this program, but its nodes keep the result of
+    the check in its own module, because they are shared by every program that imports the module
+    :param functions: Dict[str, FunctionNode]; All functions of the program
+    :return: List[Error]; type errors of all parsed functions, empty when all of them are verified
+    """
+    errors = []
+    for name, function in functions.items():
+        if name not in builtin_names and function.source is None and not function.verified:
+            errors.extend(check_function(function, functions, function.module is None))
+    return errors
@@ -0,0 +1,316 @@
+from decoder.enums import ErrorType
+from decoder.utils import Error
+from interpreter.bytecode import CodeObject, UNSET, OPERATION_SHIFT, operators, compares, unary_operators, \
+    MOVE, CHECK, JUMP, JUMP_IF_FALSE, JUMP_IF_UNSET, OPERATOR, COMPARE, UNARY, INCDEC, ASSIGN, FOR_START, WHILE_TEST, \
+    CALL, RETURN, RAISE, EVAL
+from interpreter.compiler import RuntimeFault, fail, parameter_type, token_types, compare_operations, compare_int_only_names
+from interpreter.execute import int_function_map, int_unary_map, int_value
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# The virtual machine runs the bytecode of interpreter.bytecode. Registers hold plain python values, the JCJL type of a
+# value follows from its python type. Calls between JCJL functions do not use the python stack: the registers and
+# position of the caller are pushed on a frame stack.
+
+Program = Dict[str, Union[CodeObject, Callable]]
+
+OPERATION_MASK = (1 << OPERATION_SHIFT) - 1
+
+# Functions of the fast paths, indexed by the operation number of the instruction. The last operator (div) is left out,
+# as it gives a float and needs a check for a division by 0
+FAST_OPERATORS = len(operators) - 1
+operator_functions = [int_function_map[operator][0] for operator in operators[:FAST_OPERATORS]]
+compare_functions = [compare_operations[operator] for operator in compares]
+unary_functions = [int_unary_map[operator] for operator in unary_operators]
+
+python_types = {
+    'int': (int, float),
+    'bool': (bool, ),
+    'string': (str, ),
+}
+
+
+def type_name(value: Union[int, float, str, bool]) -> str:
+    """
+    Get the JCJL type of a register value
+    :param value: int | float | str | bool; value of a register
+    :return: str; type of the value
+    """
+    if type(value) is bool:
+        return 'bool'
+    elif type(value) is str:
+        return 'string'
+    return 'int'
+
+
+def operate(operator: str, left_value: Any, right_value: Any, operator_line: int, line: int) -> Union[int, float, str, bool]:
+    """
+    Execute an operator instruction that is not handled by the fast path of the virtual machine
+    :param operator: str; operator of the node
+    :param left_value: Any; value of the left register
+    :param right_value: Any; value of the right register
+    :param operator_line: int; line of the operator
+    :param line: int; line of the left side of the operator
+    :return: int | float | str | bool; result of the operation
+    """
+    left_type = type_name(left_value)
+    right_type = type_name(right_value)
+    if left_type == 'string':
+        if right_type != 'string':
+            fail(ErrorType.RUNTIME_ERROR, f'At line {line} a operation between a string and not-string is not allowed')
+        if operator == 'plus':
+            return left_value + right_value
+        elif operator == 'equals':
+            return left_value == right_value
+        elif operator == 'notequals':
+            return left_value != right_value
+        fail(ErrorType.RUNTIME_ERROR, f'Invalid operator found: {operator} at line {operator_line}')
+    if left_type == 'int':
+        if right_type != 'int':
+            fail(ErrorType.RUNTIME_ERROR, f'At line {line} a operation between a int not-int is not allowed')
+        if operator not in int_function_map:
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid int operator found: {operator} at line {operator_line}')
+        left_value = int_value(left_value)
+        right_value = int_value(right_value)
+        if right_value == 0 and operator == 'div':
+            fail(ErrorType.RUNTIME_ERROR, f'Cannot divide by 0 at line {operator_line}')
+        return int_function_map[operator][0](left_value, right_value)
+    if right_type != 'bool':
+        fail(ErrorType.RUNTIME_ERROR, f'At line {line} a operation between a bool and a not bool is not allowed')
+    if operator == 'equals':
+        return left_value == right_value
+    elif operator == 'notequals':
+        return left_value != right_value
+    elif operator == 'and':
+        return left_value and right_value
+    elif operator == 'or':
+        return left_value or right_value
+    fail(ErrorType.RUNTIME_ERROR, f'Invalid bool operator found: {operator} at line {operator_line}')
+
+
+def compare(operator: str, left_value: Any, right_value: Any, operator_line: int, line: int, soft: bool) -> bool:
+    """
+    Execute a compare instruction that is not handled by the fast path of the virtual machine
+    :param operator: str; compare operator as written in the code
+    :param left_value: Any; value of the left register
+    :param right_value: Any; value of the right register
+    :param operator_line: int; line of the operator
+    :param line: int; line of the left side of the compare
+    :param soft: bool; give false instead of an error (compare of an if statement)
+    :return: bool; result of the compare
+    """
+    try:
+        left_type = type_name(left_value)
+        right_type = type_name(right_value)
+        if left_type != right_type:
+            fail(ErrorType.RUNTIME_ERROR, f'Can\'t compare between different types (left: {token_types[left_type]}, right: {token_types[right_type]}) at line {operator_line}')
+        name = operator.lower()
+        if name not in compare_operations:
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid compare operator ({operator}) found at line {operator_line}')
+        if name in compare_int_only_names and left_type != 'int':
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid type ({token_types[left_type]}) found for {compare_int_only_names[name]} operation at line {line}')
+        if left_type == 'int':
+            left_value = int_value(left_value)
+            right_value = int_value(right_value)
+        return compare_operations[name](left_value, right_value)
+    except RuntimeFault:
+        if soft:
+            return False
+        raise
+
+
+def unary(operator: str, left_value: Any, right_value: Any, written: str, operator_line: int) -> Union[int, float, str, bool]:
+    """
+    Execute a unary instruction that is not handled by the fast path of the virtual machine
+    :param operator: str; operator in lower case
+    :param left_value: Any; value of the variable
+    :param right_value: Any; value of the expression
+    :param written: str; operator as written in the code
+    :param operator_line: int; line of the operator
+    :return: int | float | str | bool; new value of the variable
+    """
+    left_type = type_name(left_value)
+    right_type = type_name(right_value)
+    if left_type != right_type:
+        fail(ErrorType.RUNTIME_ERROR, f'Unary expression can only be done between the same type, but left is {left_type} and right is {right_type}')
+    if left_type == 'int':
+        if operator not in int_unary_map:
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid unary operator ({written}) between tow ints on line {operator_line}')
+        return int_unary_map[operator](left_value, right_value)
+    elif left_type == 'string':
+        if operator != 'plusis':
+            fail(ErrorType.RUNTIME_ERROR, f'Invalid unary operator ({written}) between two strings at line {operator_line}')
+        return left_value + right_value
+    if operator == 'andis':
+        return left_value and right_value
+    elif operator == 'oris':
+        return left_value or right_value
+    fail(ErrorType.RUNTIME_ERROR, f'Invalid unary operation ({written}) on two bools at line {operator_line}')
+
+
+def enter(code: CodeObject, values: List[Any], call_line: int) -> List[Any]:
+    """
+    Create the registers of a function call and check the parameters
+    :param code: CodeObject; called function
+    :param values: List; parameter values
+    :param call_line: int; line of the call
+    :return: List; registers of the call
+    """
+    if len(values) != len(code.parameters):
+        fail(ErrorType.PARAMETER_ERROR, f'Function call with mis matched parameter amount at line {call_line}')
+    registers = code.registers.copy()
+    for (slot, expected_type, declared_type), value in zip(code.parameters, values):
+        given_type = parameter_type(value)
+        if expected_type != given_type:
+            fail(ErrorType.PARAMETER_ERROR, f'Parameter type mismatch in function call to {code.name} at line {call_line}. Expected {declared_type} but got {given_type}')
+        registers[slot] = value
+    return registers
+
+
+def run(program: Program, name: str, values: List[Any], call_line: int) -> Any:
+    """
+    Run a function of a program until it returns. Errors are raised as RuntimeFault
+    :param program: Program; bytecode of the program, as given by interpreter.bytecode.compile_program
+    :param name: str; name of the function
+    :param values: List; parameter values
+    :param call_line: int; line of the call
+    :return: Any; return value of the function
+    """
+    code = program[name]
+    if not isinstance(code, CodeObject):
+        return code(values, call_line)[0]
+
+    frames = []
+    registers = enter(code, values, call_line)
+    instructions = code.instructions
+    pc = 0
+    try:
+        while True:
+            opcode, a, b, c = instructions[pc]
+            pc += 1
+            instruction = opcode & OPERATION_MASK
+
+            if instruction == CHECK:
+                if registers[a] is UNSET:
+                    fail(*code.infos[pc - 1])
+            elif instruction == OPERATOR:
+                left_value = registers[b]
+                right_value = registers[c]
+                operation = opcode >> OPERATION_SHIFT
+                if type(left_value) is int and type(right_value) is int and operation < FAST_OPERATORS:
+                    if operation == 0:
+                        registers[a] = left_value + right_value
+                    elif operation == 1:
+                        registers[a] = left_value - right_value
+                    else:
+                        registers[a] = operator_functions[operation](left_value, right_value)
+                else:
+                    operator, operator_line, line = code.infos[pc - 1]
+                    registers[a] = operate(operator, left_value, right_value, operator_line, line)
+            elif instruction == COMPARE:
+                left_value = registers[b]
+                right_value = registers[c]
+                operation = opcode >> OPERATION_SHIFT
+                if type(left_value) is int and type(right_value) is int and operation < len(compare_functions):
+                    registers[a] = compare_functions[operation](left_value, right_value)
+                else:
+                    operator, operator_line, line, soft = code.infos[pc - 1]
+                    registers[a] = compare(operator, left_value, right_value, operator_line, line, soft)
+            elif instruction == JUMP_IF_FALSE:
+                if not registers[a]:
+                    pc = b
+            elif instruction == JUMP:
+                pc = a
+            elif instruction == INCDEC:
+                value = registers[a]
+                if type(value) is int or type(value) is float:
+                    registers[a] = value + b
+                else:
+                    fail(ErrorType.RUNTIME_ERROR, f'Variable of type {type_name(value)} can not be incremented or decremented at line {code.infos[pc - 1]}')
+            elif instruction == UNARY:
+                left_value = registers[a]
+                right_value = registers[b]
+                operation = opcode >> OPERATION_SHIFT
+                if type(left_value) is int and type(right_value) is int and operation < len(unary_functions):
+                    registers[a] = unary_functions[operation](left_value, right_value)
+                else:
+                    operator, written, operator_line = code.infos[pc - 1]
+                    registers[a] = unary(operator, left_value, right_value, written, operator_line)
+            elif instruction == MOVE:
+                registers[a] = registers[b]
+            elif instruction == ASSIGN:
+                old_value = registers[a]
+                new_value = registers[b]
+                if type(old_value) is not type(new_value) and type_name(old_value) != type_name(new_value):
+                    fail(ErrorType.RUNTIME_ERROR, f'Variable has type {type_name(old_value)}, but expression gave {type_name(new_value)} at line {code.infos[pc - 1]}')
+                registers[a] = new_value
+            elif instruction == WHILE_TEST:
+                value = registers[a]
+                if type(value) is str:
+                    fail(ErrorType.RUNTIME_ERROR, f'While expression resulted in type "string" at line {code.infos[pc - 1]}. Valid types are only int and boool.')
+                if not value:
+                    pc = b
+            elif instruction == CALL:
+                arguments, line = code.infos[pc - 1]
+                values = [registers[register] for register in arguments]
+                if UNSET in values:
+                    # Like the tree-walking interpreter, an undeclared variable is passed as 0
+                    values = [0 if value is UNSET else value for value in values]
+                callee = code.callees[b]
+                if isinstance(callee, CodeObject):
+                    callee_registers = enter(callee, values, line)
+                    frames.append((code, pc, registers, a, call_line))
+                    code = callee
+                    instructions = callee.instructions
+                    registers = callee_registers
+                    call_line = line
+                    pc = 0
+                else:
+                    registers[a] = callee(values, line)[0]
+            elif instruction == RETURN:
+                value = registers[a]
+                if type(value) not in python_types.get(code.return_type, ()):
+                    fail(ErrorType.RUNTIME_ERROR, f'Function {code.name} called at line {call_line} did not return the defined type. Expected {code.return_type} but got {type_name(value)}')
+                if not frames:
+                    return value
+                code, pc, registers, target, call_line = frames.pop()
+                instructions = code.instructions
+                registers[target] = value
+            elif instruction == FOR_START:
+                start_type, redefined, mismatched = code.infos[pc - 1]
+                if registers[a] is not UNSET:
+                    fail(ErrorType.RUNTIME_ERROR, redefined)
+                if type_name(registers[b]) != start_type:
+                    fail(ErrorType.RUNTIME_ERROR, mismatched + type_name(registers[b]))
+                registers[a] = registers[b]
+            elif instruction == JUMP_IF_UNSET:
+                if registers[a] is UNSET:
+                    pc = b
+            elif instruction == EVAL:
+                registers[a] = code.infos[pc - 1]()
+            elif instruction == RAISE:
+                fail(*code.infos[pc - 1])
+    except RuntimeFault as fault:
+        # Errors in the body of a function get the name of the function and the line of the call in front of the
+        # message. The position of a caller points after its call instruction.
+        frames.append((code, pc, registers, 0, call_line))
+        for frame_code, frame_pc, _, _, frame_call_line in reversed(frames):
+            if frame_pc - 1 < frame_code.return_start:
+                fault.error.message = f'Error while executing {frame_code.name}. Function called at line: {frame_call_line}\n' + fault.error.message
+        raise
+
+
+def execute_bytecode(program: Program, name: str, parameters: List[Union[int, str, bool]], call_line: int) -> Tuple[Optional[Tuple[Union[int, str, bool], str]], Error]:
+    """
+    Run a function of a program in the virtual machine
+    :param program: Program; bytecode of the program, as given by interpreter.bytecode.compile_program
+    :param name: str; name of the function to run
+    :param parameters: List; parameter values for the function
+    :param call_line: int; line from where the function is called
+    :return: Tuple[value, type] | None, Error; return value and type of the function, error object
+    """
+    try:
+        value = run(program, name, parameters, call_line)
+    except RuntimeFault as fault:
+        return None, fault.error
+    return_type = program[name].return_type if isinstance(program[name], CodeObject) else type_name(value)
+    return (value, return_type), Error(ErrorType.NO_ERROR, '')
@@ -0,0 +1,320 @@
+import os
+import sys
+import time
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+from decoder.lexer import Token, lex_line, format_syntax_error
+from decoder.parser import find_function_definition, add_builtins, first_word
+from decoder.nodes import FunctionNode
+from decoder.utils import Error
+from decoder.enums import ErrorType, TokensTypes
+from decoder.io.jcjlreader import find_program, iterate_processed_lines
+from interpreter.execute import execute_function_node
+from interpreter.typecheck import check_function
+from interpreter.modules import read_imports, import_modules, module_files, file_version
+from interpreter.console import value_text
+
+# Watch mode runs a function of a program again every time the file of the program changes. The lines, tokens and
+# FunctionNodes of the last version are kept in memory. The lines of the new version are compared with the last version
+# from the start and from the end of the file, only the functions that contain changed lines are processed and split
+# again. A function of which no line has changed keeps its FunctionNode (only its line numbers are moved when lines
+# above it were added or removed), a changed function is lexed again, reusing the tokens of lines that were already in
+# the function, and parsed on its own. The imported modules are loaded by interpreter.modules, which keeps them in memory
+# until they change.
+
+# Seconds between two checks of the file, when --watch has no value
+DEFAULT_INTERVAL = 0.5
+
+# Text of the lines of a function, with the line number of every line relative to the first line
+BlockKey = Tuple[Tuple[str, int], ...]
+
+
+class Block:
+    """
+    Lines of one function definition with its tokens and FunctionNode
+    """
+    __slots__ = ('key', 'first_line', 'start', 'end', 'line_tokens', 'function')
+
+    def __init__(self, key: BlockKey, first_line: int, start: int, end: int, line_tokens: List[List[Token]], function: FunctionNode):
+        """
+        Initialize the block
+        :param key: BlockKey; text and relative line number of every line
+        :param first_line: int; line number of the definition line
+        :param start: int; index of the first line of the block in the file, including comments and empty lines above
+            the definition
+        :param end: int; index after the return line in the file
+        :param line_tokens: List[List[Token]]; tokens of every line, without end-line tokens
+        :param function: FunctionNode; parsed function
+        """
+        self.key = key
+        self.first_line = first_line
+        self.start = start
+        self.end = end
+        self.line_tokens = line_tokens
+        self.function = function
+
+    def move(self, first_line: int):
+        """
+        Move the function to another first line, by changing the line numbers of its tokens
+        :param first_line: int; new line number of the definition line
+        """
+        shift = first_line - self.first_line
+        if shift == 0:
+            return
+        for tokens in self.line_tokens:
+            for token in tokens:
+                token.line_nmr += shift
+        self.function.return_line += shift
+        self.first_line = first_line
+
+
+def split_functions(lines: List[Tuple[str, int]], start: int, end: int) -> Tuple[List[Tuple[BlockKey, int, int, int]], bool]:
+    """
+    Split the processed lines of a part of a program in function definitions, a definition ends at the line that starts
+    with return in any case, as in decoder.parser.index_functions. Lines after the last return form a definition without return,
+    import statements before the first definition are skipped
+    :param lines: List[Tuple[str, int]]; processed lines with their line numbers, as given by the jcjlreader
+    :param start: int; index of the first line of the part in the file
+    :param end: int; index after the last line of the part in the file
+    :return: List[Tuple[BlockKey, int, int, int]], bool; lines of every definition with the line number of its first
+        line and its start and end index in the file, and whether the last definition has a return
+    """
+    blocks = []
+    first = 0
+    for position, (line, line_nmr) in enumerate(lines):
+        if not blocks and position == first and first_word(line) == 'import':
+            first = position + 1
+        elif first_word(line) == 'return':
+            blocks.append((lines[first:position + 1], start, line_nmr))
+            first = position + 1
+            start = line_nmr
+    complete = first == len(lines)
+    if not complete:
+        blocks.append((lines[first:], start, end))
+    return [(tuple((line, line_nmr - block[0][1]) for line, line_nmr in block), block[0][1], start, end) for block, start, end in blocks], complete
+
+
+def join_tokens(line_tokens: List[List[Token]]) -> List[Token]:
+    """
+    Join the tokens of lines with an end-line token after every line, as decoder.lexer does
+    :param line_tokens: List[List[Token]]; tokens of every line
+    :return: List[Token]; tokens of the lines
+    """
+    tokens = []
+    for line in line_tokens:
+        tokens.extend(line)
+        tokens.append(Token(TokensTypes.ENDLINE, '\n', line[-1].line_nmr))
+    return tokens
+
+
+def parse_function(line_tokens: List[List[Token]]) -> Tuple[Optional[FunctionNode], Error]:
+    """
+    Parse the tokens of one function definition
+    :param line_tokens: List[List[Token]]; tokens of every line of the definition
+    :return: FunctionNode | None, Error; parsed function, Error-object
+    """
+    tokens = join_tokens(line_tokens)
+    if len(tokens) < 3 or tokens[1].type != TokensTypes.FUNCTION:
+        return None, Error(ErrorType.SYNTAX_ERROR, f'No valid function definition at line {tokens[0].line_nmr}')
+    function, _, error = find_function_definition(tokens, 0, len(tokens))
+    return function, error
+
+
+def signatures(functions: Iterable[FunctionNode]) -> Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]]:
+    """
+    Get the return type and parameters of functions, the part of a function other functions depend on
+    :param functions: Iterable[FunctionNode]; functions of a program
+    :return: Dict[str, Tuple]; return type and the name and type of every parameter, by function name
+    """
+    return {function.name: (function.return_type.value, tuple((parameter.name, parameter.type.value) for parameter in function.parameters)) for function in functions}
+
+
+class WatchedProgram:
+    """
+    Program that is loaded again from its file, parsing only the functions that have changed
+    """
+    def __init__(self, file: str):
+        """
+        Initialize the program, nothing is loaded until refresh is called
+        :param file: str; path of the program
+        """
+        self.file = file
+        # Lines of the file and its functions in the order of the file, of the last version without errors
+        self.lines: List[str] = []
+        self.blocks: List[Block] = []
+        self.functions: Dict[str, FunctionNode] = dict()
+        self.imported: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = dict()
+        # Amount of functions that were lexed and parsed by the last refresh
+        self.changed = 0
+
+    def lex_block(self, key: BlockKey, first_line: int, known_lines: Dict[str, List[Token]]) -> Tuple[List[List[Token]], Error]:
+        """
+        Lex the lines of a function, the tokens of lines that were already in the program are copied
+        :param key: BlockKey; lines of the function
+        :param first_line: int; line number of the first line
+        :param known_lines: Dict[str, List[Token]]; tokens of lines of the last version, by text
+        :return: List[List[Token]], Error; tokens of every line, Error-object
+        """
+        line_tokens = []
+        for line, offset in key:
+            line_nmr = first_line + offset
+            known = known_lines.get(line)
+            if known is not None:
+                line_tokens.append([Token(token.type, token.value, line_nmr) for token in known])
+            else:
+                line_tokens.append(lex_line(line, line_nmr))
+        error_tokens = [token for tokens in line_tokens for token in tokens if token.type == TokensTypes.ERROR]
+        if error_tokens:
+            return line_tokens, Error(ErrorType.SYNTAX_ERROR, '\n'.join(format_syntax_error(token.value, token.line_nmr) for token in error_tokens))
+        return line_tokens, Error(ErrorType.NO_ERROR, '')
+
+    def changed_region(self, lines: List[str]) -> Tuple[int, int]:
+        """
+        Find the functions of the last version that contain all changed lines, by comparing the lines at the start and
+        at the end of the file with the last version
+        :param lines: List[str]; lines of the new version of the file
+        :return: int, int; index of the first and last function that contain changed lines, the amount of functions
+            when the changes are after the last function
+        """
+        size = min(len(self.lines), len(lines))
+        same_start = next((number for number in range(size) if self.lines[number] != lines[number]), size)
+        same_end = next((number for number in range(size - same_start) if self.lines[-1 - number] != lines[-1 - number]), size - same_start)
+        ends = [block.end for block in self.blocks]
+        return bisect_right(ends, same_start), bisect_right(ends, max(len(self.lines) - same_end - 1, same_start))
+
+    def refresh(self) -> Error:
+        """
+        Load the current version of the file. Only functions with changed lines are lexed, parsed and type checked,
+        unless the name or type of a function or parameter changed, also of an imported function: then all functions are
+        parsed again from their tokens and checked, because the types in the other functions depend on them. With an
+        error the last version is kept
+        :return: Error; Error-object
+        """
+        error = find_program(self.file)
+        if error is not None:
+            return error
+        with open(self.file) as program:
+            lines = program.read().split('\n')
+        shift = len(lines) - len(self.lines)
+        imports, error = read_imports(iterate_processed_lines(lines, 1))
+        if error.type != ErrorType.NO_ERROR:
+            return error
+        imported = dict()
+        error = import_modules(imports, os.path.dirname(os.path.abspath(self.file)), imported)
+        if error.type != ErrorType.NO_ERROR:
+            return error
+
+        # The changed lines are processed again, up to the end of a function definition
+        first, last = self.changed_region(lines)
+        while True:
+            start = self.blocks[first].start if first < len(self.blocks) else self.blocks[-1].end if self.blocks else 0
+            end = (self.blocks[last].end if last < len(self.blocks) else len(self.lines)) + shift
+            found, complete = split_functions(list(iterate_processed_lines(lines[start:end], start + 1)), start, end)
+            if complete or last >= len(self.blocks):
+                break
+            last += 1
+
+        old_blocks = {block.key: block for block in self.blocks[first:last + 1]}
+        known_lines = {line: tokens for block in old_blocks.values() for (line, _), tokens in zip(block.key, block.line_tokens)}
+        region = []
+        changed = []
+        for key, first_line, block_start, block_end in found:
+            block = old_blocks.pop(key, None)
+            if block is None:
+                line_tokens, error = self.lex_block(key, first_line, known_lines)
+                if error.type != ErrorType.NO_ERROR:
+                    return error
+                function, error = parse_function(line_tokens)
+                if error.type != ErrorType.NO_ERROR:
+                    return error
+                block = Block(key, first_line, block_start, block_end, line_tokens, function)
+                changed.append(block)
+            region.append((block, first_line, block_start, block_end))
+        blocks = self.blocks[:first] + [block for block, *_ in region] + self.blocks[last + 1:]
+        for block in blocks:
+            if block.function.name in imported:
+                return Error(ErrorType.IMPORT_ERROR, f'Function {block.function.name} at line {block.first_line} is already defined by an imported module')
+
+        # Blocks are only moved when the new version has no errors
+        for block, first_line, block_start, block_end in region:
+            block.move(first_line)
+            block.start, block.end = block_start, block_end
+        for block in self.blocks[last + 1:]:
+            block.move(block.first_line + shift)
+            block.start += shift
+            block.end += shift
+        imported_signatures = signatures(imported.values())
+        signatures_changed = imported_signatures != self.imported or \
+            signatures(block.function for block in self.blocks[first:last + 1]) != signatures(block.function for block, *_ in region)
+        self.blocks = blocks
+        self.lines = lines
+        self.imported = imported_signatures
+
+        if signatures_changed:
+            # The resolved types of the other functions may be wrong now, their tokens are parsed again
+            new_blocks = set(changed)
+            for block in self.blocks:
+                if block not in new_blocks:
+                    block.function, _ = parse_function(block.line_tokens)
+            changed = self.blocks
+        self.functions = {block.function.name: block.function for block in self.blocks}
+        self.functions.update(imported)
+        add_builtins(self.functions)
+        for block in changed:
+            check_function(block.function, self.functions)
+        self.changed = len(changed)
+        return Error(ErrorType.NO_ERROR, '')
+
+
+def watch(file: str, name: str, parameters: List, interval: float = DEFAULT_INTERVAL, quiet: bool = False):
+    """
+    Run a function every time the file of the program or a module it imports changes, until the watch is stopped with
+    ctrl-c
+    :param file: str; path of the program
+    :param name: str; name of the function
+    :param parameters: List; parameter values for the function
+    :param interval: float; seconds between two checks of the file
+    :param quiet: bool; leave out the reload messages and the banners
+    """
+    program = WatchedProgram(file)
+    version = None
+    try:
+        while True:
+            current = (file_version(file), *map(file_version, module_files(program.functions)))
+            if current != version:
+                version = current
+                start = time.perf_counter()
+                error = program.refresh()
+                elapsed = (time.perf_counter() - start) * 1000
+                if error.type != ErrorType.NO_ERROR:
+                    print(error)
+                else:
+                    if not quiet:
+                        print(f'Reloaded {program.changed} of {len(program.blocks)} functions in {elapsed:.1f} ms')
+                    run(program.functions, name, parameters, quiet)
+                sys.stdout.flush()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def run(functions: Dict[str, FunctionNode], name: str, parameters: List, quiet: bool = False):
+    """
+    Run a function of the watched program and print its exit value or error
+    :param functions: Dict[str, FunctionNode]; functions of the program
+    :param name: str; name of the function
+    :param parameters: List; parameter values for the function
+    :param quiet: bool; leave out the banners
+    """
+    if name not in functions:
+        print(Error(ErrorType.INVALID_NAME_ERROR, f'Program has no function {name}'))
+        return
+    if not quiet:
+        print('_____________START RUNNING PROGRAM_____________')
+    return_value, error = execute_function_node(functions[name], list(parameters), functions, 0)
+    if error.type != ErrorType.NO_ERROR:
+        print(error)
+    elif return_value is not None:
+        print(f'Program exit value: {value_text(return_value[0])}')
+    if not quiet:
+        print('_________________PROGRAM ENDED_________________')
@@ -82,5 +82,114 @@ class IntegrationTest(unittest.TestCase):
         self.assertEqual(functions, expected, 'Function node was not generated correctly')
 
 
+class ProgramCacheTest(unittest.TestCase):
+    """
+    Test the cache of parsed programs in decoder.io.programcache
+    """
+    def setUp(self):
+        import os
+        import shutil
+        import tempfile
+        from unittest import mock
+        from decoder.io import programcache
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.file = os.path.join(self.directory, 'examples.txt')
+        shutil.copy('programs/examples.txt', self.file)
+        # The cache directory of the user, for this test only
+        self.cache = os.path.join(self.directory, 'cache')
+        environment = mock.patch.dict(os.environ, {programcache.CACHE_VARIABLE: self.cache})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def parse(self):
+        """
+        Parse the program through the cache, as main.py does with --cache
+        :return: Dict[str, FunctionNode], Error, str; functions, error and the printed status messages
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter.program import parse_file
+        output = StringIO()
+        with redirect_stdout(output):
+            functions, error, _ = parse_file(self.file, cache=True, quiet=False)
+        return functions, error, output.getvalue()
+
+    def test_warm_run_skips_lexing_and_parsing(self):
+        """
+        Test if a second parse loads the same functions from the cache without lexing and parsing
+        """
+        import os
+        from decoder.io import programcache
+        cold, _, cold_output = self.parse()
+        self.assertTrue(os.path.isfile(programcache.cache_file(self.file)), 'No cache file was written')
+        warm, error, warm_output = self.parse()
+        self.assertIn('Start parsing program', cold_output)
+        self.assertNotIn('Start lexing program', warm_output)
+        self.assertNotIn('Start parsing program', warm_output)
+        self.assertEqual(str(warm), str(cold), 'Cached functions differ from the parsed functions')
+
+    def test_changed_source_is_parsed_again(self):
+        """
+        Test if a change of the program makes the cache invalid
+        """
+        self.parse()
+        with open(self.file, 'a') as program:
+            program.write('\nint function extra\n    return 5\n')
+        functions, _, output = self.parse()
+        self.assertIn('Start parsing program', output)
+        self.assertIn('extra', functions)
+
+    def test_damaged_cache_is_ignored(self):
+        """
+        Test if a damaged cache file is ignored and replaced
+        """
+        from decoder.io import programcache
+        from decoder import enums
+        self.parse()
+        path = programcache.cache_file(self.file)
+        with open(path, 'r+b') as cached:
+            cached.seek(programcache.HEADER.size)
+            cached.write(b'broken')
+        functions, error, output = self.parse()
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertIn('Start parsing program', output)
+        self.assertIn('power', functions)
+        self.assertEqual(str(self.parse()[0]), str(functions))
+
+    def test_cache_is_private(self):
+        """
+        Test if the cache directory and file can only be used by the user, and a cache file that others can write is
+        ignored
+        """
+        import os
+        import stat
+        from decoder.io import programcache
+        self.parse()
+        path = programcache.cache_file(self.file)
+        self.assertEqual(os.path.dirname(path), self.cache)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache).st_mode), 0o700)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        self.assertNotIn('Start parsing program', self.parse()[2])
+
+        os.chmod(path, 0o666)
+        self.assertIn('Start parsing program', self.parse()[2])
+
+    def test_version_includes_interpreter(self):
+        """
+        Test if the source of the interpreter is part of the interpreter version
+        """
+        from decoder.io import programcache
+        programcache.interpreter_version.cache_clear()
+        self.addCleanup(programcache.interpreter_version.cache_clear)
+        version = programcache.interpreter_version()
+        programcache.interpreter_version.cache_clear()
+        programcache.version_packages.remove('interpreter')
+        try:
+            self.assertNotEqual(programcache.interpreter_version(), version)
+        finally:
+            programcache.version_packages.append('interpreter')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -23,6 +23,320 @@ class InterpreterTest(unittest.TestCase):
 
         self.assertEqual(output, expected, 'Interpreter output was not as expected')
 
+    def test_quiet(self):
+        from io import StringIO
+        import sys
+        from decoder import utils
+        from interpreter import interpreter
+        sys.stdout = StringIO()
+
+        arguments = ['--quiet', 'tests/test_code.txt', 'even_or_odd', '5']
+        try:
+            with self.assertRaises(SystemExit):
+                interpreter.interpreter(arguments)
+        finally:
+            utils.log_status = True
+            output = sys.stdout.getvalue()
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(output, 'given value is odd\nProgram exit value: 0\n', 'Quiet output was not as expected')
+
+    def test_input_exhausted(self):
+        """
+        Test if reading more input than given is a runtime error, and if the buffered output is written before it
+        """
+        import os
+        import sys
+        import tempfile
+        from io import StringIO
+        from decoder import utils
+        from interpreter import interpreter
+
+        with tempfile.TemporaryDirectory() as directory:
+            empty = os.path.join(directory, 'input.txt')
+            open(empty, 'w').close()
+            written = os.path.join(directory, 'output.txt')
+            sys.stdout = StringIO()
+            arguments = ['--quiet', f'--input={empty}', f'--output={written}', 'programs/hello_world.txt', 'hello']
+            try:
+                with self.assertRaises(SystemExit) as raised:
+                    interpreter.interpreter(arguments)
+            finally:
+                utils.log_status = True
+                output = sys.stdout.getvalue()
+                sys.stdout = sys.__stdout__
+            with open(written) as file:
+                self.assertEqual(file.read(), 'Wat is je naam?')
+
+        self.assertEqual(raised.exception.code, 5)
+        self.assertTrue(output.startswith('RUNTIME_ERROR'))
+        self.assertIn('No more input to read at line 2', output)
+
+    def test_big_numbers(self):
+        """
+        Test the command line in a new process with a result of more digits than python converts to a string by default,
+        for every backend
+        """
+        import sys
+        import subprocess
+        from interpreter import console
+
+        expected = f'Program exit value: {console.value_text(3 ** 2 ** 14)}\n'
+        for backend in [[], ['--compile'], ['--vm']]:
+            with self.subTest(backend=backend):
+                arguments = [sys.executable, 'main.py', '--quiet', *backend, 'programs/big_numbers.txt', 'repeated_square', '3', '14']
+                process = subprocess.run(arguments, capture_output=True, text=True)
+                self.assertEqual((process.returncode, process.stderr), (0, ''))
+                self.assertEqual(process.stdout, expected)
+
+    def test_profile(self):
+        """
+        Test if the profile of a recursive program counts the statements of every call, and if --profile is refused for
+        the backends that can't be profiled
+        """
+        import os
+        import sys
+        import json
+        import tempfile
+        import subprocess
+
+        with tempfile.TemporaryDirectory() as directory:
+            report = os.path.join(directory, 'profile.json')
+            arguments = [sys.executable, 'main.py', '--quiet', f'--profile={report}', 'programs/dubble_recursive.txt', 'is_even', '6']
+            process = subprocess.run(arguments, capture_output=True, text=True)
+            self.assertEqual((process.returncode, process.stdout), (0, 'Program exit value: True\n'))
+            with open(report) as file:
+                lines = {(line['function'], line['line']): line['count'] for line in json.load(file)['lines']}
+        self.assertEqual((lines[('is_even', 11)], lines[('is_even', 13)], lines[('is_odd', 5)]), (4, 3, 3))
+
+        for backend in ['--compile', '--vm']:
+            with self.subTest(backend=backend):
+                arguments = [sys.executable, 'main.py', '--quiet', '--profile', backend, 'programs/dubble_recursive.txt', 'is_even', '6']
+                process = subprocess.run(arguments, capture_output=True, text=True)
+                self.assertEqual(process.returncode, 2)
+                self.assertTrue(process.stdout.startswith('SYNTAX_ERROR'))
+
+    def test_watch_options(self):
+        """
+        Test if --watch refuses the options it can't use, and if --quiet leaves out the banners of the watched runs
+        """
+        import io
+        import sys
+        import contextlib
+        import subprocess
+        from interpreter.program import parse_file
+        from interpreter.watch import run
+
+        for option in ['--compile', '--vm', '--memoize', '--lazy', '--typecheck', '--buffer', '--cache']:
+            with self.subTest(option=option):
+                arguments = [sys.executable, 'main.py', '--watch', option, 'programs/dubble_recursive.txt', 'is_even', '6']
+                process = subprocess.run(arguments, capture_output=True, text=True, timeout=10)
+                self.assertEqual(process.returncode, 2)
+                self.assertTrue(process.stdout.startswith('SYNTAX_ERROR'))
+                self.assertIn(option, process.stdout)
+
+        functions, _, _ = parse_file('programs/dubble_recursive.txt')
+        for quiet, expected in [(True, 'Program exit value: True\n'), (False, '_____________START RUNNING PROGRAM_____________\nProgram exit value: True\n_________________PROGRAM ENDED_________________\n')]:
+            with self.subTest(quiet=quiet):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    run(functions, 'is_even', [6], quiet)
+                self.assertEqual(output.getvalue(), expected)
+
+
+class BackendTest(unittest.TestCase):
+    """
+    Test if every backend of the interpreter gives the same output, return value and errors as the tree-walking
+    interpreter in interpreter.execute
+    """
+    calls = [
+        ('arithmetic', [13, 5]), ('unary', [6, 3]), ('divide', [7, 2]), ('divide_by_zero', [1]),
+        ('strings', ['"jcjl"']), ('bools', [True, False]), ('bools', [False, False]), ('compares', [3, 5]),
+        ('compares', [5, 5]), ('loops', [6]), ('redefine_loop', []), ('fib', [12]), ('calls', []),
+        ('string_while', []), ('string_condition', []), ('assign_mismatch', []), ('increment_string', []),
+        ('undeclared', []), ('unknown_call', []), ('wrong_return', []), ('wrong_parameters', []),
+        ('wrong_parameter_type', []), ('unary_error', []), ('bool_operator_error', []),
+        ('mixed_operator_error', []), ('nested_error', []), ('print_error', []), ('size_error', []),
+        ('fib', [1, 2]), ('fib', [True]), ('sum_tail', [100, 0]), ('return_call', [5]), ('tail_error', [3]),
+        ('tail_wrong_type', [1]), ('tail_wrong_return', [1]), ('return_call_error', []),
+        ('declared_in_branch', [1]), ('declared_in_branch', [0]),
+    ]
+
+    # Calls of the example programs, the output of these programs must be the same for every backend
+    corpus = [
+        ('programs/examples.txt', 'power', [3, 4]), ('programs/examples.txt', 'sum_three', [1, 2, 3]),
+        ('programs/examples.txt', 'main', []), ('programs/examples.txt', 'main2', []),
+        ('programs/examples.txt', 'crash', []), ('programs/examples.txt', 'sub_crash', []),
+        ('programs/examples.txt', 'sub_crash2', []), ('programs/loop.txt', 'sommig_while', [100]),
+        ('programs/loop.txt', 'sommig_for', [100]), ('programs/dubble_recursive.txt', 'even_or_odd', [7]),
+        ('programs/dubble_recursive.txt', 'even_or_odd', [10]), ('tests/test_code.txt', 'even_or_odd', [5]),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import lexer, parser
+        cls.programs = dict()
+        with redirect_stdout(StringIO()):
+            for file in ['tests/backend_code.txt'] + [file for file, _, _ in cls.corpus]:
+                if file not in cls.programs:
+                    tokens, _ = lexer.lexer(file)
+                    cls.programs[file], _ = parser.parse(tokens)
+
+    def cases(self):
+        """
+        Get all calls that are compared between the backends
+        :return: List[Tuple[str, str, list]]; file, function name, parameters
+        """
+        return [('tests/backend_code.txt', name, parameters) for name, parameters in self.calls] + self.corpus
+
+    def run_tree_walker(self, file, name, parameters):
+        """
+        Run a function with the tree-walking interpreter
+        :return: str, str, str; printed output, return value, error
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import execute
+        functions = self.programs[file]
+        output = StringIO()
+        with redirect_stdout(output):
+            value, error = execute.execute_function_node(functions[name], list(parameters), functions, 0)
+        return output.getvalue(), None if value is None else str(value[0]), str(error)
+
+    def run_compiled(self, file, name, parameters):
+        """
+        Run a function with the closure compiler
+        :return: str, str, str; printed output, return value, error
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import compiler
+        compiled = compiler.compile_functions(self.programs[file])
+        output = StringIO()
+        with redirect_stdout(output):
+            value, error = compiler.execute_compiled(compiled, name, list(parameters), 0)
+        return output.getvalue(), None if value is None else str(value[0]), str(error)
+
+    def run_vm(self, file, name, parameters):
+        """
+        Run a function with the bytecode virtual machine
+        :return: str, str, str; printed output, return value, error
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import bytecode, vm
+        program = bytecode.compile_program(self.programs[file])
+        output = StringIO()
+        with redirect_stdout(output):
+            value, error = vm.execute_bytecode(program, name, list(parameters), 0)
+        return output.getvalue(), None if value is None else str(value[0]), str(error)
+
+    def test_closure_compiler(self):
+        """
+        Test the closure compiler against the tree-walking interpreter
+        """
+        for file, name, parameters in self.cases():
+            with self.subTest(file=file, function=name, parameters=parameters):
+                self.assertEqual(self.run_compiled(file, name, parameters), self.run_tree_walker(file, name, parameters),
+                                 'Closure compiler gave a different result')
+
+    def test_vm(self):
+        """
+        Test the bytecode virtual machine against the tree-walking interpreter
+        """
+        for file, name, parameters in self.cases():
+            with self.subTest(file=file, function=name, parameters=parameters):
+                self.assertEqual(self.run_vm(file, name, parameters), self.run_tree_walker(file, name, parameters),
+                                 'Virtual machine gave a different result')
+
+    def test_memoized(self):
+        """
+        Test the tree-walking interpreter and closure compiler with memoized pure functions against the tree-walking
+        interpreter without memoization
+        """
+        import copy
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import compiler, execute, memoize
+        for file, name, parameters in self.cases():
+            with self.subTest(file=file, function=name, parameters=parameters):
+                expected = self.run_tree_walker(file, name, parameters)
+                functions = execute.ProgramFunctions(copy.deepcopy(self.programs[file]))
+                memoize.memoize_functions(functions)
+                compiled = compiler.compile_functions(functions)
+                memoize.memoize_compiled(compiled, functions)
+                for _ in range(2):
+                    output = StringIO()
+                    with redirect_stdout(output):
+                        value, error = execute.execute_function_node(functions[name], list(parameters), functions, 0)
+                    self.assertEqual((output.getvalue(), None if value is None else str(value[0]), str(error)), expected)
+                    output = StringIO()
+                    with redirect_stdout(output):
+                        value, error = compiler.execute_compiled(compiled, name, list(parameters), 0)
+                    self.assertEqual((output.getvalue(), None if value is None else str(value[0]), str(error)), expected)
+
+    def test_type_checked(self):
+        """
+        Test the tree-walking interpreter with the runtime type checks of verified functions left out against the
+        tree-walking interpreter with all checks
+        """
+        import copy
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import execute, typecheck
+        for file, name, parameters in self.cases():
+            with self.subTest(file=file, function=name, parameters=parameters):
+                expected = self.run_tree_walker(file, name, parameters)
+                functions = copy.deepcopy(self.programs[file])
+                typecheck.check_program(functions)
+                output = StringIO()
+                with redirect_stdout(output):
+                    value, error = execute.execute_function_node(functions[name], list(parameters), functions, 0)
+                self.assertEqual((output.getvalue(), None if value is None else str(value[0]), str(error)), expected)
+
+    def test_lazy_parsed(self):
+        """
+        Test the tree-walking interpreter on programs of which the function bodies are parsed when they are called against
+        the tree-walking interpreter on fully parsed programs
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        from interpreter import execute
+        for file, name, parameters in self.cases():
+            with self.subTest(file=file, function=name, parameters=parameters):
+                expected = self.run_tree_walker(file, name, parameters)
+                output = StringIO()
+                with redirect_stdout(output):
+                    functions, _ = parser.index_functions(jcjlreader.read_program(file))
+                    output.truncate(0)
+                    output.seek(0)
+                    value, error = execute.execute_function_node(functions[name], list(parameters), functions, 0)
+                self.assertEqual((output.getvalue(), None if value is None else str(value[0]), str(error)), expected)
+
+    def test_tail_call_deep_recursion(self):
+        """
+        Tail calls in the tree-walking interpreter do not use the python stack, so the recursion depth is not limited
+        by python
+        """
+        from decoder.utils import Error
+        from decoder.enums import ErrorType
+        output, value, error = self.run_tree_walker('programs/dubble_recursive.txt', 'even_or_odd', [5000])
+        self.assertEqual((output, value, error), ('given value is even\n', '0', str(Error(ErrorType.NO_ERROR, ''))))
+        output, value, error = self.run_tree_walker('tests/backend_code.txt', 'sum_tail', [5000, 0])
+        self.assertEqual(value, str(5000 * 5001 // 2))
+
+    def test_vm_deep_recursion(self):
+        """
+        Calls in the virtual machine do not use the python stack, so the recursion depth is not limited by python
+        """
+        from decoder.utils import Error
+        from decoder.enums import ErrorType
+        output, value, error = self.run_vm('programs/dubble_recursive.txt', 'even_or_odd', [5000])
+        self.assertEqual((value, error), ('0', str(Error(ErrorType.NO_ERROR, ''))))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -360,7 +360,7 @@ class TestWordListLexer(unittest.TestCase):
 
 class TestSplitLineToWords(unittest.TestCase):
     """
-    Test the decoder.lexer.string_split_by_whitespace_rec
+    Test the decoder.lexer.string_split_by_whitespace_rec and decoder.lexer.split_by_whitespace functions
     """
     def test_simple_line(self):
         """
@@ -386,6 +386,1176 @@ class TestSplitLineToWords(unittest.TestCase):
             'Line with 2 string literals could not be splitted'
         )
 
+    def test_split_words(self):
+        """
+        Test if a line without string literals is split on every whitespace character
+        """
+        self.assertEqual(lexer.split_by_whitespace('int var1 is 6'), ['int', 'var1', 'is', '6'])
+        self.assertEqual(lexer.split_by_whitespace('a  b'), ['a', '', 'b'], 'Two spaces must give an empty word')
+        self.assertEqual(lexer.split_by_whitespace('a b '), ['a', 'b'])
+        self.assertEqual(lexer.split_by_whitespace(''), [])
+
+    def test_split_string_literal(self):
+        """
+        Test if a string literal with whitespace is kept as a single word
+        """
+        self.assertEqual(lexer.split_by_whitespace('call print "hello  world" x'), ['call', 'print', '"hello  world"', 'x'])
+        self.assertEqual(lexer.split_by_whitespace('call print "a\\nb"'), ['call', 'print', '"a\\nb"'])
+        # A string literal of one word continues until a word that ends with a quote
+        self.assertEqual(lexer.split_by_whitespace('"one" two "three"'), ['"one" two "three"'])
+
+    def test_long_line(self):
+        """
+        Test if a very long line can be tokenized
+        """
+        line = 'call print "' + 'word ' * 100000 + '"'
+        tokens = lexer.lex_line(line, 1)
+        self.assertEqual([token.type for token in tokens], [enums.TokensTypes.CALL, enums.TokensTypes.IDENTIFIER, enums.TokensTypes.STRING])
+        self.assertEqual(len(tokens[2].value), len(line) - len('call print '))
+
+
+
+class TestStreamingReader(unittest.TestCase):
+    """
+    Test reading and lexing with decoder.io.jcjlreader and decoder.lexer.lex_lines for large programs
+    """
+    def test_process_many_lines(self):
+        """
+        Test if more lines than the python recursion limit can be processed, empty lines and comments are skipped
+        """
+        from decoder.io import jcjlreader
+        lines = ['int a is 1\n', '\n', 'comment text\n'] * 5000
+        processed = jcjlreader.process_lines(lines, 1)
+        self.assertEqual(len(processed), 5000)
+        self.assertEqual(processed[-1], ('int a is 1', 14998))
+
+    def test_trailing_comment(self):
+        """
+        Test if a program can end with a comment
+        """
+        from decoder.io import jcjlreader
+        self.assertEqual(jcjlreader.process_lines(['return 1\n', 'comment end'], 1), [('return 1', 1)])
+        self.assertEqual(jcjlreader.process_lines([], 1), [])
+
+    def test_lex_lines_from_generator(self):
+        """
+        Test if lex_lines takes lines from a generator and adds an end-line token after every line
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        with redirect_stdout(StringIO()):
+            tokens, error = lexer.lex_lines(((f'a{number} plusplus', number) for number in range(1, 4)))
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(len(tokens), 9)
+        self.assertEqual(tokens[-1], lexer.Token(enums.TokensTypes.ENDLINE, '\n', 3))
+
+    def test_large_program(self):
+        """
+        Test if a generated program with more lines than the python recursion limit can be read and lexed
+        """
+        import os
+        import tempfile
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from benchmarks.generate import generate_program
+        source = generate_program(5000)
+        with tempfile.TemporaryDirectory() as directory:
+            file = os.path.join(directory, 'generated.txt')
+            with open(file, 'w') as program:
+                program.write(source)
+            with redirect_stdout(StringIO()):
+                tokens, error = lexer.lexer(file)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(tokens[-1].line_nmr, len(source.splitlines()) - 1)
+
+
+class TestParser(unittest.TestCase):
+    """
+    Test the decoder.parser functions that walk over the token list
+    """
+    def parse_lines(self, lines):
+        """
+        Lex and parse the given lines and return the functions and error
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lex_lines((jcjlreader.process_line(line), line_nmr) for line_nmr, line in enumerate(lines, 1))
+            return parser.parse(tokens)
+
+    def test_find_end_nested(self):
+        """
+        Test if find_end skips nested statements and gives the positions around the end token
+        """
+        from decoder import parser
+        tokens = [lexer.lex_token(word, 1) for word in ['a', 'while', 'b', 'endwhile', 'c', 'endwhile', 'd']]
+        self.assertEqual(parser.find_end(tokens, enums.TokensTypes.WHILE, enums.TokensTypes.ENDWHILE, 0, 7), (5, 6))
+
+    def test_for_loop_in_while_loop(self):
+        """
+        Test if the while in the header of a for-loop doesn't end a surrounding while-loop too early
+        """
+        functions, error = self.parse_lines([
+            'int function main int n',
+            'while n greaterthan 0',
+            'for int i is 0 while i lessthan 2 with i plusplus',
+            'n minmin',
+            'endfor',
+            'endwhile',
+            'return n',
+        ])
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(len(functions['main'].body), 1)
+        self.assertEqual(len(functions['main'].body[0].body), 1)
+
+    def test_for_loop_without_end_in_while_loop(self):
+        """
+        Test if a for-loop without endfor in a while-loop gives the first error the previous parser gave, at the endwhile
+        instead of at a later line
+        """
+        _, error = self.parse_lines([
+            'int function main int n',
+            'while n greaterthan 0',
+            'for int i is 0 while i lessthan 2 with i plusplus',
+            'n minmin',
+            'endwhile',
+            'n',
+            'return n',
+        ])
+        self.assertEqual((error.type, error.message), (enums.ErrorType.STATEMENT_ERROR, 'No valid statement could be formed at line 5'))
+
+    def test_large_program(self):
+        """
+        Test if a generated program with more tokens than the python recursion limit can be parsed
+        """
+        from benchmarks.generate import generate_program, generate_function
+        functions, error = self.parse_lines(generate_program(5000).splitlines())
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(len(functions) - 3, -(-5000 // len(generate_function(0))))
+
+    def test_long_function_body(self):
+        """
+        Test if a function with more statements than the python recursion limit can be parsed
+        """
+        lines = ['int function main', 'int x is 0'] + ['x plusplus'] * 5000 + ['return x']
+        functions, error = self.parse_lines(lines)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(len(functions['main'].body), 5001)
+
+    def test_compact_nodes(self):
+        """
+        Test if tokens and nodes have no attribute dict, share identifier strings and can still be compared
+        """
+        import pickle
+        lines = ['int function main int n', 'int x is n plus 1', 'return x']
+        functions, error = self.parse_lines(lines)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        statement = functions['main'].body[0]
+        self.assertFalse(hasattr(statement, '__dict__'))
+        self.assertFalse(hasattr(statement.id, '__dict__'))
+        self.assertIs(statement.id.value, functions['main'].return_statement.value.value)
+        self.assertEqual(pickle.loads(pickle.dumps(functions)), self.parse_lines(lines)[0])
+
+
+class TestLazyParser(unittest.TestCase):
+    """
+    Test indexing functions without parsing their bodies
+    """
+    def test_index_functions(self):
+        """
+        Test if only the called functions are parsed, and an error in a body is only found when the function is called
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        from interpreter import execute
+
+        lines = ['int function double int n', 'n mulis 2', 'return n', 'int function main int n', 'int d is call double n',
+                 'return d', 'int function broken', 'int a is', 'return a']
+        with redirect_stdout(StringIO()):
+            functions, error = parser.index_functions(jcjlreader.process_lines(lines, 1))
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual([parameter.name for parameter in functions['main'].parameters], ['n'])
+        self.assertTrue(all(functions[name].source is not None for name in ['double', 'main', 'broken']))
+
+        value, error = execute.execute_function_node(functions['main'], [4], functions, 0)
+        self.assertEqual(value, (8, 'int'))
+        self.assertIsNone(functions['main'].source)
+        self.assertTrue(functions['main'].verified)
+        self.assertIsNotNone(functions['broken'].source)
+
+        value, error = execute.execute_function_node(functions['broken'], [], functions, 0)
+        self.assertIsNone(value)
+        self.assertEqual(error.type, enums.ErrorType.STATEMENT_ERROR)
+
+        with redirect_stdout(StringIO()):
+            _, error = parser.index_functions(jcjlreader.process_lines(['int function main', 'int a is 1'], 1))
+        self.assertEqual(error.type, enums.ErrorType.SYNTAX_ERROR)
+
+    def test_lex_errors(self):
+        """
+        Test if a definition line that can't be lexed reports every symbol of the program that can't be lexed, as the
+        lexer does without --lazy
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+
+        lines = ['int function double int n', 'n mulis 2 $', 'return n', 'int function ma€in int n', 'int d is call double n',
+                 'return d', 'int function other int n', 'int e is n ~ 1', 'return e']
+        with redirect_stdout(StringIO()):
+            _, expected = lexer.lex_lines(jcjlreader.process_lines(lines, 1))
+            _, error = parser.index_functions(jcjlreader.process_lines(lines, 1))
+        self.assertEqual(expected.message.count('\n'), 2)
+        self.assertEqual((error.type, error.message), (expected.type, expected.message))
+
+    def test_mixed_case_keywords(self):
+        """
+        Test if return and import lines are found in any case, as the lexer accepts keywords in any case
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        from interpreter import execute
+
+        lines = ['int function double int n', 'n mulis 2', 'RETURN n', 'int function main int n', 'int d is call double n',
+                 'Return d']
+        with redirect_stdout(StringIO()):
+            functions, error = parser.index_functions(jcjlreader.process_lines(['Import examples'] + lines, 1))
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(len(functions['double'].source), 2)
+        value, error = execute.execute_function_node(functions['main'], [4], functions, 0)
+        self.assertEqual(value, (8, 'int'))
+
+
+class TestStartup(unittest.TestCase):
+    """
+    Test that the command line starts without the modules that only some options need
+    """
+    def test_deferred_imports(self):
+        import sys
+        import subprocess
+        from benchmarks.startup_benchmark import DEFERRED_MODULES
+
+        check = f'import sys, interpreter.interpreter; print(*[module for module in {DEFERRED_MODULES!r} if module in sys.modules])'
+        imported = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, check=True).stdout.strip()
+        self.assertEqual(imported, '', 'Deferred modules are imported at startup')
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """
+    Test the phases and the regression detection of benchmarks.suite
+    """
+    def test_run(self):
+        from benchmarks import suite
+
+        results = suite.run(1, 0, [200])
+        self.assertEqual(set(results['workloads']), {name for name, *_ in suite.corpus} | {'generated 200 lines'})
+        for phases in results['workloads'].values():
+            self.assertEqual(tuple(phases), suite.PHASES)
+            self.assertTrue(all(statistics['min'] <= statistics['median'] for statistics in phases.values()))
+
+    def test_compare(self):
+        from benchmarks import suite
+
+        def results(median):
+            return {'workloads': {'loop': {'parse': {'median': 1.0}, 'execute_function_node': {'median': median}}, 'new': {'parse': {'median': 5.0}}}}
+
+        comparisons = suite.compare(results(10.0), results(11.5), 0.2, 0.05)
+        self.assertEqual(comparisons, [('loop', 'parse', 1.0, 1.0, False), ('loop', 'execute_function_node', 10.0, 11.5, False), ('new', 'parse', 5.0, 5.0, False)])
+        self.assertTrue(suite.compare(results(10.0), results(12.5), 0.2, 0.05)[1][4])
+        # Below the minimum a slower phase is noise
+        self.assertFalse(suite.compare(results(0.01), results(0.04), 0.2, 0.05)[1][4])
+
+
+class TestModules(unittest.TestCase):
+    """
+    Test import statements and the module loader in interpreter.modules
+    """
+    def setUp(self):
+        """
+        Keep the indexes of the modules in a temporary cache directory
+        """
+        import os
+        import shutil
+        import tempfile
+        from unittest import mock
+        from decoder.io import programcache
+        self.cache = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache)
+        environment = mock.patch.dict(os.environ, {programcache.CACHE_VARIABLE: self.cache})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def write(self, path, lines):
+        """
+        Write the lines of a program to a file
+        """
+        with open(path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+
+    def test_find_imports(self):
+        """
+        Test if the parser skips the import statements at the start of a program and rejects an invalid import
+        """
+        from decoder import parser
+        from decoder.io import jcjlreader
+        tokens, _ = lexer.tokenize(jcjlreader.process_lines(['import lib', 'import other', 'int function main', 'return 1'], 1))
+        imports, position, error = parser.find_imports(tokens)
+        self.assertEqual([token.value for token in imports], ['lib', 'other'])
+        self.assertEqual(tokens[position].type, enums.TokensTypes.TYPE)
+
+        tokens, _ = lexer.tokenize(jcjlreader.process_lines(['import lib other', 'int function main', 'return 1'], 1))
+        _, _, error = parser.find_imports(tokens)
+        self.assertEqual(error.type, enums.ErrorType.SYNTAX_ERROR)
+
+    def test_import(self):
+        """
+        Test if imported functions can be called, a module is loaded once and its index is stored in the cache directory
+        of the user, and it is loaded again when it changes
+        """
+        import os
+        import tempfile
+        from decoder.io import programcache
+        from interpreter import modules
+        from interpreter.program import Program, ProgramError
+
+        with tempfile.TemporaryDirectory() as directory:
+            library = os.path.join(directory, 'lib')
+            os.mkdir(library)
+            self.write(os.path.join(library, 'numbers.txt'), ['int function double int n', 'n mulis 2', 'return n'])
+            self.write(os.path.join(library, 'more.txt'), ['import numbers', 'int function quadruple int n', 'int d is call double n', 'd is call double d', 'return d'])
+            main = os.path.join(directory, 'main.txt')
+            self.write(main, ['import more', 'int function main int n', 'int q is call quadruple n', 'return q'])
+
+            with self.assertRaises(ProgramError) as context:
+                Program.load(main)
+            self.assertEqual(context.exception.error.type, enums.ErrorType.IMPORT_ERROR)
+
+            modules.search_path = [library]
+            try:
+                first = Program.load(main)
+                self.assertEqual(first.call('main', 3), 12)
+                self.assertEqual(first.functions['double'].module, os.path.join(library, 'numbers.txt'))
+                self.assertTrue(first.functions['quadruple'].verified)
+                self.assertEqual(first.type_errors, [])
+                index = programcache.cache_file(os.path.join(library, 'numbers.txt'), extension=modules.INDEX_EXTENSION)
+                self.assertEqual(os.path.dirname(index), self.cache)
+                self.assertTrue(os.path.isfile(index))
+                self.assertFalse(os.path.exists(os.path.join(library, '__jcjlcache__')))
+                # The module is parsed once, every program shares its verified function nodes
+                vm_program = Program.load(main, backend='vm')
+                self.assertIs(vm_program.functions['double'], first.functions['double'])
+
+                # A new process reads the index of the modules, the bodies are parsed when they are called
+                modules.modules.clear()
+                second = Program.load(main)
+                self.assertIsNotNone(second.functions['double'].source)
+                self.assertEqual(second.call('main', 3), 12)
+                self.assertIsNone(second.functions['double'].source)
+                self.assertTrue(second.functions['double'].verified)
+
+                self.write(os.path.join(library, 'numbers.txt'), ['int function double int n', 'n mulis 3', 'return n'])
+                os.utime(os.path.join(library, 'numbers.txt'), ns=(0, 0))
+                self.assertEqual(Program.load(main).call('main', 3), 27)
+            finally:
+                modules.search_path = []
+
+    def test_import_errors(self):
+        """
+        Test if a function that is defined twice and an import cycle are reported
+        """
+        import os
+        import tempfile
+        from interpreter.program import Program, ProgramError
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.write(os.path.join(directory, 'one.txt'), ['import two', 'int function one', 'return 1'])
+            self.write(os.path.join(directory, 'two.txt'), ['import one', 'int function two', 'return 2'])
+            self.write(os.path.join(directory, 'main.txt'), ['import one', 'int function main', 'return 1'])
+            self.write(os.path.join(directory, 'double.txt'), ['import two', 'int function two', 'return 3'])
+            for file in ['main.txt', 'double.txt']:
+                with self.assertRaises(ProgramError) as context:
+                    Program.load(os.path.join(directory, file))
+                self.assertEqual(context.exception.error.type, enums.ErrorType.IMPORT_ERROR)
+
+            self.write(os.path.join(directory, 'two.txt'), ['int function two', 'return 2'])
+            self.assertEqual(Program.load(os.path.join(directory, 'main.txt')).call('one'), 1)
+
+    def test_unverified_module_function(self):
+        """
+        Test if a module function that calls a function of the program is type checked for the errors of every program
+        on its own, while its shared nodes are only verified by the check of its module
+        """
+        import os
+        import tempfile
+        from interpreter.program import Program, ProgramError
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.write(os.path.join(directory, 'twice.txt'), ['int function twice int n', 'int d is call helper n', 'd mulis 2', 'return d'])
+            self.write(os.path.join(directory, 'good.txt'), ['import twice', 'int function main int n', 'int t is call twice n', 'return t', 'int function helper int n', 'return n'])
+            self.write(os.path.join(directory, 'bad.txt'), ['import twice', 'int function main int n', 'int t is call twice n', 'return t', 'string function helper int n', 'return "x"'])
+            good = Program.load(os.path.join(directory, 'good.txt'))
+            self.assertEqual(good.type_errors, [])
+            self.assertFalse(good.functions['twice'].verified)
+            self.assertEqual(good.call('main', 3), 6)
+
+            bad = Program.load(os.path.join(directory, 'bad.txt'))
+            self.assertFalse(bad.functions['twice'].verified)
+            self.assertEqual(bad.type_errors[0].type, enums.ErrorType.TYPE_ERROR)
+            with self.assertRaises(ProgramError) as context:
+                bad.call('main', 3)
+            self.assertEqual(context.exception.error.type, enums.ErrorType.RUNTIME_ERROR)
+
+
+class TestWatch(unittest.TestCase):
+    """
+    Test loading a changed program again in interpreter.watch
+    """
+    def test_refresh(self):
+        """
+        Test if only changed functions are parsed again, unchanged functions are moved to their new lines and a
+        changed signature parses all functions again
+        """
+        import os
+        import tempfile
+        from interpreter import execute
+        from interpreter.watch import WatchedProgram
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'program.txt')
+
+            def write(lines):
+                with open(path, 'w') as file:
+                    file.write('\n'.join(lines))
+
+            main = ['int function main int n', 'int d is call double n', 'return d']
+            double = ['int function double int n', 'n mulis 2', 'return n']
+            broken = ['int function broken', 'int a is 1', 'int b is a div 0', 'return b']
+            write(main + double + broken)
+            program = WatchedProgram(path)
+            self.assertEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertEqual(program.changed, 3)
+            self.assertEqual(execute.execute_function_node(program.functions['main'], [4], program.functions, 0)[0], (8, 'int'))
+            old_main, old_broken = program.functions['main'], program.functions['broken']
+
+            write(main + ['comment one more line', 'int function double int n', 'n mulis 3', 'return n'] + broken)
+            self.assertEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertEqual(program.changed, 1)
+            self.assertIs(program.functions['main'], old_main)
+            self.assertIs(program.functions['broken'], old_broken)
+            self.assertEqual(execute.execute_function_node(program.functions['main'], [4], program.functions, 0)[0], (12, 'int'))
+            _, error = execute.execute_function_node(program.functions['broken'], [], program.functions, 0)
+            self.assertIn('line 10', str(error))
+
+            write(main + ['int function double int n', 'n mulis', 'return n'] + broken)
+            self.assertNotEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertIs(program.functions['main'], old_main)
+            write(main + ['int function double int n', 'n mulis 3'] + broken)
+            self.assertNotEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertIs(program.functions['broken'], old_broken)
+
+            write(main + ['int function double int n int m', 'n mulis m', 'return n'] + broken)
+            self.assertEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertEqual(program.changed, 3)
+            self.assertIsNot(program.functions['main'], old_main)
+
+    def test_mixed_case_keywords(self):
+        """
+        Test if a return in upper case ends a function, so an edit only parses the changed function again
+        """
+        import os
+        import tempfile
+        from interpreter import execute
+        from interpreter.watch import WatchedProgram
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'program.txt')
+
+            def write(lines):
+                with open(path, 'w') as file:
+                    file.write('\n'.join(lines))
+
+            main = ['int function main int n', 'int d is call double n', 'RETURN d']
+            write(main + ['int function double int n', 'n mulis 2', 'Return n'])
+            program = WatchedProgram(path)
+            self.assertEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertEqual(program.changed, 2)
+            old_main = program.functions['main']
+
+            write(main + ['int function double int n', 'n mulis 3', 'Return n'])
+            self.assertEqual(program.refresh().type, enums.ErrorType.NO_ERROR)
+            self.assertEqual(program.changed, 1)
+            self.assertIs(program.functions['main'], old_main)
+            self.assertEqual(execute.execute_function_node(program.functions['main'], [4], program.functions, 0)[0], (12, 'int'))
+
+
+class TestMemoize(unittest.TestCase):
+    """
+    Test the purity analysis and result cache in interpreter.memoize
+    """
+    def parse_program(self, file):
+        """
+        Lex and parse a program file and return the functions
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lexer(file)
+            functions, _ = parser.parse(tokens)
+        return functions
+
+    def test_lru_eviction(self):
+        """
+        Test if the least recently used result is removed from a full cache
+        """
+        from interpreter import memoize
+        cache = memoize.LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 1, 2))
+
+    def test_call_key_types(self):
+        """
+        Test if a bool and an int parameter with the same python value give a different key
+        """
+        from interpreter import memoize
+        self.assertNotEqual(memoize.call_key('f', [True]), memoize.call_key('f', [1]))
+
+    def test_pure_functions(self):
+        """
+        Test if functions that reach print are impure and the mutually recursive functions are pure
+        """
+        from interpreter import memoize
+        functions = self.parse_program('programs/dubble_recursive.txt')
+        self.assertEqual(memoize.find_pure_functions(functions), {'is_odd', 'is_even'})
+
+    def test_memoized_fib(self):
+        """
+        Test if a memoized function gives the same result and uses the cache
+        """
+        from interpreter import execute, memoize
+        functions = self.parse_program('tests/backend_code.txt')
+        self.assertIn('fib', memoize.find_pure_functions(functions))
+        self.assertNotIn('print_error', memoize.find_pure_functions(functions))
+        functions = execute.ProgramFunctions(functions)
+        cache = memoize.memoize_functions(functions, 100)
+        value, error = execute.execute_function_node(functions['fib'], [20], functions, 0)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR)
+        self.assertEqual(value, (6765, 'int'))
+        self.assertEqual((cache.hits, cache.misses), (18, 21))
+
+
+class TestTypeCheck(unittest.TestCase):
+    """
+    Test the type check of interpreter.typecheck
+    """
+    def check_lines(self, lines):
+        """
+        Lex, parse and type check the given lines and return the functions and type errors
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        from interpreter import typecheck
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lex_lines((jcjlreader.process_line(line), line_nmr) for line_nmr, line in enumerate(lines, 1))
+            functions, _ = parser.parse(tokens)
+        return functions, typecheck.check_program(functions)
+
+    def test_verified_function(self):
+        """
+        Test if a function without type errors is verified and its nodes get their resolved types
+        """
+        functions, errors = self.check_lines([
+            'bool function main int n',
+            'int x is n plus 1',
+            'x plusplus',
+            'bool big is x greaterthan 3',
+            'return big',
+        ])
+        self.assertEqual(errors, [])
+        self.assertTrue(functions['main'].verified)
+        self.assertEqual([node.resolved_type for node in functions['main'].body], ['int', 'int', 'bool'])
+        self.assertEqual(functions['main'].body[2].expression.resolved_type, 'bool')
+
+    def test_all_errors_reported(self):
+        """
+        Test if every type error of a program is reported and functions with errors are not verified
+        """
+        functions, errors = self.check_lines([
+            'int function main',
+            'int x is "text"',
+            'string s is "a"',
+            's minis "b"',
+            'return s',
+            'int function other',
+            'bool x is 1 lessthan 2',
+            'int x is 3',
+            'return call main 1',
+        ])
+        self.assertEqual([error.type for error in errors], [enums.ErrorType.TYPE_ERROR] * 5 + [enums.ErrorType.PARAMETER_ERROR])
+        self.assertFalse(functions['main'].verified)
+        self.assertFalse(functions['other'].verified)
+        self.assertIsNone(functions['main'].body[0].resolved_type)
+
+    def test_builtin_parameters(self):
+        """
+        Test the parameter types of the build-in functions
+        """
+        _, errors = self.check_lines(['int function main', 'call print 1', 'int n is call size 3', 'return n'])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].message, 'In function main: Function size expects a parameter of type string, but got int at line 3')
+
+
+class TestFrame(unittest.TestCase):
+    """
+    Test the slots that interpreter.frame gives to the variables of a function
+    """
+    def test_resolve_frame(self):
+        """
+        Test if parameters and variables get a fixed slot and every use of a variable gets the same slot
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        from interpreter import frame
+        lines = ['int function main int n int m', 'int x is n plus m', 'x is call main x n', 'return x']
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lex_lines((jcjlreader.process_line(line), line_nmr) for line_nmr, line in enumerate(lines, 1))
+            functions, _ = parser.parse(tokens)
+        function = functions['main']
+        self.assertEqual(frame.new_frame(function), [None] * 6)
+        self.assertEqual(function.parameter_slots, [0, 2])
+        declaration, assignment = function.body
+        self.assertEqual((declaration.id.slot, declaration.expression.left.slot, declaration.expression.right.slot), (4, 0, 2))
+        self.assertEqual([token.slot for token in assignment.expression.parameters], [4, 0])
+        self.assertIsNone(assignment.expression.function.slot)
+        self.assertEqual(function.return_statement.value.slot, 4)
+
+
+class TestProfiler(unittest.TestCase):
+    """
+    Test the profiler of interpreter.profiler
+    """
+    def test_profile_counts(self):
+        """
+        Test if calls and statement executions are counted and the program runs without the profiler afterwards
+        """
+        from interpreter.program import Program
+        from interpreter import profiler
+        program = Program.load('programs/loop.txt')
+        profile = profiler.Profiler()
+        with program.observing(profile):
+            value, error = program.run('sommig_while', [10])
+        self.assertEqual(value, (55, 'int'))
+        self.assertIsNone(program.observed_functions)
+        self.assertEqual(profile.functions['sommig_while'].count, 1)
+        counts = sorted(entry.count for entry in profile.lines.values())
+        self.assertEqual(counts[-1], 10)
+        report = profile.as_dict()
+        self.assertEqual(report['functions'][0]['function'], 'sommig_while')
+        self.assertTrue(all(line['exclusive'] <= line['inclusive'] + 1e-9 for line in report['lines']))
+
+    def test_tail_calls(self):
+        """
+        Test if the last if-statement and the assignment of a tail call are counted for every call of a recursive function
+        """
+        from interpreter.program import Program
+        from interpreter import profiler
+        program = Program.load('programs/dubble_recursive.txt')
+        profile = profiler.Profiler()
+        with program.observing(profile):
+            self.assertEqual(program.call('is_even', 6), True)
+        self.assertEqual(profile.functions['is_even'].count, 4)
+        self.assertEqual(profile.functions['is_odd'].count, 3)
+        # if n notequals 0 runs in every call, the assignment of the tail call in every call but the last
+        self.assertEqual(profile.lines[('is_even', 11)].count, 4)
+        self.assertEqual(profile.lines[('is_even', 13)].count, 3)
+        self.assertEqual(profile.lines[('is_odd', 5)].count, 3)
+
+
+class TestHooks(unittest.TestCase):
+    """
+    Test the observer events of interpreter.hooks
+    """
+    def test_events(self):
+        """
+        Test if an observer that is attached to a program gets every event, and only the events of that program
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from decoder.io import jcjlreader
+        from interpreter import hooks
+        from interpreter.program import Program
+
+        class Recorder(hooks.Observer):
+            def __init__(self):
+                self.events = []
+
+            def enter_function(self, function, parameters, call_line):
+                self.events.append(('enter', function.name, parameters))
+
+            def exit_function(self, function, value, tail_call, error):
+                self.events.append(('exit', function.name, value))
+
+            def enter_statement(self, node, frame):
+                self.events.append(('statement', node.__class__.__name__))
+
+            def loop_iteration(self, body, frame):
+                self.events.append(('iteration', len(body)))
+
+            def builtin_io(self, name, parameters, value):
+                self.events.append(('io', name, parameters))
+
+        lines = ['int function main int n', 'int i is 0', 'while i lessthan n', 'i plusplus', 'endwhile', 'call print i', 'return i']
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lex_lines((jcjlreader.process_line(line), line_nmr) for line_nmr, line in enumerate(lines, 1))
+            functions, _ = parser.parse(tokens)
+        observed, other = Program(functions), Program(functions)
+        recorder = Recorder()
+        with redirect_stdout(StringIO()), observed.observing(recorder):
+            value, _ = observed.run('main', [2])
+            other.run('main', [2])
+        self.assertEqual(value, (2, 'int'))
+        self.assertEqual(recorder.events, [
+            ('enter', 'main', [2]), ('statement', 'TypeAssignment'), ('statement', 'While'),
+            ('iteration', 1), ('statement', 'IncDec'), ('iteration', 1), ('statement', 'IncDec'),
+            ('statement', 'Call'), ('enter', 'print', [2]), ('io', 'print', [2]), ('exit', 'print', (0, 'int')),
+            ('exit', 'main', (2, 'int')),
+        ])
+
+    def test_backends(self):
+        """
+        Test if only a program of the tree-walking interpreter can be observed
+        """
+        from interpreter import hooks
+        from interpreter.program import Program
+        program = Program.load('programs/examples.txt', backend='vm')
+        with self.assertRaises(ValueError):
+            program.attach(hooks.Observer())
+
+
+class TestProgram(unittest.TestCase):
+    """
+    Test the embeddable Program of interpreter.program
+    """
+    def test_call(self):
+        """
+        Test if a loaded program can be called many times with python values by every backend, without status messages
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter.program import Program, ProgramError, BACKENDS
+        from decoder.enums import ErrorType
+
+        output = StringIO()
+        with redirect_stdout(output):
+            for backend in BACKENDS:
+                program = Program.load('tests/backend_code.txt', backend=backend)
+                self.assertEqual([program.call('fib', n) for n in range(10)], [0, 1, 1, 2, 3, 5, 8, 13, 21, 34])
+                self.assertEqual(program['bools'](True, False), program.call('bools', True, False))
+                self.assertIsInstance(program.call('strings', 'jcjl'), str)
+                with self.assertRaises(ProgramError) as raised:
+                    program.call('divide_by_zero', 1)
+                self.assertEqual(raised.exception.error.type, ErrorType.RUNTIME_ERROR)
+                value, error = program.run('missing', [])
+                self.assertIsNone(value)
+                self.assertEqual(error.type, ErrorType.INVALID_NAME_ERROR)
+        self.assertNotIn('Start', output.getvalue())
+
+    def test_from_source(self):
+        """
+        Test loading a program from a string, and the error of a program that can't be parsed
+        """
+        from interpreter.program import Program, ProgramError
+        from decoder.enums import ErrorType
+
+        program = Program.from_source('string function greet string name\nreturn name\nint function length string name\nreturn call size name\n')
+        self.assertEqual(program.call('greet', 'hallo'), 'hallo')
+        self.assertEqual(program.call('length', 'hallo'), 5)
+        with self.assertRaises(ProgramError) as raised:
+            Program.from_source('int function broken\nint a is\n')
+        self.assertNotEqual(raised.exception.error.type, ErrorType.NO_ERROR)
+
+    def test_shared_functions(self):
+        """
+        Test if programs made from the same functions share the function nodes, but have their own output and result
+        caches, for every backend
+        """
+        from interpreter.program import Program, BACKENDS, parse_file
+        from interpreter.console import CaptureOutput
+
+        functions, _, _ = parse_file('programs/dubble_recursive.txt')
+        for backend in BACKENDS:
+            first_output, second_output = CaptureOutput(), CaptureOutput()
+            first = Program(functions, backend, memoize=16, output=first_output)
+            second = Program(functions, backend, output=second_output)
+            self.assertEqual(first.call('even_or_odd', 3), 0)
+            self.assertEqual(second.call('even_or_odd', 4), 0)
+            self.assertEqual(first_output.getvalue(), 'given value is odd\n')
+            self.assertEqual(second_output.getvalue(), 'given value is even\n')
+            self.assertIsNone(second.memoize_cache)
+            self.assertEqual(second.functions.caches, {})
+            self.assertIs(first.functions['is_even'], functions['is_even'])
+            self.assertIs(second.functions['is_even'], functions['is_even'])
+
+
+class TestDaemon(unittest.TestCase):
+    """
+    Test the daemon of interpreter.daemon and its client
+    """
+    def test_requests(self):
+        """
+        Test running programs over the socket of the daemon, and reloading a program that has changed
+        """
+        import os
+        import tempfile
+        import threading
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import daemon, client
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'jcjl.sock')
+            program = os.path.join(directory, 'program.txt')
+            with open(program, 'w') as program_file:
+                program_file.write('int function double int n\nn mulis 2\ncall print n\nreturn n\n')
+            with redirect_stdout(StringIO()):
+                server = threading.Thread(target=daemon.serve, args=(path,))
+                server.start()
+                while not os.path.exists(path):
+                    server.join(0.01)
+
+            answer = client.send_request(client.run_request(program, 'double', ['21']), path)
+            self.assertEqual(answer, {'output': '42\n', 'exit_value': 42, 'error': None, 'exit_code': 0})
+            answer = client.send_request(client.run_request(program, 'double', ['0x10'], backend='vm'), path)
+            self.assertEqual(answer['exit_value'], 32)
+
+            with open(program, 'w') as program_file:
+                program_file.write('int function double int n\nn plusis n\nreturn n\n')
+            answer = client.send_request(client.run_request(program, 'double', [5]), path)
+            self.assertEqual((answer['output'], answer['exit_value']), ('', 10))
+
+            answer = client.send_request(client.run_request(program, 'missing', []), path)
+            self.assertEqual(answer['exit_code'], 5)
+            answer = client.send_request(client.run_request(os.path.join(directory, 'missing.txt'), 'double', []), path)
+            self.assertEqual(answer['exit_code'], 3)
+            # An exception while running a request is answered, the daemon keeps serving
+            request = client.run_request(program, 'double', [])
+            request['arguments'] = 5
+            answer = client.send_request(request, path)
+            self.assertEqual((answer['exit_code'], answer['error'].split(':')[0]), (1, 'RUNTIME_ERROR'))
+            answer = client.send_request({'program': program}, path)
+            self.assertEqual(answer['exit_code'], 2)
+
+            self.assertEqual(client.send_request({'command': 'stop'}, path), {'stopped': True})
+            server.join()
+            self.assertFalse(os.path.exists(path))
+
+    def test_socket(self):
+        """
+        Test if only the user can use the socket, a live daemon or a file at its path is never removed, the socket of a
+        stopped daemon is, and a connection without a request doesn't block the daemon
+        """
+        import os
+        import stat
+        import socket
+        import tempfile
+        import threading
+        from io import StringIO
+        from unittest import mock
+        from contextlib import redirect_stdout
+        from interpreter import daemon, client
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'jcjl.sock')
+            with open(path, 'w'):
+                pass
+            with self.assertRaises(FileExistsError):
+                daemon.serve(path)
+            os.remove(path)
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+                stale.bind(path)
+
+            with mock.patch.object(daemon.RequestHandler, 'timeout', 0.1), redirect_stdout(StringIO()):
+                server = threading.Thread(target=daemon.serve, args=(path,))
+                server.start()
+                # The stale socket refuses connections until the daemon has replaced it
+                while server.is_alive():
+                    try:
+                        client.send_request({}, path)
+                        break
+                    except ConnectionRefusedError:
+                        server.join(0.01)
+                try:
+                    self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+                    with self.assertRaises(FileExistsError):
+                        daemon.serve(path)
+                finally:
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+                        idle.connect(path)
+                        self.assertEqual(client.send_request({'command': 'stop'}, path), {'stopped': True})
+                    server.join()
+            self.assertFalse(os.path.exists(path))
+
+        with tempfile.TemporaryDirectory() as directory:
+            private = os.path.join(directory, 'jcjl')
+            daemon.private_directory(private)
+            self.assertEqual(stat.S_IMODE(os.stat(private).st_mode), 0o700)
+            os.chmod(private, 0o755)
+            with self.assertRaises(PermissionError):
+                daemon.private_directory(private)
+            with mock.patch.dict(os.environ, {'XDG_RUNTIME_DIR': private}):
+                self.assertEqual(client.default_socket(), os.path.join(private, 'jcjl.sock'))
+
+    def test_empty_answer(self):
+        """
+        Test the answer of the client when the daemon closes the connection without answering
+        """
+        import os
+        import socket
+        import tempfile
+        import threading
+        from interpreter import client
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'jcjl.sock')
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+                listener.bind(path)
+                listener.listen(1)
+
+                def close_connection():
+                    connection, _ = listener.accept()
+                    connection.recv(1024)
+                    connection.close()
+
+                server = threading.Thread(target=close_connection)
+                server.start()
+                answer = client.send_request(client.run_request('program.txt', 'main', []), path)
+                server.join()
+        self.assertEqual((answer['exit_code'], answer['error']), (1, 'The JCJL daemon closed the connection without an answer'))
+
+
+class TestBatch(unittest.TestCase):
+    """
+    Test the batch mode of interpreter.batch
+    """
+    def test_run_batch(self):
+        """
+        Test if rows give the same results in the order of the rows, with and without worker processes
+        """
+        from io import StringIO
+        from interpreter import batch
+        from interpreter.program import parse_file
+
+        functions, _, _ = parse_file('programs/dubble_recursive.txt')
+        rows = list(batch.read_rows(StringIO('3\n4\n\n0x10\nx\n'), 'csv'))
+        self.assertEqual(rows, [['3'], ['4'], ['0x10'], ['x']])
+        rows = rows * 5
+        in_process = list(batch.run_batch(functions, 'even_or_odd', rows, workers=1))
+        in_pool = list(batch.run_batch(functions, 'even_or_odd', rows, workers=2, chunk_size=3))
+        self.assertEqual(in_process, in_pool)
+        self.assertEqual([result['row'] for result in in_pool], list(range(20)))
+        self.assertEqual(in_pool[0], {'row': 0, 'output': 'given value is odd\n', 'exit_value': 0, 'error': None})
+        self.assertEqual(in_pool[2]['output'], 'given value is even\n')
+        self.assertTrue(in_pool[3]['error'].startswith('PARAMETER_ERROR'))
+
+    def test_invalid_rows(self):
+        """
+        Test if a row that isn't a JSON array or that raises an exception gives an error for that row only, and if an
+        invalid amount of workers or chunk size is a usage error
+        """
+        from io import StringIO
+        from unittest import mock
+        from contextlib import redirect_stdout
+        from interpreter import batch
+        from interpreter.program import Program, parse_file
+
+        functions, _, _ = parse_file('programs/dubble_recursive.txt')
+        rows = list(batch.read_rows(StringIO('[3]\n{"n": 3}\n[3\n\n[[3]]\n[4]\n'), 'jsonl'))
+        results = list(batch.run_batch(functions, 'even_or_odd', rows, workers=1))
+        self.assertEqual([result['exit_value'] for result in results], [0, None, None, None, 0])
+        self.assertEqual([result['error'].split(':')[0] for result in results[1:4]], ['SYNTAX_ERROR'] * 3)
+        self.assertIn('line 5', results[3]['error'])
+
+        with mock.patch.object(Program, 'run', side_effect=RecursionError('too deep')):
+            results = list(batch.run_batch(functions, 'even_or_odd', [['3'], ['4']], workers=1))
+        self.assertEqual([result['error'].split(':')[0] for result in results], ['RUNTIME_ERROR'] * 2)
+
+        for option in ['--workers=0', '--workers=x', '--chunk=-1']:
+            output = StringIO()
+            with redirect_stdout(output):
+                self.assertEqual(batch.batch([option, 'programs/dubble_recursive.txt', 'even_or_odd']), 2)
+            self.assertTrue(output.getvalue().startswith('SYNTAX_ERROR'))
+
+
+class TestConsole(unittest.TestCase):
+    """
+    Test the outputs and inputs of interpreter.console
+    """
+    def test_program_io(self):
+        """
+        Test if every backend prints to a captured output and reads from a buffered input
+        """
+        from interpreter.program import Program, ProgramError, BACKENDS
+        from interpreter.console import CaptureOutput, BufferedInput
+
+        source = 'string function ask\nstring name is call input "naam? "\ncall print "hoi\\n"\ncall print name\nreturn name\n'
+        for backend in BACKENDS:
+            output = CaptureOutput()
+            program = Program.from_source(source, backend=backend, output=output, input_source=BufferedInput(['Jan', 'Piet']))
+            self.assertEqual(program.call('ask'), 'Jan')
+            self.assertEqual(program.call('ask'), 'Piet')
+            self.assertEqual(output.getvalue(), 'naam? hoi\n\nJan\nnaam? hoi\n\nPiet\n')
+            with self.assertRaises(ProgramError) as raised:
+                program.call('ask')
+            self.assertEqual(str(raised.exception.error).split(':')[0], 'RUNTIME_ERROR')
+
+    def test_buffered_output(self):
+        """
+        Test if a buffered console output only writes when the buffer is full or flushed
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from interpreter import console
+
+        stdout = StringIO()
+        output = console.ConsoleOutput(buffer_size=9)
+        with redirect_stdout(stdout):
+            with console.using(output):
+                console.output.write(console.print_text('"ab"'))
+                console.output.write(console.print_text(True))
+                self.assertEqual(stdout.getvalue(), '')
+                console.output.write(console.print_text(12))
+                self.assertEqual(stdout.getvalue(), 'ab\nTrue\n12\n')
+                console.output.write(console.print_text(3))
+            self.assertEqual(stdout.getvalue(), 'ab\nTrue\n12\n3\n')
+        self.assertIsInstance(console.output, console.ConsoleOutput)
+        self.assertEqual(console.output.buffer_size, 0)
+
+    def test_big_integers(self):
+        """
+        Test if integers of any number of digits are printed, while the limit of python stays in place for other code
+        """
+        import sys
+        from interpreter import console
+        from interpreter.program import Program
+        from interpreter.console import CaptureOutput
+
+        limit = sys.get_int_max_str_digits()
+        self.assertNotEqual(limit, 0)
+        output = CaptureOutput()
+        program = Program.load('programs/big_numbers.txt', output=output)
+        program.call('repeated_square', 3, 14)
+        self.assertEqual(console.print_text(3 ** 2 ** 14), console.value_text(3 ** 2 ** 14) + '\n')
+        self.assertGreater(len(console.value_text(3 ** 2 ** 14)), limit)
+        self.assertEqual(sys.get_int_max_str_digits(), limit)
+        with self.assertRaises(ValueError):
+            str(3 ** 2 ** 14)
+
+
+class TestLoops(unittest.TestCase):
+    """
+    Test the interpreter.execute loop functions
+    """
+    def run_loop_function(self, name: str, n: int):
+        """
+        Run a function from programs/loop.txt and return the result and error
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from interpreter import execute
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lexer('programs/loop.txt')
+            functions, _ = parser.parse(tokens)
+        return execute.execute_function_node(functions[name], [n], functions, 0)
+
+    def test_long_while_loop(self):
+        """
+        Test if a while loop with more iterations than the python recursion limit can run
+        """
+        value, error = self.run_loop_function('sommig_while', 5000)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR, 'Long while loop gave an error')
+        self.assertEqual(value, (5000 * 5001 // 2, 'int'), 'Long while loop gave a wrong result')
+
+    def test_long_for_loop(self):
+        """
+        Test if a for loop with more iterations than the python recursion limit can run
+        """
+        value, error = self.run_loop_function('sommig_for', 5000)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR, 'Long for loop gave an error')
+        self.assertEqual(value, (5000 * 5001 // 2, 'int'), 'Long for loop gave a wrong result')
+
+
+
+class TestStatementExecution(unittest.TestCase):
+    """
+    Test the interpreter.execute.execute_nodes function
+    """
+    def test_long_function_body(self):
+        """
+        Test if a body with more statements than the python recursion limit can be executed
+        """
+        from decoder import nodes
+        from interpreter import execute, frame
+        body = [
+            nodes.TypeAssignment(
+                lexer.Token(enums.TokensTypes.TYPE, 'int', 1),
+                lexer.Token(enums.TokensTypes.IDENTIFIER, 'x', 1),
+                nodes.Value(lexer.Token(enums.TokensTypes.INT, '0', 1))
+            )
+        ]
+        body += [nodes.IncDec(
+            lexer.Token(enums.TokensTypes.IDENTIFIER, 'x', line_nmr),
+            lexer.Token(enums.TokensTypes.INCDEC, 'plusplus', line_nmr)
+        ) for line_nmr in range(2, 5002)]
+        function = nodes.FunctionNode('main', lexer.Token(enums.TokensTypes.TYPE, 'int', 1))
+        function.body = body
+        variables, error = execute.execute_nodes(frame.new_frame(function), dict(), body)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR, 'Long function body gave an error')
+        self.assertEqual(variables[body[0].id.slot:body[0].id.slot + 2], [5000, 'int'], 'Long function body gave a wrong result')
+
+    def test_big_int_calls(self):
+        """
+        Test if ints with more digits than python can convert to a string are passed to and returned from functions
+        """
+        from io import StringIO
+        from contextlib import redirect_stdout
+        from decoder import parser
+        from interpreter import execute
+        with redirect_stdout(StringIO()):
+            tokens, _ = lexer.lexer('programs/big_numbers.txt')
+            functions, _ = parser.parse(tokens)
+        value, error = execute.execute_function_node(functions['repeated_square'], [3, 16], functions, 0)
+        self.assertEqual(error.type, enums.ErrorType.NO_ERROR, 'Big int calls gave an error')
+        self.assertEqual(value, (3 ** (2 ** 16), 'int'), 'Big int calls gave a wrong result')
+
+    def test_unknown_node(self):
+        """
+        Test if a node that is not a statement gives the expected runtime error
+        """
+        from decoder import nodes
+        from interpreter import execute
+        node = nodes.Value(lexer.Token(enums.TokensTypes.INT, '1', 3))
+        _, error = execute.execute_nodes(dict(), dict(), [node])
+        self.assertEqual(error.type, enums.ErrorType.RUNTIME_ERROR, 'Unknown node was executed')
+        self.assertEqual(error.message, 'Couldn\'t execute node with type Value; Node: [Value Node: 1]', 'Unknown node gave an unexpected error')
+
 
 if __name__ == '__main__':
     unittest.main()